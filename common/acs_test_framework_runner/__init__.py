@@ -2,15 +2,14 @@ from .mock_loader import _resolve_runner_module_from_stack, stateful_run_router
 from .mock_loader import ConfigError as MockLoaderConfigError
 from .mock_helpers import (
     build_char16_payload,
-    build_df_output,
     build_efi_var_bytes,
     build_ethtool_ip_address_output,
     build_ethtool_ip_link_line,
     build_ethtool_ip_link_show_line,
-    build_fdisk_output,
+    build_gpt_table_bytes,
+    build_mbr_table_bytes,
     build_os_indications_var,
     build_run_result_from_outcome,
-    build_sgdisk_partition_output,
     check_output_router,
     default_device_path,
     noop,
@@ -47,9 +46,11 @@ from .runner_checks import (
     resolve_target_path,
     run_single_check,
     sanitize_name,
+    invalidate_module_cache,
     load_module_from_path,
     normalize_completed_stream,
     read_source,
+    release_module,
     sanitize_xml_text,
 )
 from .runner_reporting import (
@@ -69,15 +70,14 @@ __all__ = [
     "stateful_run_router",
 
     "build_char16_payload",
-    "build_df_output",
     "build_efi_var_bytes",
     "build_ethtool_ip_address_output",
     "build_ethtool_ip_link_line",
     "build_ethtool_ip_link_show_line",
-    "build_fdisk_output",
+    "build_gpt_table_bytes",
+    "build_mbr_table_bytes",
     "build_os_indications_var",
     "build_run_result_from_outcome",
-    "build_sgdisk_partition_output",
     "check_output_router",
     "default_device_path",
     "noop",
@@ -115,9 +115,11 @@ __all__ = [
     "resolve_target_path",
     "run_single_check",
     "sanitize_name",
+    "invalidate_module_cache",
     "load_module_from_path",
     "normalize_completed_stream",
     "read_source",
+    "release_module",
     "sanitize_xml_text",
 
     "append_combined_case_log",
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import re
+import struct
+import uuid
+import zlib
 from pathlib import Path
 from subprocess import CalledProcessError, CompletedProcess
 from typing import Any
@@ -426,59 +429,100 @@ def build_run_result_from_outcome(
     raise ValueError(f"Unsupported connectivity outcome: {outcome!r}")
 
 
-def build_df_output(used_blocks: int, available_blocks: int) -> str:
-    """Render `df -B 512 --output=used,avail` output."""
-    return f"Used Avail\n{used_blocks} {available_blocks}\n"
-
-
-def build_fdisk_output(disk: str, partitions: list[dict[str, Any]]) -> str:
-    """Render minimal `fdisk -l` output that the parser can consume."""
-    lines = [
-        f"Disk /dev/{disk}: 16 GiB",
-        "Device Boot Start End Sectors Size Id Type",
-    ]
-
-    for index, part in enumerate(partitions, start=1):
-        name = part.get("name", f"{disk}{index}")
-        boot_flag = "*" if scenario_truthy(part.get("boot"), default=False) else ""
-        start = int(part.get("start", 2048))
-        sectors = int(part.get("sectors", 204800))
-        end = int(part.get("end", start + sectors - 1))
-        size = str(part.get("size", "100M"))
-        part_id = str(part.get("id", "83")).upper().removeprefix("0X")
-        type_name = str(part.get("type_name", "Linux"))
-        prefix = f"/dev/{name}"
-        if boot_flag:
-            lines.append(
-                f"{prefix} {boot_flag} {start} {end} {sectors} {size} {part_id} {type_name}"
-            )
-        else:
-            lines.append(f"{prefix} {start} {end} {sectors} {size} {part_id} {type_name}")
+def _mbr_partition_id(value: Any) -> int:
+    return int(str(value).strip().lower().removeprefix("0x"), 16)
+
+
+def build_mbr_table_bytes(partitions: list[dict[str, Any]]) -> bytes:
+    """Build a 512-byte MBR sector with up to four primary partitions."""
+    if len(partitions) > 4:
+        raise ValueError("An MBR holds at most four primary partitions")
+
+    sector = bytearray(512)
+    for index, part in enumerate(partitions):
+        boot_flag = 0x80 if scenario_truthy(part.get("boot"), default=False) else 0x00
+        struct.pack_into(
+            "<B3sB3sII",
+            sector,
+            446 + 16 * index,
+            boot_flag,
+            b"\xff\xff\xfe",
+            _mbr_partition_id(part.get("id", "83")),
+            b"\xff\xff\xfe",
+            int(part.get("start", 2048 + 2048 * index)),
+            int(part.get("sectors", 2048)),
+        )
+    sector[510:512] = b"\x55\xaa"
+    return bytes(sector)
 
-    return "\n".join(lines) + "\n"
 
+def build_gpt_table_bytes(
+    partitions: list[dict[str, Any]],
+    *,
+    sector_size: int = 512,
+    disk_sectors: int = 8,
+) -> bytes:
+    """Build a protective MBR, primary GPT header and entry array.
 
-def build_sgdisk_partition_output(partition: dict[str, Any]) -> str:
-    """Render minimal `sgdisk -i=N` output for one GPT partition."""
-    guid = str(
-        partition.get(
-            "guid",
-            "0FC63DAF-8483-4772-8E79-3D69D8477DE4",
+    Partition entries use key 'guid' (type GUID, default Linux filesystem)
+    and 'attribute_flags' (hex string) or 'platform_required'.  An entry with
+    'empty: true' leaves its slot unused.
+    """
+    entry_size = 128
+    entry_count = max(4, len(partitions))
+    entries = bytearray(entry_size * entry_count)
+    for index, part in enumerate(partitions):
+        if scenario_truthy(part.get("empty"), default=False):
+            continue
+        type_guid = uuid.UUID(str(part.get("guid", "0FC63DAF-8483-4772-8E79-3D69D8477DE4")))
+        if "attribute_flags" in part:
+            attributes = int(str(part["attribute_flags"]), 16)
+        else:
+            attributes = 1 if scenario_truthy(part.get("platform_required"), default=False) else 0
+        first_lba = int(part.get("start", 2048 + 2048 * index))
+        struct.pack_into(
+            "<16s16sQQQ",
+            entries,
+            index * entry_size,
+            type_guid.bytes_le,
+            uuid.uuid5(uuid.NAMESPACE_OID, f"partition-{index}").bytes_le,
+            first_lba,
+            first_lba + int(part.get("sectors", 2048)) - 1,
+            attributes,
         )
-    ).upper()
-    guid_name = str(partition.get("guid_name", "Linux filesystem"))
-    if "attribute_flags" in partition:
-        flags = str(partition["attribute_flags"])
-    else:
-        flags = "0000000000000001" if scenario_truthy(
-            partition.get("platform_required"),
-            default=False,
-        ) else "0000000000000000"
 
-    return (
-        f"Partition GUID code: {guid} ({guid_name})\n"
-        f"Attribute flags: {flags}\n"
-    )
+    entries_lba = 2
+    entry_sectors = -(-len(entries) // sector_size)
+    header = bytearray(struct.pack(
+        "<8sIIIIQQQQ16sQIII",
+        b"EFI PART",
+        0x00010000,
+        92,
+        0,
+        0,
+        1,
+        disk_sectors - 1,
+        entries_lba + entry_sectors,
+        disk_sectors - 2 - entry_sectors,
+        uuid.uuid5(uuid.NAMESPACE_OID, "disk").bytes_le,
+        entries_lba,
+        entry_count,
+        entry_size,
+        zlib.crc32(entries),
+    ))
+    struct.pack_into("<I", header, 16, zlib.crc32(header))
+
+    protective = bytearray(sector_size)
+    struct.pack_into("<B3sB3sII", protective, 446, 0, b"\x00\x02\x00", 0xEE,
+                     b"\xff\xff\xff", 1, min(disk_sectors - 1, 0xFFFFFFFF))
+    protective[510:512] = b"\x55\xaa"
+
+    image = bytearray(max(disk_sectors * sector_size,
+                          entries_lba * sector_size + len(entries)))
+    image[:sector_size] = protective
+    image[sector_size:sector_size + len(header)] = header
+    image[entries_lba * sector_size:entries_lba * sector_size + len(entries)] = entries
+    return bytes(image)
 
 
 def build_efi_var_bytes(attrs: int, payload: bytes = b"") -> bytes:
@@ -2,24 +2,20 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from subprocess import CalledProcessError
 from typing import Any
 from typing import Mapping
 
 try:  # Support package imports and direct harness module loading.
     from .mock_loader import ConfigError
-    from .mock_loader import _resolve_runner_module_from_stack
-    from .mock_loader import stateful_run_router
     from .mock_helpers import build_char16_payload
-    from .mock_helpers import build_df_output
     from .mock_helpers import build_efi_var_bytes
     from .mock_helpers import build_ethtool_ip_address_output
     from .mock_helpers import build_ethtool_ip_link_line
     from .mock_helpers import build_ethtool_ip_link_show_line
-    from .mock_helpers import build_fdisk_output
+    from .mock_helpers import build_gpt_table_bytes
+    from .mock_helpers import build_mbr_table_bytes
     from .mock_helpers import build_os_indications_var
     from .mock_helpers import build_run_result_from_outcome
-    from .mock_helpers import build_sgdisk_partition_output
     from .mock_helpers import check_output_router
     from .mock_helpers import default_device_path
     from .mock_helpers import noop
@@ -31,18 +27,15 @@ try:  # Support package imports and direct harness module loading.
     from .mock_helpers import which_router
 except ImportError:  # pragma: no cover - exercised by flat-module harness imports.
     from mock_loader import ConfigError
-    from mock_loader import _resolve_runner_module_from_stack
-    from mock_loader import stateful_run_router
     from mock_helpers import build_char16_payload
-    from mock_helpers import build_df_output
     from mock_helpers import build_efi_var_bytes
     from mock_helpers import build_ethtool_ip_address_output
     from mock_helpers import build_ethtool_ip_link_line
     from mock_helpers import build_ethtool_ip_link_show_line
-    from mock_helpers import build_fdisk_output
+    from mock_helpers import build_gpt_table_bytes
+    from mock_helpers import build_mbr_table_bytes
     from mock_helpers import build_os_indications_var
     from mock_helpers import build_run_result_from_outcome
-    from mock_helpers import build_sgdisk_partition_output
     from mock_helpers import check_output_router
     from mock_helpers import default_device_path
     from mock_helpers import noop
@@ -307,36 +300,122 @@ def build_ethtool_scenario_case(
     }
 
 
-PRECIOUS_MBR_IDS = {"0xF8", "0xEF"}
-PRECIOUS_GPT_GUIDS = {
-    "C12A7328-F81F-11D2-BA4B-00A0C93EC93B",
-    "21686148-6449-6E6F-744E-656564454649",
-    "3DE21764-95BD-54BD-A5C3-4ABE786F38A8",
-}
+BLK_TEST_BYTE = "B"
+BLK_MIN_DEVICE_BYTES = 4096
+BLK_DISK_MAJORS = {"mtdblock": 31, "ram": 1}
 
 
-def _completed_process_spec(
-    *,
-    returncode: int = 0,
-    stdout: str = "",
-    stderr: str = "",
-) -> dict[str, Any]:
-    return {"returncode": returncode, "stdout": stdout, "stderr": stderr}
+class _BlkFixture:
+    """Fake /dev, /sys/block and mountinfo tree for the block-device script.
 
+    Device nodes are plain files under {work_dir}/dev, so the script's
+    pread/pwrite engine runs against them unmodified.  A device whose
+    block_read is "fail" gets no node, which makes its open() fail.
+    """
 
-def _join_stdout_lines(items: list[str]) -> str:
-    if not items:
-        return ""
-    return "\n".join(items) + "\n"
+    def __init__(self, work_dir: Path) -> None:
+        self.work_dir = work_dir
+        self.text_files: dict[str, str] = {}
+        self.bin_files: dict[str, Any] = {}
+        self.mount_lines: list[str] = []
+        self.space_rules: list[dict[str, Any]] = []
+        self.write_rules: list[dict[str, Any]] = []
+        self.readback_rules: list[dict[str, Any]] = []
+
+    def add_disk(self, name: str, index: int, kind: str) -> None:
+        major = BLK_DISK_MAJORS.get(kind, 8)
+        self.text_files[f"sys/block/{name}/dev"] = f"{major}:{index * 16}\n"
+
+    def add_partition(self, disk: str, name: str, number: int) -> None:
+        self.text_files[f"sys/block/{disk}/{name}/partition"] = f"{number}\n"
+
+    def add_device(
+        self,
+        name: str,
+        cfg: Mapping[str, Any],
+        *,
+        payload: bytes | None = None,
+    ) -> None:
+        """Add a device node plus the mount state, space and I/O behavior in cfg."""
+        if str(cfg.get("block_read", "pass")).lower() in {"fail", "failed", "error"}:
+            return
+
+        used_blocks = int(cfg.get("used_blocks", 0))
+        if payload is None:
+            size = max(BLK_MIN_DEVICE_BYTES, (used_blocks + 2) * 512)
+            self.bin_files[f"dev/{name}"] = {"text": BLK_TEST_BYTE * size}
+        else:
+            self.bin_files[f"dev/{name}"] = {"hex": payload.hex()}
+
+        if scenario_truthy(cfg.get("mounted"), default=False):
+            line_id = len(self.mount_lines) + 20
+            self.mount_lines.append(
+                f"{line_id} 1 8:{line_id} / /mnt/{name} rw,relatime shared:1 - ext4 "
+                f"/dev/{name} rw\n"
+            )
 
+        if "used_blocks" in cfg or "available_blocks" in cfg:
+            self.space_rules.append({
+                "when": {"args": {0: name}},
+                "return": [used_blocks, int(cfg.get("available_blocks", 0))],
+            })
+
+        write_flow = cfg.get("write_flow") or {}
+        if not isinstance(write_flow, dict):
+            raise ConfigError("blk write_flow must be a mapping when provided")
+        readback = str(write_flow.get("readback", "match")).lower()
+        if readback == "mismatch":
+            # Drop the test block so the read-back still sees the old data.
+            self.write_rules.append({
+                "when": {"args": {2: {"contains": "Hello!"}}},
+                "return": None,
+            })
+        elif readback == "error":
+            self.readback_rules.append({
+                "raise": {
+                    "type": "py:builtins.OSError",
+                    "args": [str(write_flow.get("readback_error", "mocked readback failure"))],
+                },
+            })
+        elif readback != "match":
+            raise ConfigError("blk write_flow.readback must be match, mismatch, or error")
+
+    def build(self, prompt_response: str) -> dict[str, Any]:
+        self.text_files["mountinfo"] = "".join(self.mount_lines)
+        # Devices without configured space report none, as on an empty filesystem.
+        space_rules = [*self.space_rules, {"return": [0, 0]}]
+        mocks: dict[str, Any] = {
+            "{module}.input_with_timeout": {"return_value": prompt_response},
+            "{module}.get_partition_space": {
+                "factory": passthrough_router,
+                "inject_original_as": "real",
+                "kwargs": {"rules": space_rules},
+            },
+        }
+        if self.write_rules:
+            mocks["{module}.BlockFile.write"] = {
+                "factory": passthrough_router,
+                "inject_original_as": "real",
+                "kwargs": {"rules": self.write_rules},
+            }
+        if self.readback_rules:
+            mocks["{module}.read_back_block"] = {
+                "factory": passthrough_router,
+                "inject_original_as": "real",
+                "kwargs": {"rules": self.readback_rules},
+            }
 
-def _normalize_mbr_partition_id(value: Any) -> str:
-    text = str(value).strip().upper()
-    if not text:
-        return ""
-    if text.startswith("0X"):
-        text = text[2:]
-    return f"0x{text}"
+        return {
+            "dir_structure": [{"path": "dev"}, {"path": "sys/block"}],
+            "text_files": self.text_files,
+            "bin_files": self.bin_files,
+            "patch_constants": {
+                "DEV_DIR": str(self.work_dir / "dev"),
+                "SYS_BLOCK_DIR": str(self.work_dir / "sys" / "block"),
+                "MOUNTINFO_PATH": str(self.work_dir / "mountinfo"),
+            },
+            "mocks": mocks,
+        }
 
 
 def _normalize_prompt_response(value: Any, *, default: str = "no") -> str:
@@ -367,498 +446,40 @@ def _normalize_prompt_response(value: Any, *, default: str = "no") -> str:
     return normalized.get(text, text)
 
 
-def _platform_required(partition: dict[str, Any]) -> bool:
-    if "attribute_flags" in partition:
-        flags = str(partition["attribute_flags"]).strip()
-        try:
-            return (int(flags, 16) & 1) == 1
-        except ValueError as exc:
-            raise ConfigError(
-                f"Invalid GPT attribute_flags value: {partition['attribute_flags']!r}"
-            ) from exc
-    return scenario_truthy(partition.get("platform_required"), default=False)
-
-
-def _add_blk_write_check_run_responses(
-    run_responses: dict[str, Any],
-    target: str,
-    write_cfg: dict[str, Any] | None,
-) -> None:
-    cfg = write_cfg or {}
-    mounted = scenario_truthy(cfg.get("mounted"), default=False)
-    run_responses[f"findmnt -n /dev/{target}"] = _completed_process_spec(
-        returncode=0 if mounted else 1,
-        stdout=f"/dev/{target} /mnt/{target} ext4 rw,relatime 0 0\n" if mounted else "",
-    )
-
-    if mounted:
-        return
-
-    if "used_blocks" not in cfg and "available_blocks" not in cfg:
-        return
-
-    used_blocks = int(cfg.get("used_blocks", 0))
-    available_blocks = int(cfg.get("available_blocks", 0))
-    run_responses[f"df -B 512 /dev/{target} --output=used,avail"] = _completed_process_spec(
-        stdout=build_df_output(used_blocks, available_blocks)
-    )
-
-
-def _build_blk_write_check_stateful_rules(
-    device: str,
-    cfg: dict[str, Any],
-) -> tuple[dict[str, Any], list[dict[str, Any]]]:
-    write_flow = cfg.get("write_flow")
-    if write_flow is None:
-        return {}, []
-    if not isinstance(write_flow, dict):
-        raise ConfigError("blk_write_check.write_flow must be a mapping when provided")
-
-    initial_bytes = cfg.get("initial_device_bytes")
-    if initial_bytes is None:
-        initial_text = str(cfg.get("initial_device_text", "B" * 512))
-        initial_bytes = initial_text.encode("utf-8")
-    elif isinstance(initial_bytes, str):
-        try:
-            initial_bytes = bytes.fromhex(initial_bytes)
-        except ValueError as exc:
-            raise ConfigError(
-                "blk_write_check.initial_device_bytes must be bytes or hex string"
-            ) from exc
-    elif not isinstance(initial_bytes, bytes):
-        raise ConfigError("blk_write_check.initial_device_bytes must be bytes or hex string")
-
-    mismatch_bytes = write_flow.get("mismatch_bytes")
-    if mismatch_bytes is None:
-        mismatch_bytes = b"X" * max(len(initial_bytes), 512)
-    elif isinstance(mismatch_bytes, str):
-        try:
-            mismatch_bytes = bytes.fromhex(mismatch_bytes)
-        except ValueError as exc:
-            raise ConfigError(
-                "blk_write_check.write_flow.mismatch_bytes must be bytes or hex string"
-            ) from exc
-    elif not isinstance(mismatch_bytes, bytes):
-        raise ConfigError("blk_write_check.write_flow.mismatch_bytes must be bytes or hex string")
-
-    used_blocks = int(cfg.get("used_blocks", 0))
-    backup_name = f"{device}_backup.bin"
-    device_state_key = f"{device}:device_bytes"
-    mismatch_state_key = f"{device}:mismatch_bytes"
-    state = {
-        device_state_key: initial_bytes,
-        mismatch_state_key: mismatch_bytes,
-    }
-    rules: list[dict[str, Any]] = []
-
-    backup_command = (
-        f"dd if=/dev/{device} of={backup_name} bs=512 count=1 skip={used_blocks}"
-    )
-    backup_mode = str(write_flow.get("backup", "success")).lower()
-    if backup_mode in {"success", "pass", "ok"}:
-        rules.append({
-            "command": backup_command,
-            "write_file": {
-                "path": backup_name,
-                "content": {"from_state": device_state_key},
-            },
-            "result": {"returncode": 0, "stdout": "", "stderr": ""},
-        })
-    elif backup_mode == "error":
-        error_text = str(write_flow.get("backup_error", "mocked backup failure"))
-        rules.append({
-            "command": backup_command,
-            "raise": {
-                "type": CalledProcessError,
-                "args": [1, backup_command],
-                "kwargs": {"output": "", "stderr": error_text},
-            },
-        })
-    elif backup_mode not in {"skip", "none"}:
-        raise ConfigError(
-            "blk_write_check.write_flow.backup must be success, error, skip, or none"
-        )
-
-    write_command = (
-        f"dd if=hello.txt of=/dev/{device} bs=512 count=1 seek={used_blocks}"
-    )
-    write_mode = str(write_flow.get("write", "success")).lower()
-    if write_mode in {"success", "pass", "ok"}:
-        written_content = (
-            {"from_state": mismatch_state_key}
-            if str(write_flow.get("readback", "match")).lower() == "mismatch"
-            else {"from_file": "hello.txt"}
-        )
-        rules.append({
-            "command": write_command,
-            "set_state": {device_state_key: written_content},
-            "result": {"returncode": 0, "stdout": "", "stderr": ""},
-        })
-    elif write_mode == "error":
-        error_text = str(write_flow.get("write_error", "mocked write failure"))
-        rules.append({
-            "command": write_command,
-            "raise": {
-                "type": CalledProcessError,
-                "args": [1, write_command],
-                "kwargs": {"output": "", "stderr": error_text},
-            },
-        })
-    elif write_mode not in {"skip", "none"}:
-        raise ConfigError(
-            "blk_write_check.write_flow.write must be success, error, skip, or none"
-        )
-
-    read_command = (
-        f"dd if=/dev/{device} of=read_hello.txt bs=512 count=1 skip={used_blocks}"
-    )
-    readback_mode = str(write_flow.get("readback", "match")).lower()
-    if readback_mode in {"match", "mismatch"}:
-        rules.append({
-            "command": read_command,
-            "write_file": {
-                "path": "read_hello.txt",
-                "content": {"from_state": device_state_key},
-            },
-            "result": {"returncode": 0, "stdout": "", "stderr": ""},
-        })
-    elif readback_mode == "error":
-        error_text = str(write_flow.get("readback_error", "mocked readback failure"))
-        rules.append({
-            "command": read_command,
-            "raise": {
-                "type": CalledProcessError,
-                "args": [1, read_command],
-                "kwargs": {"output": "", "stderr": error_text},
-            },
-        })
-    else:
-        raise ConfigError("blk_write_check.write_flow.readback must be match, mismatch, or error")
-
-    restore_command = (
-        f"dd if={backup_name} of=/dev/{device} bs=512 count=1 seek={used_blocks}"
-    )
-    restore_mode = str(write_flow.get("restore", "success")).lower()
-    if restore_mode in {"success", "pass", "ok"}:
-        rules.append({
-            "command": restore_command,
-            "set_state": {device_state_key: {"from_file": backup_name}},
-            "result": {"returncode": 0, "stdout": "", "stderr": ""},
-        })
-    elif restore_mode == "error":
-        error_text = str(write_flow.get("restore_error", "mocked restore failure"))
-        rules.append({
-            "command": restore_command,
-            "raise": {
-                "type": CalledProcessError,
-                "args": [1, restore_command],
-                "kwargs": {"output": "", "stderr": error_text},
-            },
-        })
-    elif restore_mode not in {"skip", "none"}:
-        raise ConfigError(
-            "blk_write_check.write_flow.restore must be success, error, skip, or none"
-        )
-
-    return state, rules
-
-
-BLK_DEVICE_BANNER = "*" * 128
-
-
-def _print_blk_devices_separator() -> None:
-    print(f"\n{BLK_DEVICE_BANNER}\n")
-
-
-def _run_blk_device_command(module: Any, command: str) -> Any:
-    return module.subprocess.run(
-        command,
-        shell=True,
-        text=True,
-        check=False,
-        capture_output=True,
-    )
-
-
-def _list_blk_devices(module: Any) -> list[str]:
-    command = "lsblk -e 7 -d | grep disk | awk '{print $1}'"
-    result = _run_blk_device_command(module, command)
-    return result.stdout.split()
-
-
-def _print_blk_devices_header(disks: list[str]) -> None:
-    _print_blk_devices_separator()
-    print("                                                    Read block devices tool\n")
-    print(BLK_DEVICE_BANNER)
-    print("INFO: Detected following block devices with lsblk command :")
-    for num, disk in enumerate(disks):
-        print(f"{num}: {disk}")
-    _print_blk_devices_separator()
-
-
-def _detect_blk_partition_table(module: Any, disk: str) -> str:
-    command = f"timeout 10 gdisk -l /dev/{disk}"
-    result = _run_blk_device_command(module, command)
-    if "MBR: MBR only" in result.stdout:
-        return "MBR"
-    if "GPT: present" in result.stdout:
-        return "GPT"
-    print(f"INFO: No valid partition table found for {disk}, treating as raw device.")
-    return "RAW"
-
-
-def _count_blk_partitions(module: Any, disk: str) -> int:
-    command = f"lsblk -rn -o NAME,TYPE /dev/{disk} | grep -c part"
-    result = _run_blk_device_command(module, command)
-    num_parts_str = result.stdout.strip()
-    return int(num_parts_str) if num_parts_str else 0
-
-
-def _run_blk_read(module: Any, partition_label: str, context: str = "") -> bool:
-    context_suffix = f" {context}" if context else ""
-    print(f"INFO: Performing block read on /dev/{partition_label}{context_suffix}")
-    command = f"dd if=/dev/{partition_label} bs=1M count=1 > /dev/null"
-    result = _run_blk_device_command(module, command)
-    outcome = "successful" if result.returncode == 0 else "failed"
-    print(f"INFO: Block read on /dev/{partition_label}{context_suffix} {outcome}")
-    return result.returncode == 0
-
-
-def _print_precious_partition(
-    module: Any,
-    partition_label: str,
-    identifier: str,
-    precious_parts: Mapping[str, str],
-    *,
-    suffix: str = "",
-) -> None:
-    for key, value in precious_parts.items():
-        if value != identifier:
-            continue
-        print(f"INFO: {partition_label} partition is PRECIOUS{suffix}")
-        used_blocks, _ = module.get_partition_space(f"/dev/{partition_label}")
-        print(
-            "INFO: Number of 512B blocks used on "
-            f"/dev/{partition_label}: {used_blocks}"
-        )
-        print(f"      {key} : {value}")
-        print("      Skipping block read/write...")
-        break
-
-
-def _parse_mbr_partition_ids(fdisk_stdout: str) -> list[str]:
-    table_header_row = [
-        "Device",
-        "Boot",
-        "Start",
-        "End",
-        "Sectors",
-        "Size",
-        "Id",
-        "Type",
+def _blk_table_bytes(
+    table: str,
+    partitions: list[dict[str, Any]],
+    disk: Mapping[str, Any],
+) -> bytes:
+    listed = [
+        part for part in partitions
+        if scenario_truthy(part.get("in_table"), default=True)
     ]
-    lines = fdisk_stdout.strip().split("\n")
-    collect_lines = False
-    mbr_part_ids: list[str] = []
-
-    for line in lines:
-        if collect_lines:
-            columns = line.split()
-            if len(columns) < 6:
-                continue
-            if columns[1] == "*" and len(columns) >= 7:
-                mbr_part_ids.append("0x" + columns[6].upper())
-            else:
-                mbr_part_ids.append("0x" + columns[5].upper())
-            continue
-        if all(substring in line for substring in table_header_row):
-            collect_lines = True
-
-    return mbr_part_ids
-
-
-def _parse_gpt_partition_info(
-    module: Any,
-    sgdisk_stdout: str,
-) -> tuple[str, int] | None:
-    guid_regex = r"Partition GUID code: ([\w-]+) \("
-    attr_flag_regex = r"Attribute flags: ([0-9A-Fa-f]+)"
-    guid_code_match = module.re.search(guid_regex, sgdisk_stdout)
-    attribute_flags_match = module.re.search(attr_flag_regex, sgdisk_stdout)
-    if not guid_code_match or not attribute_flags_match:
-        return None
-
-    partition_guid_code = guid_code_match.group(1)
-    attribute_flags_hex = attribute_flags_match.group(1)
-    attribute_flags_int = int(attribute_flags_hex, 16)
-    return partition_guid_code, attribute_flags_int & 1
-
-
-def _handle_raw_blk_device(module: Any, disk: str) -> None:
-    print(f"INFO: No partitions detected for {disk}, treating as raw device.")
-    if _run_blk_read(module, disk):
-        module.perform_write_check(disk, "", {})
-    _print_blk_devices_separator()
-
-
-def _handle_mbr_blk_device(
-    module: Any,
-    disk: str,
-    part_labels: list[str],
-    num_parts: int,
-) -> None:
-    command = f"fdisk -l /dev/{disk}"
-    result = _run_blk_device_command(module, command)
-    mbr_part_ids = _parse_mbr_partition_ids(result.stdout)
-
-    if len(mbr_part_ids) < num_parts:
-        print(
-            "WARNING: Could not parse enough MBR partition IDs. "
-            f"Found {len(mbr_part_ids)}, expected {num_parts}."
-        )
-
-    process_count = min(len(part_labels), len(mbr_part_ids), num_parts)
-    for index in range(process_count):
-        part_label = part_labels[index]
-        partition_id = mbr_part_ids[index]
-        print(f"\nINFO: Partition : /dev/{part_label} Partition type : {partition_id}")
-
-        if partition_id in module.precious_parts_mbr.values():
-            _print_precious_partition(
-                module,
-                part_label,
-                partition_id,
-                module.precious_parts_mbr,
-            )
-            continue
-
-        if _run_blk_read(module, part_label, f"mbr_part_id = {partition_id}"):
-            module.perform_write_check(
-                part_label,
-                partition_id,
-                module.precious_parts_mbr,
-            )
-
-    _print_blk_devices_separator()
-
-
-def _handle_gpt_blk_device(
-    module: Any,
-    disk: str,
-    part_labels: list[str],
-    num_parts: int,
-) -> None:
-    process_count = min(len(part_labels), num_parts)
-    for index in range(process_count):
-        part_label = part_labels[index]
-        command = f"sgdisk -i={index + 1} /dev/{disk}"
-        result = _run_blk_device_command(module, command)
-        parsed = _parse_gpt_partition_info(module, result.stdout)
-
-        if parsed is None:
-            print(f"INFO: Unable to parse sgdisk info for {part_label}. Skipping.")
-            continue
-
-        partition_guid_code, lsb = parsed
-        print(
-            f"\nINFO: Partition : /dev/{part_label} "
-            f"Partition type GUID : {partition_guid_code} "
-            f"\"Platform required bit\" : {lsb}"
-        )
-
-        if lsb == 1:
-            print(
-                "INFO: Platform required attribute set for "
-                f"{part_label} partition, skipping block read/write..."
-            )
-            continue
-
-        if partition_guid_code in module.precious_parts_gpt.values():
-            _print_precious_partition(
-                module,
-                part_label,
-                partition_guid_code,
-                module.precious_parts_gpt,
-                suffix=".",
-            )
-            continue
-
-        if _run_blk_read(module, part_label, f"part_guid = {partition_guid_code}"):
-            module.perform_write_check(
-                part_label,
-                partition_guid_code,
-                module.precious_parts_gpt,
-            )
-
-    _print_blk_devices_separator()
-
-
-def _process_blk_device(module: Any, disk: str) -> None:
-    print(f"INFO: Block device : /dev/{disk}")
-    part_table = _detect_blk_partition_table(module, disk)
-    print(f"INFO: Partition table type : {part_table}\n")
-
-    num_parts = _count_blk_partitions(module, disk)
-    if part_table == "RAW" or num_parts == 0:
-        _handle_raw_blk_device(module, disk)
-        return
-
-    part_labels = module.get_partition_labels(disk)
-    if len(part_labels) < num_parts:
-        print(
-            "WARNING: Mismatch in partition count. Found "
-            f"{len(part_labels)} partition labels, but lsblk reported "
-            f"{num_parts} partitions for {disk}. Proceeding with the ones we have..."
-        )
-
-    if part_table == "MBR":
-        _handle_mbr_blk_device(module, disk, part_labels, num_parts)
-        return
-    if part_table == "GPT":
-        _handle_gpt_blk_device(module, disk, part_labels, num_parts)
-        return
-
-    print(
-        "INFO: Invalid partition table, expected MBR or GPT "
-        f"reported type = {part_table}"
-    )
-
-
-def _run_blk_devices_module_main() -> int:
-    """
-    Synthetic main() for block-device scripts that only define a main guard.
-
-    This mirrors the repository script flow closely enough for YAML scenario
-    tests while still exercising the target module's own helper functions.
-    """
-    module = _resolve_runner_module_from_stack()
-
-    try:
-        disks = _list_blk_devices(module)
-        _print_blk_devices_header(disks)
-
-        for disk in disks:
-            if module.is_mtd_block_device(disk):
-                print(f"INFO: Skipping MTD block device /dev/{disk}")
-                continue
-
-            if module.is_ram_disk(disk):
-                print(f"INFO: Skipping RAM disk /dev/{disk}")
-                continue
-
-            _process_blk_device(module, disk)
-
-        return 0
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        print(f"Error occurred: {exc}")
-        return 1
+    if table == "mbr":
+        if not listed:
+            raise ConfigError("an mbr disk needs at least one partition in its table")
+        return build_mbr_table_bytes(listed).ljust(BLK_MIN_DEVICE_BYTES, b"\x00")
+
+    # Unlisted GPT partitions keep their slot (and number) but leave it empty.
+    slots = [
+        part if scenario_truthy(part.get("in_table"), default=True) else {"empty": True}
+        for part in partitions
+    ]
+    sector_size = int(disk.get("sector_size", 512))
+    return build_gpt_table_bytes(slots, sector_size=sector_size)
 
 
 def build_blk_devices_scenario_case(
     scenario: dict[str, Any],
     work_dir: Path,
 ) -> dict[str, Any]:
-    """Build runtime mocks for the block-device script main flow."""
+    """Build the device tree and mocks for the block-device script main flow.
+
+    Each disk gets a sysfs entry and a /dev node holding its MBR/GPT table
+    (raw disks hold test data instead); each partition gets a sysfs entry and
+    its own node.  `in_table: false` keeps a partition out of the table while
+    sysfs still lists it.
+    """
     disks = scenario.get("disks", [])
     if disks is None:
         disks = []
@@ -866,12 +487,7 @@ def build_blk_devices_scenario_case(
         raise ConfigError("scenario.disks must be a list")
 
     prompt = _normalize_prompt_response(scenario.get("prompt", "no"))
-    prompt_response = "no" if prompt == "timeout" else prompt
-    call_log_path = str(work_dir / "blk_commands.log")
-    disk_listing_lines: list[str] = []
-    run_responses: dict[str, Any] = {}
-    stateful_state: dict[str, Any] = {}
-    stateful_rules: list[dict[str, Any]] = []
+    fixture = _BlkFixture(work_dir)
 
     for disk_index, disk in enumerate(disks, start=1):
         if not isinstance(disk, dict):
@@ -880,12 +496,11 @@ def build_blk_devices_scenario_case(
             raise ConfigError(f"scenario.disks[{disk_index}] requires key 'name'")
 
         disk_name = str(disk["name"])
-        disk_listing_lines.append(f"{disk_name} disk")
-
         disk_kind = str(disk.get("kind", "disk")).lower()
-        if disk_name.startswith("mtdblock") or disk_kind in {"mtd", "mtdblock"}:
-            continue
-        if disk_name.startswith("ram") or disk_kind == "ram":
+        if disk_kind == "mtd":
+            disk_kind = "mtdblock"
+        fixture.add_disk(disk_name, disk_index, disk_kind)
+        if disk_kind in BLK_DISK_MAJORS:
             continue
 
         table = str(disk.get("table", "raw")).lower()
@@ -900,209 +515,29 @@ def build_blk_devices_scenario_case(
         if not isinstance(partitions, list):
             raise ConfigError(f"scenario.disks[{disk_index}].partitions must be a list")
 
-        reported_partition_count = disk.get("reported_partition_count", len(partitions))
-        if not isinstance(reported_partition_count, int):
-            raise ConfigError(
-                f"scenario.disks[{disk_index}].reported_partition_count must be an integer"
-            )
-
-        gdisk_stdout = str(
-            disk.get(
-                "gdisk_output",
-                (
-                    "MBR: MBR only\n"
-                    if table == "mbr"
-                    else "GPT: present\n" if table == "gpt" else "no partition table here\n"
-                ),
-            )
-        )
-        if gdisk_stdout and not gdisk_stdout.endswith("\n"):
-            gdisk_stdout += "\n"
-
-        run_responses[f"timeout 10 gdisk -l /dev/{disk_name}"] = _completed_process_spec(
-            stdout=gdisk_stdout
-        )
-
-        if table == "raw" or reported_partition_count == 0:
-            run_responses[f"lsblk -rn -o NAME,TYPE /dev/{disk_name}"] = _completed_process_spec(
-                stdout=""
-            )
-            run_responses[f"dd if=/dev/{disk_name} of=/dev/null bs=1M count=1"] = (
-                build_run_result_from_outcome(disk.get("block_read", "pass"))
-            )
-            disk_write_cfg = disk.get("write_check") or disk
-            _add_blk_write_check_run_responses(
-                run_responses,
-                disk_name,
-                disk_write_cfg,
-            )
-            state, rules = _build_blk_write_check_stateful_rules(
-                disk_name,
-                disk_write_cfg,
-            )
-            stateful_state.update(state)
-            stateful_rules.extend(rules)
+        if table == "raw":
+            fixture.add_device(disk_name, {**disk, **(disk.get("write_check") or {})})
             continue
 
-        partition_labels: list[str] = []
         for part_index, partition in enumerate(partitions, start=1):
             if not isinstance(partition, dict):
                 raise ConfigError(
                     f"scenario.disks[{disk_index}].partitions[{part_index}] must be a mapping"
                 )
-            partition_labels.append(str(partition.get("name", f"{disk_name}{part_index}")))
-
-        lsblk_partition_lines = [f"{label} part" for label in partition_labels]
-        run_responses[f"lsblk -rn -o NAME,TYPE /dev/{disk_name}"] = _completed_process_spec(
-            stdout=_join_stdout_lines(lsblk_partition_lines)
-        )
-
-        if table == "mbr":
-            fdisk_stdout = disk.get("fdisk_output")
-            if fdisk_stdout is None:
-                fdisk_stdout = build_fdisk_output(disk_name, partitions)
-            else:
-                fdisk_stdout = str(fdisk_stdout)
-                if fdisk_stdout and not fdisk_stdout.endswith("\n"):
-                    fdisk_stdout += "\n"
-
-            run_responses[f"fdisk -l /dev/{disk_name}"] = _completed_process_spec(
-                stdout=fdisk_stdout
-            )
-
-            for part_index, partition in enumerate(partitions, start=1):
-                partition_name = str(partition.get("name", f"{disk_name}{part_index}"))
-                partition_id = _normalize_mbr_partition_id(partition.get("id", "83"))
-
-                if (
-                    partition_id in PRECIOUS_MBR_IDS
-                    or "used_blocks" in partition
-                    or "available_blocks" in partition
-                ):
-                    run_responses[
-                        f"df -B 512 /dev/{partition_name} --output=used,avail"
-                    ] = _completed_process_spec(
-                        stdout=build_df_output(
-                            int(partition.get("used_blocks", 0)),
-                            int(partition.get("available_blocks", 0)),
-                        )
-                    )
-
-                if partition_id in PRECIOUS_MBR_IDS:
-                    continue
-
-                run_responses[
-                    f"dd if=/dev/{partition_name} of=/dev/null bs=1M count=1"
-                ] = build_run_result_from_outcome(partition.get("block_read", "pass"))
-                partition_write_cfg = partition.get("write_check") or partition
-                _add_blk_write_check_run_responses(
-                    run_responses,
-                    partition_name,
-                    partition_write_cfg,
-                )
-                state, rules = _build_blk_write_check_stateful_rules(
-                    partition_name,
-                    partition_write_cfg,
-                )
-                stateful_state.update(state)
-                stateful_rules.extend(rules)
-
-            continue
-
-        for part_index, partition in enumerate(partitions, start=1):
             partition_name = str(partition.get("name", f"{disk_name}{part_index}"))
-            partition_guid = str(
-                partition.get("guid", "0FC63DAF-8483-4772-8E79-3D69D8477DE4")
-            ).upper()
-            required = _platform_required(partition)
-
-            sgdisk_stdout = partition.get("sgdisk_output")
-            if sgdisk_stdout is None:
-                sgdisk_stdout = build_sgdisk_partition_output(partition)
-            else:
-                sgdisk_stdout = str(sgdisk_stdout)
-                if sgdisk_stdout and not sgdisk_stdout.endswith("\n"):
-                    sgdisk_stdout += "\n"
-
-            run_responses[f"sgdisk -i={part_index} /dev/{disk_name}"] = _completed_process_spec(
-                stdout=sgdisk_stdout
-            )
+            fixture.add_partition(disk_name, partition_name, part_index)
+            fixture.add_device(partition_name, {**partition, **(partition.get("write_check") or {})})
 
-            if (
-                partition_guid in PRECIOUS_GPT_GUIDS
-                or required
-                or "used_blocks" in partition
-                or "available_blocks" in partition
-            ):
-                run_responses[
-                    f"df -B 512 /dev/{partition_name} --output=used,avail"
-                ] = _completed_process_spec(
-                    stdout=build_df_output(
-                        int(partition.get("used_blocks", 0)),
-                        int(partition.get("available_blocks", 0)),
-                    )
-                )
+        fixture.add_device(disk_name, {}, payload=_blk_table_bytes(table, partitions, disk))
 
-            if partition_guid in PRECIOUS_GPT_GUIDS or required:
-                continue
-
-            run_responses[
-                f"dd if=/dev/{partition_name} of=/dev/null bs=1M count=1"
-            ] = build_run_result_from_outcome(partition.get("block_read", "pass"))
-            partition_write_cfg = partition.get("write_check") or partition
-            _add_blk_write_check_run_responses(
-                run_responses,
-                partition_name,
-                partition_write_cfg,
-            )
-            state, rules = _build_blk_write_check_stateful_rules(
-                partition_name,
-                partition_write_cfg,
-            )
-            stateful_state.update(state)
-            stateful_rules.extend(rules)
-
-    run_responses["lsblk -e 7 -d -n -o NAME,TYPE"] = _completed_process_spec(
-        stdout=_join_stdout_lines(disk_listing_lines)
-    )
-
-    run_mock_spec: dict[str, Any] = {
-        "factory": run_router,
-        "kwargs": {
-            "responses": run_responses,
-            "default_returncode": 1,
-            "use_contains": False,
-            "unmatched_stderr_template": "UNMOCKED COMMAND: {cmd}\n",
-            "call_log_path": call_log_path,
-        },
-    }
-    if stateful_rules:
-        run_mock_spec = {
-            "factory": stateful_run_router,
-            "kwargs": {
-                "state": stateful_state,
-                "rules": stateful_rules,
-                "responses": run_responses,
-                "default_returncode": 1,
-                "use_contains": False,
-                "unmatched_stderr_template": "UNMOCKED COMMAND: {cmd}\n",
-                "call_log_path": call_log_path,
-            },
-        }
-
-    return {
-        "mocks": {
-            "{module}.input_with_timeout": {"return_value": prompt_response},
-            "subprocess.run": run_mock_spec,
-        },
-    }
+    return fixture.build("no" if prompt == "timeout" else prompt)
 
 
 def build_blk_write_check_scenario_case(
     scenario: dict[str, Any],
     work_dir: Path,
 ) -> dict[str, Any]:
-    """Build runtime mocks for direct perform_write_check scenarios."""
+    """Build the device node and mocks for direct perform_write_check scenarios."""
     device = scenario.get("device") or scenario.get("partition_label")
     if not isinstance(device, str) or not device.strip():
         raise ConfigError("blk_write_check requires string key 'device'")
@@ -1113,47 +548,11 @@ def build_blk_write_check_scenario_case(
         raise ConfigError("blk_write_check.precious_parts must be a mapping")
 
     prompt = _normalize_prompt_response(scenario.get("prompt", "no"))
-    prompt_result = "no" if prompt == "timeout" else prompt
-    call_log_path = str(work_dir / "blk_commands.log")
-    run_responses: dict[str, Any] = {}
-    _add_blk_write_check_run_responses(run_responses, device, scenario)
-    state, rules = _build_blk_write_check_stateful_rules(device, scenario)
-    if not rules:
-        return {
-            "args": [device, partition_id, precious_parts],
-            "mocks": {
-                "{module}.input_with_timeout": {"return_value": prompt_result},
-                "subprocess.run": {
-                    "factory": run_router,
-                    "kwargs": {
-                        "responses": run_responses,
-                        "default_returncode": 1,
-                        "use_contains": False,
-                        "unmatched_stderr_template": "UNMOCKED COMMAND: {cmd}\n",
-                        "call_log_path": call_log_path,
-                    },
-                },
-            },
-        }
-
-    return {
-        "args": [device, partition_id, precious_parts],
-        "mocks": {
-            "{module}.input_with_timeout": {"return_value": prompt_result},
-            "subprocess.run": {
-                "factory": stateful_run_router,
-                "kwargs": {
-                    "state": state,
-                    "rules": rules,
-                    "responses": run_responses,
-                    "default_returncode": 1,
-                    "use_contains": False,
-                    "unmatched_stderr_template": "UNMOCKED COMMAND: {cmd}\n",
-                    "call_log_path": call_log_path,
-                },
-            },
-        },
-    }
+    fixture = _BlkFixture(work_dir)
+    fixture.add_device(device, scenario)
+    generated = fixture.build("no" if prompt == "timeout" else prompt)
+    generated["args"] = [device, partition_id, precious_parts]
+    return generated
 
 
 def _ensure_string_list(value: Any, field_name: str) -> list[str]:
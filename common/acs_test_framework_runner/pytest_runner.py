@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import argparse
+import json
+import multiprocessing
+import os
 import shutil
 import subprocess
 import sys
+import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -75,6 +81,9 @@ PROJECT_ROOT = detect_project_root(SCRIPT_DIR)
 HARNESS_DIR = PROJECT_ROOT / "common" / "acs_test_framework_runner"
 TEST_YAML_DIR = PROJECT_ROOT / "common" / "acs_test_framework_manifests"
 REPORTS_DIR = PROJECT_ROOT / "common" / "reports"
+# Case durations from earlier runs, used to start the slowest cases first.
+# Kept outside _work/ so that it survives cleanup_old_pytest_xml_reports().
+CASE_DURATIONS_FILE = REPORTS_DIR / "case_durations.json"
 SUPPORTED_SUFFIXES = {".yaml", ".yml"}
 IN_PROCESS_CASE_TYPES = {"py_function", "module_main_with_env", "module_cli"}
 
@@ -104,13 +113,216 @@ def get_file_work_dir(suite_name: str, file_entry: str) -> Path:
     )
 
 
-def requires_serial_case_execution(suite_cases: list[dict[str, Any]]) -> bool:
-    return any(
-        str(case_def.get("type", "cli")) in IN_PROCESS_CASE_TYPES
-        for case_def in suite_cases
+def requires_process_isolation(case_def: dict[str, Any]) -> bool:
+    return str(case_def.get("type", "cli")) in IN_PROCESS_CASE_TYPES
+
+
+class CaseWorkerPool:
+    """Worker processes for suites that contain in-process cases.
+
+    py_function and module_* checks chdir, replace os.environ, redirect
+    stdout and patch module attributes for the whole process, so two of them
+    cannot run in one process at the same time. Each worker runs one case at
+    a time in its own process instead. The workers are shared by every YAML
+    group of the run.
+
+    start() forks all workers at once. Call it before any runner thread
+    exists: a worker forked while another thread holds a lock (stdout, the
+    import lock, the log lock) inherits that lock held and hangs.
+    """
+
+    def __init__(self, jobs: int) -> None:
+        self.jobs = jobs
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def available(self) -> bool:
+        return self.jobs > 1 and "fork" in multiprocessing.get_all_start_methods()
+
+    def start(self) -> None:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.jobs,
+                mp_context=multiprocessing.get_context("fork"),
+            )
+            # With the fork start method the first submit() launches every worker.
+            self._executor.submit(os.getpid).result()
+
+    def submit(self, *args: Any):
+        self.start()
+        return self._executor.submit(run_case_in_worker, *args)
+
+    def reset(self) -> None:
+        """Drop a pool whose worker died; the next start() forks new workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def run_case_in_worker(
+    suite_name: str,
+    file_entry: str,
+    case_index: int,
+    case_def: dict[str, Any],
+    options: RunCaseOptions | None = None,
+) -> TestOutcome:
+    """Worker task: run one case, then restore the worker's cwd and environment."""
+    original_cwd = os.getcwd()
+    original_env = os.environ.copy()
+    try:
+        return run_case(suite_name, file_entry, case_index, case_def, options)
+    finally:
+        os.chdir(original_cwd)
+        os.environ.clear()
+        os.environ.update(original_env)
+
+
+@dataclass
+class CaseWorkItem:
+    """One case of one target file, as scheduled across all selected groups."""
+
+    group_index: int
+    slot: int
+    duration_key: str
+    suite_name: str
+    file_entry: str
+    case_index: int
+    case_def: dict[str, Any]
+    options: RunCaseOptions
+    expected_sec: float = 0.0
+
+    @property
+    def in_process(self) -> bool:
+        return requires_process_isolation(self.case_def)
+
+    @property
+    def serial(self) -> bool:
+        return bool(self.case_def.get("serial", False))
+
+
+@dataclass
+class GroupRun:
+    """Outcome slots of one YAML group, filled in as its cases finish."""
+
+    group_name: str
+    yaml_file: Path
+    xml_report: Path
+    outcomes: list[TestOutcome | None] = field(default_factory=list)
+    items: list[CaseWorkItem] = field(default_factory=list)
+
+
+def load_case_durations() -> dict[str, float]:
+    try:
+        data = json.loads(CASE_DURATIONS_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        str(key): float(value)
+        for key, value in data.items()
+        if isinstance(value, (int, float))
+    }
+
+
+def save_case_durations(
+    durations: dict[str, float],
+    measured: dict[str, float],
+) -> None:
+    merged = dict(durations)
+    merged.update({key: round(value, 3) for key, value in measured.items()})
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    CASE_DURATIONS_FILE.write_text(
+        json.dumps(merged, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
     )
 
 
+def order_longest_first(
+    items: list[CaseWorkItem],
+    durations: dict[str, float],
+) -> list[CaseWorkItem]:
+    """Longest-processing-time-first order, from the durations of earlier runs.
+
+    Cases without a recorded duration are expected to take the mean of the
+    recorded ones. Ties keep manifest order.
+    """
+    known = [durations[item.duration_key] for item in items if item.duration_key in durations]
+    default = sum(known) / len(known) if known else 0.0
+    for item in items:
+        item.expected_sec = durations.get(item.duration_key, default)
+    return sorted(items, key=lambda item: -item.expected_sec)
+
+
+def run_work_item(
+    item: CaseWorkItem,
+    worker_pool: CaseWorkerPool | None = None,
+) -> tuple[TestOutcome, float]:
+    started = time.monotonic()
+    args = (item.suite_name, item.file_entry, item.case_index, item.case_def, item.options)
+    if worker_pool is not None:
+        outcome = worker_pool.submit(*args).result()
+    else:
+        outcome = run_case(*args)
+    return outcome, time.monotonic() - started
+
+
+def run_work_items(
+    items: list[CaseWorkItem],
+    jobs: int,
+    worker_pool: CaseWorkerPool | None = None,
+) -> dict[tuple[int, int], tuple[TestOutcome, float]]:
+    """Run cases on `jobs` slots in the given order; results keyed by (group_index, slot).
+
+    cli cases run on runner threads. In-process cases run in the worker pool,
+    each submitted from a runner thread so that no more than `jobs` cases run
+    at once. Cases with ``serial: true``, in-process cases when the pool is
+    not available and cases whose worker process died run afterwards in this
+    process, one at a time and in manifest order.
+    """
+    results: dict[tuple[int, int], tuple[TestOutcome, float]] = {}
+    use_pool = jobs > 1 and worker_pool is not None and worker_pool.available
+    deferred: list[CaseWorkItem] = []
+    parallel: list[CaseWorkItem] = []
+    for item in items:
+        if jobs <= 1 or item.serial or (item.in_process and not use_pool):
+            deferred.append(item)
+        else:
+            parallel.append(item)
+
+    broken = False
+    if use_pool and any(item.in_process for item in parallel):
+        worker_pool.start()
+    if parallel:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            future_map = {
+                executor.submit(
+                    run_work_item,
+                    item,
+                    worker_pool if item.in_process else None,
+                ): item
+                for item in parallel
+            }
+            for future in as_completed(future_map):
+                item = future_map[future]
+                try:
+                    results[(item.group_index, item.slot)] = future.result()
+                except BrokenProcessPool:
+                    broken = True
+                    deferred.append(item)
+    if broken and worker_pool is not None:
+        worker_pool.reset()
+
+    for item in sorted(deferred, key=lambda entry: (entry.group_index, entry.slot)):
+        results[(item.group_index, item.slot)] = run_work_item(item)
+    return results
+
+
 def run_case(
     suite_name: str,
     file_entry: str,
@@ -393,15 +605,17 @@ def select_yaml_runs_for_target(
 
 
 
-def run_yaml(
+def plan_yaml_group(
     yaml_file: Path,
     selected_targets: set[str],
-    jobs: int = 4,
-) -> int:
+    group_index: int = 0,
+) -> GroupRun:
+    """Load one YAML group and prepare its work directories and case work items."""
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
     group_name = get_group_name(yaml_file)
     xml_report = build_report_path(group_name, yaml_file)
+    group = GroupRun(group_name=group_name, yaml_file=yaml_file, xml_report=xml_report)
 
     print(f"\n[INFO] Running group : {group_name}")
     print(
@@ -417,16 +631,14 @@ def run_yaml(
         config = load_yaml_config(yaml_file)
         suites = normalize_suites(config)
     except ConfigError as exc:
-        outcome = build_config_error_outcome(
-            yaml_file=yaml_file,
-            message=format_outcome_message("Configuration error", str(exc)),
-            details=traceback.format_exc(),
+        group.outcomes.append(
+            build_config_error_outcome(
+                yaml_file=yaml_file,
+                message=format_outcome_message("Configuration error", str(exc)),
+                details=traceback.format_exc(),
+            )
         )
-        write_junit_xml(xml_report, group_name, yaml_file, [outcome])
-        print_group_summary(group_name, [outcome], xml_report)
-        return 1
-
-    outcomes: list[TestOutcome] = []
+        return group
 
     for suite_index, suite in enumerate(suites, start=1):
         suite_name = suite["name"]
@@ -448,7 +660,7 @@ def run_yaml(
         print(f"[INFO] Suite         : {suite_name}")
 
         if not suite_cases:
-            outcomes.append(
+            group.outcomes.append(
                 create_outcome(
                     testcase_name=f"{suite_name}::no_cases",
                     file_path="",
@@ -481,53 +693,76 @@ def run_yaml(
                 targets=[file_entry],
             )
 
-            case_jobs = list(enumerate(suite_cases, start=1))
-            file_jobs = 1 if requires_serial_case_execution(suite_cases) else jobs
-
-            if file_jobs <= 1:
-                for case_index, case_def in case_jobs:
-                    outcomes.append(
-                        run_case(
-                            suite_name=suite_name,
-                            file_entry=file_entry,
-                            case_index=case_index,
-                            case_def=case_def,
-                            options=run_case_options,
-                        )
+            for case_index, case_def in enumerate(suite_cases, start=1):
+                case_name = case_def["name"].strip()
+                group.items.append(
+                    CaseWorkItem(
+                        group_index=group_index,
+                        slot=len(group.outcomes),
+                        duration_key=(
+                            f"{group_name}::{suite_name}::"
+                            f"{Path(file_entry).name}::{case_name}"
+                        ),
+                        suite_name=suite_name,
+                        file_entry=file_entry,
+                        case_index=case_index,
+                        case_def=case_def,
+                        options=run_case_options,
                     )
-            else:
-                case_results: list[tuple[int, TestOutcome]] = []
-                with ThreadPoolExecutor(max_workers=file_jobs) as executor:
-                    future_map = {
-                        executor.submit(
-                            run_case,
-                            suite_name,
-                            file_entry,
-                            case_index,
-                            case_def,
-                            run_case_options,
-                        ): case_index
-                        for case_index, case_def in case_jobs
-                    }
-                    for future in as_completed(future_map):
-                        case_index = future_map[future]
-                        case_results.append((case_index, future.result()))
-
-                for _case_index, outcome in sorted(
-                    case_results,
-                    key=lambda item: item[0],
-                ):
-                    outcomes.append(outcome)
+                )
+                group.outcomes.append(None)
+
+    return group
+
 
+def report_yaml_group(group: GroupRun) -> int:
+    outcomes = [outcome for outcome in group.outcomes if outcome is not None]
     if not outcomes:
         return 0
 
-    write_junit_xml(xml_report, group_name, yaml_file, outcomes)
-    print_group_summary(group_name, outcomes, xml_report)
+    write_junit_xml(group.xml_report, group.group_name, group.yaml_file, outcomes)
+    print_group_summary(group.group_name, outcomes, group.xml_report)
 
     return 0 if all(item.passed or item.skipped or item.warning for item in outcomes) else 1
 
 
+def run_yaml_groups(
+    selected_runs: list[tuple[Path, set[str]]],
+    jobs: int = 4,
+    worker_pool: CaseWorkerPool | None = None,
+) -> int:
+    """Run the cases of all selected groups through one scheduler.
+
+    Every case of every group goes into a single queue, slowest first by the
+    durations recorded in CASE_DURATIONS_FILE, so a group with a few long
+    cases no longer holds back the groups after it. Outcomes are put back in
+    manifest order and each group still gets its own JUnit XML report.
+    """
+    groups = [
+        plan_yaml_group(yaml_file, selected_targets, group_index)
+        for group_index, (yaml_file, selected_targets) in enumerate(selected_runs)
+    ]
+    items = [item for group in groups for item in group.items]
+
+    durations = load_case_durations()
+    results = run_work_items(order_longest_first(items, durations), jobs, worker_pool)
+
+    measured: dict[str, float] = {}
+    for item in items:
+        outcome, elapsed = results[(item.group_index, item.slot)]
+        groups[item.group_index].outcomes[item.slot] = outcome
+        measured[item.duration_key] = elapsed
+    if measured:
+        save_case_durations(durations, measured)
+
+    overall_exit_code = 0
+    for group in groups:
+        exit_code = report_yaml_group(group)
+        if exit_code != 0:
+            overall_exit_code = exit_code
+    return overall_exit_code
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Run YAML-driven tests for impacted files or a manual target."
@@ -609,15 +844,15 @@ def main() -> int:
         for target in sorted(selected_targets):
             print(f"      * target: {target}")
 
-    overall_exit_code = 0
-    for yaml_file, selected_targets in selected_runs:
-        exit_code = run_yaml(
-            yaml_file,
-            selected_targets=selected_targets,
+    worker_pool = CaseWorkerPool(jobs)
+    try:
+        overall_exit_code = run_yaml_groups(
+            selected_runs,
             jobs=jobs,
+            worker_pool=worker_pool,
         )
-        if exit_code != 0:
-            overall_exit_code = exit_code
+    finally:
+        worker_pool.shutdown()
 
     print("\n[INFO] Custom YAML test execution completed.")
     print(
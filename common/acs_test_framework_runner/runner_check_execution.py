@@ -39,6 +39,7 @@ try:  # Support package imports and direct harness module loading.
         load_module_from_path,
         normalize_completed_stream,
         read_source,
+        release_module,
         sanitize_xml_text,
     )
 except ImportError:  # pragma: no cover - exercised by flat-module harness imports.
@@ -66,6 +67,7 @@ except ImportError:  # pragma: no cover - exercised by flat-module harness impor
         load_module_from_path,
         normalize_completed_stream,
         read_source,
+        release_module,
         sanitize_xml_text,
     )
 
@@ -412,7 +414,6 @@ def check_py_function(
     work_dir: Path,
 ) -> tuple[bool, str, str, bool]:
     module = load_module_from_path(file_path)
-    module_name = module.__name__
     stdout_buffer = io.StringIO()
     stderr_buffer = io.StringIO()
     original_cwd = Path.cwd()
@@ -567,7 +568,7 @@ def check_py_function(
         details = sanitize_xml_text("\n".join(details_lines).strip())
         return final_passed, sanitize_xml_text(final_message), details, is_error
     finally:
-        sys.modules.pop(module_name, None)
+        release_module(module)
 
 
 def check_module_main_with_env(
@@ -696,7 +697,7 @@ def check_module_main_with_env(
 
     finally:
         if module is not None:
-            sys.modules.pop(module.__name__, None)
+            release_module(module)
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
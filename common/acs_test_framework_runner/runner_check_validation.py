@@ -186,6 +186,10 @@ def validate_common_case_controls(case_def: dict[str, Any], field_name: str) ->
     if warn_only is not None and not isinstance(warn_only, bool):
         raise ConfigError(f"{field_name}.warn_only must be a boolean")
 
+    serial = case_def.get("serial")
+    if serial is not None and not isinstance(serial, bool):
+        raise ConfigError(f"{field_name}.serial must be a boolean")
+
 
 def validate_mock_spec(spec: Any, field_name: str) -> None:
     """Validate one mocks.<target> spec conservatively."""
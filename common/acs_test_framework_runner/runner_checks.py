@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import copy
 import importlib.util
 import re
 import subprocess
@@ -246,7 +247,57 @@ def build_runner_module_name(file_path: Path) -> str:
     return f"runner_module_{sanitize_name(file_path.stem)}_{uuid4().hex}"
 
 
-def load_module_from_path(file_path: Path) -> Any:
+# A module's bindings right after import, and one deep copy of the contents
+# of every module-level container among them.
+GlobalsSnapshot = tuple[dict[str, Any], dict[str, Any]]
+
+# Modules imported by load_module_from_path(), keyed by resolved path:
+# (mtime_ns, size) of the file, the module, and its globals right after import.
+_MODULE_CACHE: dict[Path, tuple[tuple[int, int], Any, GlobalsSnapshot]] = {}
+
+_CONTAINER_TYPES = (dict, list, set, bytearray)
+
+
+def _snapshot_globals(namespace: dict[str, Any]) -> GlobalsSnapshot | None:
+    # Containers are restored so that a case appending to a module-level list
+    # or dict does not leak into the next case. Everything else (functions,
+    # classes, modules, compiled patterns) is shared. All containers are copied
+    # in one go so that two names bound to the same container still share it.
+    bindings = dict(namespace)
+    containers = {
+        name: value
+        for name, value in bindings.items()
+        if not name.startswith("__") and isinstance(value, _CONTAINER_TYPES)
+    }
+    try:
+        return bindings, copy.deepcopy(containers)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
+def _restore_globals(namespace: dict[str, Any], snapshot: GlobalsSnapshot) -> None:
+    # Containers are refilled in place rather than rebound: objects built at
+    # import time (a Jinja2 DictLoader, a default argument) keep referring to
+    # the original container. The memo maps each saved container back to the
+    # original, so a container nested in another one is restored as itself.
+    bindings, pristine = snapshot
+    memo = {id(saved): bindings[name] for name, saved in pristine.items()}
+    contents = {
+        name: copy.deepcopy(list(saved.items()) if isinstance(saved, dict) else list(saved), memo)
+        for name, saved in pristine.items()
+    }
+    namespace.clear()
+    namespace.update(bindings)
+    for name, items in contents.items():
+        target = bindings[name]
+        if isinstance(target, (dict, set)):
+            target.clear()
+            target.update(items)
+        else:
+            target[:] = items
+
+
+def _execute_module(file_path: Path) -> Any:
     module_name = build_runner_module_name(file_path)
     spec = importlib.util.spec_from_file_location(
         module_name,
@@ -264,6 +315,58 @@ def load_module_from_path(file_path: Path) -> Any:
     return module
 
 
+def load_module_from_path(file_path: Path, use_cache: bool = True) -> Any:
+    """Import file_path under a unique name registered in sys.modules.
+
+    The module's top-level code runs once per process: later calls return
+    the same module object, and release_module() puts its globals back to
+    how they were right after the import. The cached module is dropped when
+    the file's mtime or size changes. use_cache=False always imports afresh,
+    and so does every call for a module whose globals cannot be deep-copied.
+    """
+    if not use_cache:
+        return _execute_module(file_path)
+
+    cache_key = file_path.resolve()
+    stat = cache_key.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _MODULE_CACHE.get(cache_key)
+    if cached is not None:
+        if cached[0] == stamp:
+            return cached[1]
+        invalidate_module_cache(cache_key)
+
+    module = _execute_module(file_path)
+    snapshot = _snapshot_globals(vars(module))
+    if snapshot is not None:
+        _MODULE_CACHE[cache_key] = (stamp, module, snapshot)
+    return module
+
+
+def release_module(module: Any) -> None:
+    """Hand back a module from load_module_from_path() at the end of a case."""
+    for cache_key, (_stamp, cached_module, snapshot) in _MODULE_CACHE.items():
+        if cached_module is module:
+            try:
+                # Restore in place: the module's functions keep this dict as
+                # their __globals__.
+                _restore_globals(vars(module), snapshot)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # The next load imports the module afresh instead.
+                invalidate_module_cache(cache_key)
+            return
+    sys.modules.pop(module.__name__, None)
+
+
+def invalidate_module_cache(file_path: Path | None = None) -> None:
+    """Drop the cached module for file_path, or every cached module."""
+    keys = list(_MODULE_CACHE) if file_path is None else [file_path.resolve()]
+    for cache_key in keys:
+        cached = _MODULE_CACHE.pop(cache_key, None)
+        if cached is not None:
+            sys.modules.pop(cached[1].__name__, None)
+
+
 def normalize_completed_stream(stream: Any) -> str:
     if stream is None:
         return ""
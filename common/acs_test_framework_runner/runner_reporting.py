@@ -168,10 +168,12 @@ def append_combined_case_log(
         description=description,
     )
 
+    entry = ("\n".join(lines).rstrip() + "\n\n").encode("utf-8")
+    # One unbuffered write per entry: cases run in worker processes append to
+    # the same file, and O_APPEND keeps a single write() in one piece.
     with LOG_WRITE_LOCK:
-        with log_path.open("a", encoding="utf-8") as handle:
-            handle.write("\n".join(lines).rstrip())
-            handle.write("\n\n")
+        with log_path.open("ab", buffering=0) as handle:
+            handle.write(entry)
 
 
 def write_case_log(
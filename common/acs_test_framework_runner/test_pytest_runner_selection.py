@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -27,6 +28,7 @@ runner_reporting = load_harness_module(
     "yaml_harness_runner_reporting",
     "runner_reporting.py",
 )
+runner_checks = load_harness_module("yaml_harness_runner_checks", "runner_checks.py")
 
 
 def test_harness_sources_changed_ignores_pycache() -> None:
@@ -206,3 +208,150 @@ def test_collect_pytest_case_logs_skips_missing_case_description(
         ]
     finally:
         shutil.rmtree(temp_path, ignore_errors=True)
+
+
+def _work_items(cases: list[dict], group_index: int = 0) -> list:
+    return [
+        pytest_runner.CaseWorkItem(
+            group_index=group_index,
+            slot=slot,
+            duration_key=f"group::suite::target.py::{case_def['name']}",
+            suite_name="suite",
+            file_entry="target.py",
+            case_index=slot + 1,
+            case_def=case_def,
+            options=pytest_runner.RunCaseOptions(),
+        )
+        for slot, case_def in enumerate(cases)
+    ]
+
+
+def _fake_worker_run_case(_suite_name, _file_entry, case_index, case_def, _options=None):
+    leaked = os.environ.get("CASE_POOL_TEST_LEAK")
+    os.environ["CASE_POOL_TEST_LEAK"] = str(case_index)
+    os.chdir(case_def["chdir"])
+    return (case_index, os.getpid(), leaked)
+
+
+def test_worker_pool_isolates_in_process_cases(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(pytest_runner, "run_case", _fake_worker_run_case)
+    monkeypatch.delenv("CASE_POOL_TEST_LEAK", raising=False)
+    original_cwd = os.getcwd()
+    items = _work_items(
+        [
+            {"name": f"case{index}", "type": "py_function", "chdir": str(tmp_path),
+             "serial": index == 3}
+            for index in range(1, 7)
+        ]
+    )
+    pool = pytest_runner.CaseWorkerPool(2)
+    try:
+        results = pytest_runner.run_work_items(items, 2, pool)
+    finally:
+        pool.shutdown()
+        os.chdir(original_cwd)
+
+    outcomes = [results[(0, slot)][0] for slot in range(6)]
+    assert [index for index, _pid, _leaked in outcomes] == [1, 2, 3, 4, 5, 6]
+    pids = {index: pid for index, pid, _leaked in outcomes}
+    assert pids[3] == os.getpid()
+    assert all(pids[index] != os.getpid() for index in (1, 2, 4, 5, 6))
+    assert all(leaked is None for index, _pid, leaked in outcomes if index != 3)
+
+
+def _fake_dying_run_case(_suite_name, _file_entry, case_index, case_def, _options=None):
+    if case_index == 2 and os.getpid() != case_def["main_pid"]:
+        os._exit(1)
+    return (case_index, os.getpid())
+
+
+def test_worker_pool_reruns_cases_of_a_dead_worker_in_process(monkeypatch) -> None:
+    monkeypatch.setattr(pytest_runner, "run_case", _fake_dying_run_case)
+    items = _work_items(
+        [{"name": f"case{index}", "type": "module_cli", "main_pid": os.getpid()}
+         for index in (1, 2, 3)]
+    )
+    pool = pytest_runner.CaseWorkerPool(2)
+    try:
+        results = pytest_runner.run_work_items(items, 2, pool)
+        assert sorted(results) == [(0, 0), (0, 1), (0, 2)]
+        assert results[(0, 1)][0] == (2, os.getpid())
+        # A fresh set of workers is forked for the cases that follow.
+        again = pytest_runner.run_work_items(items[:1], 2, pool)
+        assert again[(0, 0)][0][1] != os.getpid()
+    finally:
+        pool.shutdown()
+
+
+def test_order_longest_first_uses_recorded_durations(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(pytest_runner, "CASE_DURATIONS_FILE", tmp_path / "durations.json")
+    monkeypatch.setattr(pytest_runner, "REPORTS_DIR", tmp_path)
+    items = _work_items([{"name": name} for name in ("quick", "new", "slow", "medium")])
+    pytest_runner.save_case_durations(
+        {"other::case": 9.0},
+        {
+            "group::suite::target.py::quick": 1.0,
+            "group::suite::target.py::slow": 7.0,
+            "group::suite::target.py::medium": 4.0,
+        },
+    )
+    durations = pytest_runner.load_case_durations()
+    assert durations["other::case"] == 9.0
+
+    ordered = pytest_runner.order_longest_first(items, durations)
+
+    # "new" has no recorded duration and is expected to take the mean (4.0);
+    # it keeps its manifest position relative to "medium".
+    assert [item.case_def["name"] for item in ordered] == ["slow", "new", "medium", "quick"]
+
+
+def test_run_work_items_fills_slots_across_groups(monkeypatch) -> None:
+    monkeypatch.setattr(
+        pytest_runner,
+        "run_case",
+        lambda suite_name, file_entry, case_index, case_def, options=None: case_def["name"],
+    )
+    items = _work_items([{"name": "a0"}, {"name": "a1"}], group_index=0)
+    items += _work_items([{"name": "b0"}], group_index=1)
+
+    results = pytest_runner.run_work_items(list(reversed(items)), 4)
+
+    assert {key: value[0] for key, value in results.items()} == {
+        (0, 0): "a0",
+        (0, 1): "a1",
+        (1, 0): "b0",
+    }
+
+
+def test_load_module_from_path_reuses_module_with_pristine_globals(tmp_path) -> None:
+    target = tmp_path / "target_module.py"
+    target.write_text(
+        "import os\nLOADS = []\nLOADS.append(1)\nLIMIT = 3\n"
+        "def limit():\n    return LIMIT\n",
+        encoding="utf-8",
+    )
+    try:
+        module = runner_checks.load_module_from_path(target)
+        module.LOADS.append(2)
+        module.LIMIT = 10
+        module.EXTRA = True
+        assert module.limit() == 10
+        runner_checks.release_module(module)
+
+        again = runner_checks.load_module_from_path(target)
+        assert again is module
+        assert again.__name__ in sys.modules
+        assert again.LOADS == [1]
+        assert again.limit() == 3
+        assert not hasattr(again, "EXTRA")
+        assert again.os is os
+        runner_checks.release_module(again)
+
+        target.write_text("LOADS = ['edited']\n", encoding="utf-8")
+        os.utime(target, ns=(1, 1))
+        edited = runner_checks.load_module_from_path(target)
+        assert edited is not module
+        assert edited.LOADS == ["edited"]
+        assert module.__name__ not in sys.modules
+    finally:
+        runner_checks.invalidate_module_cache()
@@ -19,14 +19,29 @@
 The script detects block devices, identifies MBR/GPT/raw devices, skips known
 precious partitions, performs a block read test, and optionally performs a
 single-block write/restore verification on non-precious partitions.
+
+All device access happens in-process: disks and partitions are found through
+sysfs, partition tables are parsed from the first sectors of the disk, block
+I/O uses os.pread/os.pwrite (optionally with O_DIRECT), and mount state comes
+from /proc/self/mountinfo.  The /dev, /sys/block and mountinfo locations are
+module constants, so the checks also run against plain image files or loop
+devices.
+
+Usage: read_write_check_blk_devices.py [--direct] [DISK ...]
 """
 
+import argparse
+import errno
 import hashlib
+import mmap
 import os
 import re
-import subprocess
+import stat
+import struct
 import sys
 import threading
+import uuid
+import zlib
 
 
 # Precious partitions dictionary. This is a set of partition types that might
@@ -50,15 +65,169 @@ SEPARATOR = (
     "\n"
 )
 
+# Device nodes, sysfs block directory and mount table. Messages always name
+# /dev/<device>, whatever DEV_DIR is, because the log parser matches on it.
+DEV_DIR = "/dev"
+SYS_BLOCK_DIR = "/sys/block"
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+SECTOR_SIZE = 512
+READ_TEST_SIZE = 1024 * 1024
+# Buffer, offset and length alignment for O_DIRECT; covers 512e and 4Kn disks.
+DIRECT_IO_ALIGNMENT = 4096
+# Set by --direct: bypass the page cache for all block I/O.
+USE_DIRECT_IO = False
+
+LOOP_MAJOR = 7
+SCSI_ROM_TYPE = "5"
+HELLO_BLOCK = b"Hello!".ljust(SECTOR_SIZE, b"\x00")
+
+MBR_SIGNATURE = b"\x55\xaa"
+MBR_PARTITION = struct.Struct("<B3sB3sII")
+MBR_PROTECTIVE_TYPE = 0xEE
+MBR_EXTENDED_TYPES = {0x05, 0x0F, 0x85}
+MBR_MAX_LOGICAL = 128
+
+GPT_SIGNATURE = b"EFI PART"
+GPT_HEADER = struct.Struct("<8sIIIIQQQQ16sQIII")
+GPT_ENTRY = struct.Struct("<16s16sQQQ")
+GPT_MAX_ENTRY_BYTES = 1024 * 1024
+
+
+class BlockFile:
+    """A block device (or image file) opened for positioned I/O.
+
+    Reads and writes go through os.pread/os.pwrite.  With direct=True the
+    file is opened with O_DIRECT where the filesystem supports it, and I/O
+    is done on DIRECT_IO_ALIGNMENT-aligned spans through an mmap buffer.
+    """
+
+    def __init__(self, path, writable=False, direct=None):
+        self.path = path
+        flags = (os.O_RDWR if writable else os.O_RDONLY) | getattr(os, "O_CLOEXEC", 0)
+        self.direct = USE_DIRECT_IO if direct is None else direct
+        o_direct = getattr(os, "O_DIRECT", 0)
+        if not o_direct:
+            self.direct = False
+        self.fd = None
+        if self.direct:
+            try:
+                self.fd = os.open(path, flags | o_direct)
+            except OSError as error:
+                if error.errno != errno.EINVAL:
+                    raise
+                # tmpfs and some other filesystems refuse O_DIRECT.
+                self.direct = False
+        if self.fd is None:
+            self.fd = os.open(path, flags)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def size(self):
+        """Return the device (or file) size in bytes."""
+        return os.lseek(self.fd, 0, os.SEEK_END)
+
+    def _aligned_span(self, offset, length):
+        start = offset - offset % DIRECT_IO_ALIGNMENT
+        end = -(-(offset + length) // DIRECT_IO_ALIGNMENT) * DIRECT_IO_ALIGNMENT
+        return start, end - start
+
+    def _read_direct(self, offset, length):
+        start, span = self._aligned_span(offset, length)
+        buffer = mmap.mmap(-1, span)
+        try:
+            count = os.preadv(self.fd, [buffer], start)
+            return bytes(buffer[offset - start:min(count, offset - start + length)])
+        finally:
+            buffer.close()
+
+    def read(self, offset, length):
+        """Read up to length bytes at offset; shorter only at end of device."""
+        if self.direct:
+            return self._read_direct(offset, length)
+        chunks = []
+        while length > 0:
+            chunk = os.pread(self.fd, length, offset)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            offset += len(chunk)
+            length -= len(chunk)
+        return b"".join(chunks)
+
+    def write(self, offset, data):
+        """Write data at offset and flush it to the device."""
+        if self.direct:
+            start, span = self._aligned_span(offset, len(data))
+            buffer = mmap.mmap(-1, span)
+            try:
+                count = os.preadv(self.fd, [buffer], start)
+                buffer[offset - start:offset - start + len(data)] = data
+                # The last span of an image file may end before the alignment.
+                expected = max(count, offset - start + len(data))
+                with memoryview(buffer)[:expected] as payload:
+                    written = os.pwritev(self.fd, [payload], start)
+            finally:
+                buffer.close()
+        else:
+            written = os.pwrite(self.fd, data, offset)
+            expected = len(data)
+        if written != expected:
+            raise OSError(errno.EIO, f"Short write on {self.path}")
+        os.fsync(self.fd)
+
+    def drop_cache(self):
+        """Ask the kernel to drop cached pages so the next read hits the device."""
+        if not self.direct and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(self.fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+class PartitionEntry:
+    """One partition table entry: its number and type (MBR id or GPT GUID)."""
+
+    __slots__ = ("number", "type_id", "attributes")
+
+    def __init__(self, number, type_id, attributes=0):
+        self.number = number
+        self.type_id = type_id
+        self.attributes = attributes
+
+
+def device_node(name):
+    """Return the path used to open a device by name."""
+    return os.path.join(DEV_DIR, name)
+
+
+def read_sysfs(*parts):
+    """Return the stripped contents of a sysfs attribute, or None."""
+    try:
+        with open(os.path.join(SYS_BLOCK_DIR, *parts), encoding="utf-8") as file_obj:
+            return file_obj.read().strip()
+    except OSError:
+        return None
 
-def run_command(command_args, check=False):
-    """Run a command and return the completed process."""
-    return subprocess.run(
-        command_args,
-        text=True,
-        check=check,
-        capture_output=True,
-    )
+
+def read_sector(block, offset, length=SECTOR_SIZE):
+    """Read exactly length bytes at offset."""
+    data = block.read(offset, length)
+    if len(data) != length:
+        raise OSError(errno.EIO, f"Short read on {block.path} at offset {offset}")
+    return data
+
+
+def read_back_block(block, offset):
+    """Read a block back from the device rather than the page cache."""
+    block.drop_cache()
+    return read_sector(block, offset)
 
 
 def input_with_timeout(prompt, timeout=5):
@@ -80,39 +249,83 @@ def input_with_timeout(prompt, timeout=5):
     return input_queue[0] if input_queue else "no"
 
 
-def calculate_sha256(file_path):
-    """Calculate and return the SHA256 checksum of a file."""
-    sha256_hash = hashlib.sha256()
+def calculate_sha256(data):
+    """Calculate and return the SHA256 checksum of a byte string."""
+    return hashlib.sha256(data).hexdigest()
 
-    with open(file_path, "rb") as file_obj:
-        for byte_block in iter(lambda: file_obj.read(4096), b""):
-            sha256_hash.update(byte_block)
 
-    return sha256_hash.hexdigest()
+def get_partition_space(partition_label):
+    """Return used and available 512-byte blocks for a partition, as df does.
 
+    Like `df /dev/<partition>`, this reports the mounted filesystem when the
+    partition is mounted and otherwise the filesystem holding the device node.
+    """
+    path = get_mount_point(partition_label) or device_node(partition_label)
+    try:
+        fs_stat = os.statvfs(path)
+    except OSError:
+        print(f"WARNING: Unable to parse partition space for /dev/{partition_label}.")
+        return 0, 0
 
-def get_partition_space(partition_path):
-    """Return used and available 512-byte blocks for a partition."""
-    command_result = run_command(
-        ["df", "-B", "512", partition_path, "--output=used,avail"],
-        check=True,
-    )
-    output_lines = command_result.stdout.strip().split("\n")
+    used_bytes = (fs_stat.f_blocks - fs_stat.f_bfree) * fs_stat.f_frsize
+    available_bytes = fs_stat.f_bavail * fs_stat.f_frsize
+    return -(-used_bytes // SECTOR_SIZE), -(-available_bytes // SECTOR_SIZE)
+
+
+def _unescape_mount_field(field):
+    # mountinfo escapes space, tab, newline and backslash as \ooo.
+    return re.sub(r"\\([0-7]{3})", lambda match: chr(int(match.group(1), 8)), field)
 
-    if len(output_lines) > 1:
-        fields = output_lines[1].split()
-        used_block_count = int(fields[0])
-        available_block_count = int(fields[1])
-        return used_block_count, available_block_count
 
-    print(f"WARNING: Unable to parse partition space for {partition_path}.")
-    return 0, 0
+def read_mountinfo():
+    """Return ((major, minor), source, mount_point) for each mount in MOUNTINFO_PATH."""
+    mounts = []
+    try:
+        with open(MOUNTINFO_PATH, encoding="utf-8", errors="replace") as file_obj:
+            lines = file_obj.readlines()
+    except OSError:
+        return mounts
+
+    for line in lines:
+        fields = line.split()
+        if " - " not in line or len(fields) < 5:
+            continue
+        major, _, minor = fields[2].partition(":")
+        post_fields = line.split(" - ", 1)[1].split()
+        source = _unescape_mount_field(post_fields[1]) if len(post_fields) > 1 else ""
+        try:
+            numbers = (int(major), int(minor))
+        except ValueError:
+            numbers = None
+        mounts.append((numbers, source, _unescape_mount_field(fields[4])))
+
+    return mounts
+
+
+def _device_numbers(device):
+    """Return (major, minor) of a device node, or None for regular files."""
+    try:
+        node_stat = os.stat(device_node(device))
+    except OSError:
+        return None
+    if not stat.S_ISBLK(node_stat.st_mode):
+        return None
+    return os.major(node_stat.st_rdev), os.minor(node_stat.st_rdev)
+
+
+def get_mount_point(device):
+    """Return where the device is mounted, or None if it is not mounted."""
+    numbers = _device_numbers(device)
+    sources = {f"/dev/{device}", device_node(device)}
+    for mount_numbers, source, mount_point in read_mountinfo():
+        if (numbers is not None and mount_numbers == numbers) or source in sources:
+            return mount_point
+    return None
 
 
 def is_mounted(device):
     """Return True if the given device is mounted."""
-    command_result = run_command(["findmnt", "-n", device])
-    return command_result.returncode == 0
+    return get_mount_point(device) is not None
 
 
 def is_mtd_block_device(device):
@@ -125,36 +338,23 @@ def is_ram_disk(device):
     return device.startswith("ram")
 
 
-def create_hello_file(file_path):
-    """Create a 512-byte test file and return its SHA256 checksum."""
-    hello_content = "Hello!".ljust(512, "\x00")
-
-    with open(file_path, "wb") as file_obj:
-        file_obj.write(hello_content.encode("utf-8"))
-
-    return calculate_sha256(file_path)
-
-
-def cleanup_files(file_paths):
-    """Remove temporary files if they exist."""
-    for file_path in file_paths:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-
-
-def restore_backup(partition_label, backup_filename, used_blocks):
+def restore_backup(partition_label, block, backup, offset):
     """Restore the backed-up block to the target partition."""
     print("INFO: Restoring the backup to the device after write check...")
-    run_command(["dd", f"if={backup_filename}", f"of=/dev/{partition_label}",
-                 "bs=512", "count=1", f"seek={used_blocks}"], check=True)
+    block.write(offset, backup)
     print(f"INFO: Backup restored for /dev/{partition_label}.")
 
 
 def perform_write_check(partition_label, partition_id, precious_parts):
-    """Optionally perform a single-block write/read/restore check."""
+    """Optionally perform a single-block write/read/restore check.
+
+    The test block goes at the sector after the used space reported by
+    get_partition_space().  The original contents are kept in memory and
+    written back even if the write or the read-back fails.
+    """
     device_path = f"/dev/{partition_label}"
 
-    if is_mounted(device_path):
+    if is_mounted(partition_label):
         print(f"INFO: {device_path} is mounted, skipping write test.")
         return
 
@@ -168,7 +368,7 @@ def perform_write_check(partition_label, partition_id, precious_parts):
     if user_input != "yes" or partition_id in precious_parts.values():
         return
 
-    used_blocks, available_blocks = get_partition_space(device_path)
+    used_blocks, available_blocks = get_partition_space(partition_label)
     if available_blocks <= 0:
         print(
             f"WARNING: No available space for write check on {device_path}. "
@@ -176,98 +376,253 @@ def perform_write_check(partition_label, partition_id, precious_parts):
         )
         return
 
-    hello_file = "hello.txt"
-    read_back_file = "read_hello.txt"
-    backup_filename = f"{partition_label}_backup.bin"
+    offset = used_blocks * SECTOR_SIZE
+    original_sha256 = calculate_sha256(HELLO_BLOCK)
 
-    original_sha256 = create_hello_file(hello_file)
+    with BlockFile(device_node(partition_label), writable=True) as block:
+        if offset + SECTOR_SIZE > block.size():
+            print(
+                f"WARNING: Block {used_blocks} is past the end of {device_path}. "
+                "Skipping write check."
+            )
+            return
 
-    print("INFO: Creating backup of the current block before write check...")
-    run_command(["dd", f"if={device_path}", f"of={backup_filename}",
-                 "bs=512", "count=1", f"skip={used_blocks}"], check=True)
+        print("INFO: Creating backup of the current block before write check...")
+        backup = read_sector(block, offset)
 
-    print("INFO: Writing test data to the device for write check...")
-    run_command(["dd", f"if={hello_file}", f"of={device_path}",
-                 "bs=512", "count=1", f"seek={used_blocks}"], check=True)
+        try:
+            print("INFO: Writing test data to the device for write check...")
+            block.write(offset, HELLO_BLOCK)
 
-    print("INFO: Reading back the test data for verification...")
-    run_command(["dd", f"if={device_path}", f"of={read_back_file}",
-                 "bs=512", "count=1", f"skip={used_blocks}"], check=True)
+            print("INFO: Reading back the test data for verification...")
+            read_back_sha256 = calculate_sha256(read_back_block(block, offset))
 
-    read_back_sha256 = calculate_sha256(read_back_file)
+            print(f"Original SHA256: {original_sha256}")
+            print(f"Read-back SHA256: {read_back_sha256}")
 
-    print(f"Original SHA256: {original_sha256}")
-    print(f"Read-back SHA256: {read_back_sha256}")
+            if original_sha256 == read_back_sha256:
+                print(f"INFO: write check passed on {device_path}.")
+            else:
+                print(f"INFO: write check failed on {device_path}.")
+                print(
+                    f"WARNING: Data integrity check failed for {device_path}. "
+                    "Possible data corruption."
+                )
+        finally:
+            restore_backup(partition_label, block, backup, offset)
 
-    if original_sha256 == read_back_sha256:
-        print(f"INFO: write check passed on {device_path}.")
-    else:
-        print(f"INFO: write check failed on {device_path}.")
-        print(
-            f"WARNING: Data integrity check failed for {device_path}. "
-            "Possible data corruption."
-        )
 
-    restore_backup(partition_label, backup_filename, used_blocks)
-    cleanup_files([hello_file, read_back_file, backup_filename])
+def _natural_key(name):
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
 
 
 def get_partition_labels(disk):
-    """Return partition labels from lsblk without relying on Unicode output."""
-    command_result = run_command(
-        ["lsblk", "-rn", "-o", "NAME,TYPE", f"/dev/{disk}"]
-    )
-    labels = []
+    """Return the disk's partitions from sysfs, ordered by partition number."""
+    try:
+        entries = os.listdir(os.path.join(SYS_BLOCK_DIR, disk))
+    except OSError:
+        return []
+
+    partitions = []
+    for entry in entries:
+        number = read_sysfs(disk, entry, "partition")
+        if number is not None and number.isdigit():
+            partitions.append((int(number), entry))
 
-    for line in command_result.stdout.splitlines():
-        columns = line.split()
-        if len(columns) >= 2 and columns[1] == "part":
-            labels.append(columns[0])
+    return [label for _, label in sorted(partitions)]
 
-    return labels
+
+def get_partition_numbers(disk, partition_labels):
+    """Return the partition table number of each partition label."""
+    return [int(read_sysfs(disk, label, "partition")) for label in partition_labels]
 
 
 def get_disks():
-    """Return detected disk block devices."""
-    command_result = run_command(
-        ["lsblk", "-e", "7", "-d", "-n", "-o", "NAME,TYPE"]
-    )
+    """Return detected disk block devices.
+
+    Matches `lsblk -e 7 -d`: loop devices, device-mapper/MD devices and
+    optical drives are left out.
+    """
+    try:
+        entries = os.listdir(SYS_BLOCK_DIR)
+    except OSError:
+        return []
+
     disks = []
+    for disk in entries:
+        if disk.startswith(("dm-", "md")):
+            continue
+        major = (read_sysfs(disk, "dev") or "").partition(":")[0]
+        if major == str(LOOP_MAJOR) or read_sysfs(disk, "device", "type") == SCSI_ROM_TYPE:
+            continue
+        disks.append(disk)
 
-    for line in command_result.stdout.splitlines():
-        columns = line.split()
-        if len(columns) >= 2 and columns[1] == "disk":
-            disks.append(columns[0])
+    return sorted(disks, key=_natural_key)
 
-    return disks
 
+def get_logical_block_size(disk):
+    """Return the disk's logical block size from sysfs (512 if unknown)."""
+    size = read_sysfs(disk, "queue", "logical_block_size")
+    return int(size) if size and size.isdigit() else SECTOR_SIZE
 
-def get_partition_table_type(disk):
-    """Return MBR, GPT, or RAW for the given disk."""
-    command_result = run_command(
-        ["timeout", "10", "gdisk", "-l", f"/dev/{disk}"]
-    )
 
-    if "MBR: MBR only" in command_result.stdout:
-        return "MBR"
+def parse_mbr(block):
+    """Return {number: PartitionEntry} for an MBR-only disk, or None.
+
+    Disks with a protective (0xEE) entry are left to parse_gpt(), as gdisk
+    does; logical partitions in an extended partition are numbered from 5.
+    """
+    sector = block.read(0, SECTOR_SIZE)
+    if len(sector) < SECTOR_SIZE or sector[510:512] != MBR_SIGNATURE:
+        return None
 
-    if "GPT: present" in command_result.stdout:
-        return "GPT"
+    primaries = [MBR_PARTITION.unpack_from(sector, 446 + 16 * index) for index in range(4)]
+    if any(boot not in (0x00, 0x80) for boot, *_ in primaries):
+        return None
+    if any(part_type == MBR_PROTECTIVE_TYPE for _, _, part_type, _, _, _ in primaries):
+        return None
 
-    print(f"INFO: No valid partition table found for {disk}, treating as raw device.")
-    return "RAW"
+    entries = {}
+    extended_start = None
+    for number, (_, _, part_type, _, start, sectors) in enumerate(primaries, start=1):
+        if part_type == 0 or sectors == 0:
+            continue
+        entries[number] = PartitionEntry(number, f"0x{part_type:X}")
+        if part_type in MBR_EXTENDED_TYPES and extended_start is None:
+            extended_start = start
 
+    if not entries:
+        return None
 
-def get_partition_count(disk):
-    """Return the number of partitions detected on the disk."""
-    return len(get_partition_labels(disk))
+    if extended_start is not None:
+        entries.update(_parse_mbr_logical(block, extended_start))
+
+    return entries
+
+
+def _parse_mbr_logical(block, extended_start):
+    """Walk the EBR chain of an extended partition."""
+    entries = {}
+    ebr_lba = extended_start
+    seen = set()
+    number = 5
+
+    while ebr_lba not in seen and len(seen) < MBR_MAX_LOGICAL:
+        seen.add(ebr_lba)
+        sector = block.read(ebr_lba * SECTOR_SIZE, SECTOR_SIZE)
+        if len(sector) < SECTOR_SIZE or sector[510:512] != MBR_SIGNATURE:
+            break
+
+        _, _, part_type, _, _, sectors = MBR_PARTITION.unpack_from(sector, 446)
+        if part_type != 0 and sectors != 0:
+            entries[number] = PartitionEntry(number, f"0x{part_type:X}")
+            number += 1
+
+        _, _, next_type, _, next_start, _ = MBR_PARTITION.unpack_from(sector, 462)
+        if next_type not in MBR_EXTENDED_TYPES or next_start == 0:
+            break
+        ebr_lba = extended_start + next_start
+
+    return entries
+
+
+def _read_gpt_header(block, lba, sector_size):
+    """Return the GPT header fields at lba if it is valid, else None."""
+    sector = block.read(lba * sector_size, sector_size)
+    if len(sector) < GPT_HEADER.size or sector[:8] != GPT_SIGNATURE:
+        return None
+
+    header = GPT_HEADER.unpack_from(sector)
+    header_size, header_crc = header[2], header[3]
+    if not GPT_HEADER.size <= header_size <= sector_size:
+        return None
+    check = bytearray(sector[:header_size])
+    check[16:20] = b"\x00\x00\x00\x00"
+    if zlib.crc32(check) != header_crc:
+        return None
+
+    return header
+
+
+def _read_gpt_entries(block, header, sector_size):
+    """Return {number: PartitionEntry} from the entry array of a GPT header."""
+    entries_lba, entry_count, entry_size, entries_crc = header[10:14]
+    array_size = entry_count * entry_size
+    if entry_size < 128 or array_size > GPT_MAX_ENTRY_BYTES:
+        return None
+
+    array = block.read(entries_lba * sector_size, array_size)
+    if len(array) != array_size or zlib.crc32(array) != entries_crc:
+        return None
+
+    entries = {}
+    for index in range(entry_count):
+        type_guid, _, _, _, attributes = GPT_ENTRY.unpack_from(array, index * entry_size)
+        if type_guid == bytes(16):
+            continue
+        type_id = str(uuid.UUID(bytes_le=type_guid)).upper()
+        entries[index + 1] = PartitionEntry(index + 1, type_id, attributes)
+
+    return entries
+
+
+def parse_gpt(block, sector_size):
+    """Return {number: PartitionEntry} for a GPT disk, or None.
+
+    The backup header at the end of the disk is used when the primary
+    header or its entry array is damaged.
+    """
+    primary = _read_gpt_header(block, 1, sector_size)
+    if primary is not None:
+        entries = _read_gpt_entries(block, primary, sector_size)
+        if entries is not None:
+            return entries
+
+    last_lba = block.size() // sector_size - 1
+    if last_lba <= 1:
+        return None
+    backup = _read_gpt_header(block, last_lba, sector_size)
+    if backup is None:
+        return None
+    return _read_gpt_entries(block, backup, sector_size)
+
+
+def get_partition_table(disk):
+    """Return ("MBR" | "GPT" | "RAW", {number: PartitionEntry}) for the disk."""
+    entries = None
+    table = "RAW"
+
+    try:
+        with BlockFile(device_node(disk)) as block:
+            sector_sizes = [get_logical_block_size(disk)]
+            sector_sizes += [size for size in (512, 4096) if size not in sector_sizes]
+            for sector_size in sector_sizes:
+                entries = parse_gpt(block, sector_size)
+                if entries is not None:
+                    table = "GPT"
+                    break
+            else:
+                entries = parse_mbr(block)
+                if entries is not None:
+                    table = "MBR"
+    except OSError:
+        entries = None
+
+    if entries is None:
+        print(f"INFO: No valid partition table found for {disk}, treating as raw device.")
+        return "RAW", {}
+
+    return table, entries
 
 
 def read_block(partition_label):
     """Perform a block read test for the given partition label."""
-    command_result = run_command(["dd", f"if=/dev/{partition_label}",
-                                  "of=/dev/null", "bs=1M", "count=1"])
-    return command_result.returncode == 0
+    try:
+        with BlockFile(device_node(partition_label)) as block:
+            block.read(0, READ_TEST_SIZE)
+    except OSError:
+        return False
+    return True
 
 
 def process_raw_device(disk):
@@ -284,33 +639,9 @@ def process_raw_device(disk):
     print(SEPARATOR)
 
 
-def parse_mbr_partition_ids(disk):
-    """Parse MBR partition IDs from fdisk output."""
-    table_header_row = [
-        "Device", "Boot", "Start", "End", "Sectors", "Size", "Id", "Type",
-    ]
-    command_result = run_command(["fdisk", "-l", f"/dev/{disk}"])
-    output_lines = command_result.stdout.strip().split("\n")
-    should_collect_lines = False
-    mbr_part_ids = []
-
-    for line in output_lines:
-        if should_collect_lines:
-            columns = line.split()
-            if len(columns) >= 6:
-                if columns[1] == "*" and len(columns) >= 7:
-                    mbr_part_ids.append("0x" + columns[6].upper())
-                else:
-                    mbr_part_ids.append("0x" + columns[5].upper())
-        elif all(substring in line for substring in table_header_row):
-            should_collect_lines = True
-
-    return mbr_part_ids
-
-
 def print_precious_partition_info(partition_label, partition_id, precious_parts):
     """Print details for a precious partition."""
-    used_blocks, _ = get_partition_space(f"/dev/{partition_label}")
+    used_blocks, _ = get_partition_space(partition_label)
 
     for key, value in precious_parts.items():
         if value == partition_id:
@@ -324,21 +655,21 @@ def print_precious_partition_info(partition_label, partition_id, precious_parts)
             break
 
 
-def process_mbr_disk(disk, partition_labels, num_parts):
+def process_mbr_disk(disk, partition_labels, entries):
     """Process all MBR partitions on a disk."""
-    mbr_part_ids = parse_mbr_partition_ids(disk)
+    numbers = get_partition_numbers(disk, partition_labels)
+    found = [number for number in numbers if number in entries]
 
-    if len(mbr_part_ids) < num_parts:
+    if len(found) < len(partition_labels):
         print(
             "WARNING: Could not parse enough MBR partition IDs. "
-            f"Found {len(mbr_part_ids)}, expected {num_parts}."
+            f"Found {len(found)}, expected {len(partition_labels)}."
         )
 
-    process_count = min(len(partition_labels), len(mbr_part_ids), num_parts)
-
-    for index in range(process_count):
-        partition_label = partition_labels[index]
-        partition_id = mbr_part_ids[index]
+    for partition_label, number in zip(partition_labels, numbers):
+        if number not in entries:
+            continue
+        partition_id = entries[number].type_id
 
         print(f"\nINFO: Partition : /dev/{partition_label} Partition type : {partition_id}")
 
@@ -370,43 +701,19 @@ def process_mbr_disk(disk, partition_labels, num_parts):
     print(SEPARATOR)
 
 
-def parse_gpt_partition_info(disk, partition_index):
-    """Return GPT partition GUID and platform-required bit."""
-    command_result = run_command(
-        ["sgdisk", f"-i={partition_index + 1}", f"/dev/{disk}"]
-    )
-
-    guid_regex = r"Partition GUID code: ([\w-]+) \("
-    attr_flag_regex = r"Attribute flags: ([0-9A-Fa-f]+)"
-
-    guid_code_match = re.search(guid_regex, command_result.stdout)
-    attribute_flags_match = re.search(attr_flag_regex, command_result.stdout)
-
-    if not guid_code_match or not attribute_flags_match:
-        return None, None
-
-    partition_guid_code = guid_code_match.group(1)
-    attribute_flags_hex = attribute_flags_match.group(1)
-    attribute_flags_int = int(attribute_flags_hex, 16)
-    platform_required_bit = attribute_flags_int & 1
-
-    return partition_guid_code, platform_required_bit
-
-
-def process_gpt_disk(disk, partition_labels, num_parts):
+def process_gpt_disk(disk, partition_labels, entries):
     """Process all GPT partitions on a disk."""
-    process_count = min(len(partition_labels), num_parts)
+    numbers = get_partition_numbers(disk, partition_labels)
 
-    for index in range(process_count):
-        partition_label = partition_labels[index]
-        partition_guid_code, platform_required_bit = parse_gpt_partition_info(
-            disk, index
-        )
-
-        if not partition_guid_code:
-            print(f"INFO: Unable to parse sgdisk info for {partition_label}. Skipping.")
+    for partition_label, number in zip(partition_labels, numbers):
+        entry = entries.get(number)
+        if entry is None:
+            print(f"INFO: Unable to parse GPT entry for {partition_label}. Skipping.")
             continue
 
+        partition_guid_code = entry.type_id
+        platform_required_bit = entry.attributes & 1
+
         print(
             f"\nINFO: Partition : /dev/{partition_label} "
             f"Partition type GUID : {partition_guid_code} "
@@ -458,6 +765,7 @@ def print_detected_disks(disks):
     print("                                                    Read block devices tool")
     print(SEPARATOR)
 
+    # The log parser keys on this wording, which predates the sysfs scan.
     print("INFO: Detected following block devices with lsblk command :")
     for num, disk in enumerate(disks):
         print(f"{num}: {disk}")
@@ -477,39 +785,52 @@ def process_disk(disk):
 
     print(f"INFO: Block device : /dev/{disk}")
 
-    partition_table = get_partition_table_type(disk)
+    partition_table, entries = get_partition_table(disk)
     print(f"INFO: Partition table type : {partition_table}\n")
 
-    num_parts = get_partition_count(disk)
+    partition_labels = get_partition_labels(disk)
 
-    if partition_table == "RAW" or num_parts == 0:
+    if partition_table == "RAW" or not partition_labels:
         process_raw_device(disk)
         return
 
-    partition_labels = get_partition_labels(disk)
-
-    if len(partition_labels) < num_parts:
+    if len(partition_labels) < len(entries):
         print(
             "WARNING: Mismatch in partition count. "
             f"Found {len(partition_labels)} partition labels, "
-            f"but lsblk reported {num_parts} partitions for {disk}. "
+            f"but the partition table lists {len(entries)} partitions for {disk}. "
             "Proceeding with the ones we have..."
         )
 
     if partition_table == "MBR":
-        process_mbr_disk(disk, partition_labels, num_parts)
-    elif partition_table == "GPT":
-        process_gpt_disk(disk, partition_labels, num_parts)
+        process_mbr_disk(disk, partition_labels, entries)
     else:
-        print(
-            "INFO: Invalid partition table, expected MBR or GPT "
-            f"reported type = {partition_table}"
-        )
+        process_gpt_disk(disk, partition_labels, entries)
+
+
+def main(argv=None):
+    """Main entry point.
+
+    argv holds the command-line arguments; None means none were given.
+    """
+    global USE_DIRECT_IO  # pylint: disable=global-statement
 
+    parser = argparse.ArgumentParser(
+        description="Read block devices and optionally perform block write checks."
+    )
+    parser.add_argument(
+        "disks", nargs="*",
+        help="disk names under /dev to check (default: every disk found in sysfs)",
+    )
+    parser.add_argument(
+        "--direct", action="store_true",
+        help="use O_DIRECT to bypass the page cache",
+    )
+    args = parser.parse_args([] if argv is None else argv)
+    if args.direct:
+        USE_DIRECT_IO = True
 
-def main():
-    """Main entry point."""
-    disks = get_disks()
+    disks = [os.path.basename(disk) for disk in args.disks] or get_disks()
     print_detected_disks(disks)
 
     for disk in disks:
@@ -518,7 +839,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
-    except (OSError, ValueError, subprocess.SubprocessError) as error:
+        main(sys.argv[1:])
+    except (OSError, ValueError) as error:
         print(f"Error occurred: {error}")
         sys.exit(1)
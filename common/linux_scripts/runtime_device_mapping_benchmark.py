@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for runtime_device_mapping_conflict_checker.py.
+
+Generates a synthetic UEFI memory map and device tree with the requested
+number of runtime segments and MMIO reg entries, runs them through the
+checker's parsers and times each stage, including the conflict sweep.
+
+--naive also runs the pairwise segment x range scan the sweep replaced and
+checks that both report the same conflicts. That scan is quadratic, so keep
+the sizes to a few thousand ranges when using it:
+
+  python3 runtime_device_mapping_benchmark.py                  # 10^5 each
+  python3 runtime_device_mapping_benchmark.py --dts-ranges 5000 \\
+      --mem-segments 5000 --naive
+
+--out-dir keeps the generated device_tree.dts and memmap.log.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple, TypeVar
+
+import runtime_device_mapping_conflict_checker as checker
+
+SEG_TYPES = ("RT_Code", "RT_Data", "MMIO", "MMIO_Port")
+ADDRESS_SPACE = 1 << 40
+
+T = TypeVar("T")
+
+
+def random_span(rng: random.Random) -> Tuple[int, int]:
+    """Page-aligned (start, size) somewhere in a 1 TiB window."""
+    size = rng.randint(1, 16) * checker.PAGE_SIZE
+    start = rng.randrange(0, ADDRESS_SPACE - size, checker.PAGE_SIZE)
+    return start, size
+
+
+def make_memmap(count: int, rng: random.Random) -> str:
+    """UEFI memmap dump with `count` runtime segments.
+
+    Addresses carry a 0x prefix: to_int() reads an all-digit field as decimal.
+    """
+    lines = ["Type       Start            End               # Pages          Attributes"]
+    for i in range(count):
+        start, size = random_span(rng)
+        lines.append(
+            f"{SEG_TYPES[i % len(SEG_TYPES)]:<10s} 0x{start:016X}-0x{start + size - 1:016X} "
+            f"0x{size // checker.PAGE_SIZE:X} 0x800000000000000F"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def make_dts(count: int, rng: random.Random) -> str:
+    """Flat device tree with `count` enabled MMIO nodes under an identity-mapped bus."""
+    lines = ["/dts-v1/;", "/ {", "  soc {", "    #address-cells = <2>;", "    #size-cells = <2>;",
+             "    ranges;"]
+    for i in range(count):
+        base, size = random_span(rng)
+        lines += [
+            f"    dev{i}@{base:x} {{",
+            f"      reg = <0x{base >> 32:x} 0x{base & 0xFFFFFFFF:x} 0x0 0x{size:x}>;",
+            "    };",
+        ]
+    lines += ["  };", "};"]
+    return "\n".join(lines) + "\n"
+
+
+def naive_conflicts(mem_segs, dts_regs) -> List[Tuple[int, int, str]]:
+    """The pairwise scan the sweep replaced, reduced to comparable keys."""
+    return [
+        (s.start, r.base, r.node_path)
+        for s in mem_segs
+        for r in dts_regs
+        if checker.overlaps(s.start, s.end, r.base, r.end)
+    ]
+
+
+def timed(label: str, func: Callable[[], T], repeat: int = 1) -> T:
+    """Run func `repeat` times, print the best wall time and return the last result."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<24s} {best:10.3f} s")
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Time the runtime device mapping conflict check on a synthetic memmap and DT.")
+    parser.add_argument("--dts-ranges", type=int, default=100000,
+                        help="MMIO reg entries in the generated DT (default: 100000)")
+    parser.add_argument("--mem-segments", type=int, default=100000,
+                        help="Runtime segments in the generated memmap (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs of the conflict sweep, best time is reported")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generated inputs")
+    parser.add_argument("--naive", action="store_true",
+                        help="Also run the quadratic pairwise scan and compare results")
+    parser.add_argument("--out-dir", help="Keep the generated device_tree.dts and memmap.log here")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    memmap_text = make_memmap(args.mem_segments, rng)
+    dts_text = make_dts(args.dts_ranges, rng)
+    if args.out_dir:
+        out_dir = Path(args.out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        (out_dir / "memmap.log").write_text(memmap_text, encoding="utf-8")
+        (out_dir / "device_tree.dts").write_text(dts_text, encoding="utf-8")
+
+    # parse_memmap only logs for malformed lines; keep that out of the real log path
+    checker.log = lambda msg: None
+
+    mem_segs = timed("parse memmap", lambda: checker.parse_memmap(memmap_text))
+    root = timed("parse DTS", lambda: checker.parse_dts_tree(dts_text))
+    dts_regs = timed("extract MMIO ranges", lambda: checker.extract_dts_mmio_ranges(root))
+    conflicts = timed("conflict sweep", lambda: checker.find_conflicts(mem_segs, dts_regs), args.repeat)
+    print(f"{len(mem_segs)} segments x {len(dts_regs)} ranges: {len(conflicts)} conflict(s)")
+
+    if args.naive:
+        expected = timed("naive pairwise scan", lambda: naive_conflicts(mem_segs, dts_regs))
+        found = [(c.mem_start, c.dts_base, c.dts_path) for c in conflicts]
+        if found != expected:
+            print(f"MISMATCH: sweep found {len(found)} conflict(s), pairwise scan {len(expected)}")
+            return 1
+        print("Sweep and pairwise scan report the same conflicts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -27,6 +27,7 @@ The validator:
 3. Performs address translation through device tree "ranges" properties
    to convert device tree addresses to physical addresses
 4. Detects any overlaps between UEFI runtime regions and DTS MMIO ranges
+   with a single sweep over both sets ordered by start address
 5. Reports conflicts if any overlapping regions are detected
 
 The check is critical for EBBR compliance as UEFI runtime services require
@@ -35,6 +36,7 @@ exclusive access to runtime regions without interference from OS drivers.
 
 from __future__ import annotations
 
+import heapq
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -699,6 +701,74 @@ def extract_dts_mmio_ranges(root: Node) -> List[DtsRange]:
     return sorted(uniq.values(), key=lambda x: (x.base, x.size, x.node_path))
 
 
+# ============================================================================
+# SECTION: Conflict Detection - Sweep over Memmap Segments & DTS Ranges
+# ============================================================================
+
+def find_conflicts(mem_segs: List[MemSeg], dts_regs: List[DtsRange]) -> List[Conflict]:
+    """
+    Find every overlap between UEFI runtime segments and DTS MMIO ranges.
+
+    Both lists are swept together in order of start address. A range stays in
+    an active min-heap keyed by its end address until the sweep passes that
+    end, so each range only meets the still-active ranges of the other list,
+    and every one of those overlaps it. For M segments, N ranges and K
+    conflicts this is O((M + N) log(M + N) + K) rather than M x N checks.
+
+    Candidate pairs are confirmed with overlaps(); a malformed segment whose
+    end is below its start is swept over its swapped bounds so it is judged
+    exactly as a pairwise scan would judge it.
+
+    Returns:
+        List[Conflict]: Conflicts ordered by segment (mem_segs order), then by
+        range (dts_regs order), as a nested scan would report them.
+    """
+    # (low, kind, index, high) with kind 0 = memmap segment, 1 = DTS range
+    events = sorted(
+        [(min(s.start, s.end), 0, i, max(s.start, s.end)) for i, s in enumerate(mem_segs)]
+        + [(r.base, 1, j, r.end) for j, r in enumerate(dts_regs)]
+    )
+    active: Tuple[List[Tuple[int, int]], List[Tuple[int, int]]] = ([], [])
+    hits_by_reg: List[List[int]] = [[] for _ in dts_regs]
+
+    for low, kind, idx, high in events:
+        for heap in active:
+            while heap and heap[0][0] < low:
+                heapq.heappop(heap)
+        for _end, other in active[1 - kind]:
+            si, ri = (idx, other) if kind == 0 else (other, idx)
+            s, r = mem_segs[si], dts_regs[ri]
+            if overlaps(s.start, s.end, r.base, r.end):
+                hits_by_reg[ri].append(si)
+        heapq.heappush(active[kind], (high, idx))
+
+    # Bucket by range, then by segment: report order in O(M + N + K)
+    hits_by_seg: List[List[int]] = [[] for _ in mem_segs]
+    for ri, seg_idxs in enumerate(hits_by_reg):
+        for si in seg_idxs:
+            hits_by_seg[si].append(ri)
+
+    conflicts: List[Conflict] = []
+    for si, reg_idxs in enumerate(hits_by_seg):
+        s = mem_segs[si]
+        for ri in reg_idxs:
+            r = dts_regs[ri]
+            conflicts.append(
+                Conflict(
+                    mem_type=s.seg_type,
+                    mem_start=s.start,
+                    mem_end=s.end,
+                    mem_size=s.size,
+                    dts_path=r.node_path,
+                    dts_base=r.base,
+                    dts_end=r.end,
+                    dts_size=r.size,
+                    dts_note=r.note,
+                )
+            )
+    return conflicts
+
+
 # ============================================================================
 # SECTION: Main Entry Point - Orchestration & Reporting
 # ============================================================================
@@ -786,23 +856,7 @@ def main() -> None:
             )
 
     # Verify + report conflicts
-    conflicts: List[Conflict] = []
-    for s in mem_segs:
-        for r in dts_regs:
-            if overlaps(s.start, s.end, r.base, r.end):
-                conflicts.append(
-                    Conflict(
-                        mem_type=s.seg_type,
-                        mem_start=s.start,
-                        mem_end=s.end,
-                        mem_size=s.size,
-                        dts_path=r.node_path,
-                        dts_base=r.base,
-                        dts_end=r.end,
-                        dts_size=r.size,
-                        dts_note=r.note,
-                    )
-                )
+    conflicts = find_conflicts(mem_segs, dts_regs)
 
     log("")
     log("=====================================================================")
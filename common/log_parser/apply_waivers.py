@@ -17,16 +17,201 @@
 """Apply waiver files to parsed ACS JSON results."""
 
 import json
+import os
 import re
+import time
 import argparse
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Shared helpers (suite_registry.py) live in this directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.abspath(__file__))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+from suite_registry import waiver_suite_for  # pylint: disable=wrong-import-position
+
+# Detailed per-waiver messages; main() enables them unless --quiet is given.
+verbose = False
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s-]')
 
 def clean_description(desc):
     """Normalize a description string for older description-based waiver matching."""
     desc = desc.strip().lower()
-    desc = re.sub(r'\s+', ' ', desc)  # Replace multiple spaces with a single space
-    desc = re.sub(r'[^\w\s-]', '', desc)  # Remove special characters except hyphens
+    desc = _WHITESPACE_RE.sub(' ', desc)  # Replace multiple spaces with a single space
+    desc = _SPECIAL_CHARS_RE.sub('', desc)  # Remove special characters except hyphens
     return desc
 
+# Waivers are matched by "first waiver in file order wins". The index below
+# keeps that rule: every lookup returns the lowest waiver position among all
+# waivers that would have matched in the original waiver-by-waiver scan.
+class _SubstringMatcher:
+    """Aho-Corasick automaton returning the lowest-index pattern found in a text."""
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._best = [None]
+        self._empty = None  # An empty pattern is a substring of every text.
+        self._built = True
+
+    def add(self, pattern, index):
+        """Register a pattern for the waiver at position index."""
+        if not pattern:
+            if self._empty is None or index < self._empty:
+                self._empty = index
+            return
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(None)
+            node = nxt
+        if self._best[node] is None or index < self._best[node]:
+            self._best[node] = index
+        self._built = False
+
+    def _build(self):
+        """Compute failure links and fold each suffix's best index into its node."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                inherited = self._best[self._fail[child]]
+                best = self._best[child]
+                if inherited is not None and (best is None or inherited < best):
+                    self._best[child] = inherited
+                queue.append(child)
+        self._built = True
+
+    def __bool__(self):
+        return self._empty is not None or len(self._goto) > 1
+
+    def first_match(self, text):
+        """Return the lowest waiver index whose pattern occurs in text, or None."""
+        if not self._built:
+            self._build()
+        best = self._empty
+        goto, fail, best_at = self._goto, self._fail, self._best
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            found = best_at[node]
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    break
+        return best
+
+def _note_applied(applied, waiver):
+    """Record that a waiver marked at least one result (used for waiver reports)."""
+    if applied is not None:
+        applied.add(id(waiver))
+
+def _min_index(*indexes):
+    """Return the smallest waiver index that is not None."""
+    found = [index for index in indexes if index is not None]
+    return min(found) if found else None
+
+def _index_first(mapping, key, index):
+    """Keep the first (lowest) waiver index for a key."""
+    try:
+        mapping.setdefault(key, index)
+    except TypeError:
+        pass  # Unhashable waiver values never match a parsed JSON value
+
+class SubtestWaiverIndex:
+    """Lookup tables over the subtest-level waivers of one suite, built once per apply run."""
+
+    def __init__(self, subtest_waivers):
+        self.waivers = subtest_waivers
+        # BSA/SBSA nested subtests: (testcase id, value) -> waiver index
+        self.bsa_by_path = {}
+        self.bsa_by_number = {}
+        self.bsa_by_rule_id = {}
+        self.bsa_by_description = {}
+        # Cleaned descriptions for exact and substring matching
+        self.by_clean_description = {}
+        self.description_matcher = _SubstringMatcher()
+        # SubTestID matching (SCT GUIDs or test numbers)
+        self.by_subtest_id = {}
+        # SBMR nested Test_cases only use SubTestID when no description is set
+        self.sbmr_by_subtest_id = {}
+
+        for index, waiver in enumerate(subtest_waivers):
+            waiver_testcase = waiver.get('Test_case') or ''
+            waiver_testcase_id = waiver_testcase.split(':')[0].strip() if ':' in waiver_testcase else waiver_testcase
+            for field, mapping in (('sub_Test_Path', self.bsa_by_path),
+                                   ('sub_Test_Number', self.bsa_by_number),
+                                   ('sub_Rule_ID', self.bsa_by_rule_id),
+                                   ('sub_Test_Description', self.bsa_by_description)):
+                value = waiver.get(field)
+                if value:
+                    for testcase_id in (waiver_testcase, waiver_testcase_id):
+                        _index_first(mapping, (testcase_id, value), index)
+
+            waiver_desc = waiver.get('sub_Test_Description')
+            waiver_id = waiver.get('SubTestID')
+            if waiver_desc:
+                cleaned = clean_description(waiver_desc)
+                self.by_clean_description.setdefault(cleaned, index)
+                self.description_matcher.add(cleaned, index)
+            elif waiver_id:
+                _index_first(self.sbmr_by_subtest_id, waiver_id, index)
+            if waiver_id:
+                _index_first(self.by_subtest_id, waiver_id, index)
+
+    def _get(self, mapping, key):
+        """Dictionary lookup that treats unhashable keys as a miss."""
+        try:
+            return mapping.get(key)
+        except TypeError:
+            return None
+
+    def bsa_match(self, testcase_id, sub_test_path, sub_test_number, sub_rule_id, sub_test_desc):
+        """First waiver matching a nested BSA/SBSA subtest by path, number, rule id or description."""
+        return _min_index(
+            self._get(self.bsa_by_path, (testcase_id, sub_test_path)),
+            self._get(self.bsa_by_number, (testcase_id, sub_test_number)),
+            self._get(self.bsa_by_rule_id, (testcase_id, sub_rule_id)),
+            self._get(self.bsa_by_description, (testcase_id, sub_test_desc)),
+        )
+
+    def description_equal(self, description):
+        """First waiver whose cleaned description equals the cleaned subtest description."""
+        if not self.by_clean_description:
+            return None
+        return self.by_clean_description.get(clean_description(description))
+
+    def description_contains(self, description):
+        """First waiver whose cleaned description is contained in the cleaned subtest description."""
+        if not self.description_matcher:
+            return None
+        return self.description_matcher.first_match(clean_description(description))
+
+    def id_or_description(self, subtest_id, description):
+        """First waiver matching SubTestID, or (failing that) an equal cleaned description."""
+        by_id = self._get(self.by_subtest_id, subtest_id) if subtest_id else None
+        by_desc = self.description_equal(description) if isinstance(description, str) else None
+        return _min_index(by_id, by_desc)
+
+    def sbmr_nested_match(self, subtest_number, description):
+        """First waiver for SBMR nested subtests: description substring, else SubTestID."""
+        return _min_index(self.description_contains(description or ''),
+                          self._get(self.sbmr_by_subtest_id, subtest_number) if subtest_number else None)
+
 def _as_list(value):
     """Return a value as a list so callers can handle one or many entries."""
     if value is None:
@@ -309,7 +494,7 @@ def load_waivers(waiver_data, suite_name):
 
     return suite_level_waivers, testsuite_level_waivers, subsuite_level_waivers, testcase_level_waivers, subtest_level_waivers
 
-def apply_suite_level_waivers(test_suite_entry, suite_waivers):
+def apply_suite_level_waivers(test_suite_entry, suite_waivers, applied=None):
     """Apply suite-level waivers to failed results below a suite."""
     # Apply waivers to all applicable failed subtests in the suite
     for waiver in suite_waivers:
@@ -318,6 +503,7 @@ def apply_suite_level_waivers(test_suite_entry, suite_waivers):
         # Apply to testcases (BSA/SBSA/SCMI)
         for testcase in test_suite_entry.get('testcases', []):
             if _mark_failed_case_waived(testcase, reason):
+                _note_applied(applied, waiver)
                 _mark_failed_subtests_waived(testcase.get('subtests', []), reason)
                 if verbose:
                     print(f"Suite-level waiver applied to testcase '{testcase.get('Test_case')}' with reason: {reason}")
@@ -333,6 +519,7 @@ def apply_suite_level_waivers(test_suite_entry, suite_waivers):
                     sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
                     # Insert waiver_reason inside sub_test_result
                     sub_test_result['waiver_reason'] = reason
+                    _note_applied(applied, waiver)
                     existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
                     updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
                     sub_test_result['fail_reasons'] = updated_fail_reasons
@@ -343,6 +530,7 @@ def apply_suite_level_waivers(test_suite_entry, suite_waivers):
                     if '(WITH WAIVER)' not in sub_test_result.upper():
                         subtest['sub_test_result'] += ' (WITH WAIVER)'
                         subtest['waiver_reason'] = reason
+                        _note_applied(applied, waiver)
                         if verbose:
                             print(f"Suite-level waiver applied to subtest '{subtest.get('sub_Test_Description')}' with reason: {reason}")
 
@@ -358,6 +546,7 @@ def apply_suite_level_waivers(test_suite_entry, suite_waivers):
                             sub_test_result['FAILED'] -= 1
                             sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
                             sub_test_result['waiver_reason'] = reason
+                            _note_applied(applied, waiver)
                             existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
                             updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
                             sub_test_result['fail_reasons'] = updated_fail_reasons
@@ -367,8 +556,9 @@ def apply_suite_level_waivers(test_suite_entry, suite_waivers):
                             if '(WITH WAIVER)' not in result_upper:
                                 subtest['sub_test_result'] += ' (WITH WAIVER)'
                                 subtest['waiver_reason'] = reason
+                                _note_applied(applied, waiver)
 
-def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
+def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers, applied=None):
     """Apply testsuite-level waivers to matching failed testcases or subtests."""
     # Get the test_suite_name considering different keys
     test_suite_name = test_suite_entry.get('Test_suite') or test_suite_entry.get('Test_suite_name')
@@ -380,6 +570,7 @@ def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
             # For BSA/SBSA: apply to testcases
             for testcase in test_suite_entry.get('testcases', []):
                 if _mark_failed_case_waived(testcase, reason):
+                    _note_applied(applied, waiver)
                     _mark_failed_subtests_waived(testcase.get('subtests', []), reason)
                     if verbose:
                         print(f"TestSuite-level waiver applied to testcase '{testcase.get('Test_case')}' in TestSuite '{target_testsuite}' with reason: {reason}")
@@ -395,6 +586,7 @@ def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
                         sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
                         # Insert waiver_reason inside sub_test_result
                         sub_test_result['waiver_reason'] = reason
+                        _note_applied(applied, waiver)
                         existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
                         updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
                         sub_test_result['fail_reasons'] = updated_fail_reasons
@@ -405,6 +597,7 @@ def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
                         if '(WITH WAIVER)' not in sub_test_result.upper():
                             subtest['sub_test_result'] += ' (WITH WAIVER)'
                             subtest['waiver_reason'] = reason
+                            _note_applied(applied, waiver)
                             if verbose:
                                 print(f"TestSuite-level waiver applied to subtest '{subtest.get('sub_Test_Description')}' in TestSuite '{target_testsuite}' with reason: {reason}")
 
@@ -422,6 +615,7 @@ def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
                                 sub_test_result['FAILED'] -= 1
                                 sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
                                 sub_test_result['waiver_reason'] = reason
+                                _note_applied(applied, waiver)
                                 existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
                                 updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
                                 sub_test_result['fail_reasons'] = updated_fail_reasons
@@ -431,8 +625,9 @@ def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
                                 if '(WITH WAIVER)' not in result_upper:
                                     subtest['sub_test_result'] += ' (WITH WAIVER)'
                                     subtest['waiver_reason'] = reason
+                                    _note_applied(applied, waiver)
 
-def apply_subsuite_level_waivers(test_suite_entry, subsuite_waivers):
+def apply_subsuite_level_waivers(test_suite_entry, subsuite_waivers, applied=None):
     """Apply subsuite-level waivers where the parsed JSON has subsuite results."""
     # Apply waivers to all applicable failed subtests within specific SubSuites
     for waiver in subsuite_waivers:
@@ -449,6 +644,7 @@ def apply_subsuite_level_waivers(test_suite_entry, subsuite_waivers):
                         sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
                         # Insert waiver_reason inside sub_test_result
                         sub_test_result['waiver_reason'] = reason
+                        _note_applied(applied, waiver)
                         existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
                         updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
                         sub_test_result['fail_reasons'] = updated_fail_reasons
@@ -459,10 +655,11 @@ def apply_subsuite_level_waivers(test_suite_entry, subsuite_waivers):
                         if '(WITH WAIVER)' not in sub_test_result.upper():
                             subtest['sub_test_result'] += ' (WITH WAIVER)'
                             subtest['waiver_reason'] = reason
+                            _note_applied(applied, waiver)
                             if verbose:
                                 print(f"SubSuite-level waiver applied to subtest '{subtest.get('sub_Test_Description')}' with reason: {reason}")
 
-def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
+def apply_testcase_level_waivers(test_suite_entry, testcase_waivers, applied=None):
     """Apply testcase-level waivers to matching failed testcases."""
     # Apply waivers to all applicable failed subtests within specific Test_cases
     for waiver in testcase_waivers:
@@ -477,6 +674,7 @@ def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
 
             if test_case_id == target_testcase or test_case_name == target_testcase:
                 if _mark_failed_case_waived(testcase, reason):
+                    _note_applied(applied, waiver)
                     _mark_failed_subtests_waived(testcase.get('subtests', []), reason)
                     if verbose:
                         print(f"Test_case-level waiver applied to testcase '{test_case_name}' with reason: {reason}")
@@ -493,6 +691,7 @@ def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
                         sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
                         # Insert waiver_reason inside sub_test_result
                         sub_test_result['waiver_reason'] = reason
+                        _note_applied(applied, waiver)
                         existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
                         updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
                         sub_test_result['fail_reasons'] = updated_fail_reasons
@@ -503,6 +702,7 @@ def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
                         if '(WITH WAIVER)' not in sub_test_result.upper():
                             subtest['sub_test_result'] += ' (WITH WAIVER)'
                             subtest['waiver_reason'] = reason
+                            _note_applied(applied, waiver)
                             if verbose:
                                 print(f"Test_case-level waiver applied to subtest '{subtest.get('sub_Test_Description')}' with reason: {reason}")
 
@@ -520,6 +720,7 @@ def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
                                 sub_test_result['FAILED'] -= 1
                                 sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
                                 sub_test_result['waiver_reason'] = reason
+                                _note_applied(applied, waiver)
                                 existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
                                 updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
                                 sub_test_result['fail_reasons'] = updated_fail_reasons
@@ -529,9 +730,15 @@ def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
                                 if '(WITH WAIVER)' not in result_upper:
                                     subtest['sub_test_result'] += ' (WITH WAIVER)'
                                     subtest['waiver_reason'] = reason
+                                    _note_applied(applied, waiver)
 
-def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name):
+def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name, waiver_index=None, applied=None):
     """Apply subtest-level waivers, including nested BSA/SBSA subtests."""
+    # The index is built once per waiver file/suite by apply_waivers(); callers
+    # that only pass the waiver list get one built here.
+    if waiver_index is None:
+        waiver_index = SubtestWaiverIndex(subtest_waivers)
+
     # For BSA/SBSA: apply waivers to subtests within testcases
     if suite_name.upper() in ['BSA', 'SBSA']:
         for testcase in test_suite_entry.get('testcases', []):
@@ -541,48 +748,31 @@ def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name):
             # Check every nested subtest, not only direct children of the
             # testcase, so deeper SBSA/BSA rule failures can be waived.
             for subtest in _iter_nested_subtests(testcase.get('subtests', [])):
+                sub_test_result = subtest.get('sub_test_result', '')
+                if not isinstance(sub_test_result, str):
+                    continue
+                if 'FAILED' not in sub_test_result.upper() or '(WITH WAIVER)' in sub_test_result.upper():
+                    continue
                 sub_rule_id = _subtest_rule_id(subtest)
-                sub_test_number = subtest.get('sub_Test_Number', '')
-                sub_test_path = subtest.get('sub_Test_Path', '')
                 sub_test_desc = subtest.get('sub_Test_Description', '')
-                sub_test_result = subtest.get('sub_test_result', '')
-
-                # Check if this subtest has a waiver
-                for waiver in subtest_waivers:
-                    # Waiver must match the testcase
-                    waiver_testcase = waiver.get('Test_case', '')
-                    waiver_testcase_id = waiver_testcase.split(':')[0].strip() if ':' in waiver_testcase else waiver_testcase
-
-                    if waiver_testcase_id != testcase_id and waiver_testcase != testcase_id:
-                        continue
-
-                    # sub_Test_Path is safest for nested logs because the same
-                    # sub_Test_Number can appear in different parent branches.
-                    # Number, rule id, and description are kept as fallbacks for
-                    # old waiver files and hand-written waivers.
-                    waiver_id = waiver.get('sub_Rule_ID', '')
-                    waiver_number = waiver.get('sub_Test_Number', '')
-                    waiver_path = waiver.get('sub_Test_Path', '')
-                    waiver_desc = waiver.get('sub_Test_Description', '')
-                    reason = waiver.get('Reason', '')
 
-                    match = False
-                    if waiver_path and waiver_path == sub_test_path:
-                        match = True
-                    elif waiver_number and waiver_number == sub_test_number:
-                        match = True
-                    elif waiver_id and waiver_id == sub_rule_id:
-                        match = True
-                    elif waiver_desc and waiver_desc == sub_test_desc:
-                        match = True
-
-                    if match and isinstance(sub_test_result, str):
-                        if 'FAILED' in sub_test_result.upper() and '(WITH WAIVER)' not in sub_test_result.upper():
-                            subtest['sub_test_result'] = sub_test_result + ' (WITH WAIVER)'
-                            subtest['waiver_reason'] = reason
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{sub_rule_id}' ({sub_test_desc}) in testcase '{testcase_name}' with reason: {reason}")
-                            break  # Waiver applied
+                # sub_Test_Path is safest for nested logs because the same
+                # sub_Test_Number can appear in different parent branches.
+                # Number, rule id, and description are kept as fallbacks for
+                # old waiver files and hand-written waivers. The waiver must
+                # also belong to this testcase.
+                match = waiver_index.bsa_match(testcase_id,
+                                               subtest.get('sub_Test_Path', ''),
+                                               subtest.get('sub_Test_Number', ''),
+                                               sub_rule_id,
+                                               sub_test_desc)
+                if match is not None:
+                    _note_applied(applied, subtest_waivers[match])
+                    reason = subtest_waivers[match].get('Reason', '')
+                    subtest['sub_test_result'] = sub_test_result + ' (WITH WAIVER)'
+                    subtest['waiver_reason'] = reason
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{sub_rule_id}' ({sub_test_desc}) in testcase '{testcase_name}' with reason: {reason}")
 
     # Apply waivers to individual subtests based on SubTestID or sub_Test_Description
     for subtest in test_suite_entry.get('subtests', []):
@@ -591,65 +781,59 @@ def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name):
         if isinstance(sub_test_result, dict):
             # For FWTSResults.json and STANDALONE JSONs where sub_test_result is a dict with result counts
             subtest_description = subtest.get('sub_Test_Description')
-            subtest_number = subtest.get('sub_Test_Number')
 
-            for waiver in subtest_waivers:
-                waiver_desc = waiver.get('sub_Test_Description')
-                # For FWTS and STANDALONE, use descriptions
-                if waiver_desc:
-                    cleaned_waiver_desc = clean_description(waiver_desc)
-                    cleaned_subtest_desc = clean_description(subtest_description)
-                    # Special handling for "Boot sources" TestSuite
-                    if suite_name.upper() == 'STANDALONE':
-                        # If TestSuite-level waiver is applied, all subtests should have waivers already
-                        # Otherwise, handle individual subtest waivers
-                        if cleaned_waiver_desc in cleaned_subtest_desc:
-                            # Apply waiver
-                            failed = sub_test_result.get('FAILED', 0)
-                            failed_with_waiver = sub_test_result.get('FAILED_WITH_WAIVER', 0)
-
-                            if failed > 0:
-                                sub_test_result['FAILED'] = failed - 1
-                                sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
-                            else:
-                                # Edge case: FAILED is already 0
-                                sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
+            # For FWTS and STANDALONE, use descriptions
+            if suite_name.upper() == 'STANDALONE':
+                # Special handling for "Boot sources" TestSuite
+                # If TestSuite-level waiver is applied, all subtests should have waivers already
+                # Otherwise, handle individual subtest waivers
+                match = waiver_index.description_contains(subtest_description)
+                if match is not None:
+                    _note_applied(applied, subtest_waivers[match])
+                    waiver = subtest_waivers[match]
+                    # Apply waiver
+                    failed = sub_test_result.get('FAILED', 0)
+                    failed_with_waiver = sub_test_result.get('FAILED_WITH_WAIVER', 0)
+
+                    if failed > 0:
+                        sub_test_result['FAILED'] = failed - 1
+                        sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
+                    else:
+                        # Edge case: FAILED is already 0
+                        sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
 
-                            # Add waiver_reason inside sub_test_result
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                sub_test_result['waiver_reason'] = reason
-                                existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
-                                updated_fail_reasons = [(s + ' (WITH WAIVER)') for fr in existing_fail_reasons for s in (fr if isinstance(fr, list) else [fr])]
-                                sub_test_result['fail_reasons'] = updated_fail_reasons
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
-                            break  # Waiver applied, exit the loop
+                    # Add waiver_reason inside sub_test_result
+                    reason = waiver.get('Reason', '')
+                    if reason:
+                        sub_test_result['waiver_reason'] = reason
+                        existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
+                        updated_fail_reasons = [(s + ' (WITH WAIVER)') for fr in existing_fail_reasons for s in (fr if isinstance(fr, list) else [fr])]
+                        sub_test_result['fail_reasons'] = updated_fail_reasons
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
+            else:
+                # For FWTS, BBSR-FWTS, and other suites
+                match = waiver_index.description_equal(subtest_description)
+                if match is not None:
+                    _note_applied(applied, subtest_waivers[match])
+                    waiver = subtest_waivers[match]
+                    # Apply waiver
+                    failed = sub_test_result.get('FAILED', 0)
+                    failed_with_waiver = sub_test_result.get('FAILED_WITH_WAIVER', 0)
+                    if failed > 0:
+                        sub_test_result['FAILED'] = failed - 1
+                        sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
                     else:
-                        # For FWTS, BBSR-FWTS, and other suites
-                        if cleaned_waiver_desc == cleaned_subtest_desc:
-                            # Apply waiver
-                            if isinstance(sub_test_result, dict):
-                                failed = sub_test_result.get('FAILED', 0)
-                                failed_with_waiver = sub_test_result.get('FAILED_WITH_WAIVER', 0)
-                                if failed > 0:
-                                    sub_test_result['FAILED'] = failed - 1
-                                    sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
-                                else:
-                                    sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
-                            else:
-                                if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
-                                    subtest['sub_test_result'] += ' (WITH WAIVER)'
-                            # Add waiver_reason inside sub_test_result
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                sub_test_result['waiver_reason'] = reason
-                                existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
-                                updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
-                                sub_test_result['fail_reasons'] = updated_fail_reasons
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
-                            break  # Waiver applied, exit the loop
+                        sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
+                    # Add waiver_reason inside sub_test_result
+                    reason = waiver.get('Reason', '')
+                    if reason:
+                        sub_test_result['waiver_reason'] = reason
+                        existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
+                        updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
+                        sub_test_result['fail_reasons'] = updated_fail_reasons
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
 
         elif isinstance(sub_test_result, str):
             # Only apply waivers to FAILED/FAILURE tests
@@ -665,66 +849,51 @@ def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name):
             else:
                 subtest_id = subtest_number
 
-            for waiver in subtest_waivers:
-                waiver_desc = waiver.get('sub_Test_Description')
-                waiver_id = waiver.get('SubTestID')
-                if suite_name.upper() in ['FWTS', 'STANDALONE', 'BBSR-FWTS','PFDI']:
-                    # For FWTS, STANDALONE, and BBSR-FWTS, use descriptions
-                    if waiver_desc:
-                        cleaned_waiver_desc = clean_description(waiver_desc)
-                        cleaned_subtest_desc = clean_description(subtest_description)
-                        if cleaned_waiver_desc in cleaned_subtest_desc:
-                            # Apply waiver
-                            if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
-                                subtest['sub_test_result'] += ' (WITH WAIVER)'
-                            # Add waiver_reason inside sub_test_result
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                subtest['sub_test_result'] += f', waiver_reason: "{reason}"'  # Adding inside sub_test_result
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
-                            break
-                elif suite_name.upper() == 'SBMR':
-                    # For SBMR, allow description-based matching as well
-                    if waiver_desc:
-                        cleaned_waiver_desc = clean_description(waiver_desc)
-                        cleaned_subtest_desc = clean_description(subtest_description)
-                        if cleaned_waiver_desc in cleaned_subtest_desc:
-                            if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
-                                subtest['sub_test_result'] += ' (WITH WAIVER)'
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                subtest['waiver_reason'] = reason
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
-                            break
-                else:
-                    # For other suites, check SubTestID and description
-                    if waiver_id and waiver_id == subtest_id:
-                        # Apply waiver
-                        if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
-                            subtest['sub_test_result'] += ' (WITH WAIVER)'
-                        # Add waiver_reason as a separate key
-                        reason = waiver.get('Reason', '')
-                        if reason:
-                            subtest['waiver_reason'] = reason
-                        if verbose:
-                            print(f"Subtest-level waiver applied to subtest '{subtest.get('sub_Test_Description')}' with SubTestID '{subtest_id}' and reason: {reason}")
-                        break
-                    elif waiver_desc:
-                        cleaned_waiver_desc = clean_description(waiver_desc)
-                        cleaned_subtest_desc = clean_description(subtest_description)
-                        if cleaned_waiver_desc == cleaned_subtest_desc:
-                            # Apply waiver
-                            if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
-                                subtest['sub_test_result'] += ' (WITH WAIVER)'
-                            # Add waiver_reason as a separate key
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                subtest['waiver_reason'] = reason
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
-                            break
+            already_waived = 'FAILED (WITH WAIVER)' in sub_test_result.upper() or 'FAILURE (WITH WAIVER)' in sub_test_result.upper()
+            if suite_name.upper() in ['FWTS', 'STANDALONE', 'BBSR-FWTS', 'PFDI']:
+                # For FWTS, STANDALONE, and BBSR-FWTS, use descriptions
+                match = waiver_index.description_contains(subtest_description)
+                if match is not None:
+                    _note_applied(applied, subtest_waivers[match])
+                    # Apply waiver
+                    if not already_waived:
+                        subtest['sub_test_result'] += ' (WITH WAIVER)'
+                    # Add waiver_reason inside sub_test_result
+                    reason = subtest_waivers[match].get('Reason', '')
+                    if reason:
+                        subtest['sub_test_result'] += f', waiver_reason: "{reason}"'  # Adding inside sub_test_result
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
+            elif suite_name.upper() == 'SBMR':
+                # For SBMR, allow description-based matching as well
+                match = waiver_index.description_contains(subtest_description)
+                if match is not None:
+                    _note_applied(applied, subtest_waivers[match])
+                    if not already_waived:
+                        subtest['sub_test_result'] += ' (WITH WAIVER)'
+                    reason = subtest_waivers[match].get('Reason', '')
+                    if reason:
+                        subtest['waiver_reason'] = reason
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
+            else:
+                # For other suites, check SubTestID and description
+                match = waiver_index.id_or_description(subtest_id, subtest_description)
+                if match is not None:
+                    _note_applied(applied, subtest_waivers[match])
+                    waiver = subtest_waivers[match]
+                    # Apply waiver
+                    if not already_waived:
+                        subtest['sub_test_result'] += ' (WITH WAIVER)'
+                    # Add waiver_reason as a separate key
+                    reason = waiver.get('Reason', '')
+                    if reason:
+                        subtest['waiver_reason'] = reason
+                    if verbose:
+                        if waiver.get('SubTestID') and waiver.get('SubTestID') == subtest_id:
+                            print(f"Subtest-level waiver applied to subtest '{subtest_description}' with SubTestID '{subtest_id}' and reason: {reason}")
+                        else:
+                            print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
             # Handle other cases if needed
 
     # SBMR: also walk nested Test_cases -> subtests for subtest-level waivers
@@ -735,43 +904,94 @@ def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name):
                 # Apply only to failures
                 if isinstance(sub_test_result, str) and ('FAILED' not in sub_test_result.upper() and 'FAILURE' not in sub_test_result.upper()):
                     continue
-                subtest_description = subtest.get('sub_Test_Description')
-                subtest_number = subtest.get('sub_Test_Number')
-                for waiver in subtest_waivers:
-                    waiver_desc = waiver.get('sub_Test_Description')
-                    waiver_id = waiver.get('SubTestID')
-                    if waiver_desc:
-                        if clean_description(waiver_desc) in clean_description(subtest_description or ''):
-                            if isinstance(sub_test_result, dict):
-                                failed = sub_test_result.get('FAILED', 0)
-                                if failed > 0:
-                                    sub_test_result['FAILED'] = failed - 1
-                                    sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
-                                sub_test_result['waiver_reason'] = waiver.get('Reason', '')
-                            elif isinstance(sub_test_result, str):
-                                if ' (WITH WAIVER)' not in sub_test_result.upper():
-                                    subtest['sub_test_result'] += ' (WITH WAIVER)'
-                                reason = waiver.get('Reason', '')
-                                if reason:
-                                    subtest['waiver_reason'] = reason
-                            break
-                    elif waiver_id and waiver_id == subtest_number:
-                        if isinstance(sub_test_result, dict):
-                            failed = sub_test_result.get('FAILED', 0)
-                            if failed > 0:
-                                sub_test_result['FAILED'] = failed - 1
-                                sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
-                            sub_test_result['waiver_reason'] = waiver.get('Reason', '')
-                        elif isinstance(sub_test_result, str):
-                            if ' (WITH WAIVER)' not in sub_test_result.upper():
-                                subtest['sub_test_result'] += ' (WITH WAIVER)'
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                subtest['waiver_reason'] = reason
-                        break
+                match = waiver_index.sbmr_nested_match(subtest.get('sub_Test_Number'),
+                                                       subtest.get('sub_Test_Description'))
+                if match is None:
+                    continue
+                _note_applied(applied, subtest_waivers[match])
+                reason = subtest_waivers[match].get('Reason', '')
+                if isinstance(sub_test_result, dict):
+                    failed = sub_test_result.get('FAILED', 0)
+                    if failed > 0:
+                        sub_test_result['FAILED'] = failed - 1
+                        sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
+                    sub_test_result['waiver_reason'] = reason
+                elif isinstance(sub_test_result, str):
+                    if ' (WITH WAIVER)' not in sub_test_result.upper():
+                        subtest['sub_test_result'] += ' (WITH WAIVER)'
+                    if reason:
+                        subtest['waiver_reason'] = reason
+
+class WaiverContext:
+    """waiver.json and test_category.json, loaded once and reused for every suite JSON."""
+
+    def __init__(self, waiver_file, category_file=None):
+        self.waiver_file = waiver_file
+        self.category_file = category_file
+        self.waiver_data = None
+        self.category_data = None
+        self._suites = {}
+
+        # Load waiver.json
+        try:
+            with open(waiver_file, 'r', encoding='utf-8') as waiver_handle:
+                self.waiver_data = json.load(waiver_handle)
+        except Exception as err:
+            if verbose:
+                print(f"INFO: Failed to read or parse {waiver_file}: {err}")
+            return
+
+        # Load test_category.json if provided
+        if category_file:
+            try:
+                with open(category_file, 'r', encoding='utf-8') as category_handle:
+                    self.category_data = json.load(category_handle)
+            except Exception as err:
+                if verbose:
+                    print(f"WARNING: Failed to read or parse {category_file}: {err}")
+                self.category_data = None
+
+    def suite_waivers(self, suite_name):
+        """Return the load_waivers() lists and the subtest index for a suite, built once."""
+        if suite_name not in self._suites:
+            levels = load_waivers(self.waiver_data, suite_name)
+            self._suites[suite_name] = (levels, SubtestWaiverIndex(levels[4]))
+        return self._suites[suite_name]
+
+    def is_waivable(self, suite_name, test_suite_name):
+        """Check test_category.json; without a category file every test suite is waivable."""
+        if self.category_data is None:
+            return True
+        for _category_id, category_rows in self.category_data.items():
+            # category_rows is a list from test_category.json.
+            for row in category_rows:
+                if row.get("Suite", "").lower() == suite_name.lower() and row.get("Test Suite", "").lower() == test_suite_name.lower():
+                    if row.get("Waivable", "").lower() == "yes":
+                        return True
+        return False
+
+def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_file=None, context=None):
+    """Apply all matching waivers to one parsed JSON file and return a report entry.
+
+    context is a WaiverContext shared between calls; without one the waiver
+    and category files are loaded for this call only.
+    """
+    start_time = time.perf_counter()
+    report = {
+        'suite': suite_name,
+        'json_file': json_file,
+        'status': 'error',
+        'waivers': 0,
+        'matched': 0,
+        'unused': 0,
+        'time_sec': 0.0,
+    }
+
+    def finish(status):
+        report['status'] = status
+        report['time_sec'] = round(time.perf_counter() - start_time, 4)
+        return report
 
-def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_file=None):
-    """Apply all matching waivers to one parsed JSON file."""
     # Load the JSON data
     try:
         with open(json_file, 'r', encoding='utf-8') as json_handle:
@@ -779,36 +999,25 @@ def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_
     except Exception as err:
         if verbose:
             print(f"WARNING: Failed to read or parse {json_file}: {err}")
-        return
+        return finish('error')
 
-    # Load waiver.json
-    try:
-        with open(waiver_file, 'r', encoding='utf-8') as waiver_handle:
-            waiver_data = json.load(waiver_handle)
-    except Exception as err:
-        if verbose:
-            print(f"INFO: Failed to read or parse {waiver_file}: {err}")
-        return
-
-    # Load test_category.json if provided
-    if output_json_file:
-        try:
-            with open(output_json_file, 'r', encoding='utf-8') as output_handle:
-                output_json_data = json.load(output_handle)
-        except Exception as err:
-            if verbose:
-                print(f"WARNING: Failed to read or parse {output_json_file}: {err}")
-            output_json_data = None
-    else:
-        output_json_data = None
+    if context is None:
+        context = WaiverContext(waiver_file, output_json_file)
+    if context.waiver_data is None:
+        return finish('error')
 
     # Get waivers for the suite, categorized by their scope
-    suite_level_waivers, testsuite_level_waivers, subsuite_level_waivers, testcase_level_waivers, subtest_level_waivers = load_waivers(waiver_data, suite_name)
+    levels, subtest_index = context.suite_waivers(suite_name)
+    suite_level_waivers, testsuite_level_waivers, subsuite_level_waivers, testcase_level_waivers, subtest_level_waivers = levels
+    report['waivers'] = report['unused'] = sum(len(level) for level in levels)
 
     if not (suite_level_waivers or testsuite_level_waivers or (suite_name.upper() in ['SCT', 'STANDALONE', 'BBSR-SCT', 'BBSR-FWTS', "SBMR", 'BSA', 'SBSA', 'SCMI'] and (subsuite_level_waivers or testcase_level_waivers)) or subtest_level_waivers):
         if verbose:
             print(f"No valid waivers found for suite '{suite_name}'. No changes applied.")
-        return
+        return finish('no_waivers')
+
+    # Waivers that marked at least one result, by id()
+    applied = set()
 
     # Handle different json_data structures
     if 'test_results' in json_data:
@@ -822,7 +1031,7 @@ def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_
     else:
         if verbose:
             print(f"ERROR: Unexpected JSON data structure in {json_file}")
-        return
+        return finish('error')
 
     # Process each test suite in the JSON data
     for test_suite_entry in test_suite_entries:
@@ -831,60 +1040,44 @@ def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_
             continue  # Skip entries that are not test suites
 
         # Determine if waivers should be applied based on test_category.json
-        if output_json_data is None:
-            # test_category.json not provided, apply all waivers
-            waivable = True
-        else:
-            # Check if the test suite is waivable according to test_category.json
-            waivable = False
-            for _category_id, category_rows in output_json_data.items():
-                # category_rows is a list from test_category.json.
-                for row in category_rows:
-                    if row.get("Suite", "").lower() == suite_name.lower() and row.get("Test Suite", "").lower() == test_suite_name.lower():
-                        if row.get("Waivable", "").lower() == "yes":
-                            waivable = True
-                            break  # Found a waivable test suite, exit the loops
-                if waivable:
-                    break
-
-        if not waivable:
+        if not context.is_waivable(suite_name, test_suite_name):
             # Do not process non-waivable test suites
             continue
 
         # Apply suite-level waivers if any
         if suite_level_waivers:
-            apply_suite_level_waivers(test_suite_entry, suite_level_waivers)
+            apply_suite_level_waivers(test_suite_entry, suite_level_waivers, applied=applied)
 
         # Apply TestSuite-level waivers if any
         if testsuite_level_waivers:
-            apply_testsuite_level_waivers(test_suite_entry, testsuite_level_waivers)
+            apply_testsuite_level_waivers(test_suite_entry, testsuite_level_waivers, applied=applied)
 
         # Apply Test_case level waivers for BSA/SBSA and other suites
         if testcase_level_waivers:
             if suite_name.upper() in ['BSA', 'SBSA', 'SCT', 'STANDALONE', 'BBSR-SCT', 'BBSR-FWTS', 'BBSR-TPM', 'SCMI']:
-                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers)
+                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers, applied=applied)
 
         # Include 'BBSR-SCT' and 'BBSR-FWTS' suites
         # Only apply SubSuite and Test_case level waivers if the suite is 'SCT', 'STANDALONE', 'BBSR-SCT', or 'BBSR-FWTS'
         if suite_name.upper() in ['SCT', 'STANDALONE', 'BBSR-SCT', 'BBSR-FWTS', 'BBSR-TPM']:
             # Apply SubSuite-level waivers if any
             if subsuite_level_waivers:
-                apply_subsuite_level_waivers(test_suite_entry, subsuite_level_waivers)
+                apply_subsuite_level_waivers(test_suite_entry, subsuite_level_waivers, applied=applied)
 
             # Apply Test_case-level waivers if any
             if testcase_level_waivers:
-                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers)
+                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers, applied=applied)
 
         # SBMR: apply SubSuite/Test_case level waivers without modifying the original condition
         if suite_name.upper() == 'SBMR':
             if subsuite_level_waivers:
-                apply_subsuite_level_waivers(test_suite_entry, subsuite_level_waivers)
+                apply_subsuite_level_waivers(test_suite_entry, subsuite_level_waivers, applied=applied)
             if testcase_level_waivers:
-                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers)
+                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers, applied=applied)
 
         # Apply subtest-level waivers
         if subtest_level_waivers:
-            apply_subtest_level_waivers(test_suite_entry, subtest_level_waivers, suite_name)
+            apply_subtest_level_waivers(test_suite_entry, subtest_level_waivers, suite_name, subtest_index, applied=applied)
 
         # Subtest waivers are applied at the leaf/branch where they match. This
         # pass then updates failed parents only when no failed child remains
@@ -1250,22 +1443,102 @@ def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_
     except Exception as err:
         if verbose:
             print(f"ERROR: Failed to write updated data to {json_file}: {err}")
-        return
+        return finish('error')
+
+    report['matched'] = len(applied)
+    report['unused'] = report['waivers'] - report['matched']
+    return finish('applied')
+
+def discover_suite_jsons(jsons_dir):
+    """Return (suite_name, json_path) for every waivable suite JSON in an acs_jsons directory.
+
+    The file names and the suite each one is waived under come from suite_registry.py.
+    """
+    suite_jsons = []
+    for name in sorted(os.listdir(jsons_dir)):
+        suite_name = waiver_suite_for(name)
+        if suite_name:
+            suite_jsons.append((suite_name, os.path.join(jsons_dir, name)))
+    return suite_jsons
+
+_WORKER_CONTEXT = None
+
+def _init_worker(context, worker_verbose):
+    """Give each pool worker the shared WaiverContext once instead of per task."""
+    global _WORKER_CONTEXT, verbose
+    _WORKER_CONTEXT = context
+    verbose = worker_verbose
+
+def _apply_in_worker(suite_name, json_file):
+    """Pool task: apply waivers to one suite JSON with the worker's shared context."""
+    return apply_waivers(suite_name, json_file, context=_WORKER_CONTEXT)
+
+def apply_waivers_to_suites(suite_jsons, waiver_file, category_file=None, jobs=1):
+    """Apply one waiver file to several suite JSONs and return their reports in input order.
+
+    The waiver and category files are read once. With jobs > 1 the suite JSONs
+    are processed in a pool of worker processes.
+    """
+    context = WaiverContext(waiver_file, category_file)
+    if jobs > 1 and len(suite_jsons) > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=min(jobs, len(suite_jsons)),
+                                           initializer=_init_worker, initargs=(context, verbose))
+        except (OSError, NotImplementedError, ImportError):
+            executor = None
+        if executor is not None:
+            with executor:
+                futures = [executor.submit(_apply_in_worker, suite_name, json_file)
+                           for suite_name, json_file in suite_jsons]
+                return [future.result() for future in futures]
+    return [apply_waivers(suite_name, json_file, context=context) for suite_name, json_file in suite_jsons]
+
+def print_waiver_report(reports):
+    """Print the per-suite waiver report table."""
+    print(f"{'Suite':<12} {'JSON':<36} {'Waivers':>7} {'Matched':>7} {'Unused':>6} {'Time(s)':>8}  Status")
+    for entry in reports:
+        print(f"{entry['suite']:<12} {os.path.basename(entry['json_file']):<36} {entry['waivers']:>7} "
+              f"{entry['matched']:>7} {entry['unused']:>6} {entry['time_sec']:>8.3f}  {entry['status']}")
 
 def main():
     """Parse command line arguments and apply waivers."""
     parser = argparse.ArgumentParser(description='Apply waivers to test suite JSON results.')
-    parser.add_argument('suite_name', help='Name of the test suite')
-    parser.add_argument('json_file', help='Path to the JSON file')
+    parser.add_argument('suite_name', nargs='?', help='Name of the test suite')
+    parser.add_argument('json_file', nargs='?', help='Path to the JSON file')
     parser.add_argument('waiver_file', nargs='?', default='waiver.json', help='Path to the waiver file (default: waiver.json)')
     parser.add_argument('output_json_file', nargs='?', default=None, help='Path to the test category file (default: None)')
     parser.add_argument('--quiet', action='store_true', help='Suppress detailed output')
+    parser.add_argument('--acs-jsons', metavar='DIR',
+                        help='Apply waivers to every suite JSON in an acs_jsons directory '
+                             '(use --waiver-file/--category-file instead of the positional arguments)')
+    parser.add_argument('--waiver-file', dest='suites_waiver_file', default='waiver.json',
+                        help='Waiver file for --acs-jsons (default: waiver.json)')
+    parser.add_argument('--category-file', dest='suites_category_file', help='Test category file for --acs-jsons')
+    parser.add_argument('--jobs', type=int, default=1, help='Suite JSONs processed in parallel with --acs-jsons (default: 1)')
+    parser.add_argument('--report', metavar='FILE', help='Write the --acs-jsons per-suite report as JSON')
     args = parser.parse_args()
 
     # Set the global verbosity flag
     global verbose
     verbose = not args.quiet
 
+    if args.acs_jsons:
+        if args.suite_name or args.json_file:
+            parser.error('suite_name/json_file cannot be combined with --acs-jsons')
+        if not os.path.isdir(args.acs_jsons):
+            parser.error(f"--acs-jsons directory '{args.acs_jsons}' does not exist")
+        suite_jsons = discover_suite_jsons(args.acs_jsons)
+        reports = apply_waivers_to_suites(suite_jsons, args.suites_waiver_file,
+                                          args.suites_category_file, max(1, args.jobs))
+        print_waiver_report(reports)
+        if args.report:
+            with open(args.report, 'w', encoding='utf-8') as report_handle:
+                json.dump(reports, report_handle, indent=4)
+        return
+
+    if not args.suite_name or not args.json_file:
+        parser.error('suite_name and json_file are required unless --acs-jsons is given')
+
     # Now call the apply_waivers function
     apply_waivers(args.suite_name, args.json_file, args.waiver_file, args.output_json_file)
 
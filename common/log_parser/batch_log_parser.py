@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Batch driver: re-parse many archived acs_results directories.
+#
+# Every directory is handed to main_log_parser.py in its own subprocess so a
+# corrupt bundle (or one that hangs) only affects its own entry.  A bounded
+# worker pool limits how many bundles run at once, and a manifest JSON records
+# the status and wall time of each directory as the batch progresses.
+
+import argparse
+import glob
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+SCRIPTS_PATH = os.path.dirname(os.path.realpath(__file__))
+MAIN_LOG_PARSER = os.path.join(SCRIPTS_PATH, "main_log_parser.py")
+RUN_LOG_NAME = "main_log_parser.log"
+
+GLOB_CHARS = ("*", "?", "[")
+
+
+def expand_directories(patterns, list_file=None):
+    """Expand directory arguments and glob patterns into an ordered, de-duplicated list."""
+    entries = list(patterns)
+    if list_file:
+        with open(list_file, "r", encoding="utf-8") as f:
+            entries += [line.strip() for line in f
+                        if line.strip() and not line.lstrip().startswith("#")]
+
+    directories = []
+    seen = set()
+    for entry in entries:
+        if any(ch in entry for ch in GLOB_CHARS):
+            matches = sorted(glob.glob(entry, recursive=True))
+        else:
+            matches = [entry]
+        for match in matches:
+            key = os.path.abspath(match)
+            if key not in seen:
+                seen.add(key)
+                directories.append(match)
+    return directories
+
+
+def output_mtime(path):
+    """Return the mtime of a run output (None when it does not exist)."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def process_directory(results_dir, parser_args, timeout):
+    """Run main_log_parser.py on one acs_results directory and return its manifest entry."""
+    entry = {
+        "path": results_dir,
+        "status": "failed",
+        "exit_code": None,
+        "wall_time_sec": 0.0,
+        "log": "",
+        "error": "",
+    }
+    if not os.path.isdir(results_dir):
+        entry["status"] = "missing"
+        entry["error"] = "not a directory"
+        return entry
+
+    summary_dir = os.path.join(results_dir, "acs_summary")
+    log_path = os.path.join(summary_dir, RUN_LOG_NAME)
+    # Re-parsed bundles usually still hold the outputs of the on-device run,
+    # so an output only counts when this run rewrote it.
+    outputs = [os.path.join(summary_dir, "acs_jsons", "merged_results.json"),
+               os.path.join(summary_dir, "html_detailed_summaries", "acs_summary.html")]
+    before = {path: output_mtime(path) for path in outputs}
+    cmd = [sys.executable, MAIN_LOG_PARSER, results_dir] + parser_args
+
+    start = time.monotonic()
+    try:
+        os.makedirs(summary_dir, exist_ok=True)
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            entry["log"] = log_path
+            # Own process group, so a timeout also stops the run's suite workers.
+            with subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT,
+                                  stdin=subprocess.DEVNULL, start_new_session=True) as proc:
+                try:
+                    proc.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                    proc.wait()
+                    raise
+        entry["exit_code"] = proc.returncode
+        missing = [os.path.basename(path) for path in outputs
+                   if output_mtime(path) in (None, before[path])]
+        if proc.returncode != 0:
+            entry["error"] = f"main_log_parser.py exited with {proc.returncode}"
+        elif missing:
+            entry["error"] = f"not generated by this run: {', '.join(missing)}"
+        else:
+            entry["status"] = "ok"
+    except subprocess.TimeoutExpired:
+        entry["status"] = "timeout"
+        entry["error"] = f"timed out after {timeout} seconds"
+    except OSError as exc:
+        entry["error"] = str(exc)
+    entry["wall_time_sec"] = round(time.monotonic() - start, 3)
+    return entry
+
+
+def write_manifest(manifest_path, manifest):
+    """Atomically write the batch manifest so a killed batch still leaves a readable file."""
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(tmp_path, manifest_path)
+
+
+def run_batch(directories, parser_args, workers, timeout, manifest_path):
+    """Process all directories with a bounded pool, updating the manifest after each one."""
+    manifest = {
+        "started": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "finished": None,
+        "total": len(directories),
+        "ok": 0,
+        "failed": 0,
+        "timeout": 0,
+        "missing": 0,
+        "wall_time_sec": 0.0,
+        "directories": [],
+    }
+    # Keep the manifest in input order regardless of completion order.
+    entries = [None] * len(directories)
+    start = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            executor.submit(process_directory, results_dir, parser_args, timeout): index
+            for index, results_dir in enumerate(directories)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            try:
+                entry = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                entry = {"path": directories[index], "status": "failed", "exit_code": None,
+                         "wall_time_sec": 0.0, "log": "", "error": str(exc)}
+            entries[index] = entry
+            manifest[entry["status"]] += 1
+            manifest["directories"] = [e for e in entries if e is not None]
+            manifest["wall_time_sec"] = round(time.monotonic() - start, 3)
+            write_manifest(manifest_path, manifest)
+            print(f"[{done}/{len(directories)}] {entry['status'].upper():7} "
+                  f"{entry['wall_time_sec']:8.2f}s  {entry['path']}")
+
+    manifest["finished"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    manifest["directories"] = entries
+    manifest["wall_time_sec"] = round(time.monotonic() - start, 3)
+    write_manifest(manifest_path, manifest)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run main_log_parser.py over many acs_results directories.")
+    parser.add_argument("directories", nargs="*",
+                        help="acs_results directories or glob patterns "
+                             "(quote globs, '**' is supported)")
+    parser.add_argument("--from-file", dest="list_file",
+                        help="Text file with one acs_results directory or glob per line")
+    parser.add_argument("--acs_config_path", default="", help="acs_config.txt passed to every run")
+    parser.add_argument("--system_config_path", default="",
+                        help="system_config.txt passed to every run")
+    parser.add_argument("--waiver", default="", help="waiver.json passed to every run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Number of directories processed at once (default: CPU count)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Suites parsed in parallel inside each directory (default: 1)")
+    parser.add_argument("--timeout", type=float, default=1800,
+                        help="Per-directory timeout in seconds (default: 1800)")
+    parser.add_argument("--manifest", default="batch_manifest.json",
+                        help="Output manifest JSON path (default: batch_manifest.json)")
+    parser.add_argument("--results-db", metavar="DB",
+                        help="SQLite database every run is also stored in (see results_db.py)")
+    args = parser.parse_args(argv)
+
+    directories = expand_directories(args.directories, args.list_file)
+    if not directories:
+        parser.error("no acs_results directories given")
+
+    parser_args = [args.acs_config_path, args.system_config_path, args.waiver,
+                   "--jobs", str(args.jobs)]
+    if args.results_db:
+        parser_args += ["--results-db", os.path.abspath(args.results_db)]
+    manifest = run_batch(directories, parser_args, args.workers, args.timeout, args.manifest)
+
+    print(f"\nProcessed {manifest['total']} directories: {manifest['ok']} ok, "
+          f"{manifest['failed']} failed, "
+          f"{manifest['timeout']} timed out, {manifest['missing']} missing")
+    print(f"Batch manifest: {args.manifest}")
+    return 0 if manifest["ok"] == manifest["total"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,11 +15,19 @@
 # limitations under the License.
 
 import json
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from jinja2 import Template
 import os
+import sys
+
+# Shared helpers (html_chart.py, html_templates.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from html_chart import bar_chart
+from html_templates import get_template, render_to_file
+from suite_categories import enrich_suite_json
+from suite_registry import suite_label as suite_label_for
+# pylint: enable=wrong-import-position
 
 # Helper function to retrieve dictionary values in a case-insensitive manner
 def get_case_insensitive(d, key, default=0):
@@ -52,39 +60,20 @@ def generate_bar_chart_fwts(suite_summary):
     ]
     colors = ['#d4edda', '#f8d7da', '#f39c12', '#9e9e9e', '#ffe0b2', '#fff3cd']
 
-    plt.figure(figsize=(12, 7))
-    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
-
-    total_tests = sum(sizes)
-    max_size = max(sizes) if sizes else 0
-    for bar, size in zip(bars, sizes):
-        yval = bar.get_height()
-        percentage = (size / total_tests) * 100 if total_tests > 0 else 0
-        plt.text(
-            bar.get_x() + bar.get_width()/2,
-            yval + (0.01 * max_size if max_size > 0 else 0.05),
-            f'{percentage:.2f}%',
-            ha='center',
-            va='bottom',
-            fontsize=12
-        )
-
-    plt.title('FWTS Test Results Distribution', fontsize=18, fontweight='bold')
-    plt.ylabel('Total Count', fontsize=14)
-    plt.xticks(fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.tight_layout()
-
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return bar_chart(
+        labels,
+        sizes,
+        colors,
+        'FWTS Test Results Distribution',
+        'Total Count',
+        alt='Test Results Distribution'
+    )
 
 # Function to generate HTML content for both summary and detailed pages
-def generate_html_fwts(suite_summary, test_results, chart_data, output_html_path, is_summary_page=True):
+def generate_html_fwts(suite_summary, test_results, chart_data, output_html_path, is_summary_page=True,
+                       suite_label="FWTS"):
     # Jinja2 template with ONE "Reason" column + a fixed "Waiver Reason" column
-    template = Template(r"""
+    template = get_template("fwts.html", r"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -184,11 +173,11 @@ def generate_html_fwts(suite_summary, test_results, chart_data, output_html_path
         </style>
     </head>
     <body>
-        <h1>FWTS Test Summary</h1>
+        <h1>{{ suite_label }} Test Summary</h1>
 
         {% if not is_summary_page %}
         <div class="chart-container">
-            <img src="data:image/png;base64,{{ chart_data }}" alt="Test Results Distribution">
+            {{ chart_data }}
         </div>
         {% endif %}
 
@@ -237,7 +226,7 @@ def generate_html_fwts(suite_summary, test_results, chart_data, output_html_path
         {% if not is_summary_page %}
         <div class="detailed-summary">
             {% for test in test_results %}
-            <div class="test-suite-header">Test Suite: {{ test.Test_suite }}</div>
+            <div class="test-suite-header">Test Suite: {{ test.Test_suite }}</div>{{ suite_info_html(test.Test_suite_info) }}
             <div class="test-suite-description">Description: {{ test.Test_suite_description }}</div>
 
             <table>
@@ -314,7 +303,9 @@ def generate_html_fwts(suite_summary, test_results, chart_data, output_html_path
         + suite_summary["total_warnings"]
     )
 
-    html_content = template.render(
+    render_to_file(
+        template,
+        output_html_path,
         chart_data=chart_data,
         total_tests=total_tests,
         total_passed=suite_summary["total_passed"],
@@ -324,15 +315,16 @@ def generate_html_fwts(suite_summary, test_results, chart_data, output_html_path
         total_skipped=suite_summary["total_skipped"],
         total_warnings=suite_summary["total_warnings"],
         test_results=test_results,
-        is_summary_page=is_summary_page
+        is_summary_page=is_summary_page,
+        suite_label=suite_label
     )
 
-    with open(output_html_path, "w") as file:
-        file.write(html_content)
-
 def main(input_json_file, detailed_html_file, summary_html_file):
     with open(input_json_file, 'r') as json_file:
         data = json.load(json_file)
+    data = enrich_suite_json(input_json_file, data)
+    # bbsr_fwts.json is rendered with the BBSR-FWTS heading
+    suite_label = suite_label_for(input_json_file, "FWTS")
 
     suite_summary = {
         'total_passed': 0,
@@ -363,13 +355,14 @@ def main(input_json_file, detailed_html_file, summary_html_file):
     chart_data = generate_bar_chart_fwts(suite_summary)
 
     # Generate the detailed summary page
-    generate_html_fwts(suite_summary, test_results, chart_data, detailed_html_file, is_summary_page=False)
+    generate_html_fwts(suite_summary, test_results, chart_data, detailed_html_file, is_summary_page=False,
+                       suite_label=suite_label)
 
     # Generate the summary page
-    generate_html_fwts(suite_summary, test_results, chart_data, summary_html_file, is_summary_page=True)
+    generate_html_fwts(suite_summary, test_results, chart_data, summary_html_file, is_summary_page=True,
+                       suite_label=suite_label)
 
 if __name__ == "__main__":
-    import sys
     if len(sys.argv) != 4:
         print("Usage: python fwts_generate_html.py <input_json_file> <detailed_html_file> <summary_html_file>")
         sys.exit(1)
@@ -14,9 +14,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
 import re
-import json
+from itertools import chain
+
+# Shared helpers (json_stream.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+import json_stream  # pylint: disable=wrong-import-position
+
+SUBTEST_HEADER_RE = re.compile(r"Test (\d+) of (\d+): (.+)")
+NEW_ENTRY_RE = re.compile(r"^(Test \d+ of \d+:|\w+:|PASSED\b|FAILED\b|SKIPPED\b|WARNING\b|ABORTED\b)")
+SEPARATOR_RE = re.compile(r'^[=\-]+$')
+WORD_RE = re.compile(r'\b(\w+)\b')
+SKIP_ACPI_RE = re.compile(r"ACPI\s+(\S+)\s+table does not exist, skipping test")
 
 def is_pci_test(test_suite_name):
     """
@@ -29,12 +42,31 @@ def is_pci_test(test_suite_name):
     test_lower = test_suite_name.lower()
     return "pci" in test_lower
 
-def parse_fwts_log(log_path):
-    with open(log_path, 'r') as f:
-        log_data = f.readlines()
+def is_new_entry_line(text):
+    return NEW_ENTRY_RE.match(text) is not None
 
+def read_main_tests(log_file):
+    """
+    Read the "Running tests:" header (up to its ==== separator) and return
+    the set of main test names plus the lines consumed, so the caller can
+    replay them and carry on streaming the rest of the file.
+    """
+    main_tests = set()
+    header_lines = []
+    running_tests_started = False
+    for line in log_file:
+        header_lines.append(line)
+        if "Running tests:" in line:
+            running_tests_started = True
+            main_tests.update(WORD_RE.findall(line.split(':', 1)[1].strip()))
+        elif running_tests_started and not SEPARATOR_RE.match(line.strip()):  # Continuation of Running tests line
+            main_tests.update(WORD_RE.findall(line.strip()))
+        elif running_tests_started:  # Stop if separator line appears
+            break
+    return main_tests, header_lines
+
+def parse_fwts_log(log_path):
     results = []
-    main_tests = []
     current_test = None
     current_subtest = None
     Test_suite_description = None
@@ -48,25 +80,34 @@ def parse_fwts_log(log_path):
         "total_warnings": 0
     }
 
-    def is_new_entry_line(text):
-        return bool(re.match(r"^(Test \d+ of \d+:|\w+:|PASSED\b|FAILED\b|SKIPPED\b|WARNING\b|ABORTED\b)", text))
+    # A result reason continues on the following lines until an empty line or
+    # the start of a new entry. Each open reason is a (list, index) slot that
+    # is filled in as those lines stream past, so reasons keep the order in
+    # which their result lines appeared.
+    open_reasons = []
 
-    # First, identify all main tests from the "Running tests:" lines
-    running_tests_started = False
-    for line in log_data:
-        if "Running tests:" in line:
-            running_tests_started = True
-            main_tests += re.findall(r'\b(\w+)\b', line.split(':', 1)[1].strip())
-        elif running_tests_started and not re.match(r'^[=\-]+$', line.strip()):  # Continuation of Running tests line
-            main_tests += re.findall(r'\b(\w+)\b', line.strip())
-        elif running_tests_started and re.match(r'^[=\-]+$', line.strip()):  # Stop if separator line appears
-            break
+    def add_reason(reasons, reason_text):
+        open_reasons.append((reasons, len(reasons)))
+        reasons.append(reason_text)
+
+    with open(log_path, 'r') as f:
+        # First, identify all main tests from the "Running tests:" lines
+        main_tests, header_lines = read_main_tests(f)
 
-    # Process the log data
-    for i, line in enumerate(log_data):
-        # Detect the start of a new main test
-        for main_test in main_tests:
-            if line.startswith(main_test + ":"):
+        # Process the log data
+        for line in chain(header_lines, f):
+            if open_reasons:
+                next_line = line.strip()
+                # Stop if next_line is empty or looks like the start of a new test/subtest entry
+                if not next_line or is_new_entry_line(next_line):
+                    open_reasons.clear()
+                else:
+                    for reasons, index in open_reasons:
+                        reasons[index] += " " + next_line
+
+            # Detect the start of a new main test: "<main test>: <description>"
+            main_test = line[:line.find(":")] if ":" in line else None
+            if main_test in main_tests:
                 if current_test:  # Save the previous test
                     if current_subtest:
                         current_test["subtests"].append(current_subtest)
@@ -78,7 +119,7 @@ def parse_fwts_log(log_path):
                     results.append(current_test)
 
                 # Start a new main test
-                Test_suite_description = line.split(':', 1)[1].strip() if ':' in line else "No description"
+                Test_suite_description = line.split(':', 1)[1].strip()
                 current_test = {
                     "Test_suite": main_test,
                     "Test_suite_description": Test_suite_description,
@@ -92,44 +133,22 @@ def parse_fwts_log(log_path):
                     }
                 }
                 current_subtest = None  # Reset current_subtest
-                break
-
-        # Detect subtest start, subtest number, and subtest description
-        subtest_match = re.match(r"Test (\d+) of (\d+): (.+)", line)
-        if subtest_match:
-            if current_subtest:  # Save the previous subtest
-                current_test["subtests"].append(current_subtest)
-
-            subtest_number = f'{subtest_match.group(1)} of {subtest_match.group(2)}'
-            sub_Test_Description = subtest_match.group(3).strip()
-
-            current_subtest = {
-                "sub_Test_Number": subtest_number,
-                "sub_Test_Description": sub_Test_Description,
-                "sub_test_result": {
-                    "PASSED": 0,
-                    "FAILED": 0,
-                    "ABORTED": 0,
-                    "SKIPPED": 0,
-                    "WARNINGS": 0,
-                    "pass_reasons": [],
-                    "fail_reasons": [],
-                    "abort_reasons": [],
-                    "skip_reasons": [],
-                    "warning_reasons": []
-                }
-            }
-            continue
 
-        # Treat esrt abort test as failure
-        if "Aborted" in line and "Cannot find ESRT table" in line:
-            if not current_subtest:
+            # Detect subtest start, subtest number, and subtest description
+            subtest_match = SUBTEST_HEADER_RE.match(line) if line.startswith("Test ") else None
+            if subtest_match:
+                if current_subtest:  # Save the previous subtest
+                    current_test["subtests"].append(current_subtest)
+
+                subtest_number = f'{subtest_match.group(1)} of {subtest_match.group(2)}'
+                sub_Test_Description = subtest_match.group(3).strip()
+
                 current_subtest = {
-                    "sub_Test_Number": "Test 1 of 1",
-                    "sub_Test_Description": " ",
+                    "sub_Test_Number": subtest_number,
+                    "sub_Test_Description": sub_Test_Description,
                     "sub_test_result": {
                         "PASSED": 0,
-                        "FAILED": 1,
+                        "FAILED": 0,
                         "ABORTED": 0,
                         "SKIPPED": 0,
                         "WARNINGS": 0,
@@ -140,131 +159,117 @@ def parse_fwts_log(log_path):
                         "warning_reasons": []
                     }
                 }
-            abort_reason = line.strip()
-            current_subtest["sub_test_result"]["abort_reasons"].append(abort_reason)
-            continue
-
-        # Capture pass/fail/abort/skip/warning info
-        if current_subtest:
-            if "PASSED" in line:
-                current_subtest["sub_test_result"]["PASSED"] += 1
-                if "PASSED:" in line:
-                    reason_text = line.split("PASSED:", 1)[1].strip()
-                else:
-                    reason_text = line.replace("PASSED", "").strip()
-                j = i + 1
-                while j < len(log_data):
-                    next_line = log_data[j].strip()
-                    # Break if next_line is empty or looks like the start of a new test/subtest entry
-                    if not next_line or is_new_entry_line(next_line):
-                        break
-                    reason_text += " " + next_line
-                    j += 1
-                current_subtest["sub_test_result"]["pass_reasons"].append(reason_text)
-            elif "FAILED" in line:
-                current_subtest["sub_test_result"]["FAILED"] += 1
-                # Capture everything after the first colon if present, otherwise the rest of the line.
-                if ":" in line:
-                    reason_text = line.split(":", 1)[1].strip()
-                else:
-                    reason_text = line.replace("FAILED", "").strip()
-                # Append subsequent lines that seem to be part of the reason.
-                j = i + 1
-                while j < len(log_data):
-                    next_line = log_data[j].strip()
-                    # Stop if next_line is empty or looks like the start of a new test/subtest
-                    if not next_line or is_new_entry_line(next_line):
-                        break
-                    reason_text += " " + next_line
-                    j += 1
-                current_subtest["sub_test_result"]["fail_reasons"].append(reason_text)
-            elif "SKIPPED" in line:
-                current_subtest["sub_test_result"]["SKIPPED"] += 1
-                if "SKIPPED:" in line:
-                    reason_text = line.split("SKIPPED:", 1)[1].strip()
-                    j = i + 1
-                    while j < len(log_data):
-                        next_line = log_data[j].strip()
-                        # Break if next_line is empty or looks like the start of a new test/subtest
-                        if not next_line or is_new_entry_line(next_line):
-                            break
-                        reason_text += " " + next_line
-                        j += 1
-                    current_subtest["sub_test_result"]["skip_reasons"].append(reason_text)
-            elif "WARNING" in line:
-                current_subtest["sub_test_result"]["WARNINGS"] += 1
-                if "WARNING:" in line:
-                    reason_text = line.split("WARNING:", 1)[1].strip()
-                else:
-                    reason_text = line.replace("WARNING", "").strip()
-                j = i + 1
-                while j < len(log_data):
-                    next_line = log_data[j].strip()
-                    # Break if next_line is empty or looks like the start of a new test/subtest entry
-                    if not next_line or is_new_entry_line(next_line):
-                        break
-                    reason_text += " " + next_line
-                    j += 1
-                current_subtest["sub_test_result"]["warning_reasons"].append(reason_text)
-        else:
-            # Handle SKIPPED when no current_subtest exists
-            # detect lines like "ACPI XXX table does not exist, skipping test"
-            skip_acpi_match = re.search(r"ACPI\s+(\S+)\s+table does not exist, skipping test", line)
-            if skip_acpi_match and current_test:
-                # Create a new subtest to record the skip
-                sub_desc = current_test.get("Test_suite_description")
-
-                skip_subtest = {
-                    "sub_Test_Number": "Test 1 of 1",
-                    "sub_Test_Description": sub_desc,
-                    "sub_test_result": {
-                        "PASSED": 0,
-                        "FAILED": 0,
-                        "ABORTED": 0,
-                        "SKIPPED": 1,
-                        "WARNINGS": 0,
-                        "pass_reasons": [],
-                        "fail_reasons": [],
-                        "abort_reasons": [],
-                        "skip_reasons": [line.strip()],
-                        "warning_reasons": []
-                    }
-                }
-                current_test["subtests"].append(skip_subtest)
-                # do not continue here because we want to also catch normal "SKIPPED" if present
+                continue
 
-            if "SKIPPED" in line:
-                current_subtest = {
-                    "sub_Test_Number": "Test 1 of 1",
-                    "sub_Test_Description": "Skipped test",
-                    "sub_test_result": {
-                        "PASSED": 0,
-                        "FAILED": 0,
-                        "ABORTED": 0,
-                        "SKIPPED": 1,
-                        "WARNINGS": 0,
-                        "pass_reasons": [],
-                        "fail_reasons": [],
-                        "abort_reasons": [],
-                        "skip_reasons": [],
-                        "warning_reasons": []
+            # Treat esrt abort test as failure
+            if "Aborted" in line and "Cannot find ESRT table" in line:
+                if not current_subtest:
+                    current_subtest = {
+                        "sub_Test_Number": "Test 1 of 1",
+                        "sub_Test_Description": " ",
+                        "sub_test_result": {
+                            "PASSED": 0,
+                            "FAILED": 1,
+                            "ABORTED": 0,
+                            "SKIPPED": 0,
+                            "WARNINGS": 0,
+                            "pass_reasons": [],
+                            "fail_reasons": [],
+                            "abort_reasons": [],
+                            "skip_reasons": [],
+                            "warning_reasons": []
+                        }
                     }
-                }
-                if "SKIPPED:" in line:
-                    reason_text = line.split("SKIPPED:")[1].strip()
-                    current_subtest["sub_test_result"]["skip_reasons"].append(reason_text)
-                current_test["subtests"].append(current_subtest)
-                current_subtest = None
+                abort_reason = line.strip()
+                current_subtest["sub_test_result"]["abort_reasons"].append(abort_reason)
                 continue
 
-        # Parse per-test summary lines
-        per_test_summary_match = re.match(
-            r"^(\d+) passed,\s*(\d+) failed,\s*(\d+) warning,\s*(\d+) aborted,\s*(\d+) skipped,\s*(\d+) info only\.$",
-            line.strip()
-        )
-        if per_test_summary_match:
-            # Not updating counts here; we sum from subtests anyway
-            continue
+            # Capture pass/fail/abort/skip/warning info
+            if current_subtest:
+                if "PASSED" in line:
+                    current_subtest["sub_test_result"]["PASSED"] += 1
+                    if "PASSED:" in line:
+                        reason_text = line.split("PASSED:", 1)[1].strip()
+                    else:
+                        reason_text = line.replace("PASSED", "").strip()
+                    add_reason(current_subtest["sub_test_result"]["pass_reasons"], reason_text)
+                elif "FAILED" in line:
+                    current_subtest["sub_test_result"]["FAILED"] += 1
+                    # Capture everything after the first colon if present, otherwise the rest of the line.
+                    if ":" in line:
+                        reason_text = line.split(":", 1)[1].strip()
+                    else:
+                        reason_text = line.replace("FAILED", "").strip()
+                    # Subsequent lines that seem to be part of the reason are appended as they are read.
+                    add_reason(current_subtest["sub_test_result"]["fail_reasons"], reason_text)
+                elif "SKIPPED" in line:
+                    current_subtest["sub_test_result"]["SKIPPED"] += 1
+                    if "SKIPPED:" in line:
+                        reason_text = line.split("SKIPPED:", 1)[1].strip()
+                        add_reason(current_subtest["sub_test_result"]["skip_reasons"], reason_text)
+                elif "WARNING" in line:
+                    current_subtest["sub_test_result"]["WARNINGS"] += 1
+                    if "WARNING:" in line:
+                        reason_text = line.split("WARNING:", 1)[1].strip()
+                    else:
+                        reason_text = line.replace("WARNING", "").strip()
+                    add_reason(current_subtest["sub_test_result"]["warning_reasons"], reason_text)
+            else:
+                # Handle SKIPPED when no current_subtest exists
+                # detect lines like "ACPI XXX table does not exist, skipping test"
+                skip_acpi_match = (
+                    SKIP_ACPI_RE.search(line)
+                    if "table does not exist, skipping test" in line else None
+                )
+                if skip_acpi_match and current_test:
+                    # Create a new subtest to record the skip
+                    sub_desc = current_test.get("Test_suite_description")
+
+                    skip_subtest = {
+                        "sub_Test_Number": "Test 1 of 1",
+                        "sub_Test_Description": sub_desc,
+                        "sub_test_result": {
+                            "PASSED": 0,
+                            "FAILED": 0,
+                            "ABORTED": 0,
+                            "SKIPPED": 1,
+                            "WARNINGS": 0,
+                            "pass_reasons": [],
+                            "fail_reasons": [],
+                            "abort_reasons": [],
+                            "skip_reasons": [line.strip()],
+                            "warning_reasons": []
+                        }
+                    }
+                    current_test["subtests"].append(skip_subtest)
+                    # do not continue here because we want to also catch normal "SKIPPED" if present
+
+                if "SKIPPED" in line:
+                    current_subtest = {
+                        "sub_Test_Number": "Test 1 of 1",
+                        "sub_Test_Description": "Skipped test",
+                        "sub_test_result": {
+                            "PASSED": 0,
+                            "FAILED": 0,
+                            "ABORTED": 0,
+                            "SKIPPED": 1,
+                            "WARNINGS": 0,
+                            "pass_reasons": [],
+                            "fail_reasons": [],
+                            "abort_reasons": [],
+                            "skip_reasons": [],
+                            "warning_reasons": []
+                        }
+                    }
+                    if "SKIPPED:" in line:
+                        reason_text = line.split("SKIPPED:")[1].strip()
+                        current_subtest["sub_test_result"]["skip_reasons"].append(reason_text)
+                    current_test["subtests"].append(current_subtest)
+                    current_subtest = None
+                    continue
+
+            # Per-test summary lines ("N passed, N failed, ...") are not used;
+            # the counts are summed from the subtests.
 
     # After processing all lines, save the last test + subtest
     if current_subtest:
@@ -380,5 +385,4 @@ if __name__ == "__main__":
     output_json = parse_fwts_log(log_file_path)
 
     # Write to specified output file
-    with open(output_file_path, 'w') as outfile:
-        json.dump(output_json, outfile, indent=4)
+    json_stream.dump(output_json, output_file_path)
@@ -15,10 +15,19 @@
 # limitations under the License.
 
 import json
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from jinja2 import Environment, FileSystemLoader, Template
+import os
+import sys
+
+# Shared helpers (html_chart.py, html_templates.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from html_chart import bar_chart
+from html_templates import get_template, render_to_file
+from suite_categories import enrich_suite_json
+from suite_registry import suite_label as suite_label_for
+# pylint: enable=wrong-import-position
 
 # Helper function to retrieve dictionary values in a case-insensitive manner
 def get_case_insensitive(d, key, default=0):
@@ -78,44 +87,20 @@ def generate_bar_chart_improved(suite_summary):
         '#cccccc'   # Ignored (gray)
     ]
 
-    plt.figure(figsize=(12, 7))
-    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
-
-    # Add percentage labels on top of each bar
-    total_tests = sum(sizes)
-    for bar, size in zip(bars, sizes):
-        yval = bar.get_height()
-        percentage = (size / total_tests) * 100 if total_tests > 0 else 0
-        plt.text(
-            bar.get_x() + bar.get_width()/2,
-            yval + max(sizes)*0.01,
-            f'{percentage:.2f}%',
-            ha='center',
-            va='bottom',
-            fontsize=12
-        )
-
-    plt.title('SCT Test Results Distribution', fontsize=18, fontweight='bold')
-    plt.ylabel('Total Count', fontsize=14)
-    plt.xticks(fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.tight_layout()
-
-    # Save the figure to a buffer
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return bar_chart(
+        labels,
+        sizes,
+        colors,
+        'SCT Test Results Distribution',
+        'Total Count',
+        alt='Test Results Distribution'
+    )
 
 # Function to generate HTML content for both summary and detailed pages
-def generate_html_improved(suite_summary, test_results, chart_data, output_html_path, is_summary_page=True):
-    # Initialize Jinja2 environment
-    env = Environment(autoescape=True)
-    env.filters['determine_css_class'] = determine_css_class
-
+def generate_html_improved(suite_summary, test_results, chart_data, output_html_path, is_summary_page=True,
+                           suite_label="SCT"):
     # Template for both summary and detailed pages with Waiver handling + 'Ignored'
-    template = env.from_string("""
+    template = get_template("sct.html", """
     <!DOCTYPE html>
     <html>
     <head>
@@ -226,11 +211,11 @@ def generate_html_improved(suite_summary, test_results, chart_data, output_html_
         </style>
     </head>
     <body>
-        <h1>SCT Test Summary</h1>
+        <h1>{{ suite_label }} Test Summary</h1>
 
         {% if not is_summary_page %}
         <div class="chart-container">
-            <img src="data:image/png;base64,{{ chart_data }}" alt="Test Results Distribution">
+            {{ chart_data | safe }}
         </div>
         {% endif %}
 
@@ -284,7 +269,7 @@ def generate_html_improved(suite_summary, test_results, chart_data, output_html_
         {% if not is_summary_page %}
         <div class="detailed-summary">
             {% for test in test_results %}
-            <div class="heading">Test Suite Name: <span>{{ test.Test_suite }}</span></div>
+            <div class="heading">Test Suite Name: <span>{{ test.Test_suite }}</span></div>{{ suite_info_html(test.Test_suite_info) }}
             <div class="heading">Sub Test Suite: <span>{{ test.Sub_test_suite }}</span></div>
             <div class="heading">Test Case: <span>{{ test.Test_case }}</span></div>
             <div class="heading">Test Case Description: <span>{{ test.Test_case_description }}</span></div>
@@ -330,7 +315,7 @@ def generate_html_improved(suite_summary, test_results, chart_data, output_html_
         {% endif %}
     </body>
     </html>
-    """)
+    """, autoescape=True, filters={"determine_css_class": determine_css_class})
 
     # Instead of re-summing, we just read the final suite_summary from the JSON
     total_tests = (
@@ -344,7 +329,9 @@ def generate_html_improved(suite_summary, test_results, chart_data, output_html_
     )
 
     # Render the HTML content
-    html_content = template.render(
+    render_to_file(
+        template,
+        output_html_path,
         chart_data=chart_data,
         total_tests=total_tests,
         total_passed=suite_summary.get("total_passed", 0),
@@ -355,33 +342,35 @@ def generate_html_improved(suite_summary, test_results, chart_data, output_html_
         total_warnings=suite_summary.get("total_warnings", 0),
         total_ignored=suite_summary.get("total_ignored", 0),
         test_results=test_results,
-        is_summary_page=is_summary_page
+        is_summary_page=is_summary_page,
+        suite_label=suite_label
     )
 
-    with open(output_html_path, "w") as file:
-        file.write(html_content)
-
 def main(input_json_file, detailed_html_file, summary_html_file):
     # Load JSON data
     with open(input_json_file, 'r') as json_file:
         data = json.load(json_file)
+    data = enrich_suite_json(input_json_file, data)
+    # bbsr_sct.json is rendered with the BBSR-SCT heading
+    suite_label = suite_label_for(input_json_file, "SCT")
 
     # We DIRECTLY take the final suite_summary from the JSON
     suite_summary = data["suite_summary"]
     # And the test_results
     test_results = data["test_results"]
 
-    # Generate improved bar chart as base64 encoded image
+    # Generate improved bar chart markup (inline SVG by default)
     chart_data = generate_bar_chart_improved(suite_summary)
 
     # Generate the detailed summary page
-    generate_html_improved(suite_summary, test_results, chart_data, detailed_html_file, is_summary_page=False)
+    generate_html_improved(suite_summary, test_results, chart_data, detailed_html_file, is_summary_page=False,
+                           suite_label=suite_label)
 
     # Generate the summary page with the bar chart
-    generate_html_improved(suite_summary, test_results, chart_data, summary_html_file, is_summary_page=True)
+    generate_html_improved(suite_summary, test_results, chart_data, summary_html_file, is_summary_page=True,
+                           suite_label=suite_label)
 
 if __name__ == "__main__":
-    import sys
     if len(sys.argv) != 4:
         print("Usage: python json_to_html.py <input_json_file> <detailed_html_file> <summary_html_file>")
         sys.exit(1)
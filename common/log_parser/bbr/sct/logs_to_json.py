@@ -17,8 +17,22 @@
 import json
 import argparse
 import re
-import chardet
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared helpers (log_encoding.py, json_stream.py) live in the log_parser
+# directory, the edk2-test-parser table reader next to this script.
+SCT_PARSER_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(SCT_PARSER_DIR))
+for _path in (LOG_PARSER_DIR, SCT_PARSER_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+# pylint: disable=wrong-import-position
+import json_stream
+from log_encoding import detect_file_encoding
+from logs_to_json_edk2 import parse_edk2_log
+# pylint: enable=wrong-import-position
 
 # Determine if we're in Device Tree (DT) mode or SR mode by checking yocto flag.
 YOCTO_FLAG_PATH = "/mnt/yocto_image.flag"
@@ -55,14 +69,16 @@ def is_smbios_test(test_case_name):
 def is_runtime_properties_table_test(subtest_description):
     """
     Check if a subtest is the buggy EFI Runtime Properties Table test.
-    Matches: "UEFI Compliant - EFI Runtime Properties Table has inconsistencies in runtime service support"
+    Matches: "UEFI Compliant - EFI Runtime Properties Table has inconsistencies in runtime
+    service support"
     This subtest has a known bug and should be filtered out to prevent incorrect non-compliance.
 
     """
     if not subtest_description:
         return False
     # Match the specific subtest description (case-insensitive)
-    target_test = "uefi compliant - efi runtime properties table has inconsistencies in runtime service support"
+    target_test = ("uefi compliant - efi runtime properties table has inconsistencies"
+                   " in runtime service support")
     return target_test in subtest_description.lower()
 
 # JSON mapping of Test Suites, Sub Test Suites, and Test Cases
@@ -240,7 +256,7 @@ test_mapping = {
             "SetBarAttributes_Func"
         ]
     },
- 
+
     "MediaAccessTest": {
         "SimpleFileSystemProtocolTest": [
             "Flush_Func"
@@ -465,57 +481,133 @@ test_mapping = {
     }
 }
 
-def detect_file_encoding(file_path):
-    with open(file_path, 'rb') as file:
-        raw_data = file.read()
-        result = chardet.detect(raw_data)
-        return result['encoding']
+# Test case -> (test suite, sub test suite), built once from test_mapping.  A
+# case listed under several sub suites keeps the first one, as the linear
+# scan of test_mapping this replaces did.
+TEST_CASE_INDEX = {}
+for _test_suite, _sub_suites in test_mapping.items():
+    for _sub_suite, _test_cases in _sub_suites.items():
+        for _test_case in _test_cases:
+            TEST_CASE_INDEX.setdefault(_test_case, (_test_suite, _sub_suite))
+
+DEVICE_PATH_RE = re.compile(r'^\s*Device\s*Path\s*:', re.IGNORECASE)
+CASE_RESULT_RE = re.compile(r'^([^:]+):\s*\[(.*?)\]')
+SUBTEST_RESULT_RE = re.compile(r'--\s*(PASS|FAIL|FAILURE|WARNING|NOT SUPPORTED)', re.IGNORECASE)
+DESCRIPTION_SPLIT_RE = re.compile(r"[,.]")
 
 def clean_test_description(description):
     if description.startswith("/"):
-        cleaned_desc = re.split(r"[,.]", description)[-1].strip()
+        cleaned_desc = DESCRIPTION_SPLIT_RE.split(description)[-1].strip()
         return cleaned_desc
     return description
 
 def find_test_suite_and_subsuite(test_case_name):
-    for test_suite, sub_suites in test_mapping.items():
-        for sub_suite, test_cases in sub_suites.items():
-            if test_case_name in test_cases:
-                return test_suite, sub_suite
-    return None, None
+    return TEST_CASE_INDEX.get(test_case_name, (None, None))
+
+def set_test_case(test_entry, test_case_name):
+    test_entry["Test_case"] = test_case_name
+    test_suite, sub_test_suite = find_test_suite_and_subsuite(test_case_name)
+    test_entry["Test_suite"] = test_suite if test_suite else "Unknown"
+    test_entry["Sub_test_suite"] = sub_test_suite if sub_test_suite else "Unknown"
 
-def main(input_file, output_file):
+def set_case_result(test_entry, result):
+    test_entry["test_result"] = normalize_result(result)
+    test_entry["reason"] = ""
+
+def build_edk2_overrides(edk2_records):
+    """Index parse_edk2_log() records as (test-level, sub-test) override dicts.
+
+    Test-level overrides are keyed on the Entry Point GUID, sub-test ones on
+    (Entry Point GUID, sub-test GUID, description), all upper-cased.  Records
+    without a result or with FAILURE do not override anything.
+    """
+    subtest_dict = {}
+    test_guid_dict = {}
+    for item in edk2_records:
+        ep_guid = item.get("Test Entry Point GUID", "").strip()
+        sub_guid = item.get("sub_Test_GUID", "").strip()
+        result_val = item.get("result", "")
+        reason_val = item.get("reason", "")
+
+        if not result_val or result_val == "FAILURE":
+            continue
+
+        if ep_guid and sub_guid:
+            desc = item.get("sub_Test_Description", "").strip().upper()
+            subtest_dict[(ep_guid.upper(), sub_guid.upper(), desc)] = {
+                "result": result_val,
+                "reason": reason_val
+            }
+        elif ep_guid and not sub_guid:
+            test_guid_dict[ep_guid.upper()] = {
+                "result": result_val,
+                "reason": reason_val
+            }
+    return test_guid_dict, subtest_dict
+
+def apply_edk2_overrides(results, test_guid_dict, subtest_dict):
+    for test_obj in results:
+        ep_guid_current = test_obj["Test Entry Point GUID"].upper()
+        if ep_guid_current in test_guid_dict:
+            test_obj["test_result"] = normalize_result(test_guid_dict[ep_guid_current]["result"])
+            test_obj["reason"] = test_guid_dict[ep_guid_current]["reason"]
+
+        for subtest in test_obj["subtests"]:
+            st_guid = subtest["sub_Test_GUID"].upper()
+            if (ep_guid_current, st_guid) in subtest_dict:
+                match_record = subtest_dict[(ep_guid_current, st_guid)]
+                subtest["sub_test_result"] = normalize_result(match_record["result"])
+                subtest["reason"] = match_record["reason"]
+            desc_key = subtest["sub_Test_Description"].strip().upper()
+            lookup_key = (ep_guid_current, st_guid, desc_key)
+
+            if lookup_key in subtest_dict:
+                match_record = subtest_dict[lookup_key]
+                result_val = match_record.get("result", "").strip()
+                reason_val = match_record.get("reason", "").strip()
+                if result_val:
+                    subtest["sub_test_result"] = normalize_result(result_val)
+                    subtest["reason"] = reason_val
+
+def parse_sct_log(input_file):
+    """Stream a Summary.log and return its test entries in log order."""
     file_encoding = detect_file_encoding(input_file)
     results = []
     test_entry = None
     sub_test_number = 0
     capture_description = False
 
-    # We'll fill "suite_summary" after final classification
-    suite_summary = {
-        "total_passed": 0,
-        "total_failed": 0,
-        "total_failed_with_waiver": 0,
-        "total_aborted": 0,
-        "total_skipped": 0,
-        "total_warnings": 0,
-        # NEW - Not used until final classification,
-        # but we show how to handle if we want total_ignored here
-        # We won't add it unless specifically needed
-    }
-
-    bbsr_sct_flag = False
-    output_base = os.path.basename(output_file)
-    if output_base.startswith("bbsr_"):
-        bbsr_sct_flag = True
+    # The log is streamed line by line.  Fields that come from the lines after
+    # a marker (the test name after "BBR ACS", the result after "Returned
+    # Status Code", the GUID and path after a sub-test) are filled in when
+    # those lines arrive, before the line itself is looked at.
+    name_entry = None      # entry whose Test_case is the next line
+    status_entry = None    # entry whose test_result is on the next non-empty line
+    guid_subtest = None    # sub-test whose GUID is the next line
+    path_subtest = None    # sub-test whose path is the next line
 
     with open(input_file, "r", encoding=file_encoding, errors="ignore") as file:
-        lines = file.readlines()
-
-        for i, line in enumerate(lines):
+        for line in file:
             line = line.strip()
 
-            if re.match(r'^\s*Device\s*Path\s*:', line, re.IGNORECASE):
+            if path_subtest is not None:
+                path_subtest["sub_Test_Path"] = line
+                if ":" in line:
+                    path_subtest["reason"] = line.rsplit(":", 1)[1].strip()
+                path_subtest = None
+            if guid_subtest is not None:
+                guid_subtest["sub_Test_GUID"] = line
+                path_subtest, guid_subtest = guid_subtest, None
+            if name_entry is not None:
+                set_test_case(name_entry, line)
+                name_entry = None
+            if status_entry is not None and line:
+                m = CASE_RESULT_RE.match(line)
+                if m:
+                    set_case_result(status_entry, m.group(2))
+                status_entry = None
+
+            if line[:1] in ("D", "d") and DEVICE_PATH_RE.match(line):
                 dp_value = line.split(':', 1)[1].strip()
                 if test_entry is not None:
                     test_entry["Device Path"] = dp_value
@@ -543,21 +635,18 @@ def main(input_file, output_file):
                         "total_ignored": 0  # <--- NEW field in each test
                     }
                 }
-                # Next line is the test name
-                if i + 1 < len(lines):
-                    test_entry["Test_case"] = lines[i+1].strip()
+                # Next line is the test name; until it arrives the entry has
+                # an empty name, as at the end of the log.
+                set_test_case(test_entry, "")
+                name_entry = test_entry
 
                 sub_test_number = 0
-                # Attempt to find the test suite/subsuite
-                test_suite, sub_test_suite = find_test_suite_and_subsuite(test_entry["Test_case"])
-                test_entry["Test_suite"] = test_suite if test_suite else "Unknown"
-                test_entry["Sub_test_suite"] = sub_test_suite if sub_test_suite else "Unknown"
 
             if "Test Configuration #0" in line:
                 capture_description = True
                 continue
 
-            if capture_description and line and not re.match(r'-+', line):
+            if capture_description and line and not line.startswith("-"):
                 test_entry["Test_case_description"] = line
                 capture_description = False
 
@@ -566,21 +655,11 @@ def main(input_file, output_file):
 
             if "Returned Status Code" in line:
                 test_entry["Returned Status Code"] = line.split(':', 1)[1].strip()
-                # Attempt to parse next lines for "XYZ: [RESULT]"
-                j = i + 1
-                while j < len(lines):
-                    candidate = lines[j].strip()
-                    j += 1
-                    if not candidate:
-                        continue
-                    m = re.search(r'^([^:]+):\s*\[(.*?)\]', candidate)
-                    if m:
-                        test_entry["test_result"] = normalize_result(m.group(2))
-                        test_entry["reason"] = ""
-                    break
+                # The next non-empty line may carry "XYZ: [RESULT]"
+                status_entry = test_entry
 
             # Sub-test detection from lines like "FooTest -- PASS"
-            if re.search(r'--\s*(PASS|FAIL|FAILURE|WARNING|NOT SUPPORTED)', line, re.IGNORECASE):
+            if "--" in line and SUBTEST_RESULT_RE.search(line):
                 parts = line.rsplit(' -- ', 1)
                 test_desc = clean_test_description(parts[0])
                 result_str = normalize_result(parts[1])
@@ -603,102 +682,30 @@ def main(input_file, output_file):
                 else:
                     test_entry["test_case_summary"]["total_ignored"] += 1
 
-                test_guid = lines[i+1].strip() if i+1 < len(lines) else ""
-                file_path = lines[i+2].strip() if i+2 < len(lines) else ""
-
                 sub_test_number += 1
 
-                reason = ""
-                if ":" in file_path:
-                    reason_split = file_path.rsplit(":", 1)
-                    if len(reason_split) > 1:
-                        reason = reason_split[1].strip()
-
+                # GUID and path follow on the next two lines
                 sub_test = {
                     "sub_Test_Number": str(sub_test_number),
                     "sub_Test_Description": test_desc,
-                    "sub_Test_GUID": test_guid,
+                    "sub_Test_GUID": "",
                     "sub_test_result": result_str,
-                    "sub_Test_Path": file_path,
-                    "reason": reason
+                    "sub_Test_Path": "",
+                    "reason": ""
                 }
                 test_entry["subtests"].append(sub_test)
+                guid_subtest = sub_test
 
         # End of loop: add last test entry
         if test_entry:
             results.append(test_entry)
 
-    # Skip SMBIOS tests in DT mode
-    if DT_OR_SR_MODE == "DT":
-        results = [test for test in results if not is_smbios_test(test.get("Test_case", ""))]
-
-    # Filter out Runtime Properties Table test from subtests (appears only as subtest)
-    for test in results:
-        if "subtests" in test and isinstance(test["subtests"], list):
-            test["subtests"] = [
-                subtest for subtest in test["subtests"]
-                if not is_runtime_properties_table_test(subtest.get("sub_Test_Description", ""))
-            ]
+    return results
 
-    # Merge with edk2_test_parser.json if present
-    if bbsr_sct_flag:
-        edk2_file = os.path.join(os.path.dirname(output_file), "edk2_test_parser-bbsr.json")
-    else:
-        edk2_file = os.path.join(os.path.dirname(output_file), "edk2_test_parser.json")
-
-    if os.path.exists(edk2_file):
-        with open(edk2_file, "r", encoding="utf-8") as f:
-            edk2_data = json.load(f)
-
-        subtest_dict = {}
-        test_guid_dict = {}
-        for item in edk2_data:
-            ep_guid = item.get("Test Entry Point GUID", "").strip()
-            sub_guid = item.get("sub_Test_GUID", "").strip()
-            result_val = item.get("result", "")
-            reason_val = item.get("reason", "")
-
-            if not result_val or result_val == "FAILURE":
-                continue
-
-            if ep_guid and sub_guid:
-                desc = item.get("sub_Test_Description", "").strip().upper()
-                subtest_dict[(ep_guid.upper(), sub_guid.upper(), desc)] = {
-                    "result": result_val,
-                    "reason": reason_val
-                }
-            elif ep_guid and not sub_guid:
-                test_guid_dict[ep_guid.upper()] = {
-                    "result": result_val,
-                    "reason": reason_val
-                }
-
-        # Apply overrides
-        for test_obj in results:
-            ep_guid_current = test_obj["Test Entry Point GUID"].upper()
-            if ep_guid_current in test_guid_dict:
-                test_obj["test_result"] = normalize_result(test_guid_dict[ep_guid_current]["result"])
-                test_obj["reason"] = test_guid_dict[ep_guid_current]["reason"]
-
-            for subtest in test_obj["subtests"]:
-                st_guid = subtest["sub_Test_GUID"].upper()
-                if (ep_guid_current, st_guid) in subtest_dict:
-                    match_record = subtest_dict[(ep_guid_current, st_guid)]
-                    subtest["sub_test_result"] = normalize_result(match_record["result"])
-                    subtest["reason"] = match_record["reason"]
-                desc_key = subtest["sub_Test_Description"].strip().upper()
-                lookup_key = (ep_guid_current, st_guid, desc_key)
-
-                if lookup_key in subtest_dict:
-                    match_record = subtest_dict[lookup_key]
-                    result_val = match_record.get("result", "").strip()
-                    reason_val = match_record.get("reason", "").strip()
-                    if result_val:
-                        subtest["sub_test_result"] = normalize_result(result_val)
-                        subtest["reason"] = reason_val
-
-    # Reorder final dictionary so "test_result" & "reason" appear after "Returned Status Code"
-    for i, test_obj in enumerate(results):
+def iter_final_results(results, final_suite_summary):
+    """Yield each test reordered and re-tallied, adding its counts to final_suite_summary."""
+    for test_obj in results:
+        # Reorder final dictionary so "test_result" & "reason" appear after "Returned Status Code"
         reordered = {
             "Test_suite": test_obj["Test_suite"],
             "Sub_test_suite": test_obj["Sub_test_suite"],
@@ -717,10 +724,9 @@ def main(input_file, output_file):
 
         reordered["subtests"] = test_obj["subtests"]
         reordered["test_case_summary"] = test_obj["test_case_summary"]
-        results[i] = reordered
+        test_obj = reordered
 
-    # Final step: re-tally subtests so the final results reflect overrides
-    for test_obj in results:
+        # Re-tally subtests so the final results reflect overrides
         tcsum = test_obj["test_case_summary"]
         # Reset them all to 0, including new "total_ignored"
         tcsum["total_passed"] = 0
@@ -751,18 +757,7 @@ def main(input_file, output_file):
                 # ANY other override (IGNORED, KNOWN U-BOOT LIMITATION, etc)
                 tcsum["total_ignored"] += 1
 
-    # Sum them all into suite_summary
-    final_suite_summary = {
-        "total_passed": 0,
-        "total_failed": 0,
-        "total_failed_with_waiver": 0,
-        "total_aborted": 0,
-        "total_skipped": 0,
-        "total_warnings": 0,
-        "total_ignored": 0  # <--- match the new field
-    }
-    for test_obj in results:
-        tcsum = test_obj["test_case_summary"]
+        # Sum them all into suite_summary
         final_suite_summary["total_passed"] += tcsum["total_passed"]
         final_suite_summary["total_failed"] += tcsum["total_failed"]
         final_suite_summary["total_failed_with_waiver"] += tcsum["total_failed_with_waiver"]
@@ -792,17 +787,71 @@ def main(input_file, output_file):
             else:
                 final_suite_summary["total_ignored"] += 1
 
-    output_data = {
-        "test_results": results,
-        "suite_summary": final_suite_summary
+        yield test_obj
+
+def write_results(results, output_file):
+    """Tally the final results and stream the SCT JSON to output_file."""
+    final_suite_summary = {
+        "total_passed": 0,
+        "total_failed": 0,
+        "total_failed_with_waiver": 0,
+        "total_aborted": 0,
+        "total_skipped": 0,
+        "total_warnings": 0,
+        "total_ignored": 0  # <--- match the new field
     }
+    # suite_summary is encoded after the generator has filled it in.
+    json_stream.dump({
+        "test_results": iter_final_results(results, final_suite_summary),
+        "suite_summary": final_suite_summary
+    }, output_file)
+
+def main(input_file, output_file, edk2_log=None, edk2_json=None):
+    """Parse an SCT Summary.log into output_file.
+
+    edk2_log is the edk2-test-parser.log for this run; its table is parsed on
+    a worker thread while the Summary.log streams, and its results override
+    the matching tests and sub-tests.  edk2_json, when given, also receives
+    the parsed table (for debugging the overrides).
+    """
+    edk2_future = None
+    if edk2_log:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            edk2_future = executor.submit(parse_edk2_log, edk2_log)
+            results = parse_sct_log(input_file)
+    else:
+        results = parse_sct_log(input_file)
+
+    # Skip SMBIOS tests in DT mode
+    if DT_OR_SR_MODE == "DT":
+        results = [test for test in results if not is_smbios_test(test.get("Test_case", ""))]
+
+    # Filter out Runtime Properties Table test from subtests (appears only as subtest)
+    for test in results:
+        if "subtests" in test and isinstance(test["subtests"], list):
+            test["subtests"] = [
+                subtest for subtest in test["subtests"]
+                if not is_runtime_properties_table_test(subtest.get("sub_Test_Description", ""))
+            ]
+
+    # Merge the edk2-test-parser results
+    if edk2_future is not None:
+        edk2_records = edk2_future.result()
+        if edk2_json:
+            with open(edk2_json, "w", encoding="utf-8") as f:
+                json.dump(edk2_records, f, indent=4)
+        apply_edk2_overrides(results, *build_edk2_overrides(edk2_records))
 
-    with open(output_file, 'w') as json_file:
-        json.dump(output_data, json_file, indent=4)
+    write_results(results, output_file)
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Parse an SCT Log file and save results to a JSON file.")
+    parser = argparse.ArgumentParser(
+        description="Parse an SCT Log file and save results to a JSON file.")
     parser.add_argument("input_file", help="Input Log file")
     parser.add_argument("output_file", help="Output JSON file")
+    parser.add_argument("--edk2-log",
+                        help="edk2-test-parser.log whose results override the SCT results")
+    parser.add_argument("--edk2-json",
+                        help="Also write the parsed edk2-test-parser table here (debugging)")
     args = parser.parse_args()
-    main(args.input_file, args.output_file)
+    main(args.input_file, args.output_file, args.edk2_log, args.edk2_json)
@@ -22,14 +22,15 @@ import json
 import re
 import sys
 import os
-import chardet
 
-def detect_file_encoding(file_path):
-    """Detect file encoding using chardet."""
-    with open(file_path, 'rb') as f:
-        raw_data = f.read()
-        result = chardet.detect(raw_data)
-    return result.get('encoding', 'utf-8')
+# The shared log_encoding helper lives in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+from log_encoding import detect_file_encoding  # pylint: disable=wrong-import-position
+
+# A cell of a Markdown separator row such as "|---|:--:|".
+SEPARATOR_CELL_RE = re.compile(r"[-:]+")
 
 def parse_edk2_log(input_file):
     """
@@ -39,7 +40,8 @@ def parse_edk2_log(input_file):
       - "result"                (from the column "result")
       - "reason"                (from the column "updated by")
     
-    Returns a list of dictionaries.
+    Returns a list of dictionaries.  bbr/sct/logs_to_json.py calls this
+    directly (--edk2-log) to merge the records into the SCT results.
     """
     if not os.path.exists(input_file):
         print(f"Error: File not found: {input_file}", file=sys.stderr)
@@ -59,59 +61,57 @@ def parse_edk2_log(input_file):
     }
 
     with open(input_file, 'r', encoding=encoding, errors='ignore') as f:
-        lines = f.readlines()
-
-    for line in lines:
-        line = line.rstrip("\n")
-        # Process only lines that look like table rows (start and end with "|")
-        if line.strip().startswith("|") and line.strip().endswith("|"):
-            # Split the row by "|" and remove any empty first and last elements.
-            cols = line.strip().split("|")
-            if cols and cols[0] == "":
-                cols = cols[1:]
-            if cols and cols[-1] == "":
-                cols = cols[:-1]
-
-            # Check if this row is a header row by looking for our target column names.
-            lower_cols = [col.strip().lower() for col in cols]
-            if not header_found and any(t in lower_cols for t in targets):
-                # Capture *all* column names, not just targets
-                col_index_map = {col: idx for idx, col in enumerate(lower_cols)}
-                header_found = True
-                continue
-
-            # If header is found, skip separator rows (rows that contain only dashes)
-            if header_found:
-                if all(re.fullmatch(r"[-:]+", cell.strip()) for cell in cols if cell.strip()):
+        for line in f:
+            line = line.strip()
+            # Process only lines that look like table rows (start and end with "|")
+            if line.startswith("|") and line.endswith("|"):
+                # Split the row by "|" and remove any empty first and last elements.
+                cols = line.split("|")
+                if cols and cols[0] == "":
+                    cols = cols[1:]
+                if cols and cols[-1] == "":
+                    cols = cols[:-1]
+
+                # Check if this row is a header row by looking for our target column names.
+                lower_cols = [col.strip().lower() for col in cols]
+                if not header_found and any(t in lower_cols for t in targets):
+                    # Capture *all* column names, not just targets
+                    col_index_map = {col: idx for idx, col in enumerate(lower_cols)}
+                    header_found = True
                     continue
 
-                # Build a record based on the header column positions.
-                record = { output_key: "" for output_key in targets.values() }
-                # Extract known columns
-                for key, output_key in targets.items():
-                    idx = col_index_map.get(key)
-                    if idx is not None and idx < len(cols):
-                        record[output_key] = cols[idx].strip()
-
-                # Capture sub_Test_Description correctly
-
-                # If there's a 'name' column (typical for grouped tables like RuntimeServicesTest, BootServicesTest, etc.)
-                # then use that column as description.
-                # Otherwise (like GenericTest), fall back to the first column.
-                name_idx = col_index_map.get("name")
-
-                if name_idx is not None and name_idx < len(cols):
-                    # Extract from 'name' column
-                    record["sub_Test_Description"] = cols[name_idx].strip()
-                    ## TODO
-                    if record["sub_Test_Description"] == "Secure Boot - ImageLoadingTest":
-                        record["sub_Test_Description"] = "Secure Boot - ImageLoadingTest: unable to set db"
-                # Append record if any target field is non-empty
-                if any(record.values()):
-                    results.append(record)
-        else:
-            # Reset header_found if we leave a table section.
-            header_found = False
+                # If header is found, skip separator rows (rows that contain only dashes)
+                if header_found:
+                    if all(SEPARATOR_CELL_RE.fullmatch(cell.strip()) for cell in cols if cell.strip()):
+                        continue
+
+                    # Build a record based on the header column positions.
+                    record = { output_key: "" for output_key in targets.values() }
+                    # Extract known columns
+                    for key, output_key in targets.items():
+                        idx = col_index_map.get(key)
+                        if idx is not None and idx < len(cols):
+                            record[output_key] = cols[idx].strip()
+
+                    # Capture sub_Test_Description correctly
+
+                    # If there's a 'name' column (typical for grouped tables like RuntimeServicesTest, BootServicesTest, etc.)
+                    # then use that column as description.
+                    # Otherwise (like GenericTest), fall back to the first column.
+                    name_idx = col_index_map.get("name")
+
+                    if name_idx is not None and name_idx < len(cols):
+                        # Extract from 'name' column
+                        record["sub_Test_Description"] = cols[name_idx].strip()
+                        ## TODO
+                        if record["sub_Test_Description"] == "Secure Boot - ImageLoadingTest":
+                            record["sub_Test_Description"] = "Secure Boot - ImageLoadingTest: unable to set db"
+                    # Append record if any target field is non-empty
+                    if any(record.values()):
+                        results.append(record)
+            else:
+                # Reset header_found if we leave a table section.
+                header_found = False
 
     return results
 
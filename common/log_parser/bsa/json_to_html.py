@@ -16,14 +16,20 @@
 
 """Generate BSA/SBSA HTML reports from parsed JSON results."""
 
-import base64
 import json
 import os
 import sys
-from io import BytesIO
 
-from jinja2 import Template
-import matplotlib.pyplot as plt  # pylint: disable=import-error
+
+# Shared helpers (html_chart.py, html_templates.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from html_chart import bar_chart
+from html_templates import get_template, render_to_file
+from suite_categories import enrich_suite_json
+# pylint: enable=wrong-import-position
 
 # Helper function to retrieve dictionary values in a case-insensitive manner
 def get_case_insensitive(data, key, default=0):
@@ -51,7 +57,7 @@ def annotate_nested_subtests(test_results):
 
 # Function to generate bar chart for test results
 def generate_bar_chart(suite_summary):
-    """Build a base64 encoded bar chart image for suite summary counts."""
+    """Build the bar chart markup for suite summary counts."""
     labels = [
         'Passed',
         'Failed',
@@ -86,35 +92,18 @@ def generate_bar_chart(suite_summary):
         '#aed6f1'   # PAL Not Supported
     ]  # Colors for each category
 
-    plt.figure(figsize=(14, 7))
-    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
-
-    # Add percentage labels on top of the bars
-    total_tests = suite_summary.get('total_rules_run', 0) or sum(sizes)
-    for chart_bar, size in zip(bars, sizes):
-        yval = chart_bar.get_height()
-        percentage = (size / total_tests) * 100 if total_tests > 0 else 0
-        plt.text(
-            chart_bar.get_x() + chart_bar.get_width()/2,
-            yval + max(sizes)*0.01,
-            f'{percentage:.2f}%',
-            ha='center',
-            va='bottom',
-            fontsize=12
-        )
-
-    plt.title('Test Results Distribution', fontsize=18, fontweight='bold')
-    plt.ylabel('Total Count', fontsize=14)
-    plt.xticks(fontsize=11, rotation=30, ha='right')
-    plt.yticks(fontsize=12)
-    plt.tight_layout()
-
-    # Save the figure to a buffer
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return bar_chart(
+        labels,
+        sizes,
+        colors,
+        'Test Results Distribution',
+        'Total Count',
+        alt='Test Results Distribution',
+        total=suite_summary.get('total_rules_run', 0) or sum(sizes),
+        figsize=(14, 7),
+        tick_size=11,
+        rotate_labels=True
+    )
 
 # Function to generate HTML content for both summary and detailed pages
 def generate_html(  # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -128,7 +117,7 @@ def generate_html(  # pylint: disable=too-many-arguments,too-many-positional-arg
     annotate_nested_subtests(test_results)
 
     # Template for both summary and detailed pages
-    template = Template("""
+    template = get_template("bsa.html", """
     <!DOCTYPE html>
     <html>
     <head>
@@ -440,7 +429,7 @@ def generate_html(  # pylint: disable=too-many-arguments,too-many-positional-arg
 
         {% if not is_summary_page %}
         <div class="chart-container">
-            <img src="data:image/png;base64,{{ chart_data }}" alt="Test Results Distribution">
+            {{ chart_data }}
         </div>
         {% endif %}
 
@@ -509,7 +498,7 @@ def generate_html(  # pylint: disable=too-many-arguments,too-many-positional-arg
             <div class="detailed-summary">
             {% for test in test_results %}
             {% set suite_index = loop.index0 %}
-            <div class="test-suite-header">Test Suite: {{ test.Test_suite }}</div>
+            <div class="test-suite-header">Test Suite: {{ test.Test_suite }}</div>{{ suite_info_html(test.Test_suite_info) }}
             <table>
                 <thead>
                     <tr>
@@ -808,7 +797,9 @@ def generate_html(  # pylint: disable=too-many-arguments,too-many-positional-arg
         )
 
     # Render the HTML content
-    html_content = template.render(
+    render_to_file(
+        template,
+        output_html_path,
         chart_data=chart_data,
         total_tests=total_tests,
         total_passed=suite_summary.get("total_passed", 0),
@@ -825,16 +816,13 @@ def generate_html(  # pylint: disable=too-many-arguments,too-many-positional-arg
         test_suite_name=test_suite_name.upper()  # Ensure uppercase for consistency
     )
 
-    # Save to HTML file
-    with open(output_html_path, "w", encoding="utf-8") as file:
-        file.write(html_content)
-
 # Main function to process the JSON file and generate the HTML report
 def main(input_json_file, detailed_html_file, summary_html_file):
     """Load parsed JSON and generate detailed and summary HTML files."""
     # Load JSON data
     with open(input_json_file, 'r', encoding="utf-8") as json_file:
         data = json.load(json_file)
+    data = enrich_suite_json(input_json_file, data)
 
     # Extract the test results
     test_results = data.get("test_results", [])
@@ -15,17 +15,70 @@
 # limitations under the License.
 
 import argparse
-import chardet
-import json
+import os
 import re
 import sys
 from collections import defaultdict
 
-def detect_file_encoding(file_path):
-    with open(file_path, 'rb') as file:
-        raw_data = file.read()
-        result = chardet.detect(raw_data)
-        return result['encoding']
+# Shared helpers (log_encoding.py, json_stream.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+import json_stream
+from log_encoding import detect_file_encoding
+# pylint: enable=wrong-import-position
+
+# The log is decoded in fixed-size chunks (and log_encoding only samples its
+# start), so memory stays flat for multi-hundred-MB SBSA kernel logs.
+READ_CHUNK_CHARS = 1024 * 1024
+
+SUITE_HEADER_RE = re.compile(r'^\*\*\*\s+Running\s+(.+?)\s+tests\s+\*\*\*$')
+RULE_LINE_RE = re.compile(r'^([A-Za-z0-9_]+)\s*:\s*(-|\d+)\s*:\s*(.*)$')
+START_LINE_RE = re.compile(r'^START\s+([^\s:]+)\s+([A-Za-z0-9_]+)\s+([^\s:]+)\s*:\s*(.*)$')
+END_LINE_RE = re.compile(r'^END\s+([A-Za-z0-9_]+)\s+(.*)$')
+
+# Characters str.splitlines() treats as line boundaries ("\r" never reaches
+# us because the file is read with universal newlines).
+LINE_BREAKS = frozenset("\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+# First characters a RULE, Result:, START or END line can begin with.
+RULE_FIRST_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_"
+)
+
+def iter_log_lines(input_file, file_encoding):
+    # Same lines as f.read().splitlines(), without holding the whole file.
+    # A chunk that does not end on a line break leaves its last line
+    # incomplete, so that line is carried into the next chunk.
+    with open(input_file, "r", encoding=file_encoding, errors="ignore") as f:
+        pending = ""
+        while True:
+            chunk = f.read(READ_CHUNK_CHARS)
+            if not chunk:
+                break
+            lines = (pending + chunk).splitlines()
+            pending = "" if chunk[-1] in LINE_BREAKS else lines.pop()
+            yield from lines
+        if pending:
+            yield pending
+
+def iter_log_tokens(input_file, file_encoding):
+    # Yield (line, is_indented) for every non-empty log line. A leading
+    # "[timestamp]" and one following space are dropped before the
+    # indentation is measured, so kernel-prefixed lines nest like UEFI ones.
+    for raw_line in iter_log_lines(input_file, file_encoding):
+        body = raw_line
+        stripped = raw_line.lstrip()
+        if stripped[:1] == "[":
+            end = stripped.find("]")
+            if end >= 0:
+                body = stripped[end + 1:]
+                if body[:1].isspace():
+                    body = body[1:]
+        line = body.strip()
+        if line:
+            yield line, body[:1].isspace()
 
 def classify_status(status_text):
     if not status_text:
@@ -274,40 +327,23 @@ def main(input_files, output_file):
             current_source = "unknown"
         file_encoding = detect_file_encoding(input_file)
 
-        with open(input_file, "r", encoding=file_encoding, errors="ignore") as f:
-            lines = f.read().splitlines()
-
-        i = 0
-        while i < len(lines):
-            raw_line = lines[i]
-            i += 1
-
-            # Strip timestamp [....] if present (keep spaces after timestamp for indentation detection)
-            line_no_timestamp = re.sub(r'^\s*\[.*?\]\s?', '', raw_line)
-
-            # NOW detect indentation level (count leading spaces AFTER timestamp removal)
-            indent_match = re.match(r'^(\s*)', line_no_timestamp)
-            indent_spaces = len(indent_match.group(1)) if indent_match else 0
-            is_indented = indent_spaces > 0
-
-            # Strip the leading spaces to get clean line
-            line = line_no_timestamp.strip()
-
-            if not line:
-                continue
-
+        for line, is_indented in iter_log_tokens(input_file, file_encoding):
             # Start processing when we see Selected rules / Running tests / START (old format)
             # or "*** Running <suite> tests ***" (new format)
-            if not processing and (
-                "---------------------- Running tests ------------------------" in line
-                or line.startswith("Selected rules:")
-                or line.startswith("START ")
-                or line.startswith("*** Running ")
-            ):
-                processing = True
-
             if not processing:
-                continue
+                if (
+                    "---------------------- Running tests ------------------------" in line
+                    or line.startswith("Selected rules:")
+                    or line.startswith("START ")
+                    or line.startswith("*** Running ")
+                ):
+                    processing = True
+                else:
+                    continue
+
+            # Dispatch on the first character so that the debug and
+            # informational lines making up most of a log never reach a regex.
+            first_char = line[0]
 
             # ---------------- New log format support ----------------
             # Newer BSA/SBSA logs can nest rule groups:
@@ -317,22 +353,22 @@ def main(input_files, output_file):
             #       Result: <status text>
             #     === End tests for rules referenced by <PARENT_RULE> ===
             #   Result: <status text>
-            suite_hdr = re.match(r'^\*\*\*\s+Running\s+(.+?)\s+tests\s+\*\*\*$', line)
-            if suite_hdr:
-                current_suite = suite_hdr.group(1).strip().replace(" ", "_")
+            if first_char == "*":
+                suite_hdr = SUITE_HEADER_RE.match(line)
+                if suite_hdr:
+                    current_suite = suite_hdr.group(1).strip().replace(" ", "_")
                 continue
 
-            referenced_rules_marker = re.match(
-                r'^===\s+(?:Start|End)\s+tests\s+for\s+rules\s+referenced\s+by\s+([A-Za-z0-9_]+)\s+===$',
-                line
-            )
-            if referenced_rules_marker:
+            # "=== Start/End tests for rules referenced by <RULE> ===" markers
+            # only frame the nesting that indentation already gives us; like
+            # the other banners they cannot start a rule or a result.
+            if first_char not in RULE_FIRST_CHARS:
                 continue
 
             # RULE line. A rule is top-level only when it starts without
             # indentation. Indented rule lines become children of the last
             # still-open frame on the stack.
-            rule_line = re.match(r'^([A-Za-z0-9_]+)\s*:\s*(-|\d+)\s*:\s*(.*)$', line)
+            rule_line = RULE_LINE_RE.match(line) if ":" in line else None
             if rule_line:
                 rule_id = rule_line.group(1).strip()
                 test_index = (rule_line.group(2) or "").strip() or "-"
@@ -353,7 +389,9 @@ def main(input_files, output_file):
 
             # In the new log format, Result closes the most recently opened rule.
             # That rule is either emitted as a testcase or attached to its parent.
-            if line.upper().startswith("RESULT:"):
+            # Upper-casing the first 7 characters is enough: no character
+            # shrinks when upper-cased.
+            if first_char in "Rr" and line[:7].upper().startswith("RESULT:"):
                 status_text = line.split(":", 1)[1].strip()
                 if not rule_stack:
                     continue
@@ -374,10 +412,7 @@ def main(input_files, output_file):
             #   START <suite_or_dash> <RULE_ID> <index_or_dash> : <description...>
             # Old-format START/END logs use the same stack. Flat old logs stay
             # flat, while any indented old-format child rules can still nest.
-            start_match = re.match(
-                r'^START\s+([^\s:]+)\s+([A-Za-z0-9_]+)\s+([^\s:]+)\s*:\s*(.*)$',
-                line
-            )
+            start_match = START_LINE_RE.match(line) if first_char == "S" else None
             if start_match:
                 suite_tok = start_match.group(1).strip()
                 rule_id = start_match.group(2).strip()
@@ -406,7 +441,7 @@ def main(input_files, output_file):
 
             # END line:
             #   END <RULE_ID> <status text...>
-            end_match = re.match(r'^END\s+([A-Za-z0-9_]+)\s+(.*)$', line)
+            end_match = END_LINE_RE.match(line) if first_char == "E" else None
             if end_match:
                 rule_id = end_match.group(1).strip()
                 status_text = (end_match.group(2) or "").strip()
@@ -504,8 +539,7 @@ def main(input_files, output_file):
     if not acs_run_true:
         sys.exit(1)
 
-    with open(output_file, "w") as jf:
-        json.dump(output, jf, indent=2)
+    json_stream.dump(output, output_file, indent=2)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
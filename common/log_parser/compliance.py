@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# SRS compliance verdict of a merge, shared by merge_jsons.py and
+# generate_acs_summary.py.
+#
+# merge_jsons.py counts each suite once when its JSON is merged
+# (suite_counts(), a walk of its test results), then calls evaluate() with
+# the DT or SR scope table.  evaluate()
+# is a pure function of its (hashable) arguments and is memoized, so repeated
+# merges of the same results cost one evaluation.  It returns a Verdict:
+# per-suite results, the overall SRS result with the mandatory/recommended
+# suites that were not run or failed, and the BBSR and (DT) SCMI extension
+# results.
+#
+# The Verdict is written to merged_results.json twice: as the ACS Results
+# Summary strings ("Overall Compliance Result", the per-suite
+# "..._compliance" lines) that existing consumers read, and as the
+# "Compliance Verdict" object that generate_acs_summary.py reads back with
+# Verdict.from_dict() instead of parsing those strings.
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+VERDICT_KEY = "Compliance Verdict"
+
+COMPLIANT = "Compliant"
+COMPLIANT_WITH_WAIVERS = "Compliant with waivers"
+NOT_COMPLIANT = "Not Compliant"
+NOT_RUN = "Not Run"
+
+REQUIREMENT_TAGS = {"M": "Mandatory", "CM": "Conditional-Mandatory", "EM": "Extension"}
+BBSR_SUITES = ("BBSR-TPM", "BBSR-FWTS", "BBSR-SCT")
+
+def compliance_label(suite_name: str, requirement: str) -> str:
+    """Return the ACS Results Summary key of a suite's compliance line."""
+    tag = REQUIREMENT_TAGS.get(requirement, "Recommended")
+    # Match the console ordering: “Suite: <tag>  : <suite> …”
+    return f"Suite_Name: {tag}  : {suite_name}_compliance"
+
+
+################################################################################
+# Per-suite counts
+################################################################################
+
+@dataclass(frozen=True)
+class SuiteCounts:
+    """Failed, waived and not run (aborted or skipped) tests of one suite."""
+    failed: int = 0
+    failed_with_waiver: int = 0
+    not_run: int = 0
+
+    def __add__(self, other: "SuiteCounts") -> "SuiteCounts":
+        return SuiteCounts(self.failed + other.failed,
+                           self.failed_with_waiver + other.failed_with_waiver,
+                           self.not_run + other.not_run)
+
+
+def count_key(key: str) -> str:
+    """Map a summary key ("total_failed", "Failed", "Passed (Partial)") to its count key."""
+    key = key.strip().lower().replace("(", "").replace(")", "").replace(" ", "_")
+    if key.startswith("total_"):
+        key = key[len("total_"):]
+    return {"failed_with_waivers": "failed_with_waiver", "warning": "warnings"}.get(key, key)
+
+
+def add_counts(counts: Dict[str, int], summary: dict) -> None:
+    for key, value in summary.items():
+        if isinstance(value, int) and not isinstance(value, bool):
+            key = count_key(key)
+            counts[key] = counts.get(key, 0) + value
+
+
+def summary_counts(data) -> Optional[Dict[str, int]]:
+    """
+    Return the result counts of a suite JSON or merged section from its
+    suite_summary (PFDI: the trailing Suite_summary entry) or, when it has
+    none, the sum of its entries' summaries. None when there is no summary.
+    """
+    summary = None
+    entries = []
+    if isinstance(data, dict):
+        summary = data.get("suite_summary")
+        entries = data.get("test_results", [])
+    elif isinstance(data, list):
+        entries = data
+        if entries and isinstance(entries[-1], dict) and "Suite_summary" in entries[-1]:
+            summary = entries[-1]["Suite_summary"]
+
+    counts: Dict[str, int] = {}
+    if isinstance(summary, dict) and summary:
+        add_counts(counts, summary)
+        return counts
+    found = False
+    for entry in entries if isinstance(entries, list) else []:
+        if not isinstance(entry, dict):
+            continue
+        entry_summary = entry.get("test_case_summary")
+        if not isinstance(entry_summary, dict):
+            entry_summary = entry.get("test_suite_summary")
+        if isinstance(entry_summary, dict):
+            add_counts(counts, entry_summary)
+            found = True
+    return counts if found else None
+
+
+def _result_counts(result) -> SuiteCounts:
+    """Return the counts of one result string or result count dict."""
+    if isinstance(result, dict):
+        return SuiteCounts(result.get("FAILED", 0), result.get("FAILED_WITH_WAIVER", 0),
+                           result.get("ABORTED", 0) + result.get("SKIPPED", 0))
+    if not isinstance(result, str):
+        return SuiteCounts()
+    upper = result.upper()
+    if "FAIL" in upper:
+        return SuiteCounts(0, 1) if "(WITH WAIVER)" in upper else SuiteCounts(1)
+    if "ABORT" in upper or "SKIP" in upper:
+        return SuiteCounts(not_run=1)
+    return SuiteCounts()
+
+
+def walk_counts(data) -> SuiteCounts:
+    """
+    Count a suite JSON's results by walking its test results. BSA-style
+    entries are counted per test case, the others per subtest (SBMR: the
+    subtests of each of its Test_cases).
+    """
+    if isinstance(data, dict) and "test_results" in data:
+        test_results = data["test_results"]
+    elif isinstance(data, list):
+        test_results = data
+    else:
+        return SuiteCounts()
+    if not isinstance(test_results, list):
+        return SuiteCounts()
+
+    total = SuiteCounts()
+    for suite_entry in test_results:
+        if not isinstance(suite_entry, dict):
+            continue
+        # If testcases exist, count only testcase-level results to avoid double counting.
+        testcases = suite_entry.get("testcases", [])
+        if testcases:
+            for testcase in testcases:
+                total += _result_counts(testcase.get("Test_result", ""))
+        else:
+            for sub in suite_entry.get("subtests", []):
+                total += _result_counts(sub.get("sub_test_result"))
+        for case in suite_entry.get("Test_cases", []):
+            for sub in case.get("subtests", []):
+                total += _result_counts(sub.get("sub_test_result"))
+    return total
+
+
+def suite_counts(data) -> SuiteCounts:
+    """
+    Return the SuiteCounts of one suite JSON.
+
+    The counts come from walking its test results (walk_counts()), not from
+    its summary: the suites' summaries do not count alike (SCT's total_failed
+    also includes tests without subtests), and the verdict must match the
+    per-test results.
+    """
+    return walk_counts(data)
+
+
+################################################################################
+# Verdict
+################################################################################
+
+@dataclass(frozen=True)
+class Shortfall:
+    """The suites of one requirement level that were not run or failed."""
+    not_run: Tuple[str, ...] = ()
+    failed: Tuple[str, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.not_run or self.failed)
+
+    def text(self) -> str:
+        parts = []
+        if self.not_run:
+            parts.append(f"not run: {', '.join(self.not_run)}")
+        if self.failed:
+            parts.append(f"failed: {', '.join(self.failed)}")
+        return "; ".join(parts)
+
+    def to_dict(self) -> dict:
+        return {"not_run": list(self.not_run), "failed": list(self.failed)}
+
+    @classmethod
+    def from_dict(cls, data) -> "Shortfall":
+        data = data if isinstance(data, dict) else {}
+        return cls(tuple(data.get("not_run") or ()), tuple(data.get("failed") or ()))
+
+
+@dataclass(frozen=True)
+class GroupVerdict:
+    """The SRS, BBSR or SCMI result: its status, shortfalls and the summary string."""
+    status: str
+    result: str
+    mandatory: Shortfall = field(default_factory=Shortfall)
+    recommended: Shortfall = field(default_factory=Shortfall)
+
+    def to_dict(self) -> dict:
+        return {"status": self.status, "result": self.result,
+                "mandatory": self.mandatory.to_dict(), "recommended": self.recommended.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data) -> Optional["GroupVerdict"]:
+        if not isinstance(data, dict):
+            return None
+        status = str(data.get("status", "Unknown"))
+        return cls(status, str(data.get("result", status)),
+                   Shortfall.from_dict(data.get("mandatory")),
+                   Shortfall.from_dict(data.get("recommended")))
+
+
+@dataclass(frozen=True)
+class SuiteVerdict:
+    """One suite's requirement level, status and compliance line."""
+    suite: str
+    requirement: str
+    in_scope: bool
+    ran: bool
+    status: str
+    result: str
+    counts: SuiteCounts = field(default_factory=SuiteCounts)
+
+    @property
+    def label(self) -> str:
+        return compliance_label(self.suite, self.requirement)
+
+    def to_dict(self) -> dict:
+        return {"suite": self.suite, "requirement": self.requirement, "in_scope": self.in_scope,
+                "ran": self.ran, "status": self.status, "result": self.result,
+                "failed": self.counts.failed, "failed_with_waiver": self.counts.failed_with_waiver,
+                "not_run": self.counts.not_run}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SuiteVerdict":
+        return cls(data.get("suite", ""), data.get("requirement", "R"), bool(data.get("in_scope")),
+                   bool(data.get("ran")), data.get("status", ""), data.get("result", ""),
+                   SuiteCounts(data.get("failed", 0), data.get("failed_with_waiver", 0),
+                               data.get("not_run", 0)))
+
+
+@dataclass(frozen=True)
+class Verdict:
+    """The compliance verdict of one merge."""
+    mode: str
+    suites: Tuple[SuiteVerdict, ...]
+    overall: GroupVerdict
+    bbsr: GroupVerdict
+    scmi: Optional[GroupVerdict] = None
+
+    def suite(self, name: str) -> Optional[SuiteVerdict]:
+        for suite in self.suites:
+            if suite.suite == name:
+                return suite
+        return None
+
+    def summary_fields(self) -> dict:
+        """Return the ACS Results Summary strings of the verdict."""
+        fields = {suite.label: suite.result for suite in self.suites}
+        fields["Overall Compliance Result"] = self.overall.result
+        fields["BBSR compliance results"] = self.bbsr.result
+        if self.scmi is not None:
+            fields["SCMI compliance results"] = self.scmi.result
+        return fields
+
+    def to_dict(self) -> dict:
+        return {"mode": self.mode,
+                "overall": self.overall.to_dict(),
+                "bbsr": self.bbsr.to_dict(),
+                "scmi": self.scmi.to_dict() if self.scmi is not None else None,
+                "suites": [suite.to_dict() for suite in self.suites]}
+
+    @classmethod
+    def from_dict(cls, data) -> Optional["Verdict"]:
+        """Return the Verdict of a serialized "Compliance Verdict" (None if it is not one)."""
+        if not isinstance(data, dict):
+            return None
+        overall = GroupVerdict.from_dict(data.get("overall"))
+        if overall is None:
+            return None
+        bbsr = GroupVerdict.from_dict(data.get("bbsr")) or GroupVerdict(NOT_RUN, "Not run")
+        suites = tuple(SuiteVerdict.from_dict(s) for s in data.get("suites") or ()
+                       if isinstance(s, dict))
+        return cls(data.get("mode", ""), suites, overall, bbsr,
+                   GroupVerdict.from_dict(data.get("scmi")))
+
+
+def suite_scope(mode, scope_table, suites):
+    """
+    Return (scope, requirements) for one merge.
+
+    suites lists the (suite_key, per_file) of each file merged. scope is the
+    (suite_key, requirement) pairs reported even when a suite did not run;
+    requirements gives the level of every suite.
+    """
+    present = {key for key, _ in suites}
+    os_variants = [key for key, per_file in suites if per_file]
+    requirements = {key: "M" for key in os_variants}
+    if "OS_TEST" in present:
+        requirements["OS_TEST"] = "M"
+
+    scope = list(scope_table)
+    if mode == "DT":
+        scope += [(key, "M") for key in os_variants]
+        # With results for three OS images the generic OS_TEST is not required.
+        if len(os_variants) >= 3 and ("OS_TEST", "M") in scope:
+            scope.remove(("OS_TEST", "M"))
+    for n, r in scope:
+        requirements.setdefault(n, r)
+
+    if mode != "DT":
+        # Always consider SBSA mandatory if present
+        promote = {"SBSA"} if "SBSA" in present else set()
+
+        # if either SBMR-IB or SBMR-OOB is present, promote BOTH to mandatory
+        if {"SBMR-IB", "SBMR-OOB"} & present:
+            promote.update({"SBMR-IB", "SBMR-OOB"})
+        for n in promote:
+            requirements[n] = "M"
+        scope = [(n, "M") if n in promote else (n, r) for (n, r) in scope]
+    return list(dict.fromkeys(scope)), requirements
+
+
+def _ran_status(counts: SuiteCounts) -> str:
+    if counts.failed:
+        return NOT_COMPLIANT
+    if counts.failed_with_waiver:
+        return COMPLIANT_WITH_WAIVERS
+    return COMPLIANT
+
+
+def _bbsr_verdict(suites) -> GroupVerdict:
+    ran = [s for s in suites if s.ran]
+    if not ran:
+        return GroupVerdict(NOT_RUN, "Not run")
+    shortfall = Shortfall(tuple(s.suite for s in suites if not s.ran),
+                          tuple(s.suite for s in ran if s.status == NOT_COMPLIANT))
+    if shortfall:
+        return GroupVerdict(NOT_COMPLIANT, f"{NOT_COMPLIANT} : Mandatory - ({shortfall.text()})",
+                            shortfall)
+    if any(s.status == COMPLIANT_WITH_WAIVERS for s in ran):
+        return GroupVerdict(COMPLIANT_WITH_WAIVERS, COMPLIANT_WITH_WAIVERS)
+    return GroupVerdict(COMPLIANT, COMPLIANT)
+
+
+def _scmi_verdict(scmi) -> GroupVerdict:
+    if scmi is None or not scmi.ran:
+        return GroupVerdict(NOT_RUN, NOT_RUN)
+    if scmi.status == NOT_COMPLIANT:
+        shortfall = Shortfall(failed=("SCMI",))
+        return GroupVerdict(NOT_COMPLIANT, f"{NOT_COMPLIANT} : Mandatory - (SCMI)", shortfall)
+    return GroupVerdict(scmi.status, scmi.status)
+
+
+@lru_cache(maxsize=256)
+def evaluate(mode, scope_table, suites, counts) -> Verdict:
+    """
+    Return the Verdict of one merge.
+
+    scope_table is the DT or SR ((suite_key, requirement), ...) table, suites
+    the (suite_key, per_file) of each file merged, in merge order, and counts
+    the ((suite_key, SuiteCounts), ...) of each suite key. Mandatory (M) and
+    conditional-mandatory (CM) suites decide the result; recommended (R)
+    suites that were not run also do in DT mode.
+    """
+    scope, requirements = suite_scope(mode, scope_table, suites)
+    counts = dict(counts)
+    verdicts = []
+    mandatory_missing, mandatory_failed = [], []
+    recommended_missing, recommended_failed = [], []
+    overall = COMPLIANT
+
+    for suite, requirement in scope:
+        if suite not in counts:
+            is_recommended = requirement not in ("M", "CM", "EM")
+            if requirement == "M" or (is_recommended and mode == "DT"):
+                result = "Not Compliant: not run"
+                overall = NOT_COMPLIANT
+            else:
+                result = NOT_RUN
+            if requirement == "M":
+                mandatory_missing.append(suite)
+            elif is_recommended:
+                recommended_missing.append(suite)
+            verdicts.append(SuiteVerdict(suite, requirements.get(suite, "R"), True, False,
+                                         NOT_RUN, result))
+            continue
+
+        totals = counts[suite]
+        status = _ran_status(totals)
+        if status == COMPLIANT:
+            result = COMPLIANT
+        elif status == COMPLIANT_WITH_WAIVERS:
+            result = f"Compliant with waivers: Waivers {totals.failed_with_waiver}"
+            if requirement in ("M", "CM") and overall != NOT_COMPLIANT:
+                overall = COMPLIANT_WITH_WAIVERS
+        else:
+            result = f"Not Compliant: Failed {totals.failed}"
+            if requirement in ("M", "CM"):
+                overall = NOT_COMPLIANT
+                mandatory_failed.append(suite)
+            elif requirement != "EM":
+                recommended_failed.append(suite)
+        verdicts.append(SuiteVerdict(suite, requirements.get(suite, "R"), True, True,
+                                     status, result, totals))
+
+    # Suites outside the scope table still get a compliance line.
+    in_scope = {suite for suite, _ in scope}
+    for suite, totals in counts.items():
+        if suite not in in_scope:
+            status = _ran_status(totals)
+            result = "Not compliant" if status == NOT_COMPLIANT else status
+            verdicts.append(SuiteVerdict(suite, requirements.get(suite, "R"), False, True,
+                                         status, result, totals))
+
+    mandatory = Shortfall(tuple(mandatory_missing), tuple(mandatory_failed))
+    recommended = Shortfall(tuple(recommended_missing), tuple(recommended_failed))
+    result = overall
+    if overall == NOT_COMPLIANT:
+        reason_parts = []
+        if mandatory:
+            reason_parts.append(f"Mandatory - ({mandatory.text()})")
+        if recommended:
+            reason_parts.append(f"Recommended - ({recommended.text()})")
+        if reason_parts:
+            result += f" : {' : '.join(reason_parts)}"
+
+    by_name = {v.suite: v for v in verdicts}
+    bbsr = _bbsr_verdict([by_name[name] for name in BBSR_SUITES if name in by_name])
+    scmi = _scmi_verdict(by_name.get("SCMI")) if mode == "DT" else None
+    return Verdict(mode, tuple(verdicts), GroupVerdict(overall, result, mandatory, recommended),
+                   bbsr, scmi)
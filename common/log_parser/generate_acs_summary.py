@@ -20,10 +20,12 @@ import json
 import argparse
 import os
 import subprocess
-import re
-import html
 from jinja2 import Template
 
+import compliance
+from compliance import add_counts, summary_counts
+from html_chart import stacked_bar_chart
+
 def get_system_info():
     system_info = {}
 
@@ -132,262 +134,161 @@ def read_acs_info_system_info(acs_info_json_path):
     except Exception:
         return {}
 
-def remove_result_summary_headings(content):
-    # Use regular expressions to remove any heading containing 'Result Summary'
-    pattern = r'<h[1-6][^>]*>\s*Result Summary\s*</h[1-6]>'
-    content = re.sub(pattern, '', content, flags=re.IGNORECASE)
-    return content
-
-def read_html_content(file_path):
-    if file_path and os.path.exists(file_path):
-        with open(file_path, 'r') as file:
-            content = file.read()
-            # Remove 'Result Summary' headings
-            content = remove_result_summary_headings(content)
-            return content
-    else:
-        return None
-
-def inject_test_suite_info(merged_json_path, output_dir):
-    # Add Test_suite_info into detailed HTMLs after they are generated.
-    if not merged_json_path or not os.path.isfile(merged_json_path):
-        return
+# Suites of the "Test Summaries" section, in page order:
+# (anchor id, label, detailed page, merged_results.json section).
+# A section also takes in its per-file sections ("<section> - <stem>").
+SUMMARY_SUITES = (
+    ("bsa_summary", "BSA", "bsa_detailed.html", "Suite_Name: BSA"),
+    ("sbsa_summary", "SBSA", "sbsa_detailed.html", "Suite_Name: SBSA"),
+    ("fwts_summary", "FWTS", "fwts_detailed.html", "Suite_Name: FWTS"),
+    ("sct_summary", "SCT", "sct_detailed.html", "Suite_Name: SCT"),
+    ("scmi_summary", "SCMI", "scmi_detailed.html", "Suite_Name: SCMI"),
+    ("sbmr_ib_summary", "SBMR-IB", "sbmr_ib_detailed.html", "Suite_Name: SBMR-IB"),
+    ("sbmr_oob_summary", "SBMR-OOB", "sbmr_oob_detailed.html", "Suite_Name: SBMR-OOB"),
+    ("post_script_summary", "POST-SCRIPT", "post_script_detailed.html", "Suite_Name: POST_SCRIPT"),
+    ("standalone_summary", "Standalone tests", "standalone_tests_detailed.html", "Suite_Name: Standalone"),
+    ("bbsr_fwts_summary", "BBSR-FWTS", "bbsr_fwts_detailed.html", "Suite_Name: BBSR-FWTS"),
+    ("bbsr_sct_summary", "BBSR-SCT", "bbsr_sct_detailed.html", "Suite_Name: BBSR-SCT"),
+    ("bbsr_tpm_summary", "BBSR-TPM", "bbsr_tpm_detailed.html", "Suite_Name: BBSR-TPM"),
+    ("pfdi_summary", "PFDI", "pfdi_detailed.html", "Suite_Name: PFDI"),
+    ("OS_tests_summary", "OS tests", "os_tests_detailed.html", "Suite_Name: OS Tests"),
+)
+
+# Result columns of the suite tables and series of the chart: (count key, heading, color)
+RESULT_COLUMNS = (
+    ("passed", "Passed", "#d4edda"),
+    ("failed", "Failed", "#f8d7da"),
+    ("failed_with_waiver", "Failed with Waiver", "#f39c12"),
+    ("aborted", "Aborted", "#9e9e9e"),
+    ("skipped", "Skipped", "#ffe0b2"),
+    ("warnings", "Warnings", "#fff3cd"),
+    ("ignored", "Ignored", "#e0e0e0"),
+    ("passed_partial", "Passed (Partial)", "#f8b88b"),
+    ("not_implemented", "Not Implemented", "#cfd8dc"),
+    ("pal_not_supported", "PAL Not Supported", "#aed6f1"),
+)
+# Shown only where they are non-zero; the others are always shown.
+OPTIONAL_COLUMNS = ("ignored", "passed_partial", "not_implemented", "pal_not_supported")
+
+def load_merged_results(merged_json_path):
+    """Load merged_results.json; returns {} when it is missing or unreadable."""
     try:
         with open(merged_json_path, 'r') as jf:
             data = json.load(jf)
-    except Exception:
-        return
-
-    def entries(v):
-        # Always return a list of suite entries.
-        if isinstance(v, list):
-            return v
-        if isinstance(v, dict) and isinstance(v.get("test_results"), list):
-            return v["test_results"]
-        if isinstance(v, dict):
-            return [v]
-        return []
-
-    suite_map = {}
-    if isinstance(data, dict):
-        for suite_key, suite_data in data.items():
-            for entry in entries(suite_data):
-                if not isinstance(entry, dict):
-                    continue
-                name = (entry.get("Test_suite") or entry.get("Test_suite_name") or "").strip()
-                info = entry.get("Test_suite_info")
-                if name and info is not None:
-                    # Store by lowercase name so PCIe/PCIE still matches.
-                    suite_map.setdefault(suite_key, {})[name.lower()] = info
-
-    def fmt_info(info):
-        # Format list info as bullets; otherwise keep as plain text.
-        if isinstance(info, list):
-            items = "".join(f"<li>{html.escape(str(i))}</li>" for i in info)
-            return f"<ul style=\"margin: 6px 0 0 18px;\">{items}</ul>"
-        return html.escape(str(info))
-
-    patterns = [
-        # Different detailed HTML templates use different headers.
-        (r'(<div class="test-suite-header">Test Suite:\s*([^<]+)</div>)', 2),
-        (r'(<div class="suite-header">Test Suite:\s*([^<]+)</div>)', 2),
-        (r'(<div class="heading">Test Suite Name:\s*<span>([^<]+)</span></div>)', 2),
-        (r'(<h3>\s*([^:<]+)\s*:[^<]*</h3>)', 2),
-    ]
-    files = [
-        # All detailed HTML files that should get Test_suite_info.
-        ("bsa_detailed.html", "Suite_Name: BSA"),
-        ("sbsa_detailed.html", "Suite_Name: SBSA"),
-        ("fwts_detailed.html", "Suite_Name: FWTS"),
-        ("sct_detailed.html", "Suite_Name: SCT"),
-        ("bbsr_fwts_detailed.html", "Suite_Name: BBSR-FWTS"),
-        ("bbsr_sct_detailed.html", "Suite_Name: BBSR-SCT"),
-        ("bbsr_tpm_detailed.html", "Suite_Name: BBSR-TPM"),
-        ("pfdi_detailed.html", "Suite_Name: PFDI"),
-        ("post_script_detailed.html", "Suite_Name: POST_SCRIPT"),
-        ("scmi_detailed.html", "Suite_Name: SCMI"),
-        ("sbmr_ib_detailed.html", "Suite_Name: SBMR-IB"),
-        ("sbmr_oob_detailed.html", "Suite_Name: SBMR-OOB"),
-        ("standalone_tests_detailed.html", "Suite_Name: Standalone"),
-        ("os_tests_detailed.html", "Suite_Name: OS Tests"),
-    ]
+        return data if isinstance(data, dict) else {}
+    except Exception as e:
+        print(f"Warning: Could not read merged JSON {merged_json_path}: {e}")
+        return {}
 
-    for filename, suite_key in files:
-        info_map = suite_map.get(suite_key)
-        if not info_map:
-            continue
-        file_path = os.path.join(output_dir, filename)
-        if not os.path.exists(file_path):
+def section_counts(section):
+    """
+    Return the result counts of one merged_results.json section: its
+    suite_summary (PFDI: the trailing Suite_summary entry) or, for the
+    Standalone list that has none, the sum of its entries' summaries.
+    """
+    return summary_counts(section) or {}
+
+def suite_rows(merged):
+    """Return one row per suite of merged that ran, in SUMMARY_SUITES order."""
+    rows = []
+    for anchor, label, detailed_page, section in SUMMARY_SUITES:
+        names = [name for name in merged if name == section or name.startswith(section + " - ")]
+        if not names:
             continue
-        with open(file_path, 'r') as file:
-            content = file.read()
-        updated = content
-        for pattern, name_group in patterns:
-            out = []
-            last = 0
-            for match in re.finditer(pattern, updated, re.IGNORECASE):
-                out.append(updated[last:match.end()])
-                suite_name = (match.group(name_group) or "").strip().lower()
-                info = info_map.get(suite_name)
-                if info is not None:
-                    # Avoid duplicating Test_suite_info in the same section.
-                    lookahead = updated[match.end():match.end() + 300]
-                    if "Test_suite_info" not in lookahead:
-                        block = (
-                            "<div class=\"test-suite-info\" "
-                            "style=\"margin: 6px 0 16px 0; color: #7f8c8d; font-size: 16px;\">"
-                            "<strong>Test_suite_info:</strong>"
-                            f"{fmt_info(info)}</div>"
-                        )
-                        out.append(block)
-                last = match.end()
-            out.append(updated[last:])
-            updated = "".join(out)
-        if updated != content:
-            with open(file_path, 'w') as file:
-                file.write(updated)
+        counts = {}
+        for name in names:
+            add_counts(counts, section_counts(merged[name]))
+        columns = [(key, heading) for key, heading, _ in RESULT_COLUMNS
+                   if key not in OPTIONAL_COLUMNS or counts.get(key)]
+        total = counts.get("rules_run") or sum(counts.get(key, 0) for key, _, _ in RESULT_COLUMNS)
+        rows.append({
+            "id": anchor,
+            "label": label,
+            "detailed_page": detailed_page,
+            "counts": counts,
+            "columns": columns,
+            "total": total,
+        })
+    return rows
+
+def suites_chart(rows):
+    """Return the stacked bar chart markup of all suite rows ("" when there are none)."""
+    if not rows:
+        return ""
+    series = []
+    colors = []
+    for key, heading, color in RESULT_COLUMNS:
+        values = [row["counts"].get(key, 0) for row in rows]
+        if key not in OPTIONAL_COLUMNS or any(values):
+            series.append((heading, values))
+            colors.append(color)
+    return stacked_bar_chart(
+        [row["label"] for row in rows],
+        series,
+        colors,
+        'Test Results by Suite',
+        'Total Count',
+        alt='Test Results by Suite',
+        figsize=(14, 7),
+        tick_size=11,
+        rotate_labels=True
+    )
 
-def adjust_bbsr_headings(content, suite_name):
-    if content:
-        pattern = r'(<h[1-6][^>]*>)(.*? Test Summary)(</h[1-6]>)'
-        replacement = r'\1' + suite_name + r' Test Summary\3'
-        content = re.sub(pattern, replacement, content, count=1, flags=re.IGNORECASE)
-    return content
+# Text colour of a compliance status in the results tables.
+STATUS_COLORS = {
+    compliance.NOT_COMPLIANT: "red",
+    compliance.COMPLIANT_WITH_WAIVERS: "#FFBF00",
+    compliance.COMPLIANT: "green",
+}
 
-def adjust_detailed_summary_heading(file_path, suite_name):
-    if file_path and os.path.exists(file_path):
-        with open(file_path, 'r') as file:
-            content = file.read()
-        content = adjust_bbsr_headings(content, suite_name)
-        with open(file_path, 'w') as file:
-            file.write(content)
+def summary_status(result):
+    """Return the status at the head of an ACS Results Summary string ("Not Compliant : ..." -> "Not Compliant")."""
+    return result.split(":")[0].strip() if result else "Unknown"
 
-def read_overall_compliance_from_merged_json(merged_json_path):
+def read_compliance(merged):
     """
-    Opens the merged_results.json and retrieves the final
-    "Overall Compliance Result" from:
-      data["Suite_Name: acs_info"]["ACS Results Summary"]["Overall Compliance Result"]
+    Return the compliance.Verdict of merged_results.json (the loaded document
+    or its path), or None when there is no merged JSON.
 
-    Returns: (overall_result, bbsr_result, scmi_result, mandatory_details, recommended_details, bbsr_details)
-    where mandatory_details, recommended_details, and bbsr_details are dicts with 'not_run' and 'failed' lists
+    The verdict merge_jsons.py stores under "Compliance Verdict" is used as
+    it is. A merged JSON written before the verdict was stored gives a
+    verdict with the overall, BBSR and SCMI results of its ACS Results
+    Summary and no suite details.
+    """
+    data = load_merged_results(merged) if isinstance(merged, str) else merged
+    if not data:
+        return None
+    acs_info = data.get("Suite_Name: acs_info")
+    acs_info = acs_info if isinstance(acs_info, dict) else {}
+    verdict = compliance.Verdict.from_dict(acs_info.get(compliance.VERDICT_KEY))
+    if verdict is not None:
+        return verdict
+
+    summary = acs_info.get("ACS Results Summary")
+    summary = summary if isinstance(summary, dict) else {}
+    def group(key, default):
+        result = summary.get(key) or default
+        return compliance.GroupVerdict(summary_status(result), result)
+    scmi = group("SCMI compliance results", "") if "SCMI compliance results" in summary else None
+    return compliance.Verdict("", (), group("Overall Compliance Result", "Unknown"),
+                              group("BBSR compliance results", "Unknown"), scmi)
+
+def generate_html(system_info, acs_results_summary, verdict, suites, output_html_path):
+    """
+    Write the ACS summary page. acs_results_summary gives the Band and Date,
+    verdict the compliance results (a compliance.Verdict) and suites the
+    rows from suite_rows().
     """
-    overall_result = "Unknown"
-    bbsr_result = "Unknown"
-    mandatory_details = {"not_run": [], "failed": []}
-    recommended_details = {"not_run": [], "failed": []}
-    bbsr_details = {"not_run": [], "failed": []}
-    scmi_result = "Unknown"
-
-    try:
-        with open(merged_json_path, 'r') as jf:
-            data = json.load(jf)
-        acs_info_data = data.get("Suite_Name: acs_info", {})
-        acs_summary = acs_info_data.get("ACS Results Summary", {})
-        overall_result = acs_summary.get("Overall Compliance Result", "Unknown")
-
-        # Parse the overall result to extract mandatory and recommended details
-        # Format: "Not Compliant : Mandatory - (not run: X; failed: Y) : Recommended - (not run: A; failed: B)"
-        if "Mandatory -" in overall_result or "Recommended -" in overall_result:
-            # Split by " : " to get sections
-            sections = overall_result.split(" : ")
-            for section in sections:
-                if section.startswith("Mandatory -"):
-                    # Extract content within parentheses
-                    match = re.search(r'Mandatory - \((.*?)\)', section)
-                    if match:
-                        content = match.group(1)
-                        # Parse "not run: X; failed: Y"
-                        parts = content.split("; ")
-                        for part in parts:
-                            if part.startswith("not run:"):
-                                suites = part.replace("not run:", "").strip()
-                                mandatory_details["not_run"] = [s.strip() for s in suites.split(",")]
-                            elif part.startswith("failed:"):
-                                suites = part.replace("failed:", "").strip()
-                                mandatory_details["failed"] = [s.strip() for s in suites.split(",")]
-
-                elif section.startswith("Recommended -"):
-                    match = re.search(r'Recommended - \((.*?)\)', section)
-                    if match:
-                        content = match.group(1)
-                        parts = content.split("; ")
-                        for part in parts:
-                            if part.startswith("not run:"):
-                                suites = part.replace("not run:", "").strip()
-                                recommended_details["not_run"] = [s.strip() for s in suites.split(",")]
-                            elif part.startswith("failed:"):
-                                suites = part.replace("failed:", "").strip()
-                                recommended_details["failed"] = [s.strip() for s in suites.split(",")]
-
-        # Get BBSR compliance result and parse it
-        if "BBSR compliance results" in acs_info_data:
-            bbsr_result = acs_info_data.get("BBSR compliance results", "Unknown")
-        else:
-            bbsr_result = acs_summary.get("BBSR compliance results", "Unknown")
-
-        # Parse BBSR result to extract mandatory details
-        # Format: "Not Compliant : Mandatory - (not run: X; failed: Y)"
-        if "Mandatory -" in bbsr_result:
-            match = re.search(r'Mandatory - \((.*?)\)', bbsr_result)
-            if match:
-                content = match.group(1)
-                parts = content.split("; ")
-                for part in parts:
-                    if part.startswith("not run:"):
-                        suites = part.replace("not run:", "").strip()
-                        bbsr_details["not_run"] = [s.strip() for s in suites.split(",")]
-                    elif part.startswith("failed:"):
-                        suites = part.replace("failed:", "").strip()
-                        bbsr_details["failed"] = [s.strip() for s in suites.split(",")]
-
-        # Get SCMI compliance result from ACS Results Summary
-        scmi_result = acs_summary.get("SCMI compliance results", "")
-
-    except Exception as e:
-        print(f"Warning: Could not read merged JSON or find 'Overall Compliance Result': {e}")
-
-    # Derive SCMI details for the Extensions table (without storing in merged JSON)
-    scmi_details = {"not_run": [], "failed": []}
-    scmi_low = (scmi_result or "").lower()
-    if "not compliant" in scmi_low:
-        scmi_details["failed"] = ["SCMI"]
-
-    return overall_result, bbsr_result, scmi_result, mandatory_details, recommended_details, bbsr_details, scmi_details
-
-def generate_html(system_info, acs_results_summary,
-                  bsa_summary_path, sbsa_summary_path, fwts_summary_path, sct_summary_path,
-                  sbmr_ib_summary_path, sbmr_oob_summary_path, scmi_summary_path,
-                  bbsr_fwts_summary_path, bbsr_sct_summary_path, bbsr_tpm_summary_path, pfdi_summary_path,
-                  post_script_summary_path,
-                  standalone_summary_path, OS_tests_summary_path,
-                  output_html_path):
-
-    # Read the summary HTML content from each suite
-    bsa_summary_content = read_html_content(bsa_summary_path)
-    sbsa_summary_content = read_html_content(sbsa_summary_path)
-    fwts_summary_content = read_html_content(fwts_summary_path)
-    sct_summary_content = read_html_content(sct_summary_path)
-    sbmr_ib_summary_content  = read_html_content(sbmr_ib_summary_path)
-    sbmr_oob_summary_content = read_html_content(sbmr_oob_summary_path)
-    scmi_summary_content = read_html_content(scmi_summary_path)
-    bbsr_fwts_summary_content = read_html_content(bbsr_fwts_summary_path)
-    bbsr_sct_summary_content = read_html_content(bbsr_sct_summary_path)
-    bbsr_tpm_summary_content = read_html_content(bbsr_tpm_summary_path)
-    pfdi_summary_content = read_html_content(pfdi_summary_path)
-    post_script_summary_content = read_html_content(post_script_summary_path)
-    standalone_summary_content = read_html_content(standalone_summary_path)
-    OS_tests_summary_content = read_html_content(OS_tests_summary_path)
-
-    # Adjust headings in BBSR/Standalone/OS summaries
-    bbsr_fwts_summary_content = adjust_bbsr_headings(bbsr_fwts_summary_content, 'BBSR-FWTS')
-    bbsr_sct_summary_content = adjust_bbsr_headings(bbsr_sct_summary_content, 'BBSR-SCT')
-    bbsr_tpm_summary_content = adjust_bbsr_headings(bbsr_tpm_summary_content, 'BBSR-TPM')
-    post_script_summary_content = adjust_bbsr_headings(post_script_summary_content, 'POST-SCRIPT')
-    OS_tests_summary_content = adjust_bbsr_headings(OS_tests_summary_content, 'OS')
-    standalone_summary_content = adjust_bbsr_headings(standalone_summary_content, 'Standalone')
 
     # Jinja2 template for the final HTML page
     html_template = '''
+    {% macro shortfall_row(level, shortfall) %}
+                    <tr>
+                        <td style="padding-left: 20px; color: red;">
+                            <strong>{{ level }}:</strong> {{ shortfall.text() }}
+                        </td>
+                    </tr>
+    {% endmacro %}
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -447,6 +348,14 @@ def generate_html(system_info, acs_results_summary,
                 padding: 20px;
                 border-bottom: 1px solid #ddd;
             }
+            .chart-container {
+                display: flex;
+                justify-content: center;
+                margin-bottom: 20px;
+            }
+            .suite-table th, .suite-table td {
+                text-align: center;
+            }
             .details-link {
                 text-align: center;
                 margin-top: 10px;
@@ -571,368 +480,95 @@ def generate_html(system_info, acs_results_summary,
                         <th>Date</th>
                         <td>{{ acs_results_summary.get('Date', 'Unknown') }}</td>
                     </tr>
+                    {% set overall = verdict.overall %}
+                    {% set overall_rows = [overall.mandatory, overall.recommended]|select|list if overall.status == 'Not Compliant' else [] %}
                     <tr>
-                        <th rowspan="3">SRS requirements compliance results</th>
-                        <td style="
-                            color:
-                            {% if 'Not Compliant' in acs_results_summary.get('Overall Compliance Results', '') %}
-                                red
-                            {% elif 'Compliant with Waivers' in acs_results_summary.get('Overall Compliance Results', '') %}
-                                #FFBF00
-                            {% elif 'Compliant' in acs_results_summary.get('Overall Compliance Results', '') %}
-                                green
-                            {% else %}
-                                black
-                            {% endif %}
-                        ">
-                            {% set overall = acs_results_summary.get('Overall Compliance Results', 'Unknown') %}
-                            {% if ':' in overall %}
-                                {{ overall.split(':')[0].strip() }}
-                            {% else %}
-                                {{ overall }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% set mandatory = acs_results_summary.get('Mandatory Details', {}) %}
-                    {% set recommended = acs_results_summary.get('Recommended Details', {}) %}
-                    {% if mandatory.get('not_run') or mandatory.get('failed') %}
-                    <tr>
-                        <td style="padding-left: 20px; color: red;">
-                            <strong>Mandatory:</strong>
-                            {% if mandatory.get('not_run') %}
-                                not run: {{ mandatory.get('not_run')|join(', ') }}
-                            {% endif %}
-                            {% if mandatory.get('not_run') and mandatory.get('failed') %}; {% endif %}
-                            {% if mandatory.get('failed') %}
-                                failed: {{ mandatory.get('failed')|join(', ') }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endif %}
-                    {% if recommended.get('not_run') or recommended.get('failed') %}
-                    <tr>
-                        <td style="padding-left: 20px; color: red;">
-                            <strong>Recommended:</strong>
-                            {% if recommended.get('not_run') %}
-                                not run: {{ recommended.get('not_run')|join(', ') }}
-                            {% endif %}
-                            {% if recommended.get('not_run') and recommended.get('failed') %}; {% endif %}
-                            {% if recommended.get('failed') %}
-                                failed: {{ recommended.get('failed')|join(', ') }}
-                            {% endif %}
-                        </td>
+                        <th rowspan="{{ 1 + overall_rows|length }}">SRS requirements compliance results</th>
+                        <td style="color: {{ status_colors.get(overall.status, 'black') }};">{{ overall.status }}</td>
                     </tr>
+                    {% if overall_rows %}
+                    {% if overall.mandatory %}{{ shortfall_row('Mandatory', overall.mandatory) }}{% endif %}
+                    {% if overall.recommended %}{{ shortfall_row('Recommended', overall.recommended) }}{% endif %}
                     {% endif %}
                 </table>
             </div>
             <div class="acs-results-summary">
                 <h2>Extensions</h2>
                 <table>
-                    {% set bbsr_ext = acs_results_summary.get('BBSR Details', {}) %}
-                    {% set bbsr_has_details = bbsr_ext.get('not_run') or bbsr_ext.get('failed') %}
+                    {% for name, group in extensions %}
+                    {% set has_details = group.status == 'Not Compliant' and group.mandatory %}
                     <tr>
-                        <th rowspan="{{ 2 if bbsr_has_details else 1 }}">BBSR compliance results</th>
-                        <td style="
-                            color:
-                            {% if 'Not Compliant' in acs_results_summary.get('BBSR compliance results', '') %}
-                                red
-                            {% elif 'waiver' in acs_results_summary.get('BBSR compliance results', '')|lower %}
-                                #FFBF00
-                            {% elif 'Compliant' in acs_results_summary.get('BBSR compliance results', '') %}
-                                green
-                            {% else %}
-                                black
-                            {% endif %}
-                        ">
-                            {% set bbsr = acs_results_summary.get('BBSR compliance results', 'Not run') %}
-                            {% if ':' in bbsr %}
-                                {{ bbsr.split(':')[0].strip() }}
-                            {% else %}
-                                {{ bbsr }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% if bbsr_has_details %}
-                    <tr>
-                        <td style="padding-left: 20px; color: red;">
-                            <strong>Mandatory:</strong>
-                            {% if bbsr_ext.get('not_run') %}
-                                not run: {{ bbsr_ext.get('not_run')|join(', ') }}
-                            {% endif %}
-                            {% if bbsr_ext.get('not_run') and bbsr_ext.get('failed') %}; {% endif %}
-                            {% if bbsr_ext.get('failed') %}
-                                failed: {{ bbsr_ext.get('failed')|join(', ') }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endif %}
-                    {% if 'SCMI compliance results' in acs_results_summary %}
-                    {% set scmi_ext = acs_results_summary.get('SCMI Details', {}) %}
-                    {% set scmi_has_details = scmi_ext.get('not_run') or scmi_ext.get('failed') %}
-                    <tr>
-                        <th rowspan="{{ 2 if scmi_has_details else 1 }}">SCMI compliance results</th>
-                        <td style="
-                            color:
-                            {% if 'not compliant' in acs_results_summary.get('SCMI compliance results', '')|lower %}
-                                red
-                            {% elif 'waiver' in acs_results_summary.get('SCMI compliance results', '')|lower %}
-                                #FFBF00
-                            {% elif 'Compliant' in acs_results_summary.get('SCMI compliance results', '') %}
-                                green
-                            {% else %}
-                                black
-                            {% endif %}
-                        ">
-                            {% set scmi = acs_results_summary.get('SCMI compliance results', 'Not run') %}
-                            {% if ':' in scmi %}
-                                {{ scmi.split(':')[0].strip() }}
-                            {% else %}
-                                {{ scmi }}
-                            {% endif %}
-                        </td>
+                        <th rowspan="{{ 2 if has_details else 1 }}">{{ name }} compliance results</th>
+                        <td style="color: {{ status_colors.get(group.status, 'black') }};">{{ group.status }}</td>
                     </tr>
-                    {% if scmi_has_details %}
-                    <tr>
-                        <td style="padding-left: 20px; color: red;">
-                            <strong>Mandatory:</strong>
-                            {% if scmi_ext.get('not_run') %}
-                                not run: {{ scmi_ext.get('not_run')|join(', ') }}
-                            {% endif %}
-                            {% if scmi_ext.get('not_run') and scmi_ext.get('failed') %}; {% endif %}
-                            {% if scmi_ext.get('failed') %}
-                                failed: {{ scmi_ext.get('failed')|join(', ') }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endif %}
-                    {% endif %}
+                    {% if has_details %}{{ shortfall_row('Mandatory', group.mandatory) }}{% endif %}
+                    {% endfor %}
                 </table>
             </div>
             <div class="dropdown">
                 <button>Go to Summary</button>
                 <div class="dropdown-content">
-                    {% if bsa_summary_content %}
-                    <a href="#bsa_summary">BSA Summary</a>
-                    {% endif %}
-                    {% if sbsa_summary_content %}
-                    <a href="#sbsa_summary">SBSA Summary</a>
-                    {% endif %}
-                    {% if fwts_summary_content %}
-                    <a href="#fwts_summary">FWTS Summary</a>
-                    {% endif %}
-                    {% if sct_summary_content %}
-                    <a href="#sct_summary">SCT Summary</a>
-                    {% endif %}
-                    {% if scmi_summary_content %}
-                    <a href="#scmi_summary">SCMI Summary</a>
-                    {% endif %}
-                    {% if sbmr_ib_summary_content %}
-                    <a href="#sbmr_ib_summary">SBMR-IB Summary</a>
-                    {% endif %}
-                    {% if sbmr_oob_summary_content %}
-                    <a href="#sbmr_oob_summary">SBMR-OOB Summary</a>
-                    {% endif %}
-                    {% if post_script_summary_content %}
-                    <a href="#post_script_summary">POST-SCRIPT Summary</a>
-                    {% endif %}
-                    {% if standalone_summary_content %}
-                    <a href="#standalone_summary">Standalone tests Summary</a>
-                    {% endif %}
-                    {% if bbsr_fwts_summary_content %}
-                    <a href="#bbsr_fwts_summary">BBSR-FWTS Summary</a>
-                    {% endif %}
-                    {% if bbsr_sct_summary_content %}
-                    <a href="#bbsr_sct_summary">BBSR-SCT Summary</a>
-                    {% endif %}
-                    {% if pfdi_summary_content %}
-                    <a href="#pfdi_summary">PFDI Summary</a>
-                    {% endif %}
-                    {% if bbsr_tpm_summary_content %}
-                    <a href="#bbsr_tpm_summary">BBSR-TPM Summary</a>
-                    {% endif %}
-                    {% if OS_tests_summary_content %}
-                    <a href="#OS_tests_summary">OS tests Summary</a>
-                    {% endif %}
+                    {% for suite in suites %}
+                    <a href="#{{ suite.id }}">{{ suite.label }} Summary</a>
+                    {% endfor %}
                 </div>
             </div>
             <div class="summary-section">
                 <h2>Test Summaries</h2>
-                {% if bsa_summary_content %}
-                <div class="summary" id="bsa_summary">
-                    {{ bsa_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="bsa_detailed.html" target="_blank">Click here to go to the detailed summary for BSA</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if sbsa_summary_content %}
-                <div class="summary" id="sbsa_summary">
-                    {{ sbsa_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="sbsa_detailed.html" target="_blank">Click here to go to the detailed summary for SBSA</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if fwts_summary_content %}
-                <div class="summary" id="fwts_summary">
-                    {{ fwts_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="fwts_detailed.html" target="_blank">Click here to go to the detailed summary for FWTS</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if sct_summary_content %}
-                <div class="summary" id="sct_summary">
-                    {{ sct_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="sct_detailed.html" target="_blank">Click here to go to the detailed summary for SCT</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if scmi_summary_content %}
-                <div class="summary" id="scmi_summary">
-                    {{ scmi_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="scmi_detailed.html" target="_blank">Click here to go to the detailed summary for SCMI</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if sbmr_ib_summary_content %}
-                <div class="summary" id="sbmr_ib_summary">
-                    {{ sbmr_ib_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="sbmr_ib_detailed.html" target="_blank">Click here to go to the detailed summary for SBMR-IB</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if sbmr_oob_summary_content %}
-                <div class="summary" id="sbmr_oob_summary">
-                    {{ sbmr_oob_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="sbmr_oob_detailed.html" target="_blank">Click here to go to the detailed summary for SBMR-OOB</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if post_script_summary_content %}
-                <div class="summary" id="post_script_summary">
-                    {{ post_script_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="post_script_detailed.html" target="_blank">Click here to go to the detailed summary for POST-SCRIPT</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if standalone_summary_content %}
-                <div class="summary" id="standalone_summary">
-                    {{ standalone_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="standalone_tests_detailed.html" target="_blank">Click here to go to the detailed summary for Standalone tests</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if bbsr_fwts_summary_content %}
-                <div class="summary" id="bbsr_fwts_summary">
-                    {{ bbsr_fwts_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="bbsr_fwts_detailed.html" target="_blank">Click here to go to the detailed summary for BBSR-FWTS</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if bbsr_sct_summary_content %}
-                <div class="summary" id="bbsr_sct_summary">
-                    {{ bbsr_sct_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="bbsr_sct_detailed.html" target="_blank">Click here to go to the detailed summary for BBSR-SCT</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if bbsr_tpm_summary_content %}
-                <div class="summary" id="bbsr_tpm_summary">
-                    {{ bbsr_tpm_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="bbsr_tpm_detailed.html" target="_blank">Click here to go to the detailed summary for BBSR-TPM</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if pfdi_summary_content %}
-                <div class="summary" id="pfdi_summary">
-                    {{ pfdi_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="pfdi_detailed.html" target="_blank">
-                            Click here to go to the detailed summary for PFDI
-                        </a>
-                    </div>
+                {% if suites_chart %}
+                <div class="chart-container">
+                    {{ suites_chart | safe }}
                 </div>
                 {% endif %}
-                {% if OS_tests_summary_content %}
-                <div class="summary" id="OS_tests_summary">
-                    {{ OS_tests_summary_content | safe }}
+                {% for suite in suites %}
+                <div class="summary" id="{{ suite.id }}">
+                    <h3>{{ suite.label }}</h3>
+                    <table class="suite-table">
+                        <tr>
+                            <th>Total Tests</th>
+                            {% for key, heading in suite.columns %}
+                            <th>{{ heading }}</th>
+                            {% endfor %}
+                        </tr>
+                        <tr>
+                            <td>{{ suite.total }}</td>
+                            {% for key, heading in suite.columns %}
+                            <td>{{ suite.counts.get(key, 0) }}</td>
+                            {% endfor %}
+                        </tr>
+                    </table>
                     <div class="details-link">
-                        <a href="os_tests_detailed.html" target="_blank">Click here to go to the detailed summary for OS Tests</a>
+                        <a href="{{ suite.detailed_page }}" target="_blank">Click here to go to the detailed summary for {{ suite.label }}</a>
                     </div>
                 </div>
-                {% endif %}
+                {% endfor %}
             </div>
         </div>
     </body>
     </html>
     '''
 
+    extensions = [("BBSR", verdict.bbsr)]
+    if verdict.scmi is not None:
+        extensions.append(("SCMI", verdict.scmi))
+
     template = Template(html_template)
     html_output = template.render(
         system_info=system_info,
         acs_results_summary=acs_results_summary,
-        bsa_summary_content=bsa_summary_content,
-        sbsa_summary_content=sbsa_summary_content,
-        fwts_summary_content=fwts_summary_content,
-        sct_summary_content=sct_summary_content,
-        scmi_summary_content=scmi_summary_content,
-        sbmr_ib_summary_content=sbmr_ib_summary_content,
-        sbmr_oob_summary_content=sbmr_oob_summary_content,
-        bbsr_fwts_summary_content=bbsr_fwts_summary_content,
-        bbsr_sct_summary_content=bbsr_sct_summary_content,
-        bbsr_tpm_summary_content=bbsr_tpm_summary_content,
-        pfdi_summary_content=pfdi_summary_content,
-        post_script_summary_content=post_script_summary_content,
-        standalone_summary_content=standalone_summary_content,
-        OS_tests_summary_content=OS_tests_summary_content
+        verdict=verdict,
+        extensions=extensions,
+        status_colors=STATUS_COLORS,
+        suites=suites,
+        suites_chart=suites_chart(suites)
     )
 
     with open(output_html_path, 'w') as html_file:
         html_file.write(html_output)
 
-    # Adjust headings in the *detailed* summary pages
-    detailed_summaries = [
-        (os.path.join(os.path.dirname(output_html_path), 'bbsr_fwts_detailed.html'), 'BBSR-FWTS'),
-        (os.path.join(os.path.dirname(output_html_path), 'bbsr_sct_detailed.html'), 'BBSR-SCT'),
-        (os.path.join(os.path.dirname(output_html_path), 'bbsr_tpm_detailed.html'), 'BBSR-TPM'),
-        (os.path.join(os.path.dirname(output_html_path), 'sbmr_ib_detailed.html'),  'SBMR-IB'),
-        (os.path.join(os.path.dirname(output_html_path), 'sbmr_oob_detailed.html'), 'SBMR-OOB'),
-        (os.path.join(os.path.dirname(output_html_path), 'pfdi_detailed.html'), 'PFDI'),
-        (os.path.join(os.path.dirname(output_html_path), 'os_tests_detailed.html'), 'OS'),
-        (os.path.join(os.path.dirname(output_html_path), 'standalone_tests_detailed.html'), 'Standalone'),
-        (os.path.join(os.path.dirname(output_html_path), 'post_script_detailed.html'), 'POST-SCRIPT')
-    ]
-    for file_path, suite_name in detailed_summaries:
-        adjust_detailed_summary_heading(file_path, suite_name)
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate ACS Summary HTML page")
-    parser.add_argument("--merged_json", default="", help="Path to merged_results.json if you want to pull final compliance from there")
-    parser.add_argument("bsa_summary_path", help="Path to the BSA summary HTML file")
-    parser.add_argument("sbsa_summary_path", help="Path to the SBSA summary HTML file")
-    parser.add_argument("fwts_summary_path", help="Path to the FWTS summary HTML file")
-    parser.add_argument("sct_summary_path", help="Path to the SCT summary HTML file")
-    parser.add_argument("bbsr_fwts_summary_path", help="Path to the BBSR FWTS summary HTML file")
-    parser.add_argument("bbsr_sct_summary_path", help="Path to the BBSR SCT summary HTML file")
-    parser.add_argument("bbsr_tpm_summary_path", help="Path to the BBSR TPM summary HTML file")
-    parser.add_argument("pfdi_summary_path",help="Path to the pfdi summary HTML file")
-    parser.add_argument("post_script_summary_path", help="Path to the post-script summary HTML file")
-    parser.add_argument("standalone_summary_path", help="Path to the Standalone tests summary HTML file")
-    parser.add_argument("OS_tests_summary_path", help="Path to the OS Tests summary HTML file")
-    parser.add_argument("capsule_update_summary_path", help="Path to the Capsule Update summary HTML file")
-    parser.add_argument("sbmr_ib_summary_path", help="Path to the SBMR-IB summary HTML file")
-    parser.add_argument("sbmr_oob_summary_path", help="Path to the SBMR-OOB summary HTML file")
-    parser.add_argument("scmi_summary_path", help="Path to the SCMI summary HTML file")
+    parser.add_argument("--merged_json", default="", help="Path to merged_results.json with the suite results and final compliance")
     parser.add_argument("output_html_path", help="Path to the output ACS summary HTML file")
     parser.add_argument("--acs_config_path", default="", help="Path to the acs_config.txt file")
     parser.add_argument("--system_config_path", default="", help="Path to the system_config.txt file")
@@ -965,80 +601,23 @@ if __name__ == "__main__":
     # 4) Extract summary date from system_info
     summary_generated_date = system_info.pop('Summary Generated On Date/time', 'Unknown')
 
-    # 5) Read in the stand-alone & capsule summary, then combine them
-    standalone_summary_content = read_html_content(args.standalone_summary_path)
-    capsule_update_summary_content = read_html_content(args.capsule_update_summary_path)
-    if capsule_update_summary_content:
-        # Append capsule content to standalone if it exists
-        if not standalone_summary_content:
-            standalone_summary_content = capsule_update_summary_content
-        else:
-            standalone_summary_content += "<hr/>\n" + capsule_update_summary_content
-
-    # 6) Collect the summary contents for each suite so we can get the fail/waiver counts (purely for printing)
-    suite_content_map = {
-        "BSA": read_html_content(args.bsa_summary_path),
-        "SBSA": read_html_content(args.sbsa_summary_path),
-        "FWTS": read_html_content(args.fwts_summary_path),
-        "SCT": read_html_content(args.sct_summary_path),
-        "SCMI": read_html_content(args.scmi_summary_path),
-        "SBMR-IB":  read_html_content(args.sbmr_ib_summary_path),
-        "SBMR-OOB": read_html_content(args.sbmr_oob_summary_path),
-        "BBSR-FWTS": read_html_content(args.bbsr_fwts_summary_path),
-        "BBSR-SCT": read_html_content(args.bbsr_sct_summary_path),
-        "BBSR-TPM": read_html_content(args.bbsr_tpm_summary_path),
-        "PFDI": read_html_content(args.pfdi_summary_path),
-        "POST-SCRIPT": read_html_content(args.post_script_summary_path),
-        "Standalone tests": standalone_summary_content,
-        "OS tests": read_html_content(args.OS_tests_summary_path)
-    }
-
-    # 8) Read overall compliance solely from merged JSON (if provided)
-    overall_compliance = "Unknown"
-    mandatory_details = {"not_run": [], "failed": []}
-    recommended_details = {"not_run": [], "failed": []}
-    bbsr_details = {"not_run": [], "failed": []}
-    scmi_details = {"not_run": [], "failed": []}
+    # 5) Load merged JSON (if provided) once; it gives the suite results and the compliance verdict
+    merged = {}
+    verdict = None
     if args.merged_json and os.path.isfile(args.merged_json):
-        overall_compliance, bbsr_compliance, scmi_compliance, mandatory_details, recommended_details, bbsr_details, scmi_details = read_overall_compliance_from_merged_json(args.merged_json)
+        merged = load_merged_results(args.merged_json)
+        verdict = read_compliance(merged)
     else:
         print("Warning: merged JSON not provided or does not exist => Overall compliance unknown")
-        overall_compliance, bbsr_compliance, scmi_compliance = "Unknown", "Unknown", "Unknown"
+    if verdict is None:
+        unknown = compliance.GroupVerdict("Unknown", "Unknown")
+        verdict = compliance.Verdict("", (), unknown, unknown)
 
-    # 9) Prepare the dictionary that will be used in the final HTML
+    # 6) Prepare the dictionary that will be used in the final HTML
     acs_results_summary = {
         'Band': acs_config_info.get('Band', 'Unknown'),
         'Date': summary_generated_date,
-        'Overall Compliance Results': overall_compliance,
-        'BBSR compliance results': bbsr_compliance,
-        'Mandatory Details': mandatory_details,
-        'Recommended Details': recommended_details,
-        'BBSR Details': bbsr_details,
-        'SCMI Details': scmi_details
     }
-    if scmi_compliance:
-        acs_results_summary['SCMI compliance results'] = scmi_compliance
-
-    # 10) Finally, generate the consolidated HTML page
-    generate_html(
-        system_info,
-        acs_results_summary,
-        args.bsa_summary_path,
-        args.sbsa_summary_path,
-        args.fwts_summary_path,
-        args.sct_summary_path,
-        args.sbmr_ib_summary_path,
-        args.sbmr_oob_summary_path,
-        args.scmi_summary_path,
-        args.bbsr_fwts_summary_path,
-        args.bbsr_sct_summary_path,
-        args.bbsr_tpm_summary_path,
-        args.pfdi_summary_path,
-        args.post_script_summary_path,
-        args.standalone_summary_path,
-        args.OS_tests_summary_path,
-        args.output_html_path
-    )
 
-    # Inject Test_suite_info into detailed HTMLs (no change to suite parsers)
-    inject_test_suite_info(args.merged_json, os.path.dirname(args.output_html_path))
+    # 7) Finally, generate the consolidated HTML page
+    generate_html(system_info, acs_results_summary, verdict, suite_rows(merged), args.output_html_path)
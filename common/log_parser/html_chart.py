@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Result bar charts for the json_to_html pages, and the stacked multi-suite
+# chart of the ACS summary page (generate_acs_summary.py).
+#
+# The default backend writes the chart as inline SVG, so rendering a page does
+# not need matplotlib at all.  Setting ACS_CHART_BACKEND=png (or passing
+# --chart-backend png to main_log_parser.py) brings back the matplotlib PNG
+# embedded as a base64 <img>; matplotlib is only imported in that case.
+
+import base64
+import html
+import math
+import os
+import sys
+from io import BytesIO
+
+CHART_BACKEND_ENV = "ACS_CHART_BACKEND"
+CHART_BACKENDS = ("svg", "png")
+
+# Pixels per figsize unit; matplotlib saves at 100 dpi.
+DPI = 100
+FONT_FAMILY = "DejaVu Sans, Arial, Helvetica, sans-serif"
+
+
+def chart_backend():
+    """Return the configured backend, falling back to svg for unknown values."""
+    backend = os.environ.get(CHART_BACKEND_ENV, "svg").strip().lower()
+    return backend if backend in CHART_BACKENDS else "svg"
+
+
+def percentage_labels(sizes, total=None, empty_label="0.00%"):
+    """Format each size as a share of total (default: the sum of sizes)."""
+    if total is None:
+        total = sum(sizes)
+    if not total:
+        return [empty_label for _ in sizes]
+    return [f"{size / total * 100:.2f}%" for size in sizes]
+
+
+def _tick_step(max_value, max_ticks=8):
+    """Pick a 1/2/2.5/5 x 10^n step so max_value needs at most max_ticks ticks."""
+    if max_value <= 0:
+        return 1
+    raw = max_value / max_ticks
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 2.5, 5, 10):
+        step = factor * magnitude
+        if step >= raw:
+            break
+    # Counts are integers, so never subdivide below one.
+    return max(step, 1)
+
+
+def _format_tick(value):
+    return str(int(value)) if float(value).is_integer() else f"{value:g}"
+
+
+def render_svg(labels, sizes, colors, title, ylabel, bar_labels,  # pylint: disable=too-many-arguments,too-many-locals
+               figsize=(12, 7), title_size=18, tick_size=12, rotate_labels=False):
+    """Return the bar chart as an inline <svg> element."""
+    width, height = figsize[0] * DPI, figsize[1] * DPI
+    left, right, top = 90, 30, 40 + title_size * 2
+    bottom = 140 if rotate_labels else 60
+    plot_w, plot_h = width - left - right, height - top - bottom
+
+    step = _tick_step(max(sizes) if sizes else 0)
+    y_max = step * max(1, math.ceil((max(sizes) if sizes else 0) * 1.05 / step))
+
+    def y_pos(value):
+        return top + plot_h - value / y_max * plot_h
+
+    esc = html.escape
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'width="{width}" height="{height}" style="max-width:100%;height:auto" '
+        f'role="img" aria-label="{esc(title)}" font-family="{FONT_FAMILY}">',
+        f'<rect width="{width}" height="{height}" fill="#ffffff"/>',
+        f'<text x="{left + plot_w / 2:.1f}" y="{20 + title_size}" font-size="{title_size}" '
+        f'font-weight="bold" text-anchor="middle">{esc(title)}</text>',
+        f'<text transform="translate(24 {top + plot_h / 2:.1f}) rotate(-90)" font-size="14" '
+        f'text-anchor="middle">{esc(ylabel)}</text>',
+    ]
+
+    tick = 0
+    while tick <= y_max:
+        y = y_pos(tick)
+        parts.append(f'<line x1="{left - 6}" y1="{y:.1f}" x2="{left}" y2="{y:.1f}" stroke="#000000"/>')
+        parts.append(f'<text x="{left - 10}" y="{y + tick_size / 3:.1f}" font-size="{tick_size}" '
+                     f'text-anchor="end">{_format_tick(tick)}</text>')
+        tick += step
+
+    slot = plot_w / max(1, len(sizes))
+    for index, (label, size, color, bar_label) in enumerate(zip(labels, sizes, colors, bar_labels)):
+        x = left + slot * index + slot * 0.1
+        center = x + slot * 0.4
+        y = y_pos(size)
+        parts.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{slot * 0.8:.1f}" '
+                     f'height="{top + plot_h - y:.1f}" fill="{esc(color)}" stroke="#000000">'
+                     f'<title>{esc(label)}: {size}</title></rect>')
+        parts.append(f'<text x="{center:.1f}" y="{y - 6:.1f}" font-size="12" '
+                     f'text-anchor="middle">{esc(bar_label)}</text>')
+        label_y = top + plot_h + 8 + tick_size
+        if rotate_labels:
+            parts.append(f'<text transform="translate({center:.1f} {label_y:.1f}) rotate(-30)" '
+                         f'font-size="{tick_size}" text-anchor="end">{esc(label)}</text>')
+        else:
+            parts.append(f'<text x="{center:.1f}" y="{label_y:.1f}" font-size="{tick_size}" '
+                         f'text-anchor="middle">{esc(label)}</text>')
+
+    parts.append(f'<line x1="{left}" y1="{top}" x2="{left}" y2="{top + plot_h}" stroke="#000000"/>')
+    parts.append(f'<line x1="{left}" y1="{top + plot_h}" x2="{left + plot_w}" y2="{top + plot_h}" '
+                 f'stroke="#000000"/>')
+    parts.append('</svg>')
+    return "".join(parts)
+
+
+def render_png(labels, sizes, colors, title, ylabel, bar_labels,  # pylint: disable=too-many-arguments
+               figsize=(12, 7), title_size=18, tick_size=12, rotate_labels=False):
+    """Return the bar chart as base64 PNG data rendered with matplotlib."""
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel,import-error
+
+    plt.figure(figsize=figsize)
+    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
+    offset = max(sizes) * 0.01 if sizes and max(sizes) else 0.05
+    for chart_bar, bar_label in zip(bars, bar_labels):
+        plt.text(
+            chart_bar.get_x() + chart_bar.get_width() / 2,
+            chart_bar.get_height() + offset,
+            bar_label,
+            ha='center',
+            va='bottom',
+            fontsize=12
+        )
+
+    plt.title(title, fontsize=title_size, fontweight='bold')
+    plt.ylabel(ylabel, fontsize=14)
+    if rotate_labels:
+        plt.xticks(fontsize=tick_size, rotation=30, ha='right')
+    else:
+        plt.xticks(fontsize=tick_size)
+    plt.yticks(fontsize=tick_size)
+    plt.tight_layout()
+
+    buffer = BytesIO()
+    plt.savefig(buffer, format='png')
+    plt.close()
+    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def render_stacked_svg(groups, series, colors, title, ylabel,  # pylint: disable=too-many-arguments,too-many-locals
+                       figsize=(12, 7), title_size=18, tick_size=12, rotate_labels=False):
+    """Return a stacked bar chart (one bar per group) as an inline <svg> element."""
+    width, height = figsize[0] * DPI, figsize[1] * DPI
+    legend_h = 24
+    left, right, top = 90, 30, 40 + title_size * 2 + legend_h
+    bottom = 140 if rotate_labels else 60
+    plot_w, plot_h = width - left - right, height - top - bottom
+
+    totals = [sum(values[index] for _, values in series) for index in range(len(groups))]
+    step = _tick_step(max(totals) if totals else 0)
+    y_max = step * max(1, math.ceil((max(totals) if totals else 0) * 1.05 / step))
+
+    def y_pos(value):
+        return top + plot_h - value / y_max * plot_h
+
+    esc = html.escape
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'width="{width}" height="{height}" style="max-width:100%;height:auto" '
+        f'role="img" aria-label="{esc(title)}" font-family="{FONT_FAMILY}">',
+        f'<rect width="{width}" height="{height}" fill="#ffffff"/>',
+        f'<text x="{left + plot_w / 2:.1f}" y="{20 + title_size}" font-size="{title_size}" '
+        f'font-weight="bold" text-anchor="middle">{esc(title)}</text>',
+        f'<text transform="translate(24 {top + plot_h / 2:.1f}) rotate(-90)" font-size="14" '
+        f'text-anchor="middle">{esc(ylabel)}</text>',
+    ]
+
+    legend_x = left
+    legend_y = 30 + title_size
+    for (name, _), color in zip(series, colors):
+        parts.append(f'<rect x="{legend_x}" y="{legend_y}" width="14" height="14" '
+                     f'fill="{esc(color)}" stroke="#000000"/>')
+        parts.append(f'<text x="{legend_x + 20}" y="{legend_y + 12}" font-size="{tick_size}">'
+                     f'{esc(name)}</text>')
+        legend_x += 30 + len(name) * tick_size * 0.6
+
+    tick = 0
+    while tick <= y_max:
+        y = y_pos(tick)
+        parts.append(f'<line x1="{left - 6}" y1="{y:.1f}" x2="{left}" y2="{y:.1f}" stroke="#000000"/>')
+        parts.append(f'<text x="{left - 10}" y="{y + tick_size / 3:.1f}" font-size="{tick_size}" '
+                     f'text-anchor="end">{_format_tick(tick)}</text>')
+        tick += step
+
+    slot = plot_w / max(1, len(groups))
+    for index, (group, total) in enumerate(zip(groups, totals)):
+        x = left + slot * index + slot * 0.1
+        center = x + slot * 0.4
+        base = 0
+        for (name, values), color in zip(series, colors):
+            value = values[index]
+            if not value:
+                continue
+            y = y_pos(base + value)
+            parts.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{slot * 0.8:.1f}" '
+                         f'height="{y_pos(base) - y:.1f}" fill="{esc(color)}" stroke="#000000">'
+                         f'<title>{esc(group)} - {esc(name)}: {value}</title></rect>')
+            base += value
+        parts.append(f'<text x="{center:.1f}" y="{y_pos(total) - 6:.1f}" font-size="12" '
+                     f'text-anchor="middle">{total}</text>')
+        label_y = top + plot_h + 8 + tick_size
+        if rotate_labels:
+            parts.append(f'<text transform="translate({center:.1f} {label_y:.1f}) rotate(-30)" '
+                         f'font-size="{tick_size}" text-anchor="end">{esc(group)}</text>')
+        else:
+            parts.append(f'<text x="{center:.1f}" y="{label_y:.1f}" font-size="{tick_size}" '
+                         f'text-anchor="middle">{esc(group)}</text>')
+
+    parts.append(f'<line x1="{left}" y1="{top}" x2="{left}" y2="{top + plot_h}" stroke="#000000"/>')
+    parts.append(f'<line x1="{left}" y1="{top + plot_h}" x2="{left + plot_w}" y2="{top + plot_h}" '
+                 f'stroke="#000000"/>')
+    parts.append('</svg>')
+    return "".join(parts)
+
+
+def render_stacked_png(groups, series, colors, title, ylabel,  # pylint: disable=too-many-arguments
+                       figsize=(12, 7), title_size=18, tick_size=12, rotate_labels=False):
+    """Return the stacked bar chart as base64 PNG data rendered with matplotlib."""
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel,import-error
+
+    plt.figure(figsize=figsize)
+    bottoms = [0] * len(groups)
+    for (name, values), color in zip(series, colors):
+        plt.bar(groups, values, bottom=bottoms, color=color, edgecolor='black', label=name)
+        bottoms = [b + v for b, v in zip(bottoms, values)]
+    offset = max(bottoms) * 0.01 if bottoms and max(bottoms) else 0.05
+    for index, total in enumerate(bottoms):
+        plt.text(index, total + offset, str(total), ha='center', va='bottom', fontsize=12)
+
+    plt.title(title, fontsize=title_size, fontweight='bold')
+    plt.ylabel(ylabel, fontsize=14)
+    plt.legend(fontsize=tick_size)
+    if rotate_labels:
+        plt.xticks(fontsize=tick_size, rotation=30, ha='right')
+    else:
+        plt.xticks(fontsize=tick_size)
+    plt.yticks(fontsize=tick_size)
+    plt.tight_layout()
+
+    buffer = BytesIO()
+    plt.savefig(buffer, format='png')
+    plt.close()
+    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def bar_chart(labels, sizes, colors, title, ylabel, alt=None,  # pylint: disable=too-many-arguments
+              total=None, empty_label="0.00%", **style):
+    """Return HTML markup for a result bar chart with a percentage above each bar.
+
+    style is passed to the renderer: figsize, title_size, tick_size and
+    rotate_labels.  The markup is an <svg> element, or an <img> holding the
+    matplotlib PNG when the png backend is selected.
+    """
+    bar_labels = percentage_labels(sizes, total, empty_label)
+    if chart_backend() == "png":
+        try:
+            png = render_png(labels, sizes, colors, title, ylabel, bar_labels, **style)
+            return (f'<img src="data:image/png;base64,{png}" '
+                    f'alt="{html.escape(alt or title)}">')
+        except ImportError:
+            print("WARNING: matplotlib is not available; using the SVG chart.", file=sys.stderr)
+    return render_svg(labels, sizes, colors, title, ylabel, bar_labels, **style)
+
+
+def stacked_bar_chart(groups, series, colors, title, ylabel, alt=None, **style):  # pylint: disable=too-many-arguments
+    """Return HTML markup for a stacked bar chart with one bar per group.
+
+    series is a list of (name, values) with one value per group; each series
+    takes the color at the same position and the bar total is shown above
+    each bar.  The backend is picked as in bar_chart().
+    """
+    if chart_backend() == "png":
+        try:
+            png = render_stacked_png(groups, series, colors, title, ylabel, **style)
+            return (f'<img src="data:image/png;base64,{png}" '
+                    f'alt="{html.escape(alt or title)}">')
+        except ImportError:
+            print("WARNING: matplotlib is not available; using the SVG chart.", file=sys.stderr)
+    return render_stacked_svg(groups, series, colors, title, ylabel, **style)
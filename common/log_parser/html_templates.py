@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Jinja2 environment shared by the json_to_html scripts.
+#
+# The page templates stay inline in each script; get_template() registers the
+# source under a name in a DictLoader, so a template is compiled once per
+# process no matter how many pages (detailed + summary) or how many times the
+# in-process pipeline re-runs the script.  Compiled templates are also kept in
+# Jinja2's bytecode cache on disk, so a fresh process skips the compile too.
+# render_to_file() writes a page as it is generated instead of building the
+# whole HTML string first, which keeps large detailed pages out of memory.
+# suite_info_html() is available to every template; the detailed pages call it
+# right after a test suite header to show the suite's Test_suite_info.
+
+import html
+
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, is_undefined
+from markupsafe import Markup
+
+# Generated pieces joined per write; single pieces are often a few bytes.
+STREAM_BUFFER_ITEMS = 256
+
+_sources = {}
+_autoescaped = set()
+# Templates with their own filters get an overlay of the shared environment,
+# so two scripts can register filters under the same name.
+_overlays = {}
+
+
+def _bytecode_cache():
+    try:
+        # Default location is a private per-user directory under the temp dir.
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+ENVIRONMENT = Environment(
+    loader=DictLoader(_sources),
+    autoescape=lambda name: name in _autoescaped,
+    bytecode_cache=_bytecode_cache(),
+)
+
+
+def suite_info_html(info):
+    """Return the Test_suite_info block for a test suite header ('' when info is missing)."""
+    if info is None or is_undefined(info):
+        return Markup("")
+    if isinstance(info, list):
+        # List info is shown as bullets; anything else as plain text.
+        items = "".join(f"<li>{html.escape(str(i))}</li>" for i in info)
+        text = f"<ul style=\"margin: 6px 0 0 18px;\">{items}</ul>"
+    else:
+        text = html.escape(str(info))
+    return Markup(
+        "<div class=\"test-suite-info\" "
+        "style=\"margin: 6px 0 16px 0; color: #7f8c8d; font-size: 16px;\">"
+        f"<strong>Test_suite_info:</strong>{text}</div>"
+    )
+
+
+ENVIRONMENT.globals["suite_info_html"] = suite_info_html
+
+
+def get_template(name, source, autoescape=False, filters=None):
+    """Return the template registered as name, compiling source only when it changed."""
+    _sources[name] = source
+    if autoescape:
+        _autoescaped.add(name)
+    else:
+        _autoescaped.discard(name)
+
+    env = ENVIRONMENT
+    if filters:
+        env = _overlays.get(name)
+        if env is None:
+            env = ENVIRONMENT.overlay()
+            env.filters = dict(ENVIRONMENT.filters)
+            _overlays[name] = env
+        # Filters are looked up when the template renders, so refreshing them
+        # here is enough when the calling script has been re-executed.
+        env.filters.update(filters)
+    return env.get_template(name)
+
+
+def render_to_file(template, output_path, **context):
+    """Render template with context straight into output_path (UTF-8)."""
+    stream = template.stream(**context)
+    stream.enable_buffering(STREAM_BUFFER_ITEMS)
+    stream.dump(output_path, encoding="utf-8")
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Incremental JSON output for the parsers and merge_jsons.py.
+#
+# JsonStreamWriter writes one document a member at a time, so a parser can
+# hand over test suites as it finishes them and merge_jsons.py can copy one
+# suite file at a time into merged_results.json.  Values that are iterators
+# (generators) are written as arrays item by item; a dict is only walked
+# member by member when it holds such an iterator, so a summary dict that
+# follows a generator in the same document is encoded after the generator
+# has run and filled it in.
+#
+# With indent=N the output is byte-identical to json.dump(obj, f, indent=N).
+# json.dump switches to its pure-Python encoder whenever indent is set; the
+# encoder here joins strings instead of chaining generators and hands
+# scalar-only containers (sub-test entries, summaries) to the C encoder,
+# which makes it about 1.5x faster on parser output.  indent=None gives
+# compact output (no whitespace) through the C encoder alone, for machine
+# consumers.
+
+import json
+import math
+from collections.abc import Iterator
+from typing import Any, Callable, Dict
+# c_make_encoder is the C accelerator (None without _json); typeshed does not declare it.
+from json.encoder import c_make_encoder  # type: ignore[attr-defined]
+from json.encoder import encode_basestring_ascii
+
+DEFAULT_INDENT = 4
+_CONTAINERS = (dict, list, tuple)
+_CONSTANTS = {None: "null", True: "true", False: "false"}
+
+
+def _float_str(value):
+    # Same spelling as json.dumps(allow_nan=True).
+    if math.isnan(value):
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _key_str(key):
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    if isinstance(key, float):
+        return '"' + _float_str(key) + '"'
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, int):
+        return '"' + int.__repr__(key) + '"'
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+
+def _not_serializable(obj):
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+# C encoders keyed by member separator, for containers that hold only scalars.
+_flat_encoders: Dict[str, Callable[[Any, int], tuple]] = {}
+
+
+def _encode_flat(obj, inner):
+    """Members of a scalar-only container, separated by "," + inner, without the brackets."""
+    encoder = _flat_encoders.get(inner)
+    if encoder is None:
+        encoder = _flat_encoders[inner] = c_make_encoder(
+            None, _not_serializable, encode_basestring_ascii, None, ": ", "," + inner,
+            False, False, True)
+    return "".join(encoder(obj, 0))[1:-1]
+
+
+def _encode_scalar(obj):
+    if isinstance(obj, str):
+        return encode_basestring_ascii(obj)
+    if obj is None or obj is True or obj is False:
+        return _CONSTANTS[obj]
+    if isinstance(obj, int):
+        return int.__repr__(obj)
+    if isinstance(obj, float):
+        return _float_str(obj)
+    return _not_serializable(obj)
+
+
+def _encode_pretty(obj, newline, step):
+    """Encode obj as json.dumps(indent=...) would; newline is "\\n" plus the current indent."""
+    if isinstance(obj, dict):
+        brackets, members = "{}", obj.values()
+    elif isinstance(obj, (list, tuple)):
+        brackets, members = "[]", obj
+    else:
+        return _encode_scalar(obj)
+    if not obj:
+        return brackets
+    inner = newline + step
+    if c_make_encoder is not None and not any(isinstance(item, _CONTAINERS) for item in members):
+        body = _encode_flat(obj, inner)
+    elif brackets == "{}":
+        body = ("," + inner).join([_key_str(key) + ": " + _encode_pretty(value, inner, step)
+                                   for key, value in obj.items()])
+    else:
+        body = ("," + inner).join([_encode_pretty(item, inner, step) for item in obj])
+    return brackets[0] + inner + body + newline + brackets[1]
+
+
+def encode(obj, indent=DEFAULT_INDENT, level=0):
+    """Return obj as JSON text, nested `level` containers deep (indent=None: compact)."""
+    if indent is None:
+        return json.dumps(obj, separators=(",", ":"))
+    return _encode_pretty(obj, "\n" + " " * (indent * level), " " * indent)
+
+
+def _has_stream(obj):
+    """True if obj is an iterator or a dict holding one (directly or in nested dicts)."""
+    if isinstance(obj, Iterator):
+        return True
+    if isinstance(obj, dict):
+        return any(_has_stream(value) for value in obj.values())
+    return False
+
+
+class JsonStreamWriter:
+    """Write a single JSON document to a text stream piece by piece.
+
+    Containers are opened and closed explicitly (begin_object/key/end_object,
+    begin_array/end_array) or written whole with value().  level indents the
+    output as if it were nested that many containers deep, for fragments that
+    are later copied into a larger document with encoded().
+    """
+
+    def __init__(self, stream, indent=DEFAULT_INDENT, level=0):
+        self.stream = stream
+        self.indent = indent
+        self.level = level
+        self._key_sep = ":" if indent is None else ": "
+        # One entry per open container: True until its first member is written.
+        self._empty = []
+        self._after_key = False
+
+    def _depth(self):
+        return self.level + len(self._empty)
+
+    def _start_member(self):
+        if self._after_key:
+            self._after_key = False
+            return
+        if not self._empty:
+            return
+        sep = "" if self._empty[-1] else ","
+        self._empty[-1] = False
+        if self.indent is not None:
+            sep += "\n" + " " * (self.indent * self._depth())
+        self.stream.write(sep)
+
+    def _open(self, bracket):
+        self._start_member()
+        self.stream.write(bracket)
+        self._empty.append(True)
+
+    def _close(self, bracket):
+        empty = self._empty.pop()
+        if not empty and self.indent is not None:
+            self.stream.write("\n" + " " * (self.indent * self._depth()))
+        self.stream.write(bracket)
+
+    def begin_object(self):
+        self._open("{")
+
+    def end_object(self):
+        self._close("}")
+
+    def begin_array(self):
+        self._open("[")
+
+    def end_array(self):
+        self._close("]")
+
+    def key(self, name):
+        """Start an object member; the next value()/begin_*() call is its value."""
+        self._start_member()
+        self.stream.write(_key_str(name) + self._key_sep)
+        self._after_key = True
+
+    def value(self, obj):
+        """Write obj; iterators are consumed and written as arrays one item at a time."""
+        if isinstance(obj, Iterator):
+            self.begin_array()
+            for item in obj:
+                self.value(item)
+            self.end_array()
+        elif isinstance(obj, dict) and _has_stream(obj):
+            self.begin_object()
+            for name, member in obj.items():
+                self.key(name)
+                self.value(member)
+            self.end_object()
+        else:
+            self._start_member()
+            self.stream.write(encode(obj, self.indent, self._depth()))
+
+    def encoded(self, chunks):
+        """Write a value that is already encoded (at this depth), given as str chunks."""
+        self._start_member()
+        for chunk in chunks:
+            self.stream.write(chunk)
+
+    def member(self, name, obj):
+        """Write one complete object member."""
+        self.key(name)
+        self.value(obj)
+
+
+def dump(obj, path, indent=DEFAULT_INDENT):
+    """Write obj to path with JsonStreamWriter (iterators in obj are streamed)."""
+    with open(path, "w") as f:
+        JsonStreamWriter(f, indent).value(obj)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Line classification shared by the UEFI-app log parsers (SCMI, PFDI).
+#
+# A parser lists its line kinds as LineRules, in the order its if/elif chain
+# tried them, and LineClassifier.classify() returns the first rule whose regex
+# matches.  Each rule also states what a matching line must contain: the first
+# non-blank character and/or keywords.  Those checks are plain string
+# operations, so the detail lines that make up most of a log are turned away
+# without running any regex.  Keywords are compared case-insensitively, like
+# the re.IGNORECASE patterns they guard; lines with non-ASCII characters skip
+# the prefilter and go straight to the regexes, whose Unicode case folding a
+# str.lower() check would not reproduce.
+
+import os
+import re
+import sys
+
+# Shared helpers (log_encoding.py) live in this directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.abspath(__file__))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+from log_encoding import detect_file_encoding  # pylint: disable=wrong-import-position
+
+DIGITS = "0123456789"
+
+
+class LineRule:
+    """One kind of log line: a regex plus the cheap checks that must hold for it to match.
+
+    first_chars: characters the line may start with once leading whitespace is
+    skipped.  keywords: strings the line must contain, lowercase; a tuple
+    entry means any one of its strings.  search=True uses regex.search instead
+    of regex.match.
+    """
+
+    __slots__ = ("kind", "regex", "search", "first_chars", "required", "alternatives")
+
+    def __init__(self, kind, pattern, flags=0, search=False, first_chars=None, keywords=()):
+        self.kind = kind
+        self.regex = re.compile(pattern, flags)
+        self.search = search
+        self.first_chars = first_chars
+        self.required = tuple(kw for kw in keywords if isinstance(kw, str))
+        self.alternatives = tuple(tuple(kw) for kw in keywords if not isinstance(kw, str))
+
+    def run(self, line):
+        return self.regex.search(line) if self.search else self.regex.match(line)
+
+
+class LineClassifier:
+    """Return the first LineRule matching a line, trying only rules whose prefilter passes."""
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        # Rules to try per first character; rules without first_chars apply to any line.
+        self._any_first = tuple(rule for rule in self.rules if rule.first_chars is None)
+        self._by_first = {}
+        for rule in self.rules:
+            for char in rule.first_chars or "":
+                self._by_first[char] = tuple(
+                    r for r in self.rules if r.first_chars is None or char in r.first_chars)
+        self._lower = any(rule.required or rule.alternatives for rule in self.rules)
+
+    def classify(self, line):
+        """Return (kind, match) for the first matching rule, or (None, None)."""
+        if not line.isascii():
+            for rule in self.rules:
+                match = rule.run(line)
+                if match:
+                    return rule.kind, match
+            return None, None
+
+        rules = self._by_first.get(line.lstrip()[:1], self._any_first) if self._by_first else self.rules
+        lowered = line.lower() if self._lower else line
+        for rule in rules:
+            for keyword in rule.required:
+                if keyword not in lowered:
+                    break
+            else:
+                if rule.alternatives and not all(
+                        any(kw in lowered for kw in group) for group in rule.alternatives):
+                    continue
+                match = rule.run(line)
+                if match:
+                    return rule.kind, match
+        return None, None
+
+
+def iter_log_lines(path):
+    """Yield the lines of a log as str.splitlines() would, reading the file as a stream."""
+    with open(path, "r", encoding=detect_file_encoding(path), errors="ignore") as f:
+        for line in f:
+            # splitlines() also breaks on \x0b, \x0c, \x1c-\x1e and the
+            # Unicode line separators, which the file iterator does not.
+            yield from line.splitlines()
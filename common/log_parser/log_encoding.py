@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Encoding detection shared by the logs_to_json parsers.
+#
+# A BOM settles it (the UEFI shell writes UTF-16 with a BOM).  Otherwise the
+# file is decoded as strict UTF-8: the first 64 KB in sniff_encoding(), the
+# rest streamed in chunks by detect_file_encoding(), which costs far less than
+# running chardet over a large log.  Only when that fails does chardet run:
+# on a capped sample when the start of the log is not UTF-8, on the whole
+# file (as the parsers used to) when a non-UTF-8 byte only turns up later,
+# e.g. Latin-1 text in an otherwise ASCII log.  Results are remembered per
+# path, mtime and size for the life of the process, so the in-process
+# pipeline never sniffs the same log twice.
+
+import codecs
+import os
+
+import chardet
+
+UTF8_PREFIX_BYTES = 64 * 1024
+CHARDET_SAMPLE_BYTES = 256 * 1024
+UTF8_CHUNK_BYTES = 1024 * 1024
+
+# UTF-32 BOMs first: the UTF-32-LE BOM starts with the UTF-16-LE one.  The
+# BOM-consuming codecs are returned so the BOM never reaches the parser.
+BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_encoding_cache = {}
+
+
+def chardet_encoding(data):
+    """Return chardet's encoding for data; ASCII or unknown reads as UTF-8."""
+    encoding = chardet.detect(data)["encoding"]
+    if not encoding or encoding.lower() == "ascii":
+        return "utf-8"
+    return encoding
+
+
+def decodes_as_utf8(f):
+    """Return True when the rest of binary file f is valid UTF-8."""
+    decoder = codecs.getincrementaldecoder("utf-8")("strict")
+    try:
+        while True:
+            chunk = f.read(UTF8_CHUNK_BYTES)
+            if not chunk:
+                break
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def sniff_encoding(data):
+    """Return the encoding of a log given its leading bytes."""
+    for bom, encoding in BOMS:
+        if data.startswith(bom):
+            return encoding
+
+    prefix = data[:UTF8_PREFIX_BYTES]
+    # NUL bytes are valid UTF-8 but mean BOM-less UTF-16/32, so leave those to chardet.
+    if b"\0" not in prefix:
+        try:
+            # final=False tolerates a multi-byte character cut at the prefix end.
+            codecs.getincrementaldecoder("utf-8")("strict").decode(prefix, final=False)
+            return "utf-8"
+        except UnicodeDecodeError:
+            pass
+
+    return chardet_encoding(data[:CHARDET_SAMPLE_BYTES])
+
+
+def detect_file_encoding(file_path):
+    """Return the encoding to open file_path with, detected once per file version."""
+    path = os.path.abspath(file_path)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    encoding = _encoding_cache.get(key)
+    if encoding is None:
+        with open(path, "rb") as f:
+            encoding = sniff_encoding(f.read(max(UTF8_PREFIX_BYTES, CHARDET_SAMPLE_BYTES)))
+            if encoding == "utf-8":
+                f.seek(0)
+                if not decodes_as_utf8(f):
+                    f.seek(0)
+                    encoding = chardet_encoding(f.read())
+        _encoding_cache[key] = encoding
+    return encoding
@@ -0,0 +1,903 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Single-process driver for the ACS log parser pipeline.
+#
+# Every suite runs the same stages the shell flow used to launch as separate
+# python3 processes:  parse -> apply waivers -> render HTML.  Suites do not
+# depend on each other, so they run concurrently in a process pool; merge and
+# the ACS summary run once all suites have finished.  Each per-suite script is
+# compiled once per worker and executed in-process with its normal command-line
+# semantics, so the generated JSON/HTML is identical to running it by hand.
+# Parser outputs are kept in acs_summary/.cache (see parse_cache.py), so a
+# re-run only parses the suites whose logs or parser changed.
+
+import argparse
+import builtins
+import glob
+import io
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+
+from apply_waivers import WaiverContext, apply_waivers as apply_suite_waivers
+from html_chart import CHART_BACKEND_ENV, CHART_BACKENDS
+from parse_cache import DEFAULT_MAX_AGE_DAYS, DEFAULT_MAX_BYTES, ParseCache
+from suite_categories import TEST_CATEGORY_ENV
+
+SCRIPTS_PATH = os.path.dirname(os.path.realpath(__file__))
+YOCTO_FLAG = "/mnt/yocto_image.flag"
+ACS_RUN_CONFIG = "/mnt/acs_tests/config/acs_run_config.ini"
+
+# Define color codes
+YELLOW = "\033[1;33m"  # Yellow for WARNING
+RED = "\033[0;31m"     # Red for ERROR
+NC = "\033[0m"         # No Color (Reset)
+
+USAGE = "<acs_results_directory> [acs_config.txt] [system_config.txt] [waiver.json]"
+
+# Compiled code objects of the per-suite scripts, keyed by absolute path.
+_SCRIPT_CODE = {}
+
+
+def _script_code(rel_path):
+    """Compile a log_parser script once and return (path, code)."""
+    path = os.path.join(SCRIPTS_PATH, rel_path)
+    code = _SCRIPT_CODE.get(path)
+    if code is None:
+        with open(path, "rb") as f:
+            code = compile(f.read(), path, "exec")
+        _SCRIPT_CODE[path] = code
+    return path, code
+
+
+def _exit_status(code):
+    """Map a SystemExit code to a process exit status like the interpreter does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_script(rel_path, *args):
+    """Run a log_parser script in-process as if invoked as 'python3 <script> <args>'."""
+    path, code = _script_code(rel_path)
+    saved_argv = sys.argv
+    sys.argv = [path] + [str(arg) for arg in args]
+    try:
+        exec(code, {"__name__": "__main__", "__file__": path, "__builtins__": builtins})  # pylint: disable=exec-used
+    except SystemExit as exc:
+        return _exit_status(exc.code)
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = saved_argv
+    return 0
+
+
+class _CapturedStream(io.TextIOBase):
+    """Text stream that records writes so a suite's console output can be replayed in order."""
+
+    def __init__(self, chunks, fd):
+        super().__init__()
+        self._chunks = chunks
+        self._fd = fd
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        self._chunks.append((self._fd, s))
+        return len(s)
+
+
+def _replay(chunks):
+    """Write captured (fd, text) chunks to the real stdout/stderr."""
+    for fd, text in chunks:
+        stream = sys.stdout if fd == 1 else sys.stderr
+        stream.write(text)
+        stream.flush()
+
+
+def run_parser(ctx, rel_path, output_json, *args, extra_inputs=()):
+    """Run a logs_to_json script, reusing its pre-waiver output from the parse cache when possible.
+
+    Every argument other than output_json is treated as an input whose content
+    goes into the cache key; extra_inputs lists files the parser reads on its own.
+    """
+    cache = ctx.get("cache")
+    if cache is None:
+        return run_script(rel_path, *args)
+
+    inputs = [arg for arg in args if arg != output_json] + list(extra_inputs)
+    key = cache.make_key(rel_path, args, output_json, inputs,
+                         context=("DT" if ctx["yocto"] else "SR",))
+    chunks = cache.load(key, output_json)
+    if chunks is not None:
+        _replay(chunks)
+        return 0
+
+    chunks = []
+    with redirect_stdout(_CapturedStream(chunks, 1)), redirect_stderr(_CapturedStream(chunks, 2)):
+        rc = run_script(rel_path, *args)
+    _replay(chunks)
+    # Only successful parses are reused; failures are re-run so their messages stay accurate.
+    if rc == 0 and os.path.isfile(output_json):
+        cache.store(key, output_json, chunks)
+    return rc
+
+
+def _shell_dirname(path):
+    """Behave like dirname(1), which ignores trailing slashes."""
+    stripped = path.rstrip("/")
+    if not stripped:
+        return "/"
+    head = os.path.dirname(stripped)
+    if not head:
+        return "."
+    return head.rstrip("/") or "/"
+
+
+def _sbsa_run_enabled():
+    """Return True when acs_run_config.ini sets SbsaRunEnabled=1."""
+    try:
+        with open(ACS_RUN_CONFIG, "r", errors="ignore") as f:
+            values = [line.rstrip("\n").split("=")[1] for line in f
+                      if line.startswith("SbsaRunEnabled=")]
+    except OSError:
+        return False
+    return len(values) == 1 and values[0].isdigit() and int(values[0]) == 1
+
+
+def check_file(path, level=""):
+    """Report whether a log file is present; 'M' marks it as mandatory."""
+    if not os.path.isfile(path):
+        if level == "M":
+            print(f"{RED}ERROR: Log file {path} is missing.{NC}")
+        else:
+            print(f"{YELLOW}WARNING: Log file {path} is missing.{NC}")
+        return False
+    print(f"Processing {path} file.")
+    return True
+
+
+def apply_waivers(ctx, suite_name, json_file):
+    """Apply waivers to a suite JSON when a waiver file was provided.
+
+    The waiver and category files are loaded once into ctx["waivers"] and
+    shared by every suite instead of being re-read for each JSON.
+    """
+    if ctx["waivers"] is None:
+        return
+    try:
+        report = apply_suite_waivers(suite_name, json_file, context=ctx["waivers"])
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        return
+    ctx["waiver_reports"].append(report)
+
+
+################################################################################
+# Per-suite stages (parse -> waivers -> html)
+################################################################################
+def run_bsa(ctx):
+    logs_path, jsons_dir, htmls_dir = ctx["logs_path"], ctx["jsons_dir"], ctx["htmls_dir"]
+    bsa_log = f"{logs_path}/uefi/BsaResults.log"
+    bsa_kernel_log = f"{logs_path}/linux_acs/bsa_acs_app/BsaResultsKernel.log"
+    if not os.path.isfile(bsa_kernel_log):
+        bsa_kernel_log = f"{logs_path}/linux/BsaResultsKernel.log"
+    bsa_json = f"{jsons_dir}/bsa.json"
+    level = "" if ctx["yocto"] else "M"
+
+    bsa_logs = [log for log in (bsa_log, bsa_kernel_log) if check_file(log, level)]
+    processed = False
+    if bsa_logs:
+        processed = True
+        if run_parser(ctx, "bsa/logs_to_json.py", bsa_json, *bsa_logs, bsa_json) != 0:
+            processed = False
+            print(f"{RED}ERROR: BSA logs parsing to json failed.{NC}")
+        else:
+            apply_waivers(ctx, "BSA", bsa_json)
+            run_script("bsa/json_to_html.py", bsa_json,
+                       f"{htmls_dir}/bsa_detailed.html", f"{htmls_dir}/bsa_summary.html")
+    return {"bsa": processed}
+
+
+def run_sbsa(ctx):
+    if ctx["yocto"]:
+        return {}
+    logs_path, jsons_dir, htmls_dir = ctx["logs_path"], ctx["jsons_dir"], ctx["htmls_dir"]
+    sbsa_log = f"{logs_path}/uefi/SbsaResults.log"
+    sbsa_kernel_log = f"{logs_path}/linux/SbsaResultsKernel.log"
+    sbsa_json = f"{jsons_dir}/sbsa.json"
+    level = "M" if _sbsa_run_enabled() else ""
+
+    sbsa_logs = [log for log in (sbsa_log, sbsa_kernel_log) if check_file(log, level)]
+    processed = False
+    if sbsa_logs:
+        processed = True
+        if run_parser(ctx, "bsa/logs_to_json.py", sbsa_json, *sbsa_logs, sbsa_json) != 0:
+            processed = False
+            print(f"{RED}ERROR: SBSA logs parsing to json failed.{NC}")
+        else:
+            apply_waivers(ctx, "SBSA", sbsa_json)
+            run_script("bsa/json_to_html.py", sbsa_json,
+                       f"{htmls_dir}/sbsa_detailed.html", f"{htmls_dir}/sbsa_summary.html")
+    return {"sbsa": processed}
+
+
+def run_fwts(ctx):
+    fwts_log = f"{ctx['logs_path']}/fwts/FWTSResults.log"
+    fwts_json = f"{ctx['jsons_dir']}/fwts.json"
+    htmls_dir = ctx["htmls_dir"]
+    processed = False
+    if check_file(fwts_log, "M"):
+        processed = True
+        if run_parser(ctx, "bbr/fwts/logs_to_json.py", fwts_json, fwts_log, fwts_json) != 0:
+            processed = False
+            print(f"{RED}ERROR: FWTS logs parsing to json failed.{NC}")
+        else:
+            apply_waivers(ctx, "FWTS", fwts_json)
+            run_script("bbr/fwts/json_to_html.py", fwts_json,
+                       f"{htmls_dir}/fwts_detailed.html", f"{htmls_dir}/fwts_summary.html")
+    return {"fwts": processed}
+
+
+def parse_sct(ctx, sct_log, sct_json, edk2_parser_log=None, edk2_parser_json=None):
+    """Parse an SCT Summary.log, merging the edk2-test-parser results in memory.
+
+    The parsed edk2-test-parser table is only written to edk2_parser_json with
+    --debug; such runs skip the parse cache so the file is always produced.
+    """
+    args = [sct_log, sct_json]
+    if edk2_parser_log:
+        args += ["--edk2-log", edk2_parser_log]
+        if ctx["debug"]:
+            return run_script("bbr/sct/logs_to_json.py", *args, "--edk2-json", edk2_parser_json)
+    return run_parser(ctx, "bbr/sct/logs_to_json.py", sct_json, *args)
+
+
+def run_sct(ctx):
+    logs_path, jsons_dir, htmls_dir = ctx["logs_path"], ctx["jsons_dir"], ctx["htmls_dir"]
+    sct_log = f"{logs_path}/sct_results/Overall/Summary.log"
+    sct_json = f"{jsons_dir}/sct.json"
+    edk2_parser_log = f"{logs_path}/edk2-test-parser/edk2-test-parser.log"
+    edk2_parser_json = f"{jsons_dir}/edk2_test_parser.json"
+    processed = False
+    if check_file(sct_log, "M"):
+        processed = True
+        # EDK2 Log Parsing: the edk2-test-parser.log results override SCT results
+        if not check_file(edk2_parser_log):
+            edk2_parser_log = None
+        if parse_sct(ctx, sct_log, sct_json, edk2_parser_log, edk2_parser_json) != 0:
+            processed = False
+            print(f"{RED}ERROR: SCT logs parsing to json failed.{NC}")
+        else:
+            apply_waivers(ctx, "SCT", sct_json)
+            run_script("bbr/sct/json_to_html.py", sct_json,
+                       f"{htmls_dir}/sct_detailed.html", f"{htmls_dir}/sct_summary.html")
+    return {"sct": processed}
+
+
+def run_bbsr_fwts(ctx):
+    bbsr_fwts_log = f"{ctx['logs_path']}/bbsr/fwts/FWTSResults.log"
+    bbsr_fwts_json = f"{ctx['jsons_dir']}/bbsr_fwts.json"
+    htmls_dir = ctx["htmls_dir"]
+    processed = False
+    if check_file(bbsr_fwts_log):
+        processed = True
+        run_parser(ctx, "bbr/fwts/logs_to_json.py", bbsr_fwts_json, bbsr_fwts_log, bbsr_fwts_json)
+        apply_waivers(ctx, "BBSR-FWTS", bbsr_fwts_json)
+        run_script("bbr/fwts/json_to_html.py", bbsr_fwts_json,
+                   f"{htmls_dir}/bbsr_fwts_detailed.html", f"{htmls_dir}/bbsr_fwts_summary.html")
+    return {"bbsr_fwts": processed}
+
+
+def run_bbsr_sct(ctx):
+    logs_path, jsons_dir, htmls_dir = ctx["logs_path"], ctx["jsons_dir"], ctx["htmls_dir"]
+    bbsr_sct_log = f"{logs_path}/bbsr/sct_results/Overall/Summary.log"
+    bbsr_sct_json = f"{jsons_dir}/bbsr_sct.json"
+    bbsr_edk2_parser_log = f"{logs_path}/edk2-test-parser/edk2-test-parser-bbsr.log"
+    bbsr_edk2_parser_json = f"{jsons_dir}/edk2_test_parser-bbsr.json"
+    processed = False
+    if check_file(bbsr_sct_log):
+        processed = True
+        # EDK2 Log Parsing: the edk2-test-parser-bbsr.log is only produced on DT
+        if not (ctx["yocto"] and check_file(bbsr_edk2_parser_log)):
+            bbsr_edk2_parser_log = None
+        parse_sct(ctx, bbsr_sct_log, bbsr_sct_json, bbsr_edk2_parser_log, bbsr_edk2_parser_json)
+        apply_waivers(ctx, "BBSR-SCT", bbsr_sct_json)
+        run_script("bbr/sct/json_to_html.py", bbsr_sct_json,
+                   f"{htmls_dir}/bbsr_sct_detailed.html", f"{htmls_dir}/bbsr_sct_summary.html")
+    return {"bbsr_sct": processed}
+
+
+def run_bbsr_tpm(ctx):
+    bbsr_tpm_log = f"{ctx['logs_path']}/bbsr/tpm2/verify_tpm_measurements.log"
+    bbsr_tpm_json = f"{ctx['jsons_dir']}/bbsr_tpm.json"
+    htmls_dir = ctx["htmls_dir"]
+    processed = False
+    if check_file(bbsr_tpm_log):
+        processed = True
+        run_parser(ctx, "bbr/tpm/logs_to_json.py", bbsr_tpm_json, bbsr_tpm_log, bbsr_tpm_json)
+        apply_waivers(ctx, "BBSR-TPM", bbsr_tpm_json)
+        run_script("bbr/tpm/json_to_html.py", bbsr_tpm_json,
+                   f"{htmls_dir}/bbsr_tpm_detailed.html", f"{htmls_dir}/bbsr_tpm_summary.html")
+    return {"bbsr_tpm": processed}
+
+
+def run_pfdi(ctx):
+    if not ctx["yocto"]:
+        return {}
+    pfdi_log = f"{ctx['logs_path']}/uefi/pfdiresults.log"
+    pfdi_json = f"{ctx['jsons_dir']}/pfdi.json"
+    htmls_dir = ctx["htmls_dir"]
+    processed = False
+    if check_file(pfdi_log, "CM"):
+        processed = True
+        rc = run_parser(ctx, "bsa/logs_to_json.py", pfdi_json, pfdi_log, pfdi_json)
+        if rc == 0:
+            apply_waivers(ctx, "PFDI", pfdi_json)
+            run_script("bsa/json_to_html.py", pfdi_json,
+                       f"{htmls_dir}/pfdi_detailed.html", f"{htmls_dir}/pfdi_summary.html")
+        elif rc == 1:
+            processed = False
+            print(f"{RED} PFDI -- Not Implemented{NC}")
+        else:
+            processed = False
+            print(f"{RED}ERROR: PFDI logs parsing to json failed.{NC}")
+    return {"pfdi": processed}
+
+
+def run_scmi(ctx):
+    if not ctx["yocto"]:
+        return {}
+    scmi_log = f"{ctx['logs_path']}/linux_acs/scmi_acs_app/arm_scmi_test_log.txt"
+    scmi_json = f"{ctx['jsons_dir']}/scmi.json"
+    htmls_dir = ctx["htmls_dir"]
+    result = {"scmi": False}
+    if check_file(scmi_log):
+        rc = run_parser(ctx, "scmi/logs_to_json.py", scmi_json, scmi_log, scmi_json)
+        if rc == 0:
+            result["scmi"] = True
+            apply_waivers(ctx, "SCMI", scmi_json)
+            run_script("scmi/json_to_html.py", scmi_json,
+                       f"{htmls_dir}/scmi_detailed.html", f"{htmls_dir}/scmi_summary.html")
+        elif rc == 2:
+            result["env"] = {"SCMI_LOG_PRESENT": "1"}
+            print(f"{YELLOW}WARNING: SCMI raw transport base path error; "
+                  f"treating SCMI as not run.{NC}")
+        elif rc == 1:
+            print(f"{RED} SCMI -- Not Implemented{NC}")
+        else:
+            print(f"{RED}ERROR: SCMI logs parsing to json failed.{NC}")
+    return result
+
+
+def run_sbmr(ctx):
+    if ctx["yocto"]:
+        return {}
+    logs_path, jsons_dir, htmls_dir = ctx["logs_path"], ctx["jsons_dir"], ctx["htmls_dir"]
+    result = {}
+    # Parse IB, then OOB
+    for band, label, log_dir in (("ib", "IB", "sbmr_in_band_logs"),
+                                 ("oob", "OOB", "sbmr_out_of_band_logs")):
+        sbmr_xml = f"{logs_path}/sbmr/{log_dir}/output.xml"
+        sbmr_json = f"{jsons_dir}/sbmr_{band}.json"
+        result[f"sbmr_{band}"] = False
+        if check_file(sbmr_xml, "M"):
+            result[f"sbmr_{band}"] = True
+            if run_parser(ctx, "sbmr/logs_to_json.py", sbmr_json, sbmr_xml, sbmr_json) != 0:
+                result[f"sbmr_{band}"] = False
+                print(f"{RED}ERROR: SBMR {label} logs parsing to json failed.{NC}")
+            else:
+                apply_waivers(ctx, "SBMR", sbmr_json)
+
+    # Generate separate HTMLs per band
+    for band, log_dir in (("ib", "sbmr_in_band_logs"), ("oob", "sbmr_out_of_band_logs")):
+        if result[f"sbmr_{band}"]:
+            run_script("sbmr/json_to_html.py", f"{jsons_dir}/sbmr_{band}.json",
+                       f"{htmls_dir}/sbmr_{band}_detailed.html",
+                       f"{htmls_dir}/sbmr_{band}_summary.html",
+                       f"{logs_path}/sbmr/{log_dir}/report.html")
+    return result
+
+
+def run_post_script(ctx):
+    if not ctx["yocto"]:
+        return {}
+    post_script_json = f"{ctx['jsons_dir']}/post_script.json"
+    htmls_dir = ctx["htmls_dir"]
+    processed = False
+    if check_file(ctx["post_script_log"], "M"):
+        processed = True
+        if run_parser(ctx, "post_script/logs_to_json.py", post_script_json,
+                      ctx["post_script_log"], post_script_json) != 0:
+            processed = False
+            print(f"{RED}ERROR: post-script logs parsing to json failed.{NC}")
+        else:
+            apply_waivers(ctx, "POST_SCRIPT", post_script_json)
+            run_script("post_script/json_to_html.py", post_script_json,
+                       f"{htmls_dir}/post_script_detailed.html",
+                       f"{htmls_dir}/post_script_summary.html")
+    return {"post_script": processed}
+
+
+def run_standalone(ctx):
+    if not ctx["yocto"]:
+        return {}
+    logs_path, jsons_dir, htmls_dir = ctx["logs_path"], ctx["jsons_dir"], ctx["htmls_dir"]
+    linux_tools_logs_path = f"{logs_path}/linux_tools"
+    standalone_jsons = []
+    result = {}
+
+    # 1) DT_KSELFTEST .. 4) READ_WRITE_CHECK
+    for log_name, json_name, level in (
+            ("dt_kselftest.log", "dt_kselftest.json", ""),
+            ("dt-validate-parser.log", "dt_validate.json", "M"),
+            ("ethtool-test.log", "ethtool_test.json", "M"),
+            ("read_write_check_blk_devices.log", "read_write_check_blk_devices.json", "M")):
+        log_file = f"{linux_tools_logs_path}/{log_name}"
+        json_file = f"{jsons_dir}/{json_name}"
+        if check_file(log_file, level):
+            run_parser(ctx, "standalone_tests/logs_to_json.py", json_file, log_file, json_file)
+            standalone_jsons.append(json_file)
+            apply_waivers(ctx, "Standalone", json_file)
+
+    # 5) CAPSULE UPDATE => parse as standalone
+    fw_path = f"{_shell_dirname(logs_path)}/fw"
+    capsule_json = f"{jsons_dir}/capsule_update.json"
+    if check_file(f"{fw_path}/capsule_test_results.log", "M"):
+        run_parser(ctx, "standalone_tests/logs_to_json.py", capsule_json, "capsule_update",
+                   f"{fw_path}/capsule-update.log",
+                   f"{fw_path}/capsule-on-disk.log",
+                   f"{fw_path}/capsule_test_results.log",
+                   capsule_json)
+        if os.path.isfile(capsule_json):
+            result["capsule"] = True
+            apply_waivers(ctx, "Standalone", capsule_json)
+            standalone_jsons.append(capsule_json)
+        else:
+            print("WARNING: Capsule Update JSON not created.")
+
+    # 6) PSCI CHECK
+    psci_log = f"{linux_tools_logs_path}/psci/psci_kernel.log"
+    psci_json = f"{jsons_dir}/psci.json"
+    if check_file(psci_log):
+        if run_parser(ctx, "standalone_tests/logs_to_json.py", psci_json,
+                      "psci_check", psci_log, psci_json) != 0:
+            print(f"{RED}ERROR: PSCI log parsing to json failed.{NC}")
+        else:
+            standalone_jsons.append(psci_json)
+
+    # 7) SMBIOS CHECK, 8) NETWORK BOOT CHECK, 9) RUNTIME DEVICE MAPPING CHECK
+    smbios_log = f"{logs_path}/sct_results/Overall/Summary.log"
+    for log_file, json_name, error_label in (
+            (smbios_log, "smbios_check.json", "SMBIOS"),
+            (f"{logs_path}/network_boot/network_boot_results.log", "network_boot.json",
+             "Network boot"),
+            (f"{linux_tools_logs_path}/runtime_device_mapping_conflict_test.log",
+             "runtime_dev_map.json", "Runtime device mapping")):
+        json_file = f"{jsons_dir}/{json_name}"
+        if check_file(log_file, "M"):
+            if run_parser(ctx, "standalone_tests/logs_to_json.py", json_file,
+                          log_file, json_file) == 0:
+                apply_waivers(ctx, "Standalone", json_file)
+                standalone_jsons.append(json_file)
+            else:
+                print(f"{RED}ERROR: {error_label} log parsing to json failed.{NC}")
+        elif log_file == smbios_log:
+            print(f"{YELLOW}WARNING: SMBIOS log not found: {smbios_log}{NC}")
+
+    # Now generate a single STANDALONE HTML
+    if standalone_jsons:
+        result["standalone"] = True
+        result["standalone_jsons"] = standalone_jsons
+        run_script("standalone_tests/json_to_html.py", *standalone_jsons,
+                   f"{htmls_dir}/standalone_tests_detailed.html",
+                   f"{htmls_dir}/standalone_tests_summary.html",
+                   "--include-drop-down")
+    return result
+
+
+def run_os_tests(ctx):
+    logs_path, jsons_dir, htmls_dir = ctx["logs_path"], ctx["jsons_dir"], ctx["htmls_dir"]
+    os_logs_path = f"{_shell_dirname(logs_path)}/os-logs"
+    os.makedirs(jsons_dir, exist_ok=True)
+    os_jsons = []
+    html_args = []
+    result = {"os_tests": False}
+
+    if ctx["yocto"]:
+        boot_sources_paths = []
+        if os.path.isdir(os_logs_path) and os.listdir(os_logs_path):
+            for os_dir in sorted(glob.glob(f"{os_logs_path}/linux*")):
+                if not os.path.isdir(os_dir):
+                    continue
+                os_name = os.path.basename(os_dir)
+                eth_tool_log = f"{os_dir}/ethtool_test.log"
+                boot_sources_log = f"{os_dir}/boot_sources.log"
+                if os.path.isfile(eth_tool_log):
+                    output_json = f"{jsons_dir}/ethtool_test_{os_name}.json"
+                    run_parser(ctx, "os_tests/logs_to_json.py", output_json,
+                               eth_tool_log, output_json, os_name)
+                    os_jsons.append(output_json)
+                    apply_waivers(ctx, "os Tests", output_json)
+                    result["os_tests"] = True
+                    if os.path.isfile(boot_sources_log):
+                        boot_sources_paths.append(boot_sources_log)
+                    else:
+                        boot_sources_paths.append("Unknown")
+                else:
+                    print(f"{RED}ERROR: ethtool_test.log not found in {os_dir}{NC}")
+        else:
+            print(f"{RED}ERROR: No os-logs found in os-logs directory at {os_logs_path}{NC}")
+        html_args = ["--include-drop-down", "--boot-sources-paths"] + boot_sources_paths
+    else:
+        # SR band OS logs and post-script checks
+        sr_os_logs_json = f"{jsons_dir}/os_test.json"
+        if run_parser(ctx, "os_tests/sr_logs_to_json.py", sr_os_logs_json,
+                      os_logs_path, ctx["post_script_log"], sr_os_logs_json) == 0:
+            os_jsons.append(sr_os_logs_json)
+            apply_waivers(ctx, "os Tests", sr_os_logs_json)
+            result["os_tests"] = True
+        else:
+            print(f"{RED}ERROR: SR OS logs parsing to json failed.{NC}")
+        html_args = ["--include-drop-down"]
+
+    if os_jsons:
+        run_script("os_tests/json_to_html.py", *os_jsons,
+                   f"{htmls_dir}/os_tests_detailed.html", f"{htmls_dir}/os_tests_summary.html",
+                   *html_args)
+    result["os_jsons"] = os_jsons
+    return result
+
+
+# Suite stages in report order. Each one is independent of the others.
+SUITE_STAGES = (
+    run_bsa,
+    run_sbsa,
+    run_fwts,
+    run_sct,
+    run_bbsr_fwts,
+    run_bbsr_sct,
+    run_bbsr_tpm,
+    run_pfdi,
+    run_scmi,
+    run_sbmr,
+    run_post_script,
+    run_standalone,
+    run_os_tests,
+)
+
+
+def _run_stage(index, ctx):
+    """Run one suite stage with its console output captured for ordered replay."""
+    chunks = []
+    result = {}
+    ctx = dict(ctx, waiver_reports=[])
+    with redirect_stdout(_CapturedStream(chunks, 1)), redirect_stderr(_CapturedStream(chunks, 2)):
+        try:
+            result = SUITE_STAGES[index](ctx)
+        except Exception:  # pylint: disable=broad-except
+            traceback.print_exc()
+    result = dict(result, waiver_reports=ctx["waiver_reports"])
+    return result, chunks
+
+
+def _merge_stage_result(results, result):
+    """Fold one stage result into the run state; waiver reports accumulate in stage order."""
+    reports = results.get("waiver_reports", []) + result.pop("waiver_reports", [])
+    results.update(result)
+    results["waiver_reports"] = reports
+
+
+def run_suite_stages(ctx, jobs):
+    """Run all suite stages, in parallel when jobs > 1, and return their merged results."""
+    results = {}
+    executor = None
+    if jobs > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=min(jobs, len(SUITE_STAGES)))
+        except (OSError, NotImplementedError, ImportError):
+            executor = None
+
+    if executor is None:
+        for index in range(len(SUITE_STAGES)):
+            result, chunks = _run_stage(index, ctx)
+            _replay(chunks)
+            _merge_stage_result(results, result)
+        return results
+
+    with executor:
+        futures = [executor.submit(_run_stage, index, ctx) for index in range(len(SUITE_STAGES))]
+        # Replay in report order so the console log reads like a serial run.
+        for future in futures:
+            result, chunks = future.result()
+            _replay(chunks)
+            _merge_stage_result(results, result)
+    return results
+
+
+################################################################################
+# Merge + ACS summary
+################################################################################
+def merge_inputs(ctx, state):
+    """Collect the suite JSONs to merge, in merged_results.json order."""
+    jsons_dir = ctx["jsons_dir"]
+    json_files = []
+
+    def add_if_exists(path, processed=True):
+        if processed and os.path.isfile(path):
+            json_files.append(path)
+
+    add_if_exists(f"{jsons_dir}/acs_info.json")
+    add_if_exists(f"{jsons_dir}/bsa.json")
+    add_if_exists(f"{jsons_dir}/sbsa.json", state.get("sbsa", False))
+    add_if_exists(f"{jsons_dir}/fwts.json")
+    add_if_exists(f"{jsons_dir}/sct.json")
+    add_if_exists(f"{jsons_dir}/sbmr_ib.json", state.get("sbmr_ib", False))
+    add_if_exists(f"{jsons_dir}/sbmr_oob.json", state.get("sbmr_oob", False))
+    add_if_exists(f"{jsons_dir}/bbsr_fwts.json", state.get("bbsr_fwts", False))
+    add_if_exists(f"{jsons_dir}/bbsr_sct.json", state.get("bbsr_sct", False))
+    add_if_exists(f"{jsons_dir}/bbsr_tpm.json", state.get("bbsr_tpm", False))
+    add_if_exists(f"{jsons_dir}/pfdi.json", state.get("pfdi", False))
+    add_if_exists(f"{jsons_dir}/scmi.json", state.get("scmi", False))
+    add_if_exists(f"{jsons_dir}/post_script.json", state.get("post_script", False))
+    if state.get("standalone", False):
+        json_files.extend(state.get("standalone_jsons", []))
+    if state.get("os_tests", False):
+        json_files.extend(state.get("os_jsons", []))
+    return json_files
+
+
+def summary_args(ctx, uefi_version_log, merged_json):
+    """Build the generate_acs_summary.py argument list."""
+    # The summary is rendered from merged_results.json, not the suite summary pages
+    args = [f"{ctx['htmls_dir']}/acs_summary.html"]
+
+    if ctx["acs_config_path"]:
+        args += ["--acs_config_path", ctx["acs_config_path"]]
+    if ctx["system_config_path"]:
+        args += ["--system_config_path", ctx["system_config_path"]]
+    if uefi_version_log:
+        args += ["--uefi_version_log", uefi_version_log]
+    device_tree_dts = os.environ.get("DEVICE_TREE_DTS", "")
+    if device_tree_dts:
+        args += ["--device_tree_dts", device_tree_dts]
+    # Provide acs_info.json for System Information fields (e.g., BMC Firmware Version)
+    acs_info_json = f"{ctx['jsons_dir']}/acs_info.json"
+    if os.path.isfile(acs_info_json):
+        args += ["--acs_info_json", acs_info_json]
+    # If merged_results.json was created, pass it along
+    if os.path.isfile(merged_json):
+        args += ["--merged_json", merged_json]
+    return args
+
+
+def write_waiver_report(report_path, reports):
+    """Write the per-suite waiver report (matched/unused waivers and time per suite JSON)."""
+    try:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=4)
+    except OSError as exc:
+        print(f"{YELLOW}WARNING: Could not write {report_path}: {exc}{NC}")
+
+
+def write_summary_pdf(acs_summary_html, acs_summary_pdf):
+    """Convert the ACS HTML summary to PDF with weasyprint."""
+    try:
+        from weasyprint import HTML, CSS  # pylint: disable=import-outside-toplevel,import-error
+        HTML(acs_summary_html).write_pdf(acs_summary_pdf,
+                                         stylesheets=[CSS(string='@page { margin: 0; }')])
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Parse ACS result logs into JSON/HTML reports and the ACS summary.",
+        usage=f"%(prog)s [--jobs N] {USAGE}")
+    parser.add_argument("logs_path", nargs="?", metavar="acs_results_directory")
+    parser.add_argument("acs_config_path", nargs="?", default="", metavar="acs_config.txt")
+    parser.add_argument("system_config_path", nargs="?", default="", metavar="system_config.txt")
+    parser.add_argument("waiver_json", nargs="?", default="", metavar="waiver.json")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Number of suites parsed in parallel (default: CPU count, 1 = serial)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always re-parse logs instead of reusing acs_summary/.cache results")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help="Evict least recently used cache entries above this size "
+                             f"(default: {DEFAULT_MAX_BYTES // (1024 * 1024)})")
+    parser.add_argument("--cache-max-age-days", type=float, default=DEFAULT_MAX_AGE_DAYS,
+                        help="Evict cache entries unused for this many days "
+                             f"(default: {DEFAULT_MAX_AGE_DAYS})")
+    parser.add_argument("--chart-backend", choices=CHART_BACKENDS, default=None,
+                        help="Chart format in the HTML reports: inline svg (default) or "
+                             "matplotlib png; also settable with " + CHART_BACKEND_ENV)
+    parser.add_argument("--debug", action="store_true",
+                        help="Also write intermediate JSON (edk2_test_parser*.json) to acs_jsons")
+    parser.add_argument("--compact-json", action="store_true",
+                        help="Write merged_results.json without indentation, for machine consumers")
+    parser.add_argument("--results-db", metavar="DB",
+                        help="Also store the merged results in this SQLite database "
+                             "(see results_db.py)")
+    args = parser.parse_args(argv)
+
+    if not args.logs_path:
+        print(f"Usage: {parser.prog} {USAGE}")
+        return 1
+    if args.chart_backend:
+        # Set before the suite pool starts so every worker renders the same way.
+        os.environ[CHART_BACKEND_ENV] = args.chart_backend
+
+    yocto = os.path.isfile(YOCTO_FLAG)
+    logs_path = args.logs_path
+    acs_config_path = args.acs_config_path
+    system_config_path = args.system_config_path
+    waiver_json = args.waiver_json
+    test_category = ("/usr/bin/log_parser/test_categoryDT.json" if yocto
+                     else "/usr/bin/log_parser/test_category.json")
+    # The detailed pages and merge_jsons.py read their Test_suite_info from this file too.
+    os.environ[TEST_CATEGORY_ENV] = test_category
+
+    # Check if ACS_CONFIG_PATH is provided
+    if not acs_config_path:
+        print(f"{YELLOW}WARNING: ACS information will be affected on summary page "
+              f"as acs_config.txt is not provided{NC}")
+        print("")
+        print(f"If you want ACS information, please use this format: {parser.prog} {USAGE}")
+        print("")
+
+    # Check if SYSTEM_CONFIG_PATH is provided
+    if not system_config_path:
+        print(f"{YELLOW}WARNING: System information may be incomplete "
+              f"as system_config.txt is not provided{NC}")
+        print("")
+        print("If you want complete system information, please use this format: "
+              f"{parser.prog} {USAGE}")
+        print("")
+
+    ###########################################################################
+    #               Gather ACS Info (acs_info.py)
+    ###########################################################################
+    acs_summary_dir = f"{logs_path}/acs_summary"
+    jsons_dir = f"{acs_summary_dir}/acs_jsons"
+    htmls_dir = f"{acs_summary_dir}/html_detailed_summaries"
+    os.makedirs(acs_summary_dir, exist_ok=True)
+    os.makedirs(jsons_dir, exist_ok=True)
+
+    run_script("acs_info.py",
+               "--acs_config_path", acs_config_path,
+               "--system_config_path", system_config_path,
+               "--uefi_version_log", f"{logs_path}/uefi_dump/uefi_version.log",
+               "--dmidecode_log", f"{logs_path}/linux_dump/dmidecode.txt",
+               "--ipmitool_log", f"{logs_path}/linux_dump/ipmitool.txt",
+               "--psci_kernel_log", f"{logs_path}/linux_tools/psci/psci_kernel.log",
+               "--output_dir", jsons_dir)
+    print("")
+    print(f"Test category: {test_category}\n")
+
+    # Check if waiver.json is provided
+    if waiver_json:
+        if os.path.isfile(waiver_json):
+            print("Waivers will be applied using:")
+            print(f"  Waiver File        : {waiver_json}")
+            print("")
+        else:
+            print(f"{YELLOW}WARNING: waiver.json ('{waiver_json}') "
+                  f"must be provided to apply waivers.{NC}")
+            print("Waivers will not be applied.")
+            print("")
+            waiver_json = ""
+    else:
+        print(f"{YELLOW}WARNING: waiver.json not provided. Waivers will not be applied.{NC}")
+        print("")
+    sys.stdout.flush()
+
+    os.makedirs(htmls_dir, exist_ok=True)
+
+    ctx = {
+        "yocto": yocto,
+        "logs_path": logs_path,
+        "jsons_dir": jsons_dir,
+        "htmls_dir": htmls_dir,
+        "acs_config_path": acs_config_path,
+        "system_config_path": system_config_path,
+        "waiver_json": waiver_json,
+        "test_category": test_category,
+        "post_script_log": f"{logs_path}/post-script/post-script.log",
+        "cache": None,
+        "debug": args.debug,
+        "waivers": WaiverContext(waiver_json, test_category) if waiver_json else None,
+    }
+    if not args.no_cache:
+        ctx["cache"] = ParseCache(f"{acs_summary_dir}/.cache", SCRIPTS_PATH,
+                                  max_bytes=int(args.cache_max_mb * 1024 * 1024),
+                                  max_age_days=args.cache_max_age_days)
+
+    ###########################################################################
+    # Suites: parse -> waivers -> html (independent, run concurrently)
+    ###########################################################################
+    state = run_suite_stages(ctx, max(1, args.jobs))
+    os.environ.update(state.get("env", {}))
+    if ctx["waivers"] is not None:
+        write_waiver_report(f"{acs_summary_dir}/waiver_report.json", state["waiver_reports"])
+
+    ###########################################################################
+    # UEFI version
+    ###########################################################################
+    uefi_version_log = f"{logs_path}/uefi_dump/uefi_version.log"
+    if not os.path.isfile(uefi_version_log):
+        print(f"INFO: UEFI version log '{os.path.basename(uefi_version_log)}' not found.")
+        uefi_version_log = ""
+
+    ###########################################################################
+    # MERGE JSON
+    ###########################################################################
+    # Non-zero when the merged JSON or the summary could not be generated.
+    status = 0
+    merged_json = f"{jsons_dir}/merged_results.json"
+    json_files = merge_inputs(ctx, state)
+    if json_files:
+        sys.stdout.flush()
+        merge_flags = ["--compact"] if args.compact_json else []
+        if args.results_db:
+            merge_flags += ["--sqlite", os.path.abspath(args.results_db)]
+        if run_script("merge_jsons.py", *merge_flags, merged_json, *json_files) != 0:
+            print(f"{RED}ERROR: merge_jsons.py failed; {merged_json} may be missing or stale{NC}")
+            status = 1
+        print(f"ACS Merged JSON: {merged_json}")
+    else:
+        print("No JSON files to merge.")
+    print("")
+
+    ###########################################################################
+    # NOW Generate ACS Summary (ONLY ONCE, at the very end)
+    ###########################################################################
+    acs_summary_html = f"{htmls_dir}/acs_summary.html"
+    acs_summary_pdf = f"{acs_summary_dir}/acs_summary.pdf"
+    sys.stdout.flush()
+    summary_flags = summary_args(ctx, uefi_version_log, merged_json)
+    if run_script("generate_acs_summary.py", *summary_flags) != 0:
+        print(f"{RED}ERROR: generate_acs_summary.py failed{NC}")
+        status = 1
+
+    print(f"ACS HTML Summary : {acs_summary_html}")
+
+    if yocto:
+        print(" Converting ACS HTML Summary to PDF")
+        # Convert ACS Summary HTML to PDF
+        if os.path.isfile(acs_summary_html):
+            sys.stdout.flush()
+            write_summary_pdf(acs_summary_html, acs_summary_pdf)
+            print(f"ACS PDF Summary : {acs_summary_pdf}")
+
+    if ctx["cache"] is not None:
+        ctx["cache"].evict()
+
+    print("")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
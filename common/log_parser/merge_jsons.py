@@ -18,6 +18,22 @@ import json
 from collections import OrderedDict
 import argparse
 import os
+import sqlite3
+import sys
+import tempfile
+
+# Shared helpers (json_stream.py) live in this directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.abspath(__file__))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+import compliance
+import json_stream
+import results_db
+import suite_categories
+import suite_registry
+from json_stream import DEFAULT_INDENT, JsonStreamWriter
+# pylint: enable=wrong-import-position
 
 # Define color codes
 RED = "\033[91m"
@@ -25,9 +41,6 @@ YELLOW = "\033[93m"
 GREEN = "\033[32m"
 RESET = "\033[0m"
 
-# Requirement map for each suite
-_REQUIREMENT_MAP = {}
-
 ################################################################################
 # 1. Determine if we're in Device Tree (DT) mode or SR mode by checking yocto flag
 ################################################################################
@@ -40,149 +53,73 @@ else:
 ################################################################################
 # 2. Define Mandatory Suites based on your table
 #    (Recommended suites are simply "not in this list"; they won't affect compliance.)
+#    The requirement levels are kept with each suite in suite_registry.py.
 ################################################################################
 
 # BBSR is extension
 # BSA, Kselftest, PSCI, post script are recommendation
-
-# DT SRS scope table
-DT_SRS_SCOPE_TABLE = [
-    ("SCT", "M"),
-    ("FWTS", "M"),
-    ("Capsule Update", "M"),
-    ("DT_VALIDATE", "M"),
-    ("READ_WRITE_CHECK_BLK_DEVICES", "M"),
-    ("ETHTOOL_TEST", "M"),
-    ("SCMI", "EM"),
-    ("NETWORK_BOOT", "R"),
-    ("BSA", "R"),
-    ("BBSR-SCT", "EM"),
-    ("BBSR-TPM", "EM"),
-    ("BBSR-FWTS", "EM"),
-    ("DT_KSELFTEST", "R"),
-    ("SMBIOS", "R"),
-    ("PSCI", "R"),
-    ("RUNTIME_DEV_MAP","R"),
-    ("POST_SCRIPT", "R"),
-    ("OS_TEST", "M"),
-    ("PFDI", "CM")
-]
-
 # SBSA is mandatory for servers only, default treat as recommended
 # if SBSA is run, treat as mandatory
-# BBSR is extension
-
-# SR SRS scope table
-SR_SRS_SCOPE_TABLE = [
-    ("SCT", "M"),
-    ("FWTS", "M"),
-    ("BSA", "M"),
-    ("OS_TEST", "M"),
-    ("BBSR-SCT", "EM"),
-    ("BBSR-FWTS", "EM"),
-    ("BBSR-TPM", "EM"),
-    ("SBMR-IB", "R"),
-    ("SBMR-OOB", "R"),
-    ("SBSA", "R")
-]
-
-def compliance_label(suite_name: str) -> str:
-    req = _REQUIREMENT_MAP.get(suite_name, "R")
-    if req == "M":
-        tag = "Mandatory"
-    elif req == "CM":
-        tag = "Conditional-Mandatory"
-    elif req == "EM":
-        tag = "Extension"
-    else:
-        tag = "Recommended"
-    # Match the console ordering: “Suite: <tag>  : <suite> …”
-    return f"Suite_Name: {tag}  : {suite_name}_compliance"
+DT_SRS_SCOPE_TABLE = suite_registry.scope_table("DT")
+SR_SRS_SCOPE_TABLE = suite_registry.scope_table("SR")
 
+# Schema for merged_results.json. With --validate every section is checked
+# against it as it is merged; jsonschema takes tens of seconds on a full SCT
+# section, so this is not done by default.
+SCHEMA_PATH = os.path.join(os.path.dirname(LOG_PARSER_DIR), "tools", "acs-results-schema.json")
 
-def reformat_json(json_file_path):
-    """
-    Re-format (pretty-print) the file to confirm it's valid JSON.
+def load_json(json_file_path, normalize=False):
     """
-    try:
-        with open(json_file_path, 'r') as jf:
-            data = json.load(jf)
-        with open(json_file_path, 'w') as jf:
-            json.dump(data, jf, indent=4)
-    except FileNotFoundError:
-        raise
-    except json.JSONDecodeError:
-        print(f"Warning: {json_file_path} is invalid JSON. Skipping.")
-
-def count_fails_in_json(data):
+    Parse a JSON file once. With normalize=True the file is also rewritten
+    pretty-printed (indent=4), as older releases always did.
     """
-    Inspect JSON data and count how many tests are 'FAILED' vs 'FAILED_WITH_WAIVER'.
-    Returns (failed, failed_with_waiver).
-
-    Expects a structure with top-level 'test_results' => [ {subtests: [...]} ]
-    or a top-level list for subtests. If not recognized, returns (0,0).
+    with open(json_file_path, 'r') as jf:
+        data = json.load(jf)
+    if normalize:
+        json_stream.dump(data, json_file_path)
+    return data
 
+def load_schema_validator(schema_path):
     """
-    total_failed = 0
-    total_failed_with_waiver = 0
-
-    if isinstance(data, dict) and "test_results" in data:
-        test_results = data["test_results"]
-    elif isinstance(data, list):
-        test_results = data
-    else:
-        return (0, 0)  # no recognized substructure
-
-    if not isinstance(test_results, list):
-        return (0, 0)
-
-    for suite_entry in test_results:
-        # If testcases exist, count only testcase-level results to avoid double counting.
-        testcases = suite_entry.get("testcases", [])
-        if testcases:
-            for testcase in testcases:
-                test_result = testcase.get("Test_result", "")
-                if isinstance(test_result, str):
-                    if "FAILED" in test_result.upper() or "FAILURE" in test_result.upper() or "FAIL" in test_result.upper():
-                        if "(WITH WAIVER)" in test_result.upper():
-                            total_failed_with_waiver += 1
-                        else:
-                            total_failed += 1
-        else:
-            # Standard structure: subtests at suite level
-            subtests = suite_entry.get("subtests", [])
-            for sub in subtests:
-                res = sub.get("sub_test_result")
-                if isinstance(res, dict):
-                    # e.g. { "FAILED": 1, "FAILED_WITH_WAIVER": 1, ... }
-                    f = res.get("FAILED", 0)
-                    fw = res.get("FAILED_WITH_WAIVER", 0)
-                    total_failed += f
-                    total_failed_with_waiver += fw
-                elif isinstance(res, str):
-                    # e.g. "FAILED (WITH WAIVER)"
-                    if "FAILED" in res.upper() or "FAILURE" in res.upper() or "FAIL" in res.upper():
-                        if "(WITH WAIVER)" in res.upper():
-                            total_failed_with_waiver += 1
-                        else:
-                            total_failed += 1
-        # SBMR nested structure
-        for case in suite_entry.get("Test_cases", []):
-            for sub in case.get("subtests", []):
-                res = sub.get("sub_test_result")
-                if isinstance(res, dict):
-                    f = res.get("FAILED", 0)
-                    fw = res.get("FAILED_WITH_WAIVER", 0)
-                    total_failed += f
-                    total_failed_with_waiver += fw
-                elif isinstance(res, str):
-                    if "FAILED" in res.upper() or "FAILURE" in res.upper() or "FAIL" in res.upper():
-                        if "(WITH WAIVER)" in res.upper():
-                            total_failed_with_waiver += 1
-                        else:
-                            total_failed += 1
-
-    return (total_failed, total_failed_with_waiver)
+    Return a validator for merged_results.json sections, or None when no
+    schema is given or it cannot be used.
+    """
+    if not schema_path:
+        return None
+    if not os.path.isfile(schema_path):
+        print(f"Note: {schema_path} not found; merged results are not validated.")
+        return None
+    try:
+        from jsonschema import Draft202012Validator
+    except ImportError:
+        print("Note: jsonschema is not installed; merged results are not validated.")
+        return None
+    with open(schema_path, 'r') as sf:
+        schema = json.load(sf)
+    # Sections are validated one at a time, so none of them is required.
+    schema["required"] = []
+    return Draft202012Validator(schema)
+
+def check_schema(validator, section_name, data, source, mismatches):
+    """Record in `mismatches` if `data`, as the merged section `section_name`, breaks the schema."""
+    if validator is None:
+        return
+    count = 0
+    first = None
+    for error in validator.iter_errors({section_name: data}):
+        count += 1
+        if first is None:
+            first = "/".join(str(p) for p in error.absolute_path) + ": " + error.message[:200]
+    if count:
+        mismatches.append((source, count, first))
+
+def report_schema_mismatches(mismatches):
+    """Print one warning line for all sections that did not match the schema."""
+    if not mismatches:
+        return
+    counts = ", ".join(f"{os.path.basename(source)}: {count}" for source, count, _ in mismatches)
+    print(f"Warning: {len(mismatches)} section(s) do not match the results schema ({counts}); "
+          f"first at {mismatches[0][2]}")
 
 def _get_suite_summary(d):
     if isinstance(d, dict):
@@ -201,64 +138,30 @@ def _sum_suite_summary(a, b):
 # We will load the test_categoryDT.json data here, so we can enrich the
 #        merged JSON with "Waivable", "SRS scope", and
 #        "Main Readiness Grouping" fields for each test suite.
+#        The lookups are shared with the json_to_html scripts (suite_categories.py).
 ################################################################################
 
-if DT_OR_SR_MODE == "DT":
-    TEST_CATEGORY_PATH = "/usr/bin/log_parser/test_categoryDT.json"
-else:
-    TEST_CATEGORY_PATH = "/usr/bin/log_parser/test_category.json"
-
-try:
-    with open(TEST_CATEGORY_PATH, "r") as catf:
-        test_category_data = json.load(catf)
-except Exception:
-    test_category_data = {}
-
-def build_testcategory_dict(category_data):
-    """
-    Build a helper dictionary:
-      result[suite_name_lower][test_suite_name_lower] -> row dictionary
-    so we can easily retrieve waivable / scope / readiness grouping etc.
-    """
-    result = {}
-    if not isinstance(category_data, dict):
-        return result
-
-    for cat_id, rows in category_data.items():
-        if isinstance(rows, list):
-            for row in rows:
-                suite_str = row.get("Suite", "").strip()
-                testsuite_str = row.get("Test Suite", "").strip()
-                if not suite_str or not testsuite_str:
-                    continue
-                # Convert to lowercase for easy matching
-                s_lower = suite_str.lower()
-                ts_lower = testsuite_str.lower()
-                if s_lower not in result:
-                    result[s_lower] = {}
-                result[s_lower][ts_lower] = row
-    return result
-
-test_cat_dict = build_testcategory_dict(test_category_data)
+TEST_CATEGORY_PATH = suite_categories.category_path(DT_OR_SR_MODE)
+test_cat_dict = suite_categories.load_category_index(TEST_CATEGORY_PATH)
+
+# Maintain priority: "Test_suite" first, "Sub_test_suite" second, "subtests" last
+SORT_PRIORITY_FIRST = ["Test_suite", "Test_sub_suite"]
+SORT_PRIORITY_LAST = ["subtests"]
+
+def sort_key(k):
+    k_lower = k.lower()
+    if k in SORT_PRIORITY_FIRST:
+        # Force these to the top, in defined order
+        return (0, SORT_PRIORITY_FIRST.index(k))
+    elif k in SORT_PRIORITY_LAST:
+        # Force these to the end
+        return (2, 0)
+    else:
+        # Everything else goes in the middle alphabetically
+        return (1, k_lower)
 
 def recursive_sort(obj):
     if isinstance(obj, dict):
-        # Maintain priority: "Test_suite" first, "Sub_test_suite" second, "subtests" last
-        priority_first = ["Test_suite", "Test_sub_suite"]
-        priority_last = ["subtests"]
-
-        def sort_key(k):
-            k_lower = k.lower()
-            if k in priority_first:
-                # Force these to the top, in defined order
-                return (0, priority_first.index(k))
-            elif k in priority_last:
-                # Force these to the end
-                return (2, 0)
-            else:
-                # Everything else goes in the middle alphabetically
-                return (1, k_lower)
-
         return OrderedDict(
             (k, recursive_sort(v))
             for k, v in sorted(obj.items(), key=lambda kv: sort_key(kv[0]))
@@ -269,9 +172,229 @@ def recursive_sort(obj):
     else:
         return obj
 
-def merge_json_files(json_files, output_file):
-    merged_results = {}
-    suite_fail_data = {}
+RENAME_SUITES_TO_STANDALONE = {
+    "Suite_Name: DT Kselftest": "Suite_Name: Standalone",
+    "Suite_Name: CAPSULE_UPDATE": "Suite_Name: Standalone",
+    "Suite_Name: DT Validate": "Suite_Name: Standalone",
+    "Suite_Name: Ethtool Test": "Suite_Name: Standalone",
+    "Suite_Name: Read Write Check Block Devices": "Suite_Name: Standalone",
+    "Suite_Name: PSCI": "Suite_Name: Standalone",
+    "Suite_Name: SMBIOS": "Suite_Name: Standalone",
+    "Suite_Name: Network boot": "Suite_Name: Standalone",
+    "Suite_Name: Runtime device mapping": "Suite_Name: Standalone"
+}
+
+def _entry_to_list(entry):
+    if isinstance(entry, list):
+        return entry
+    if (
+        isinstance(entry, dict)
+        and "test_results" in entry
+        and isinstance(entry["test_results"], list)
+    ):
+        return entry["test_results"]
+    return [entry]
+
+class SectionSpool:
+    """
+    Suite sections encoded into an anonymous temporary file as they are
+    merged, then copied into merged_results.json once the compliance
+    results (which sort first) are known.
+    """
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, directory, indent):
+        self.file = tempfile.TemporaryFile("w+", encoding="ascii", newline="", dir=directory)
+        self.indent = indent
+
+    def add(self, obj, level, depth):
+        """Encode recursive_sort(obj) nested `level` deep; return its span in the spool."""
+        start = self.file.tell()
+        write_sorted(JsonStreamWriter(self.file, self.indent, level), obj, depth)
+        return (start, self.file.tell())
+
+    def chunks(self, span):
+        start, end = span
+        self.file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = self.file.read(min(remaining, self.CHUNK_SIZE))
+            remaining -= len(chunk)
+            yield chunk
+
+    def close(self):
+        self.file.close()
+
+def write_sorted(writer, obj, depth=2):
+    """
+    Write recursive_sort(obj) with the writer. The outer `depth` levels are
+    written member by member, so only one test entry is copied at a time.
+    """
+    if depth and isinstance(obj, dict):
+        writer.begin_object()
+        for k, v in sorted(obj.items(), key=lambda kv: sort_key(kv[0])):
+            writer.key(k)
+            write_sorted(writer, v, depth - 1)
+        writer.end_object()
+    elif depth and isinstance(obj, list):
+        writer.begin_array()
+        for v in obj:
+            write_sorted(writer, v, depth - 1)
+        writer.end_array()
+    else:
+        writer.value(recursive_sort(obj))
+
+def enrich_with_test_category(data, suite_key, categories=None):
+    """
+    Return data with the test_category.json fields added to each test suite
+    entry. Entries that gain fields are copied; data itself is not changed.
+    """
+    if categories is None:
+        categories = test_cat_dict
+    return suite_categories.enrich(data, suite_key, categories)
+
+ACS_INFO_SECTION = "Suite_Name: acs_info"
+
+def print_verdict(verdict):
+    """Print the per-suite, overall and BBSR compliance results of a verdict."""
+    for suite in verdict.suites:
+        if not suite.in_scope:
+            continue
+        prefix = {"M": "Suite: Mandatory  : ", "CM": "Suite: Conditional-Mandatory  : ",
+                  "EM": "Suite: Extension  : "}.get(suite.requirement, "Suite: Recommended: ")
+        line = f"{prefix}{suite.suite}: {suite.result}"
+        if suite.result.startswith("Not Compliant") and (suite.requirement in ("M", "CM") or not suite.ran):
+            line = f"{RED}{line}{RESET}"
+        print(line)
+
+    overall = verdict.overall.result
+    if overall.startswith("Not Compliant"):
+        print(f"\n{RED}SRS requirements compliance result: {overall}{RESET}\n")
+    elif overall.startswith("Compliant with waivers"):
+        print(f"\n{YELLOW}SRS requirements compliance result: {overall}{RESET}\n")
+    else:
+        print(f"\n{GREEN}SRS requirements compliance result: {overall}{RESET}\n")
+
+    bbsr = verdict.bbsr.result
+    if bbsr.lower().startswith("compliant with waivers"):
+        print(f"{YELLOW}BBSR compliance results: {bbsr}{RESET}\n")
+    elif bbsr.lower().startswith("compliant"):
+        print(f"{GREEN}BBSR compliance results: {bbsr}{RESET}\n")
+    elif bbsr.lower().startswith("not run"):
+        print(f"BBSR compliance results: {bbsr}\n")
+    else:
+        print(f"{RED}BBSR compliance results: {bbsr}{RESET}\n")
+
+class SuiteMerge:
+    """
+    One merge in progress: the suites added so far and their result counts.
+    The merge keeps all of its state here, so any number of merges can run in
+    one process, one after another or in parallel threads.
+    """
+
+    def __init__(self, mode=None, categories=None):
+        self.mode = DT_OR_SR_MODE if mode is None else mode
+        self.categories = categories
+        # (suite_key, per_file) of each file added, and the counts per suite key
+        self.suites = []
+        self.suite_counts = {}
+
+    def add(self, file_name, data):
+        """Count one suite JSON's results; return (section_name, enriched data)."""
+        spec = suite_registry.classify(file_name)
+        suite_key, section_name = spec.names_for(file_name)
+        self.suites.append((suite_key, spec.per_file))
+
+        counts = compliance.suite_counts(data)
+        if suite_key in self.suite_counts:
+            counts = self.suite_counts[suite_key] + counts
+        self.suite_counts[suite_key] = counts
+        return section_name, enrich_with_test_category(data, suite_key, self.categories)
+
+    def verdict(self):
+        """Return the compliance.Verdict of the suites added so far."""
+        table = DT_SRS_SCOPE_TABLE if self.mode == "DT" else SR_SRS_SCOPE_TABLE
+        return compliance.evaluate(self.mode, tuple(table), tuple(self.suites),
+                                   tuple(self.suite_counts.items()))
+
+    def acs_info_section(self, acs_info):
+        """
+        Return a copy of acs_info with the compliance results in its ACS
+        Results Summary and the structured verdict beside it.
+        """
+        if isinstance(acs_info, dict):
+            section = dict(acs_info)
+            summary = section.get("ACS Results Summary")
+            section["ACS Results Summary"] = dict(summary) if isinstance(summary, dict) else {}
+        else:
+            section = {"ACS Results Summary": {}}
+        verdict = self.verdict()
+        print_verdict(verdict)
+        summary = section["ACS Results Summary"]
+        summary.update(verdict.summary_fields())
+        summary.pop("Overall Compliance Results", None)
+        section[compliance.VERDICT_KEY] = verdict.to_dict()
+        return section
+
+def section_layout(section_names):
+    """
+    Return [(output section, [suite sections])] in merged_results.json order,
+    acs_info included. The Standalone suites share one section.
+    """
+    layout = {ACS_INFO_SECTION: []}
+    for old_key, new_key in RENAME_SUITES_TO_STANDALONE.items():
+        if old_key in section_names:
+            layout.setdefault(new_key, []).append(old_key)
+    for name in section_names:
+        if name not in RENAME_SUITES_TO_STANDALONE:
+            layout[name] = [name]
+    return sorted(layout.items(), key=lambda item: sort_key(item[0]))
+
+def merge_results(acs_info, suites, mode=None, categories=None):
+    """
+    Merge results that are already in memory and return the merged_results
+    document. suites is a list of (file name, suite data); the file name
+    selects the suite as in merge_json_files(). Neither the inputs nor any
+    module state is changed.
+    """
+    merge = SuiteMerge(mode, categories)
+    sections = {}
+    for file_name, data in suites:
+        # Only the last file for a section is kept, as a plain dict merge would.
+        section_name, data = merge.add(file_name, data)
+        sections[section_name] = data
+    acs_info_section = merge.acs_info_section(acs_info)
+
+    merged = OrderedDict()
+    for name, sources in section_layout(sections):
+        if name == ACS_INFO_SECTION:
+            merged[name] = recursive_sort(acs_info_section)
+        elif name in RENAME_SUITES_TO_STANDALONE.values():
+            merged[name] = [recursive_sort(entry) for source in sources
+                            for entry in _entry_to_list(sections[source])]
+        else:
+            merged[name] = recursive_sort(sections[name])
+    return merged
+
+def merge_json_files(json_files, output_file, indent=DEFAULT_INDENT, normalize=False,
+                     schema_path=None, mode=None, db_path=None):
+    """Merge the suite JSONs into output_file (indent=None writes compact JSON).
+
+    The file-based form of merge_results(). Each input is parsed once: its
+    failures are counted, it is enriched, checked against schema_path (if
+    given) and encoded into a spool file, so memory is bounded by the
+    largest input rather than the total. Inputs are only rewritten
+    (pretty-printed) with normalize=True.
+
+    With db_path the written file is then also stored in that results
+    database (results_db.py), see store_in_results_db().
+    """
+    merge = SuiteMerge(mode)
+    # Suite sections map to their spans in the spool.
+    suite_sections = {}
+    validator = load_schema_validator(schema_path)
+    schema_mismatches = []
+    spool = SectionSpool(os.path.dirname(os.path.abspath(output_file)), indent)
 
     # We'll store the "acs_info" data in acs_info_data (if found)
     acs_info_path = None
@@ -283,490 +406,79 @@ def merge_json_files(json_files, output_file):
             new_json_files.append(fpath)
 
     acs_info_data = None
-    acs_results_summary = None
-
     if acs_info_path and os.path.isfile(acs_info_path):
         try:
-            reformat_json(acs_info_path)
-            with open(acs_info_path, 'r') as f:
-                acs_info_data = json.load(f)
-            merged_results["Suite_Name: acs_info"] = acs_info_data
-
-            if isinstance(acs_info_data, dict):
-                acs_results_summary = acs_info_data.get("ACS Results Summary")
-                if not isinstance(acs_results_summary, dict):
-                    acs_results_summary = {}
-                    acs_info_data["ACS Results Summary"] = acs_results_summary
+            acs_info_data = load_json(acs_info_path, normalize)
         except Exception as e:
             print(f"Warning: Could not load acs_info.json: {e}")
 
-    if not acs_results_summary:
-        acs_results_summary = {}
-        merged_results["Suite_Name: acs_info"] = {
-            "ACS Results Summary": acs_results_summary
-        }
-
-    os_logs_found = 0
-    # Step 2) Process each suite JSON
+    # Process each suite JSON
     for json_path in new_json_files:
         if not os.path.isfile(json_path):
             print(f"Warning: {json_path} not found. Skipping.")
             continue
 
         try:
-            reformat_json(json_path)
-        except json.JSONDecodeError:
-            continue
-
-        try:
-            with open(json_path, 'r') as jf:
-                data = json.load(jf)
+            data = load_json(json_path, normalize)
         except (FileNotFoundError, json.JSONDecodeError):
             print(f"Warning: {json_path} is invalid JSON. Skipping.")
             continue
 
-        # Identify suite name from filename
-        fn = os.path.basename(json_path).upper()
-        base_lower = os.path.basename(json_path).lower()
-        if "BSA" in fn and "SBSA" not in fn:
-            section_name = "Suite_Name: BSA"
-            suite_key    = "BSA"
-        elif "SBSA" in fn:
-            section_name = "Suite_Name: SBSA"
-            suite_key    = "SBSA"
-        elif "BBSR" in fn and "FWTS" in fn:
-            section_name = "Suite_Name: BBSR-FWTS"
-            suite_key    = "BBSR-FWTS"
-        elif "FWTS" in fn:
-            section_name = "Suite_Name: FWTS"
-            suite_key    = "FWTS"
-        elif "BBSR" in fn and "SCT" in fn:
-            section_name = "Suite_Name: BBSR-SCT"
-            suite_key    = "BBSR-SCT"
-        elif "BBSR" in fn and "TPM" in fn:
-            section_name = "Suite_Name: BBSR-TPM"
-            suite_key    = "BBSR-TPM"
-        elif "SCT" in fn:
-            section_name = "Suite_Name: SCT"
-            suite_key    = "SCT"
-        elif "SBMR_IB" in fn or "SBMR-IB" in fn or "sbmr_ib" in base_lower:
-            section_name = "Suite_Name: SBMR-IB"
-            suite_key    = "SBMR-IB"
-        elif "SBMR_OOB" in fn or "SBMR-OOB" in fn or "sbmr_oob" in base_lower:
-            section_name = "Suite_Name: SBMR-OOB"
-            suite_key    = "SBMR-OOB"
-        elif "CAPSULE_UPDATE" in fn:
-            section_name = "Suite_Name: CAPSULE_UPDATE"
-            suite_key    = "Capsule Update"
-        elif "DT_KSELFTEST" in fn:
-            section_name = "Suite_Name: DT Kselftest"
-            suite_key    = "DT_KSELFTEST"
-        elif "DT_VALIDATE" in fn:
-            section_name = "Suite_Name: DT Validate"
-            suite_key    = "DT_VALIDATE"
-        elif os.path.basename(json_path).lower() == "ethtool_test.json":
-            section_name = "Suite_Name: Ethtool Test"
-            suite_key    = "ETHTOOL_TEST"
-        elif os.path.basename(json_path).lower() == "os_test.json":
-            section_name = "Suite_Name: OS Tests"
-            suite_key    = "OS_TEST"
-            _REQUIREMENT_MAP["OS_TEST"] = "M"
-        elif "ethtool_test" in fn.lower():
-            base_name_no_ext = os.path.splitext(os.path.basename(json_path))[0]
-            section_name = f"Suite_Name: OS Tests - {base_name_no_ext}"
-            suite_key    = f"OS_{base_name_no_ext}"
-            global DT_SRS_SCOPE_TABLE
-            DT_SRS_SCOPE_TABLE += [(f"OS_{base_name_no_ext}","M")]
-            _REQUIREMENT_MAP[f"OS_{base_name_no_ext}"] = "M"
-            os_logs_found += 1
-            if os_logs_found == 3:
-                DT_SRS_SCOPE_TABLE.remove(("OS_TEST","M"))
-        elif "READ_WRITE_CHECK_BLK_DEVICES" in fn:
-            section_name = "Suite_Name: Read Write Check Block Devices"
-            suite_key    = "READ_WRITE_CHECK_BLK_DEVICES"
-        elif "NETWORK_BOOT" in fn or "network_boot" in fn.lower():
-            section_name = "Suite_Name: Network boot"
-            suite_key    = "NETWORK_BOOT"
-        elif "SMBIOS" in fn:
-            section_name = "Suite_Name: SMBIOS"
-            suite_key    = "SMBIOS"
-        elif "PSCI" in fn:
-            section_name = "Suite_Name: PSCI"
-            suite_key    = "PSCI"
-        elif "PFDI" in fn:
-            section_name = "Suite_Name: PFDI"
-            suite_key    = "PFDI"
-        elif "SCMI" in fn:
-            section_name = "Suite_Name: SCMI"
-            suite_key    = "SCMI"
-        elif "runtime_dev_map" in fn.lower():
-            section_name = "Suite_Name: Runtime device mapping"
-            suite_key    = "RUNTIME_DEV_MAP"
-        elif "POST_SCRIPT" in fn:
-            section_name = "Suite_Name: POST_SCRIPT"
-            suite_key    = "POST_SCRIPT"
-        else:
-            section_name = "Suite_Name: Unknown"
-            suite_key    = "Unknown"
-
-        # If 'data' is a dict with 'test_results' list, unify it
-        if (isinstance(data, dict)
-            and "test_results" in data
-            and isinstance(data["test_results"], list)
-        ):
-            data_list = data["test_results"]
-        else:
-            data_list = data
-
-
-        ########################################################################
-        # Enrich each test_suite dict with matching fields from test_cat_dict
-        ########################################################################
-        # suite_key is e.g. "BSA", so we'll look up suite_key.lower() in test_cat_dict
-        # data might be a list of test_suite dicts (like BSA suite).
-        # If there's a match on "Test_suite" => "Test Suite", copy fields.
-        # Determine lookup suite key for Standalone-style sub-suites
-        lookup_suite_key = suite_key.lower()
-        standalone_aliases = {
-            "dt_kselftest", "dt_validate", "ethtool_test",
-            "read_write_check_blk_devices", "psci", "capsule update", "network_boot", "smbios", "runtime_dev_map"
-        }
-        if lookup_suite_key in standalone_aliases or lookup_suite_key.startswith("os_"):
-            lookup_suite_key = "standalone"
-        if lookup_suite_key in ("sbmr-ib", "sbmr-oob"):
-            lookup_suite_key = "sbmr"
-        if lookup_suite_key in test_cat_dict:
-            # Now use 'data_list' instead of 'data'
-            if isinstance(data_list, list):
-                for ts_dict in data_list:
-                    if not isinstance(ts_dict, dict):
-                        continue
-
-                    ts_name_merged = (ts_dict.get("Test_suite") or ts_dict.get("Test_suite_name") or "").strip().lower()
-                    if ts_name_merged in test_cat_dict[lookup_suite_key]:
-                        row_vals = test_cat_dict[lookup_suite_key][ts_name_merged]
-                        if "Waivable" in row_vals:
-                            ts_dict["Waivable"] = row_vals["Waivable"]
-                        if "SRS scope" in row_vals:
-                            ts_dict["SRS scope"] = row_vals["SRS scope"]
-                        if "Description" in row_vals:
-                            ts_dict["Test_suite_info"] = row_vals["Description"]
-                        if "Main Readiness Grouping" in row_vals:
-                            ts_dict["Main Readiness Grouping"] = row_vals["Main Readiness Grouping"]
-
-                        desired_order = [
-                            "Test_suite",
-                            "Test_suite_name",
-                            "Test_suite_description",
-                            "Test_suite_info",
-                            "Waivable",
-                            "SRS scope",
-                            "Main Readiness Grouping",
-                            "Sub_test_suite",
-                            "Test_case",
-                            "Test_case_description",
-                            "Test Entry Point GUID",
-                            "Returned Status Code",
-                            "test_result",
-                            "reason",
-                            "subtests",
-                            "test_case_summary"
-                        ]
-                        temp = {}
-                        for key in desired_order:
-                            if key in ts_dict:
-                                temp[key] = ts_dict[key]
-                        for key, val in ts_dict.items():
-                            if key not in temp:
-                                temp[key] = val
-                        ts_dict.clear()
-                        ts_dict.update(temp)
-        merged_results[section_name] = data
-
-        f, fw = count_fails_in_json(data)
-        if suite_key in suite_fail_data:
-            suite_fail_data[suite_key]["Failed"] += f
-            suite_fail_data[suite_key]["Failed_with_Waiver"] += fw
-        else:
-            suite_fail_data[suite_key] = {
-                "Failed": f,
-                "Failed_with_Waiver": fw
-            }
-    # --- ensure labels use the right Mandatory/Recommended tags for this mode ---
-    base_table = DT_SRS_SCOPE_TABLE if DT_OR_SR_MODE == "DT" else SR_SRS_SCOPE_TABLE
-    for n, r in base_table:
-        _REQUIREMENT_MAP.setdefault(n, r)
-
-    # Step 3) Compute *per-suite* and overall compliance
-    # Base mandatory set
-    if DT_OR_SR_MODE == "DT":
-        mandatory_suites = set(DT_SRS_SCOPE_TABLE)
-        present = set(suite_fail_data.keys())
-    else:
-        mandatory_suites = set(SR_SRS_SCOPE_TABLE)
-        present = set(suite_fail_data.keys())
-
-        # Always consider SBSA mandatory if present (your existing rule)
-        promote = {"SBSA"} if "SBSA" in present else set()
-
-        # if either SBMR-IB or SBMR-OOB is present, promote BOTH to mandatory
-        if {"SBMR-IB", "SBMR-OOB"} & present:
-            promote.update({"SBMR-IB", "SBMR-OOB"})
-        for n in promote:
-            _REQUIREMENT_MAP[n] = "M"
-        mandatory_suites = {(n, "M") if n in promote else (n, r) for (n, r) in mandatory_suites}
-
-    overall_comp = "Compliant"
-    # Keep track of missing_suites and non_waived_suites for parentheses
-    # Separate tracking for mandatory and recommended
-    mandatory_missing_list = []
-    mandatory_non_waived_list = []
-    recommended_missing_list = []
-    recommended_non_waived_list = []
-
-    if acs_info_data and isinstance(acs_info_data, dict):
-        acs_results_summary = acs_info_data.get("ACS Results Summary", {})
-    else:
-        acs_results_summary = merged_results["Suite_Name: acs_info"].get("ACS Results Summary", {})
-
-    for suite_name, requirement in mandatory_suites:
-        if suite_name not in suite_fail_data:
-            label = compliance_label(suite_name)
-            if requirement == "M":
-                acs_results_summary[label] = "Not Compliant: not run"
-                print(f"{RED}Suite: Mandatory  : {suite_name}: {acs_results_summary[label]}{RESET}")
-                overall_comp = "Not Compliant"
-                mandatory_missing_list.append(suite_name)
-            elif requirement == "CM":
-                acs_results_summary[label] = "Not Run"
-                print(f"Suite: Conditional-Mandatory  : {suite_name}: {acs_results_summary[label]}")
-                #overall_comp = "Not Compliant"
-                #mandatory_missing_list.append(suite_name)
-            elif requirement == "EM":
-                acs_results_summary[label] = "Not Run"
-                print(f"Suite: Extension  : {suite_name}: {acs_results_summary[label]}")
-            else:
-                if DT_OR_SR_MODE == "DT":
-                    acs_results_summary[label] = "Not Compliant: not run"
-                    print(f"{RED}Suite: Recommended: {suite_name}: {acs_results_summary[label]}{RESET}")
-                    overall_comp = "Not Compliant"
-                    recommended_missing_list.append(suite_name)
-                else:
-                    acs_results_summary[label] = "Not Run"
-                    print(f"Suite: Recommended: {suite_name}: {acs_results_summary[label]}")
-                    recommended_missing_list.append(suite_name)
-        else:
-            fail_info = suite_fail_data.get(suite_name)
-            f = fail_info.get("Failed", 0)
-            fw = fail_info.get("Failed_with_Waiver", 0)
-            label = compliance_label(suite_name)
-            if (f + fw) == 0:
-                acs_results_summary[label] = "Compliant"
-                if requirement in ("M", "CM"):
-                    if requirement == "M":
-                        print(f"Suite: Mandatory  : {suite_name}: {acs_results_summary[label]}")
-                    else:
-                        print(f"Suite: Conditional-Mandatory  : {suite_name}: {acs_results_summary[label]}")
-                elif requirement == "EM":
-                    print(f"Suite: Extension  : {suite_name}: {acs_results_summary[label]}")
-                else:
-                    print(f"Suite: Recommended: {suite_name}: {acs_results_summary[label]}")
-            elif f == 0 and fw > 0:
-                acs_results_summary[label] = f"Compliant with waivers: Waivers {fw}"
-                if requirement in ("M", "CM"):
-                    if requirement == "M":
-                        print(f"Suite: Mandatory  : {suite_name}: {acs_results_summary[label]}")
-                    else:
-                         print(f"Suite: Conditional-Mandatory  : {suite_name}: {acs_results_summary[label]}")
-                elif requirement == "EM":
-                    print(f"Suite: Extension  : {suite_name}: {acs_results_summary[label]}")
-                else:
-                    print(f"Suite: Recommended: {suite_name}: {acs_results_summary[label]}")
-                if requirement in ("M", "CM") and overall_comp != "Not Compliant":
-                    overall_comp="Compliant with waivers"
-            else:
-                acs_results_summary[label] = f"Not Compliant: Failed {f}"
-                if requirement in ("M", "CM"):
-                    if requirement == "M":
-                        print(f"{RED}Suite: Mandatory  : {suite_name}: {acs_results_summary[label]}{RESET}")
-                    else:
-                        print(f"{RED}Suite: Conditional-Mandatory  : {suite_name}: {acs_results_summary[label]}{RESET}")
-                    overall_comp="Not Compliant"
-                    mandatory_non_waived_list.append(suite_name)
-                elif requirement == "EM":
-                    print(f"Suite: Extension  : {suite_name}: {acs_results_summary[label]}")
-                else:
-                    print(f"Suite: Recommended: {suite_name}: {acs_results_summary[label]}")
-                    recommended_non_waived_list.append(suite_name)
-
-    #Ensure suite-wise compliance lines for *all* discovered suites (including recommended)
-    for skey, info in suite_fail_data.items():
-        # If no label set, default to "Compliant" if fails=0, else "Not compliant", etc.
-        label = compliance_label(skey)
-        if label not in acs_results_summary:
-            f = info["Failed"]
-            fw = info["Failed_with_Waiver"]
-            if (f + fw) == 0:
-                acs_results_summary[label] = "Compliant"
-            elif f == 0 and fw > 0:
-                acs_results_summary[label] = "Compliant with waivers"
-            else:
-                acs_results_summary[label] = "Not compliant"
-
-    # Step 4) Overall compliance
-    if overall_comp == "Not Compliant":
-        reason_parts = []
-
-        # Build Mandatory part
-        mandatory_parts = []
-        if mandatory_missing_list:
-            mandatory_parts.append(f"not run: {', '.join(mandatory_missing_list)}")
-        if mandatory_non_waived_list:
-            mandatory_parts.append(f"failed: {', '.join(mandatory_non_waived_list)}")
-
-        if mandatory_parts:
-            reason_parts.append(f"Mandatory - ({'; '.join(mandatory_parts)})")
-
-        # Build Recommended part
-        recommended_parts = []
-        if recommended_missing_list:
-            recommended_parts.append(f"not run: {', '.join(recommended_missing_list)}")
-        if recommended_non_waived_list:
-            recommended_parts.append(f"failed: {', '.join(recommended_non_waived_list)}")
-
-        if recommended_parts:
-            reason_parts.append(f"Recommended - ({'; '.join(recommended_parts)})")
-
-        if reason_parts:
-            overall_comp += f" : {' : '.join(reason_parts)}"
-    elif overall_comp == "Compliant with waivers":
-        pass
-
-    acs_results_summary["Overall Compliance Result"] = overall_comp
-    if overall_comp.startswith("Not Compliant"):
-        print(f"\n{RED}SRS requirements compliance result: {overall_comp}{RESET}\n")
-    elif overall_comp.startswith("Compliant with waivers"):
-        print(f"\n{YELLOW}SRS requirements compliance result: {overall_comp}{RESET}\n")
-    else:
-        print(f"\n{GREEN}SRS requirements compliance result: {overall_comp}{RESET}\n")
-
-    if "Overall Compliance Results" in acs_results_summary:
-        del acs_results_summary["Overall Compliance Results"]
+        section_name, data = merge.add(json_path, data)
 
-    bbsr_tpm  = acs_results_summary.get(compliance_label("BBSR-TPM"), "")
-    bbsr_fwts = acs_results_summary.get(compliance_label("BBSR-FWTS"), "")
-    bbsr_sct  = acs_results_summary.get(compliance_label("BBSR-SCT"), "")
-    overall_str = acs_results_summary.get("Overall Compliance Result", "")
+        # Only the last file for a section is kept, as a plain dict merge would.
+        if section_name in RENAME_SUITES_TO_STANDALONE:
+            entries = _entry_to_list(data)
+            check_schema(validator, RENAME_SUITES_TO_STANDALONE[section_name], entries, json_path,
+                         schema_mismatches)
+            suite_sections[section_name] = [spool.add(entry, 2, 1) for entry in entries]
+        else:
+            check_schema(validator, section_name, data, json_path, schema_mismatches)
+            suite_sections[section_name] = [spool.add(data, 1, 2)]
 
-    # --- handle BBSR result ---
-    def _is_missing(val: str) -> bool:
-        return (not val) or val.lower().startswith("not run")
+    acs_info_section = merge.acs_info_section(acs_info_data)
+    check_schema(validator, ACS_INFO_SECTION, acs_info_section, acs_info_path or "acs_info",
+                 schema_mismatches)
+    report_schema_mismatches(schema_mismatches)
 
-    _no_bbsr_logs = all(_is_missing(x) for x in (bbsr_tpm, bbsr_fwts, bbsr_sct))
-    if _no_bbsr_logs:
-        acs_results_summary["BBSR compliance results"] = "Not run"
-    else:
-        # Gather which suites didn’t run vs. which failed non-waived
-        missing_list_bbsr = []
-        non_waived_list_bbsr = []
-        waiver_seen = False
-
-        for label, comp_str in [
-            ("BBSR-TPM", bbsr_tpm),
-            ("BBSR-FWTS", bbsr_fwts),
-            ("BBSR-SCT", bbsr_sct),
-        ]:
-            low = (comp_str or "").lower()
-            if low.startswith("not run"):
-                missing_list_bbsr.append(label)
-            elif low.startswith("not compliant: failed"):
-                non_waived_list_bbsr.append(label)
-            elif "waiver" in low:
-                waiver_seen = True
-
-        if non_waived_list_bbsr or missing_list_bbsr:
-            bbsr_comp = "Not Compliant"
-            reason_parts = []
-            if missing_list_bbsr:
-                reason_parts.append(f"not run: {', '.join(missing_list_bbsr)}")
-            if non_waived_list_bbsr:
-                reason_parts.append(f"failed: {', '.join(non_waived_list_bbsr)}")
-            if reason_parts:
-                bbsr_comp += f" : Mandatory - ({'; '.join(reason_parts)})"
-            acs_results_summary["BBSR compliance results"] = bbsr_comp
-        elif waiver_seen:
-            acs_results_summary["BBSR compliance results"] = "Compliant with waivers"
-        else:
-            acs_results_summary["BBSR compliance results"] = "Compliant"
-
-    # Persist + print BBSR result with color
-    bbsr_comp_str = acs_results_summary["BBSR compliance results"]
-    if bbsr_comp_str.lower().startswith("compliant with waivers"):
-        print(f"{YELLOW}BBSR compliance results: {bbsr_comp_str}{RESET}\n")
-    elif bbsr_comp_str.lower().startswith("compliant"):
-        print(f"{GREEN}BBSR compliance results: {bbsr_comp_str}{RESET}\n")
-    elif bbsr_comp_str.lower().startswith("not run"):
-        print(f"BBSR compliance results: {bbsr_comp_str}\n")
-    else:
-        print(f"{RED}BBSR compliance results: {bbsr_comp_str}{RESET}\n")
-
-    # --- handle SCMI result (DT only, separate from Overall Compliance) ---
-    if DT_OR_SR_MODE == "DT":
-        scmi_label = compliance_label("SCMI")
-        scmi_status = acs_results_summary.get(scmi_label, "")
-        if not scmi_status:
-            acs_results_summary["SCMI compliance results"] = "Not Run"
-        else:
-            scmi_low = scmi_status.lower()
-            if scmi_low.startswith("not run"):
-                acs_results_summary["SCMI compliance results"] = "Not Run"
-            elif scmi_low.startswith("not compliant: failed"):
-                acs_results_summary["SCMI compliance results"] = "Not Compliant : Mandatory - (SCMI)"
-            elif "waiver" in scmi_low:
-                acs_results_summary["SCMI compliance results"] = "Compliant with waivers"
-            elif scmi_low.startswith("compliant"):
-                acs_results_summary["SCMI compliance results"] = "Compliant"
+    # Recursive alphabetical sorting of entire JSON, written one section at a time
+    with open(output_file, 'w') as outj:
+        writer = JsonStreamWriter(outj, indent)
+        writer.begin_object()
+        for name, sources in section_layout(suite_sections):
+            writer.key(name)
+            if name == ACS_INFO_SECTION:
+                write_sorted(writer, acs_info_section)
+            elif name in RENAME_SUITES_TO_STANDALONE.values():
+                writer.begin_array()
+                for source in sources:
+                    for span in suite_sections[source]:
+                        writer.encoded(spool.chunks(span))
+                writer.end_array()
             else:
-                acs_results_summary["SCMI compliance results"] = scmi_status
-
-    merged_results["Suite_Name: acs_info"]["ACS Results Summary"]["BBSR compliance results"] = (acs_results_summary.pop("BBSR compliance results", None))
-    if DT_OR_SR_MODE == "DT":
-        merged_results["Suite_Name: acs_info"]["ACS Results Summary"]["SCMI compliance results"] = (acs_results_summary.pop("SCMI compliance results", None))
-
-    RENAME_SUITES_TO_STANDALONE = {
-        "Suite_Name: DT Kselftest": "Suite_Name: Standalone",
-        "Suite_Name: CAPSULE_UPDATE": "Suite_Name: Standalone",
-        "Suite_Name: DT Validate": "Suite_Name: Standalone",
-        "Suite_Name: Ethtool Test": "Suite_Name: Standalone",
-        "Suite_Name: Read Write Check Block Devices": "Suite_Name: Standalone",
-        "Suite_Name: PSCI": "Suite_Name: Standalone",
-        "Suite_Name: SMBIOS": "Suite_Name: Standalone",
-        "Suite_Name: Network boot": "Suite_Name: Standalone",
-        "Suite_Name: Runtime device mapping": "Suite_Name: Standalone"
-    }
-
-    def _entry_to_list(entry):
-        if isinstance(entry, list):
-            return entry
-        if (
-            isinstance(entry, dict)
-            and "test_results" in entry
-            and isinstance(entry["test_results"], list)
-        ):
-            return entry["test_results"]
-        return [entry]
+                writer.encoded(spool.chunks(suite_sections[name][0]))
+        writer.end_object()
+    spool.close()
 
-    for old_key, new_key in RENAME_SUITES_TO_STANDALONE.items():
-        if old_key in merged_results:
-            old_data_list = _entry_to_list(merged_results.pop(old_key))
-            merged_results.setdefault(new_key, [])
-            merged_results[new_key].extend(old_data_list)
+    if db_path:
+        store_in_results_db(db_path, output_file)
 
-    # Recursive alphabetical sorting of entire JSON
-    merged_results = recursive_sort(merged_results)
+def store_in_results_db(db_path, output_file):
+    """Store a written merged results file in the results database at db_path.
 
-    with open(output_file, 'w') as outj:
-        json.dump(merged_results, outj, indent=4)
+    The database is optional: the file is ingested in its own short
+    transaction once it is complete, and a database that cannot be opened or
+    written (not a database, locked past results_db.LOCK_TIMEOUT) only gives
+    a warning.
+    """
+    try:
+        db = results_db.connect(db_path)
+        try:
+            results_db.ingest_files(db, [os.path.abspath(output_file)], force=True)
+        finally:
+            db.close()
+    except sqlite3.Error as e:
+        print(f"Warning: could not store {output_file} in {db_path}: {e}")
 
 def main():
     parser = argparse.ArgumentParser(
@@ -775,9 +487,23 @@ def main():
     parser.add_argument("output_file", help="Output merged JSON file")
     parser.add_argument("json_files", nargs='+',
                         help="List of JSON files to merge (including acs_info.json if present)")
+    parser.add_argument("--compact", action="store_true",
+                        help="Write compact JSON (no indentation) for machine consumers")
+    parser.add_argument("--normalize", action="store_true",
+                        help="Also rewrite each input JSON pretty-printed (indent=4)")
+    parser.add_argument("--validate", action="store_true",
+                        help="Check each merged section against the results schema (needs jsonschema)")
+    parser.add_argument("--schema", default=SCHEMA_PATH,
+                        help="Results schema used by --validate (default: %(default)s)")
+    parser.add_argument("--sqlite", metavar="DB",
+                        help="Also store the merged run in this SQLite results database "
+                             "(see results_db.py)")
     args = parser.parse_args()
 
-    merge_json_files(args.json_files, args.output_file)
+    merge_json_files(args.json_files, args.output_file,
+                     indent=None if args.compact else DEFAULT_INDENT,
+                     normalize=args.normalize, schema_path=args.schema if args.validate else None,
+                     db_path=args.sqlite)
 
 if __name__ == "__main__":
     main()
@@ -15,14 +15,20 @@
 # limitations under the License.
 
 import json
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from jinja2 import Template
 import sys
 import argparse
 import os
 
+# Shared helpers (html_chart.py, html_templates.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from html_chart import bar_chart
+from html_templates import get_template, render_to_file
+from suite_categories import enrich_suite_json
+# pylint: enable=wrong-import-position
+
 def detect_columns_used(subtests):
     """
     Returns a dict of booleans indicating whether "pass_reasons",
@@ -72,44 +78,18 @@ def generate_bar_chart(suite_summary, show_extended=False):
         ]
         colors = ['#d4edda', '#f8d7da', '#ffe0b2']
 
-    plt.figure(figsize=(8, 6))
-    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
-
-    # Add percentage labels on top of the bars
-    total_tests = sum(sizes)
-    for bar, size in zip(bars, sizes):
-        yval = bar.get_height()
-        if total_tests > 0:
-            percentage = (size / total_tests) * 100
-            label = f'{percentage:.2f}%'
-            plt.text(
-                bar.get_x() + bar.get_width() / 2,
-                yval + 0.05 * total_tests,
-                label,
-                ha='center',
-                va='bottom',
-                fontsize=12
-            )
-        else:
-            plt.text(
-                bar.get_x() + bar.get_width() / 2,
-                yval + 0.05,
-                '0%',
-                ha='center',
-                va='bottom',
-                fontsize=12
-            )
-
-    plt.title('OS Test Results', fontsize=16, fontweight='bold', pad=20)
-    plt.ylabel('Number of Tests', fontsize=14)
-    plt.tight_layout()
-
-    # Save the figure to a buffer
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return bar_chart(
+        labels,
+        sizes,
+        colors,
+        'OS Test Results',
+        'Number of Tests',
+        alt='OS Test Results',
+        empty_label='0%',
+        figsize=(8, 6),
+        title_size=16,
+        tick_size=10
+    )
 
 # Function to determine subtest status
 def get_subtest_status(subtest_result):
@@ -128,11 +108,11 @@ def get_subtest_status(subtest_result):
 
 # Function to generate HTML content for both summary and detailed pages
 def generate_html(suite_summary, test_results_list, output_html_path, is_summary_page=True, include_drop_down=False, show_extended_summary=False):
-    # Set the test suite name to 'OS Tests'
-    test_suite_name = 'OS Tests'
+    # Page heading: "OS Test Summary"
+    test_suite_name = 'OS'
 
     # Template for both summary and detailed pages
-    template = Template(r"""
+    template = get_template("os_tests.html", r"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -262,7 +242,7 @@ def generate_html(suite_summary, test_results_list, output_html_path, is_summary
 
         {% if not is_summary_page %}
         <div class="chart-container">
-            <img src="data:image/png;base64,{{ chart_data }}" alt="OS Test Results">
+            {{ chart_data }}
         </div>
         {% endif %}
 
@@ -331,7 +311,7 @@ def generate_html(suite_summary, test_results_list, output_html_path, is_summary
             {% for idx, test_results in enumerate(test_results_list) %}
             {% for test_idx, test in enumerate(test_results) %}
             <a id="section{{ idx }}_{{ test_idx }}"></a>
-            <div class="test-suite-header">Test Suite: {{ test.Test_suite_name }}</div>
+            <div class="test-suite-header">Test Suite: {{ test.Test_suite_name }}</div>{{ suite_info_html(test.Test_suite_info) }}
             <div class="test-suite-description">Description: {{ test.Test_suite_description }}</div>
             
             {% if test.Test_case %}
@@ -422,7 +402,9 @@ def generate_html(suite_summary, test_results_list, output_html_path, is_summary
         chart_data = None  # No chart data for summary page
 
     # Render the HTML content
-    html_content = template.render(
+    render_to_file(
+        template,
+        output_html_path,
         test_suite_name=test_suite_name,
         total_tests=total_tests,
         total_passed=suite_summary.get("total_passed", 0),
@@ -440,10 +422,6 @@ def generate_html(suite_summary, test_results_list, output_html_path, is_summary
         get_subtest_status=get_subtest_status  # Pass the function to the template
     )
 
-    # Save to HTML file
-    with open(output_html_path, "w") as file:
-        file.write(html_content)
-
 def main():
     parser = argparse.ArgumentParser(description='Generate HTML report from JSON data.')
     parser.add_argument('input_json_files', nargs='+', help='Input JSON file(s)')
@@ -477,6 +455,7 @@ def main():
                 print(f"Error decoding JSON from file {input_json_file}: {e}")
                 continue
 
+            data = enrich_suite_json(input_json_file, data)
             test_results = data.get("test_results", [])
             os_name = data.get("os_name", "Unknown")
             if test_results:
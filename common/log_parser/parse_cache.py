@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Content-addressed cache for logs_to_json results (acs_summary/.cache).
+#
+# An entry is keyed on the SHA-256 of the parser source (and the helper modules
+# it loads), the parser arguments and the content of every input it reads, so
+# any change to a log or to the parser produces a new key.  Entries hold the
+# parser's JSON output as written *before* waivers are applied, plus the
+# console output the parser printed, so a cache hit behaves like a parse.
+
+import hashlib
+import json
+import os
+import time
+
+# Bump when the entry layout or key derivation changes.
+CACHE_FORMAT = "1"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_AGE_DAYS = 30
+
+# Extra source files a parser reads besides its own script, keyed by the
+# parser path relative to the log_parser directory.
+PARSER_DEPENDENCIES = {
+    "bsa/logs_to_json.py": ("log_encoding.py", "json_stream.py"),
+    "bbr/fwts/logs_to_json.py": ("json_stream.py",),
+    "bbr/sct/logs_to_json.py": ("log_encoding.py", "json_stream.py", "bbr/sct/logs_to_json_edk2.py"),
+    "scmi/logs_to_json.py": ("log_encoding.py", "line_classifier.py", "json_stream.py"),
+    "pfdi/logs_to_json.py": ("log_encoding.py", "line_classifier.py", "json_stream.py"),
+}
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _hash_file(hasher, path):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+
+
+def hash_path(path):
+    """Hash a file, or every file below a directory; missing paths hash to a fixed marker."""
+    hasher = hashlib.sha256()
+    if os.path.isfile(path):
+        hasher.update(b"file\0")
+        _hash_file(hasher, path)
+    elif os.path.isdir(path):
+        hasher.update(b"dir\0")
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                hasher.update(os.path.relpath(file_path, path).encode("utf-8", "surrogateescape") + b"\0")
+                if os.path.isfile(file_path):
+                    _hash_file(hasher, file_path)
+                hasher.update(b"\0")
+    else:
+        hasher.update(b"absent\0")
+    return hasher.hexdigest()
+
+
+class ParseCache:
+    """Directory of <key>.out (parser output) and <key>.log (console chunks) entries."""
+
+    def __init__(self, cache_dir, scripts_path, max_bytes=DEFAULT_MAX_BYTES,
+                 max_age_days=DEFAULT_MAX_AGE_DAYS):
+        self.cache_dir = cache_dir
+        self.scripts_path = scripts_path
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self._source_hashes = {}
+
+    def _parser_version(self, rel_path):
+        """Hash of the parser script plus its declared helper modules."""
+        version = self._source_hashes.get(rel_path)
+        if version is None:
+            hasher = hashlib.sha256()
+            for dep in (rel_path,) + tuple(PARSER_DEPENDENCIES.get(rel_path, ())):
+                hasher.update(dep.encode("utf-8") + b"\0")
+                hasher.update(hash_path(os.path.join(self.scripts_path, dep)).encode("ascii"))
+            version = hasher.hexdigest()
+            self._source_hashes[rel_path] = version
+        return version
+
+    def make_key(self, rel_path, args, output_path, inputs, context=()):
+        """Build the cache key for one parser invocation.
+
+        args is the full argument list; the output path is reduced to its
+        basename because parsers only look at the name, and inputs are the
+        files/directories whose content the parser reads.
+        """
+        hasher = hashlib.sha256()
+        material = {
+            "format": CACHE_FORMAT,
+            "parser": rel_path,
+            "parser_version": self._parser_version(rel_path),
+            "args": [os.path.basename(arg) if arg == output_path else arg for arg in args],
+            "context": list(context),
+            "inputs": [[path, hash_path(path)] for path in inputs],
+        }
+        hasher.update(json.dumps(material, sort_keys=True).encode("utf-8", "surrogateescape"))
+        return hasher.hexdigest()
+
+    def _entry_paths(self, key):
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return f"{base}.out", f"{base}.log"
+
+    def load(self, key, output_path):
+        """Copy a cached output to output_path; return its console chunks, or None on a miss."""
+        out_path, log_path = self._entry_paths(key)
+        try:
+            with open(out_path, "rb") as f:
+                data = f.read()
+            with open(log_path, "r", encoding="utf-8") as f:
+                chunks = [tuple(chunk) for chunk in json.load(f)]
+        except (OSError, ValueError):
+            return None
+        with open(output_path, "wb") as f:
+            f.write(data)
+        now = time.time()
+        for path in (out_path, log_path):
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+        return chunks
+
+    def store(self, key, output_path, chunks):
+        """Save a freshly written parser output and its console chunks."""
+        out_path, log_path = self._entry_paths(key)
+        try:
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+            pid = os.getpid()
+            with open(output_path, "rb") as src, open(f"{out_path}.{pid}.tmp", "wb") as dst:
+                dst.write(src.read())
+            with open(f"{log_path}.{pid}.tmp", "w", encoding="utf-8") as f:
+                json.dump(chunks, f)
+            # Publish the log first: load() needs both files, so a reader never
+            # sees a half-written entry.
+            os.replace(f"{log_path}.{pid}.tmp", log_path)
+            os.replace(f"{out_path}.{pid}.tmp", out_path)
+        except OSError:
+            pass
+
+    def evict(self):
+        """Drop entries older than max_age_days, then least recently used ones above max_bytes."""
+        entries = {}
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                key = name.split(".", 1)[0]
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                size, mtime, paths = entries.get(key, (0, 0.0, []))
+                entries[key] = (size + st.st_size, max(mtime, st.st_mtime), paths + [path])
+
+        cutoff = time.time() - self.max_age_days * 86400
+        total = sum(size for size, _mtime, _paths in entries.values())
+        removed = 0
+        for key, (size, mtime, paths) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if mtime >= cutoff and total <= self.max_bytes:
+                continue
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+
+        for root, dirs, files in os.walk(self.cache_dir, topdown=False):
+            if root != self.cache_dir and not dirs and not files:
+                try:
+                    os.rmdir(root)
+                except OSError:
+                    pass
+        return removed
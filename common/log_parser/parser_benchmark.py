@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Throughput benchmark for the logs_to_json parsers.
+#
+# A synthetic log of the requested size is generated once, then every parser
+# given with --parser is run on it in its own process and timed.  Passing an
+# older copy of a parser next to the current one gives a before/after figure:
+#
+#   git show HEAD~1:common/log_parser/bsa/logs_to_json.py > /tmp/bsa_old.py
+#   python3 parser_benchmark.py sbsa --size-mb 300 \
+#       --parser /tmp/bsa_old.py --parser bsa/logs_to_json.py
+
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS_PATH = os.path.dirname(os.path.realpath(__file__))
+
+BSA_SUITES = ("PE", "GIC", "Timer", "Watchdog", "PCIe", "SMMU", "Memory", "Peripheral")
+BSA_RESULTS = ("PASSED", "PASSED", "PASSED", "FAILED", "SKIPPED", "PASSED(*PARTIAL)",
+               "PAL NOT SUPPORTED")
+
+
+def write_bsa_log(path, size_bytes, rng, rule_prefix="B", timestamps=False):
+    """Write a new-format BSA/SBSA log with nested rules and verbose debug output."""
+    clock = 0.0
+    rule_number = 0
+    with open(path, "w", encoding="utf-8") as f:
+        def emit(text):
+            nonlocal clock
+            if timestamps:
+                clock += rng.random() / 1000
+                f.write(f"[{clock:12.6f}] {text}\n")
+            else:
+                f.write(f"{text}\n")
+
+        emit("---------------------- Running tests ------------------------")
+        while f.tell() < size_bytes:
+            suite = BSA_SUITES[rule_number // 50 % len(BSA_SUITES)]
+            if rule_number % 50 == 0:
+                emit(f"*** Running {suite} tests ***")
+            rule_number += 1
+            rule_id = f"{rule_prefix}_{suite.upper()}_{rule_number:05d}"
+            emit(f"{rule_id} : {rule_number} : Check {suite} behaviour {rule_number}")
+            children = rng.randint(0, 3)
+            if children:
+                emit(f"  === Start tests for rules referenced by {rule_id} ===")
+                for child in range(children):
+                    emit(f"  {rule_id}_{child} : - : Referenced check {child}")
+                    for _ in range(rng.randint(5, 20)):
+                        emit(f"       DEBUG: addr 0x{rng.getrandbits(48):012x}"
+                             f" val 0x{rng.getrandbits(32):08x}")
+                    emit(f"    Result: {rng.choice(BSA_RESULTS)}")
+                emit(f"  === End tests for rules referenced by {rule_id} ===")
+            for _ in range(rng.randint(10, 60)):
+                emit(f"       Info: PE {rng.randint(0, 255)} register 0x{rng.getrandbits(32):08x}")
+            emit(f"  Result: {rng.choice(BSA_RESULTS)}")
+
+
+def write_sbsa_log(path, size_bytes, rng):
+    """SBSA kernel log: S_ rules behind dmesg-style timestamps."""
+    write_bsa_log(path, size_bytes, rng, rule_prefix="S", timestamps=True)
+
+
+def write_fwts_log(path, size_bytes, rng, test_count=150):
+    """FWTS results log: a wrapped "Running tests:" header, then test sections until size_bytes."""
+    tests = [f"fwtstest{n:03d}" for n in range(test_count)]
+    results = ("PASSED: Test {n}, check ok.", "FAILED [MEDIUM] Check{n}: Test {n}, value mismatch.",
+               "SKIPPED: Test {n}, not supported.", "WARNING: Test {n}, odd value.")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Results generated by fwts: Version V26.01.00.\n\n")
+        f.write("Running tests: " + " ".join(tests[:10]) + "\n")
+        for start in range(10, test_count, 10):
+            f.write("  " + " ".join(tests[start:start + 10]) + "\n")
+        f.write("=" * 80 + "\n")
+        index = 0
+        while f.tell() < size_bytes:
+            test = tests[index % test_count]
+            index += 1
+            f.write(f"{test}: Synthetic test {index}.\n" + "-" * 80 + "\n")
+            subtests = rng.randint(1, 8)
+            for n in range(1, subtests + 1):
+                f.write(f"Test {n} of {subtests}: Check item {n}.\n")
+                for _ in range(rng.randint(1, 4)):
+                    f.write(rng.choice(results).format(n=n) + "\n")
+                    if rng.random() < 0.3:
+                        f.write(f"  detail 0x{rng.getrandbits(32):08x}\n")
+                f.write("\n")
+            f.write(f"{subtests} passed, 0 failed, 0 warning, 0 aborted, 0 skipped, 0 info only.\n")
+            f.write("=" * 80 + "\n")
+
+
+def write_sct_log(path, size_bytes, rng):
+    """SCT Summary.log: test entries with sub-test results until size_bytes."""
+    cases = ("CheckEvent_Func", "AllocatePages_Conf", "GetVariable_Func", "Unlisted_Func")
+    results = ("PASS", "PASS", "PASS", "FAIL", "WARNING", "NOT SUPPORTED")
+    with open(path, "w", encoding="utf-8") as f:
+        index = 0
+        while f.tell() < size_bytes:
+            index += 1
+            case = cases[index % len(cases)]
+            f.write(f"BBR ACS 2.1\n{case}\nTest Configuration #0\n{'-' * 48}\n"
+                    f"{case} test {index}\nTest Entry Point GUID: {rng.getrandbits(64):016X}\n"
+                    f"Returned Status Code: Success\n{case}: [PASSED]\n  Passes........... 2\n")
+            for n in range(rng.randint(1, 40)):
+                f.write(f"BS.{case} - Check {n} -- {rng.choice(results)}\n"
+                        f"{rng.getrandbits(64):016X}\n"
+                        f"/home/x/{case}BBTest.c:{n}:Status - Success\n")
+            f.write("\n")
+
+
+def write_scmi_log(path, size_bytes, rng):
+    """SCMI ACS app log: protocol suites of tests, most with check details before the status."""
+    protocols = ("BASE", "POWER DOMAIN", "SYSTEM POWER", "PERFORMANCE", "CLOCK", "SENSOR")
+    statuses = ("CONFORMANT", "CONFORMANT", "CONFORMANT", "NON CONFORMANT", "SKIPPED")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("**** SCMI Compliance Suite ****\n")
+        index = 0
+        while f.tell() < size_bytes:
+            f.write(f"*** Starting {protocols[index // 40 % len(protocols)]} tests ***\n")
+            for _ in range(40):
+                index += 1
+                if rng.random() < 0.3:
+                    f.write(f"{index} : Query message {index} : {rng.choice(statuses)}\n")
+                    continue
+                f.write(f"{index} : Query message {index}\n")
+                for _ in range(rng.randint(5, 25)):
+                    f.write(f"    Message id 0x{rng.getrandbits(8):02x}"
+                            f" returned 0x{rng.getrandbits(32):08x}\n")
+                if rng.random() < 0.2:
+                    f.write("    CHECK STATUS FAILED: EXPECTED 0x0"
+                            f" RECEIVED 0x{rng.getrandbits(8):02x}\n")
+                f.write(f"    CHECK STATUS : {rng.choice(statuses)}\n")
+
+
+def write_pfdi_log(path, size_bytes, rng):
+    """PFDI UEFI app log: "*** Starting ... tests ***" suites of numbered tests and results."""
+    results = ("PASS", "PASS", "PASS", "FAIL", "SKIP", "WARN")
+    with open(path, "w", encoding="utf-8") as f:
+        index = 0
+        while f.tell() < size_bytes:
+            f.write(f"*** Starting PFDI function {index // 50} tests ***\n")
+            for _ in range(50):
+                index += 1
+                if rng.random() < 0.3:
+                    f.write(f"{index} : PFDI check {index} : Result : {rng.choice(results)}\n")
+                    continue
+                f.write(f"{index} : PFDI check {index}\n")
+                for _ in range(rng.randint(5, 25)):
+                    f.write(f"       PE {rng.randint(0, 255)} status 0x{rng.getrandbits(32):08x}\n")
+                if rng.random() < 0.2:
+                    f.write(f"       PFDI call failed with {rng.randint(-9, -1)}\n")
+                f.write(f"   Result: {rng.choice(results)}\n\n")
+
+
+# suite -> (log generator, default parser relative to the log_parser directory)
+BENCHMARKS = {
+    "bsa": (write_bsa_log, "bsa/logs_to_json.py"),
+    "sbsa": (write_sbsa_log, "bsa/logs_to_json.py"),
+    "fwts": (write_fwts_log, "bbr/fwts/logs_to_json.py"),
+    "sct": (write_sct_log, "bbr/sct/logs_to_json.py"),
+    "scmi": (write_scmi_log, "scmi/logs_to_json.py"),
+    "pfdi": (write_pfdi_log, "pfdi/logs_to_json.py"),
+}
+
+
+def count_lines(path):
+    lines = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            lines += chunk.count(b"\n")
+    return lines
+
+
+def run_parser(parser_path, log_path, output_json):
+    """Run one parser process; return (exit code, wall seconds, peak RSS in MB)."""
+    start = time.monotonic()
+    with subprocess.Popen([sys.executable, parser_path, log_path, output_json],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) as proc:
+        # wait4 reports the resource usage of this child alone.
+        _pid, status, usage = os.wait4(proc.pid, 0)
+        elapsed = time.monotonic() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+    return proc.returncode, elapsed, usage.ru_maxrss / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure logs_to_json parser throughput on a synthetic log.")
+    parser.add_argument("suite", choices=sorted(BENCHMARKS), help="Log flavour to generate")
+    parser.add_argument("--size-mb", type=float, default=100,
+                        help="Size of the generated log (default: 100)")
+    parser.add_argument("--parser", dest="parsers", action="append", default=[],
+                        help="Parser script to time; repeat to compare"
+                             " (default: the in-tree parser)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Runs per parser, best time is reported")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generated log")
+    parser.add_argument("--log",
+                        help="Keep the generated log at this path instead of a temporary file")
+    args = parser.parse_args(argv)
+
+    generator, default_parser = BENCHMARKS[args.suite]
+    parsers = args.parsers or [default_parser]
+    parsers = [p if os.path.isfile(p) else os.path.join(SCRIPTS_PATH, p) for p in parsers]
+
+    workdir = tempfile.mkdtemp(prefix="parser_benchmark_")
+    try:
+        log_path = args.log or os.path.join(workdir, f"{args.suite}.log")
+        generator(log_path, int(args.size_mb * 1024 * 1024), random.Random(args.seed))
+        size_mb = os.path.getsize(log_path) / (1024 * 1024)
+        lines = count_lines(log_path)
+        print(f"{args.suite}: {lines} lines, {size_mb:.1f} MB")
+        print(f"{'parser':50} {'seconds':>9} {'lines/sec':>12} {'peak RSS MB':>12}")
+
+        rc = 0
+        for parser_path in parsers:
+            best_elapsed, best_rss = float("inf"), 0.0
+            for _ in range(max(1, args.repeat)):
+                exit_code, elapsed, peak_rss = run_parser(
+                    parser_path, log_path, os.path.join(workdir, "out.json"))
+                if exit_code != 0:
+                    print(f"{parser_path:50} failed with exit code {exit_code}")
+                    rc = 1
+                    break
+                if elapsed < best_elapsed:
+                    best_elapsed, best_rss = elapsed, peak_rss
+            if best_elapsed != float("inf"):
+                print(f"{parser_path:50} {best_elapsed:9.2f} {lines / best_elapsed:12.0f}"
+                      f" {best_rss:12.1f}")
+        return rc
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,11 +14,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json, base64, os, sys
-from io import BytesIO
+import json, os, sys
 from pathlib import Path
-import matplotlib.pyplot as plt
-from jinja2 import Template
+
+# Shared helpers (html_chart.py, html_templates.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from html_chart import bar_chart
+from html_templates import get_template, render_to_file
+from suite_categories import enrich_suite_json
+# pylint: enable=wrong-import-position
 
 
 def generate_bar_chart(summary_dict):
@@ -35,33 +42,20 @@ def generate_bar_chart(summary_dict):
     colors = ["#d4edda", "#f8d7da", "#f39c12",
               "#9e9e9e", "#ffe0b2", "#fff3cd"]
 
-    plt.figure(figsize=(12, 7))
-    bars = plt.bar(labels, sizes, edgecolor="black", color=colors)
-
-    total = sum(sizes)
-    for bar in bars:
-        pct = (bar.get_height() / total * 100) if total else 0
-        plt.text(bar.get_x() + bar.get_width()/2,
-                 bar.get_height() + max(sizes) * 0.01,
-                 f"{pct:.2f}%", ha="center", va="bottom", fontsize=12)
-
-    plt.title("Test Results Distribution", fontsize=18, fontweight="bold")
-    plt.ylabel("Total Count", fontsize=14)
-    plt.xticks(fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.tight_layout()
-
-    buf = BytesIO()
-    plt.savefig(buf, format="png")
-    plt.close()
-    buf.seek(0)
-    return base64.b64encode(buf.getvalue()).decode("utf-8")
+    return bar_chart(
+        labels,
+        sizes,
+        colors,
+        "Test Results Distribution",
+        "Total Count",
+        alt="Chart"
+    )
 
 
 # ----------------------------- HTML builder ----------------------------- #
 def build_html(overall_summary, test_results, chart_b64,
                dest_html, suite_name, summary_only=False):
-    tmpl = Template("""
+    tmpl = get_template("pfdi.html", """
 <!DOCTYPE html>
 <html>
 <head>
@@ -99,7 +93,7 @@ def build_html(overall_summary, test_results, chart_b64,
 
 {% if not summary_only %}
 <div class="chart-container">
-  <img src="data:image/png;base64,{{ chart_b64 }}" alt="Chart">
+  {{ chart_b64 }}
 </div>
 {% endif %}
 
@@ -120,7 +114,7 @@ def build_html(overall_summary, test_results, chart_b64,
 {% if not summary_only %}
 <div class="detailed-summary">
 {% for suite in test_results %}
-  <div class="test-suite-header">Test Suite: {{ suite.Test_suite }}</div>
+  <div class="test-suite-header">Test Suite: {{ suite.Test_suite }}</div>{{ suite_info_html(suite.Test_suite_info) }}
   <table>
     <thead>
       <tr>
@@ -151,7 +145,9 @@ def build_html(overall_summary, test_results, chart_b64,
                  overall_summary["total_aborted"] + overall_summary["total_skipped"] +
                  overall_summary["total_warnings"] + overall_summary["total_failed_with_waiver"])
 
-    html = tmpl.render(
+    render_to_file(
+        tmpl,
+        dest_html,
         suite_name=suite_name,
         chart_b64=chart_b64,
         test_results=test_results,
@@ -160,12 +156,11 @@ def build_html(overall_summary, test_results, chart_b64,
         **overall_summary
     )
 
-    Path(dest_html).write_text(html, encoding="utf-8")
-
 
 # ----------------------------- main script ----------------------------- #
 def main(inp_json, detailed_html, summary_html):
     data = json.loads(Path(inp_json).read_text())
+    data = enrich_suite_json(inp_json, data)
 
     # everything except the last element (overall Suite_summary) are suites
     suites = data[:-1]
@@ -15,13 +15,20 @@
 # limitations under the License.
 
 import argparse
-import chardet
-import json
+import os
 import re
 from collections import defaultdict
-from pathlib import Path
 import sys
 
+# Shared helpers (line_classifier.py, json_stream.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+import json_stream
+from line_classifier import DIGITS, LineClassifier, LineRule, iter_log_lines
+# pylint: enable=wrong-import-position
+
 RESULT_MAP = {
     "PASS": "PASSED",
     "PASSED": "PASSED",
@@ -35,9 +42,19 @@ RESULT_MAP = {
     "WARNING": "WARNING",
 }
 
-def detect_file_encoding(path: Path) -> str:
-    raw = path.read_bytes()
-    return chardet.detect(raw)["encoding"] or "utf‑8"
+# Lines outside a test: the suite banner and the "<n> : <name>" test header,
+# which may carry the verdict inline.
+SUITE_LINES = LineClassifier([
+    LineRule("banner", r"\*{3}\s*Starting\s+(.*?)\s+tests\s*\*{3}", re.I,
+             first_chars="*", keywords=("starting", "tests")),
+    LineRule("header", r"^\s*(\d+)\s*:\s*(.+?)(?:\s*:\s*Result\s*:\s*([A-Z]+))?$", re.I,
+             first_chars=DIGITS),
+])
+# Lines inside a test that has no inline verdict yet.
+TEST_LINES = LineClassifier([
+    LineRule("verdict", r"Result\s*:\s*([A-Z]+)", re.I, search=True, keywords=("result", ":")),
+    LineRule("failed", r"failed", re.I, search=True, keywords=("failed",)),
+])
 
 def parse_files(input_files, output_file):
     processing = False
@@ -56,37 +73,26 @@ def parse_files(input_files, output_file):
     )
 
     for file_name in input_files:
-        path = Path(file_name)
-        enc = detect_file_encoding(path)
-
-        with path.open("r", encoding=enc, errors="ignore") as fh:
-            lines = fh.read().splitlines()
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        for line in iter_log_lines(file_name):
+            line = line.strip()
 
-            banner = re.match(r"\*{3}\s*Starting\s+(.*?)\s+tests\s*\*{3}", line, re.I)
-            if banner:
-                suite_name = banner.group(1).strip()
+            kind, match = SUITE_LINES.classify(line)
+            if kind == "banner":
+                suite_name = match.group(1).strip()
                 processing = True
                 in_test = False
-                i += 1
                 continue
 
             if not processing:
-                i += 1
                 continue
 
             if not line:
-                i += 1
                 continue
 
-            header = re.match(r"^\s*(\d+)\s*:\s*(.+?)(?:\s*:\s*Result\s*:\s*([A-Z]+))?$", line, re.I)
-            if header:
-                test_number = header.group(1).strip()
-                test_name = header.group(2).rstrip()
-                inline_verdict = header.group(3)
+            if kind == "header":
+                test_number = match.group(1).strip()
+                test_name = match.group(2).rstrip()
+                inline_verdict = match.group(3)
                 reason_lines = []
                 if inline_verdict:
                     verdict_raw = inline_verdict.upper()
@@ -116,13 +122,12 @@ def parse_files(input_files, output_file):
                     in_test = False
                 else:
                     in_test = True
-                i += 1
                 continue
 
             if in_test:
-                verdict_line = re.search(r"Result\s*:\s*([A-Z]+)", line, re.I)
-                if verdict_line:
-                    verdict_raw = verdict_line.group(1).upper()
+                kind, match = TEST_LINES.classify(line)
+                if kind == "verdict":
+                    verdict_raw = match.group(1).upper()
                     verdict = RESULT_MAP.get(verdict_raw, verdict_raw)
 
                     if test_number not in test_numbers_per_suite[suite_name]:
@@ -154,17 +159,9 @@ def parse_files(input_files, output_file):
                     continue
 
                 # ---- grab first two “failed …” line as reason ----
-                if re.search(r"failed", line, re.I) and len(reason_lines) < 2:
+                if kind == "failed" and len(reason_lines) < 2:
                     reason_lines.append(line.strip())
 
-                i += 1
-                continue
-
-            i += 1  # default advance
-
-
-
-
     # ---------- build JSON ----------
     formatted = []
     pfdi_run_true = False
@@ -205,8 +202,7 @@ def parse_files(input_files, output_file):
     if not pfdi_run_true:
         sys.exit(1)
 
-    with open(output_file, "w", encoding="utf‑8") as out:
-        json.dump(formatted, out, indent=2)
+    json_stream.dump(formatted, output_file, indent=2)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
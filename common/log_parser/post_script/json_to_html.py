@@ -15,11 +15,18 @@
 # limitations under the License.
 
 import json
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from jinja2 import Template
 import sys
+import os
+
+# Shared helpers (html_chart.py, html_templates.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from html_chart import bar_chart
+from html_templates import get_template, render_to_file
+from suite_categories import enrich_suite_json
+# pylint: enable=wrong-import-position
 
 # Helper function for case-insensitive dictionary get
 def get_case_insensitive(d, key, default=0):
@@ -44,39 +51,17 @@ def generate_bar_chart(suite_summary):
     # Same color array as FWTS
     colors = ['#d4edda', '#f8d7da', '#f39c12', '#9e9e9e', '#ffe0b2', '#fff3cd']
 
-    plt.figure(figsize=(12, 7))
-    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
-
-    total_tests = sum(sizes)
-    max_size = max(sizes) if sizes else 0
-    for bar, size in zip(bars, sizes):
-        height = bar.get_height()
-        pct = (size / total_tests) * 100 if total_tests else 0
-        # Place the % label slightly above each bar
-        plt.text(
-            bar.get_x() + bar.get_width()/2,
-            height + (0.01 * max_size if max_size else 0.05),
-            f'{pct:.2f}%',
-            ha='center',
-            va='bottom',
-            fontsize=12
-        )
-
-    plt.title('Post-Script Test Results Distribution', fontsize=18, fontweight='bold')
-    plt.ylabel('Total Count', fontsize=14)
-    plt.xticks(fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.tight_layout()
-
-    # Convert plot to base64
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return bar_chart(
+        labels,
+        sizes,
+        colors,
+        'Post-Script Test Results Distribution',
+        'Total Count',
+        alt='Test Results Distribution'
+    )
 
 def generate_html(suite_summary, test_results, chart_data, output_html_path, is_summary_page=False):
-    template = Template(r"""
+    template = get_template("post_script.html", r"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -162,7 +147,7 @@ def generate_html(suite_summary, test_results, chart_data, output_html_path, is_
 
     {% if not is_summary_page %}
     <div class="chart-container">
-        <img src="data:image/png;base64,{{ chart_data }}" alt="Test Results Distribution">
+        {{ chart_data }}
     </div>
     {% endif %}
 
@@ -212,7 +197,7 @@ def generate_html(suite_summary, test_results, chart_data, output_html_path, is_
     <div class="detailed-container">
         <h2>Detailed Subtests</h2>
         {% for suite in test_results %}
-        <h3>{{ suite.Test_suite }}: {{ suite.Test_suite_description }}</h3>
+        <h3>{{ suite.Test_suite }}: {{ suite.Test_suite_description }}</h3>{{ suite_info_html(suite.Test_suite_info) }}
         <table>
             <thead>
                 <tr>
@@ -321,7 +306,9 @@ def generate_html(suite_summary, test_results, chart_data, output_html_path, is_
         + suite_summary["total_warnings"]
     )
 
-    html_content = template.render(
+    render_to_file(
+        template,
+        output_html_path,
         is_summary_page=is_summary_page,
         suite_summary=suite_summary,
         total_tests=total_tests,
@@ -329,9 +316,6 @@ def generate_html(suite_summary, test_results, chart_data, output_html_path, is_
         chart_data=chart_data
     )
 
-    with open(output_html_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
 def main():
     if len(sys.argv) != 4:
         print(f"Usage: {sys.argv[0]} <input_json> <detailed_html> <summary_html>")
@@ -343,6 +327,7 @@ def main():
 
     with open(input_json_file, 'r', encoding='utf-8') as jf:
         data = json.load(jf)
+    data = enrich_suite_json(input_json_file, data)
 
     # suite_summary we can take directly from top-level "suite_summary"
     suite_summary = data.get("suite_summary", {
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# SQLite store of merged_results.json runs, for queries across many systems.
+#
+# Each run is normalized into four tables:
+#   systems    one row per run: acs_info System Info, band and compliance
+#   suites     one row per merged section ("BSA", "SCT", "Standalone", ...)
+#   testcases  test cases (BSA rules, SCT/FWTS tests, ...) with their result
+#   subtests   subtests, nested through parent_id
+# Results keep their text as written in the JSON (result) and a normalized
+# status (FAILED, FAILED_WITH_WAIVER, PASSED, ...) that the indexes and the
+# query commands use.
+#
+# A run is identified by its run_key (by default the absolute path of its
+# merged_results.json). Storing a run again replaces its rows, so re-parsing
+# a results directory does not duplicate it. The ingest command skips files
+# whose content hash is unchanged and commits in batches, so one database
+# can be kept up to date over a whole archive of runs.
+#
+# merge_jsons.py --sqlite writes a run while it merges; this script's
+# commands ingest existing merged_results.json files and query a database.
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+MERGED_RESULTS_NAME = "merged_results.json"
+SUITE_PREFIX = "Suite_Name: "
+ACS_INFO_SECTION = "Suite_Name: acs_info"
+SCHEMA_VERSION = 1
+DEFAULT_BATCH = 50
+# Seconds to wait for a database locked by another writer; batch_log_parser.py
+# runs merge into one database in parallel and each holds the lock while it merges.
+LOCK_TIMEOUT = 600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS systems (
+    id INTEGER PRIMARY KEY,
+    run_key TEXT NOT NULL UNIQUE,
+    content_hash TEXT,
+    source TEXT,
+    vendor TEXT,
+    system_name TEXT,
+    soc_family TEXT,
+    firmware_version TEXT,
+    bmc_firmware_version TEXT,
+    uefi_version TEXT,
+    band TEXT,
+    generated_on TEXT,
+    overall_compliance TEXT,
+    bbsr_compliance TEXT,
+    system_info TEXT,
+    results_summary TEXT,
+    ingested_at TEXT
+);
+CREATE TABLE IF NOT EXISTS suites (
+    id INTEGER PRIMARY KEY,
+    system_id INTEGER NOT NULL REFERENCES systems(id) ON DELETE CASCADE,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS testcases (
+    id INTEGER PRIMARY KEY,
+    suite_id INTEGER NOT NULL REFERENCES suites(id) ON DELETE CASCADE,
+    test_suite TEXT,
+    rule_id TEXT,
+    description TEXT,
+    result TEXT,
+    status TEXT,
+    waiver_reason TEXT
+);
+CREATE TABLE IF NOT EXISTS subtests (
+    id INTEGER PRIMARY KEY,
+    testcase_id INTEGER NOT NULL REFERENCES testcases(id) ON DELETE CASCADE,
+    parent_id INTEGER REFERENCES subtests(id) ON DELETE CASCADE,
+    depth INTEGER NOT NULL,
+    rule_id TEXT,
+    description TEXT,
+    result TEXT,
+    status TEXT,
+    waiver_reason TEXT
+);
+CREATE INDEX IF NOT EXISTS systems_soc_firmware ON systems(soc_family, firmware_version);
+CREATE INDEX IF NOT EXISTS suites_system ON suites(system_id);
+CREATE INDEX IF NOT EXISTS suites_name ON suites(name);
+CREATE INDEX IF NOT EXISTS testcases_suite ON testcases(suite_id);
+CREATE INDEX IF NOT EXISTS testcases_rule ON testcases(rule_id);
+CREATE INDEX IF NOT EXISTS testcases_status ON testcases(status, rule_id);
+CREATE INDEX IF NOT EXISTS testcases_waiver ON testcases(waiver_reason) WHERE waiver_reason IS NOT NULL;
+CREATE INDEX IF NOT EXISTS subtests_testcase ON subtests(testcase_id);
+CREATE INDEX IF NOT EXISTS subtests_parent ON subtests(parent_id);
+CREATE INDEX IF NOT EXISTS subtests_rule ON subtests(rule_id);
+CREATE INDEX IF NOT EXISTS subtests_status ON subtests(status, rule_id);
+CREATE INDEX IF NOT EXISTS subtests_waiver ON subtests(waiver_reason) WHERE waiver_reason IS NOT NULL;
+"""
+
+# Normalized statuses, worst first: a test case without a result of its own
+# takes the worst status of its subtests.
+STATUS_ORDER = [
+    "FAILED",
+    "FAILED_WITH_WAIVER",
+    "ABORTED",
+    "WARNINGS",
+    "NOT_IMPLEMENTED",
+    "PAL_NOT_SUPPORTED",
+    "PASSED_PARTIAL",
+    "SKIPPED",
+    "PASSED",
+]
+
+# Result text markers of each status other than the failures, checked in order
+# (a "PASSED (PARTIAL)" result is PASSED_PARTIAL, not PASSED).
+STATUS_MARKERS = [
+    ("ABORTED", ("ABORT",)),
+    ("WARNINGS", ("WARN",)),
+    ("NOT_IMPLEMENTED", ("NOT IMPLEMENTED", "NOT_IMPLEMENTED")),
+    ("PAL_NOT_SUPPORTED", ("NOT SUPPORTED", "NOT_SUPPORTED")),
+    ("PASSED_PARTIAL", ("PARTIAL",)),
+    ("SKIPPED", ("SKIP", "NOT RUN", "NOT TESTED")),
+    ("PASSED", ("PASS",)),
+]
+
+# System Info key -> systems column
+SYSTEM_COLUMNS = {
+    "Vendor": "vendor",
+    "System Name": "system_name",
+    "SoC Family": "soc_family",
+    "Firmware Version": "firmware_version",
+    "BMC Firmware Version": "bmc_firmware_version",
+    "UEFI Version": "uefi_version",
+    "Summary Generated On": "generated_on",
+}
+
+# Filters shared by the query commands: option -> systems/suites column.
+SYSTEM_FILTERS = [
+    ("vendor", "sy.vendor"),
+    ("system_name", "sy.system_name"),
+    ("soc_family", "sy.soc_family"),
+    ("firmware", "sy.firmware_version"),
+    ("band", "sy.band"),
+    ("suite", "su.name"),
+]
+
+
+def connect(path):
+    """Open (and create if needed) the results database at path."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=LOCK_TIMEOUT)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.executescript(SCHEMA)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def file_hash(path):
+    """Return the sha256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def suite_name(section_name):
+    """Return the suite name of a merged section ("Suite_Name: BSA" -> "BSA")."""
+    if section_name.startswith(SUITE_PREFIX):
+        return section_name[len(SUITE_PREFIX):]
+    return section_name
+
+
+def normalize_status(result):
+    """Return the normalized status of a result string or result count dict."""
+    if isinstance(result, dict):
+        counts = {normalize_status(key): value for key, value in result.items()}
+        for status in STATUS_ORDER:
+            if isinstance(counts.get(status), (int, float)) and counts[status] > 0:
+                return status
+        return "INFO"
+    if not isinstance(result, str) or not result.strip():
+        return None
+    text = result.strip().upper()
+    if "FAIL" in text:
+        return "FAILED_WITH_WAIVER" if "WAIVER" in text else "FAILED"
+    for status, markers in STATUS_MARKERS:
+        if any(marker in text for marker in markers):
+            return status
+    return text.replace(" ", "_")
+
+
+def worst_status(statuses):
+    """Return the worst of statuses in STATUS_ORDER (None when there is none)."""
+    ranked = [s for s in statuses if s in STATUS_ORDER]
+    if not ranked:
+        return None
+    return min(ranked, key=STATUS_ORDER.index)
+
+
+def result_text(result):
+    """Return a result as stored in the result column."""
+    if result is None or isinstance(result, str):
+        return result
+    return json.dumps(result, sort_keys=True, separators=(",", ":"))
+
+
+def section_entries(data):
+    """Return the test suite entries of a merged section."""
+    if isinstance(data, dict):
+        data = data.get("test_results", [])
+    if not isinstance(data, list):
+        return []
+    return [entry for entry in data
+            if isinstance(entry, dict)
+            and not set(entry) <= {"Suite_summary", "suite_summary"}]
+
+
+def entry_testcases(entry):
+    """Return (test suite name, test case dicts) of one test suite entry.
+
+    BSA-style entries list their rules under "testcases", SBMR under
+    "Test_cases"; the other suites' entries are a test case themselves.
+    """
+    test_suite = entry.get("Test_suite") or entry.get("Test_suite_name") or ""
+    for key in ("testcases", "Test_cases"):
+        cases = entry.get(key)
+        if isinstance(cases, list):
+            return test_suite, [case for case in cases if isinstance(case, dict)]
+    return test_suite, [entry]
+
+
+class RunWriter:
+    """
+    Writes one run into an open database. The rows go into the caller's
+    transaction; nothing is committed here. Creating the writer replaces any
+    earlier run with the same run_key.
+    """
+
+    def __init__(self, conn, run_key, acs_info=None, source=None):
+        self.conn = conn
+        conn.execute("DELETE FROM systems WHERE run_key = ?", (run_key,))
+        cursor = conn.execute(
+            "INSERT INTO systems (run_key, source, ingested_at) VALUES (?, ?, ?)",
+            (run_key, source or run_key, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        self.system_id = cursor.lastrowid
+        if acs_info is not None:
+            self.set_acs_info(acs_info)
+
+    def set_acs_info(self, acs_info):
+        """Store the System Info and ACS Results Summary of the run."""
+        if not isinstance(acs_info, dict):
+            return
+        system_info = acs_info.get("System Info")
+        summary = acs_info.get("ACS Results Summary")
+        system_info = system_info if isinstance(system_info, dict) else {}
+        summary = summary if isinstance(summary, dict) else {}
+        columns = {column: system_info.get(key) for key, column in SYSTEM_COLUMNS.items()}
+        columns["band"] = summary.get("Band")
+        columns["overall_compliance"] = summary.get("Overall Compliance Result")
+        columns["bbsr_compliance"] = summary.get("BBSR compliance results")
+        columns["system_info"] = json.dumps(system_info, sort_keys=True)
+        columns["results_summary"] = json.dumps(summary, sort_keys=True)
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        self.conn.execute(f"UPDATE systems SET {assignments} WHERE id = ?",
+                          (*columns.values(), self.system_id))
+
+    def set_content_hash(self, content_hash):
+        self.conn.execute("UPDATE systems SET content_hash = ? WHERE id = ?",
+                          (content_hash, self.system_id))
+
+    def add_section(self, section_name, data):
+        """Store the test cases of one merged section."""
+        cursor = self.conn.execute("INSERT INTO suites (system_id, name) VALUES (?, ?)",
+                                   (self.system_id, suite_name(section_name)))
+        suite_id = cursor.lastrowid
+        for entry in section_entries(data):
+            test_suite, cases = entry_testcases(entry)
+            for case in cases:
+                self._add_testcase(suite_id, test_suite, case)
+
+    def _add_testcase(self, suite_id, test_suite, case):
+        result = case.get("Test_result", case.get("test_result"))
+        cursor = self.conn.execute(
+            "INSERT INTO testcases"
+            " (suite_id, test_suite, rule_id, description, result, waiver_reason)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (suite_id, test_suite, case.get("Test_case") or test_suite,
+             case.get("Test_case_description"), result_text(result), case.get("waiver_reason")))
+        testcase_id = cursor.lastrowid
+        status = normalize_status(result)
+        sub_status = self._add_subtests(testcase_id, None, 0, case.get("subtests"))
+        if status is None:
+            status = sub_status
+        self.conn.execute("UPDATE testcases SET status = ? WHERE id = ?", (status, testcase_id))
+
+    def _add_subtests(self, testcase_id, parent_id, depth, subtests):
+        """Store a subtest list; return the worst status found in it."""
+        if not isinstance(subtests, list):
+            return None
+        statuses = []
+        for sub in subtests:
+            if not isinstance(sub, dict):
+                continue
+            result = sub.get("sub_test_result")
+            status = normalize_status(result)
+            # apply_waivers.py keeps FWTS/SBMR waiver reasons inside the result count dict
+            waiver_reason = sub.get("waiver_reason")
+            if waiver_reason is None and isinstance(result, dict):
+                waiver_reason = result.get("waiver_reason")
+            cursor = self.conn.execute(
+                "INSERT INTO subtests (testcase_id, parent_id, depth, rule_id, description,"
+                " result, status, waiver_reason) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (testcase_id, parent_id, depth,
+                 sub.get("sub_Test_Number") or sub.get("sub_Test_GUID"),
+                 sub.get("sub_Test_Description"), result_text(result), status, waiver_reason))
+            nested = self._add_subtests(testcase_id, cursor.lastrowid, depth + 1,
+                                        sub.get("subtests"))
+            statuses.append(status or nested)
+        return worst_status(statuses)
+
+
+def ingest_merged(conn, merged, run_key, source=None, content_hash=None):
+    """Store one loaded merged_results document as run run_key."""
+    writer = RunWriter(conn, run_key, merged.get(ACS_INFO_SECTION), source)
+    for section_name, data in merged.items():
+        if section_name != ACS_INFO_SECTION:
+            writer.add_section(section_name, data)
+    writer.set_content_hash(content_hash)
+    return writer.system_id
+
+
+def find_merged_files(paths):
+    """Return the merged results files named by paths (directories are searched)."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                if MERGED_RESULTS_NAME in names:
+                    files.append(os.path.join(root, MERGED_RESULTS_NAME))
+        else:
+            files.append(path)
+    return files
+
+
+def ingest_files(conn, paths, batch=DEFAULT_BATCH, force=False):
+    """
+    Store the merged results files under paths, committing every batch runs.
+    Files already stored with the same content are skipped unless force.
+    Returns (ingested, skipped, failed) counts.
+    """
+    ingested = skipped = failed = pending = 0
+    for path in find_merged_files(paths):
+        run_key = os.path.abspath(path)
+        try:
+            content_hash = file_hash(path)
+            if not force:
+                row = conn.execute("SELECT content_hash FROM systems WHERE run_key = ?",
+                                   (run_key,)).fetchone()
+                if row is not None and row[0] == content_hash:
+                    skipped += 1
+                    continue
+            with open(path, "r") as f:
+                merged = json.load(f)
+            if not isinstance(merged, dict):
+                raise ValueError("not a merged results object")
+        except (OSError, ValueError) as e:
+            print(f"Warning: {path}: {e}. Skipping.")
+            failed += 1
+            continue
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        conn.execute("SAVEPOINT run")
+        try:
+            ingest_merged(conn, merged, run_key, path, content_hash)
+        except Exception as e:  # pylint: disable=broad-except
+            conn.execute("ROLLBACK TO run")
+            conn.execute("RELEASE run")
+            print(f"Warning: {path}: {e}. Skipping.")
+            failed += 1
+            continue
+        conn.execute("RELEASE run")
+        ingested += 1
+        pending += 1
+        if pending >= batch:
+            conn.commit()
+            pending = 0
+    conn.commit()
+    return ingested, skipped, failed
+
+
+def system_filters(args):
+    """Return (WHERE clause, parameters) for the query commands' filters."""
+    clauses, params = [], []
+    for option, column in SYSTEM_FILTERS:
+        value = getattr(args, option, None)
+        if value:
+            clauses.append(f"{column} LIKE ?")
+            params.append(value)
+    return (" AND " + " AND ".join(clauses)) if clauses else "", params
+
+
+def failures_query(args):
+    """Return (SQL, parameters) listing failing rules by the number of systems."""
+    where, params = system_filters(args)
+    status = "FAILED_WITH_WAIVER" if args.waived else "FAILED"
+    if args.rule:
+        where += " AND t.rule_id LIKE ?"
+        params.append(args.rule)
+    sql = f"""
+        SELECT su.name, t.rule_id, COUNT(DISTINCT sy.id) AS systems, COUNT(*) AS results
+        FROM (SELECT suite_id, rule_id FROM testcases WHERE status = ?
+              UNION ALL
+              SELECT tc.suite_id, s.rule_id FROM subtests s JOIN testcases tc ON tc.id = s.testcase_id
+              WHERE s.status = ? AND s.rule_id IS NOT NULL) t
+        JOIN suites su ON su.id = t.suite_id
+        JOIN systems sy ON sy.id = su.system_id
+        WHERE 1 = 1{where}
+        GROUP BY su.name, t.rule_id
+        ORDER BY systems DESC, su.name, t.rule_id
+    """
+    return sql, [status, status] + params
+
+
+def waivers_query(args):
+    """Return (SQL, parameters) listing the applied waiver reasons."""
+    where, params = system_filters(args)
+    sql = f"""
+        SELECT su.name, t.waiver_reason, COUNT(DISTINCT sy.id) AS systems, COUNT(*) AS results
+        FROM (SELECT suite_id, waiver_reason FROM testcases WHERE waiver_reason IS NOT NULL
+              UNION ALL
+              SELECT tc.suite_id, s.waiver_reason FROM subtests s JOIN testcases tc ON tc.id = s.testcase_id
+              WHERE s.waiver_reason IS NOT NULL) t
+        JOIN suites su ON su.id = t.suite_id
+        JOIN systems sy ON sy.id = su.system_id
+        WHERE 1 = 1{where}
+        GROUP BY su.name, t.waiver_reason
+        ORDER BY systems DESC, su.name, t.waiver_reason
+    """
+    return sql, params
+
+
+def systems_query(args):
+    """Return (SQL, parameters) listing the stored runs."""
+    where, params = system_filters(args)
+    sql = f"""
+        SELECT sy.vendor, sy.system_name, sy.soc_family, sy.firmware_version, sy.band,
+               sy.overall_compliance, sy.source
+        FROM systems sy LEFT JOIN suites su ON su.system_id = sy.id
+        WHERE 1 = 1{where}
+        GROUP BY sy.id
+        ORDER BY sy.vendor, sy.system_name, sy.firmware_version
+    """
+    return sql, params
+
+
+def print_rows(cursor):
+    """Print a query result as a tab separated table with a heading row."""
+    if cursor.description is None:
+        return 0
+    print("\t".join(column[0] for column in cursor.description))
+    count = 0
+    for row in cursor:
+        print("\t".join("" if value is None else str(value) for value in row))
+        count += 1
+    return count
+
+
+def add_filter_arguments(parser):
+    parser.add_argument("--suite", help="Suite name, e.g. BSA (SQL LIKE pattern)")
+    parser.add_argument("--vendor", help="System vendor (SQL LIKE pattern)")
+    parser.add_argument("--system-name", dest="system_name", help="System name (SQL LIKE pattern)")
+    parser.add_argument("--soc-family", dest="soc_family", help="SoC family (SQL LIKE pattern)")
+    parser.add_argument("--firmware", help="Firmware version (SQL LIKE pattern)")
+    parser.add_argument("--band", help="ACS band (SQL LIKE pattern)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Store merged_results.json runs in an SQLite database and query it.")
+    parser.add_argument("database", help="SQLite results database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="Store merged_results.json files")
+    ingest.add_argument("paths", nargs="+",
+                        help="merged_results.json files, or directories searched for them")
+    ingest.add_argument("--batch", type=int, default=DEFAULT_BATCH,
+                        help=f"Runs stored per transaction (default: {DEFAULT_BATCH})")
+    ingest.add_argument("--force", action="store_true",
+                        help="Store files again even when their content is unchanged")
+
+    failures = commands.add_parser("failures", help="Failing rules by number of systems")
+    add_filter_arguments(failures)
+    failures.add_argument("--rule", help="Rule or test case ID (SQL LIKE pattern)")
+    failures.add_argument("--waived", action="store_true",
+                          help="List failures that were waived instead of unwaived ones")
+
+    waivers = commands.add_parser("waivers", help="Applied waiver reasons by number of systems")
+    add_filter_arguments(waivers)
+
+    systems = commands.add_parser("systems", help="Stored runs")
+    add_filter_arguments(systems)
+
+    sql = commands.add_parser("sql", help="Run an SQL query")
+    sql.add_argument("query", help="SQL statement")
+    args = parser.parse_args(argv)
+
+    if args.command != "ingest" and not os.path.isfile(args.database):
+        print(f"Error: {args.database} not found")
+        return 1
+    conn = connect(args.database)
+    try:
+        if args.command == "ingest":
+            ingested, skipped, failed = ingest_files(conn, args.paths, max(1, args.batch),
+                                                     args.force)
+            print(f"Stored {ingested} runs, {skipped} unchanged, {failed} failed")
+            return 1 if failed else 0
+        if args.command == "sql":
+            try:
+                print_rows(conn.execute(args.query))
+            except sqlite3.Error as e:
+                print(f"Error: {e}")
+                return 1
+            conn.commit()
+            return 0
+        query = {"failures": failures_query, "waivers": waivers_query,
+                 "systems": systems_query}[args.command]
+        print_rows(conn.execute(*query(args)))
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,13 +15,19 @@
 # limitations under the License.
 
 import json
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from jinja2 import Template
 import os
 import sys
 
+# Shared helpers (html_chart.py, html_templates.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from html_chart import bar_chart
+from html_templates import get_template, render_to_file
+from suite_categories import enrich_suite_json
+# pylint: enable=wrong-import-position
+
 # ----------------------------
 # Helpers
 # ----------------------------
@@ -107,40 +113,20 @@ def generate_bar_chart(suite_summary):
     ]
     colors = ['#d4edda', '#f8d7da', '#f39c12', '#9e9e9e', '#ffe0b2', '#fff3cd']
 
-    plt.figure(figsize=(12, 7))
-    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
-
-    total_tests = sum(sizes)
-    max_size = max(sizes) if sizes else 0
-    for bar, size in zip(bars, sizes):
-        y = bar.get_height()
-        pct = (size / total_tests) * 100 if total_tests > 0 else 0
-        plt.text(
-            bar.get_x() + bar.get_width()/2,
-            y + (0.01 * max_size if max_size else 0.1),
-            f'{pct:.2f}%',
-            ha='center',
-            va='bottom',
-            fontsize=12
-        )
-
-    plt.title('Test Results Distribution', fontsize=18, fontweight='bold')
-    plt.ylabel('Total Count', fontsize=14)
-    plt.xticks(fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.tight_layout()
-
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return bar_chart(
+        labels,
+        sizes,
+        colors,
+        'Test Results Distribution',
+        'Total Count',
+        alt='Test Results Distribution'
+    )
 
 # ----------------------------
 # HTML templates
 # ----------------------------
 
-DETAIL_TEMPLATE = Template("""
+DETAIL_TEMPLATE = get_template("sbmr_detailed.html", """
 <!DOCTYPE html>
 <html>
 <head>
@@ -231,7 +217,7 @@ DETAIL_TEMPLATE = Template("""
     <h1>{{ page_title }} Test Details</h1>
 
     <div class="chart-container">
-        <img src="data:image/png;base64,{{ ds.chart_data }}" alt="Test Results Distribution">
+        {{ ds.chart_data }}
     </div>
 
     <div class="result-summary">
@@ -252,7 +238,7 @@ DETAIL_TEMPLATE = Template("""
 
     <div class="detailed-summary">
         {% for suite in ds.suites %}
-            <div class="suite-header">Test Suite: {{ suite.Test_suite }}</div>
+            <div class="suite-header">Test Suite: {{ suite.Test_suite }}</div>{{ suite_info_html(suite.Test_suite_info) }}
 
             {% if suite.Test_cases is defined and suite.Test_cases %}
                 {% for case in suite.Test_cases %}
@@ -323,7 +309,7 @@ DETAIL_TEMPLATE = Template("""
 </html>
 """)
 
-SUMMARY_TEMPLATE = Template("""
+SUMMARY_TEMPLATE = get_template("sbmr_summary.html", """
 <!DOCTYPE html>
 <html>
 <head>
@@ -372,9 +358,8 @@ SUMMARY_TEMPLATE = Template("""
 # ----------------------------
 
 def render_detail_html(dataset, output_html_path, page_title, report_link=None):
-    html = DETAIL_TEMPLATE.render(ds=dataset, page_title=page_title.upper(), report_link=report_link)
-    with open(output_html_path, "w") as f:
-        f.write(html)
+    render_to_file(DETAIL_TEMPLATE, output_html_path,
+                   ds=dataset, page_title=page_title.upper(), report_link=report_link)
 
 def render_summary_html(combined_summary, output_html_path, page_title):
     total_tests = (
@@ -385,7 +370,9 @@ def render_summary_html(combined_summary, output_html_path, page_title):
         + combined_summary.get("total_warnings", 0)
         + combined_summary.get("total_failed_with_waiver", 0)
     )
-    html = SUMMARY_TEMPLATE.render(
+    render_to_file(
+        SUMMARY_TEMPLATE,
+        output_html_path,
         page_title=page_title.upper(),
         total_tests=total_tests,
         total_passed=combined_summary.get("total_passed", 0),
@@ -395,8 +382,6 @@ def render_summary_html(combined_summary, output_html_path, page_title):
         total_skipped=combined_summary.get("total_skipped", 0),
         total_warnings=combined_summary.get("total_warnings", 0),
     )
-    with open(output_html_path, "w") as f:
-        f.write(html)
 
 # ----------------------------
 # Main
@@ -423,6 +408,7 @@ def main():
 
     with open(input_json_file, "r") as jf:
         data = json.load(jf)
+    data = enrich_suite_json(input_json_file, data)
 
     suites = data.get("test_results", [])
     suite_summary = data.get("suite_summary") or compute_suite_summary_from_results(suites)
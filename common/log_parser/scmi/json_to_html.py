@@ -16,18 +16,25 @@
 
 """Render SCMI JSON results into detailed and summary HTML reports."""
 
-import base64
 import json
 import sys
-from io import BytesIO
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-from jinja2 import Template
+import os
+
+# Shared helpers (html_chart.py, html_templates.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from html_chart import bar_chart
+from html_templates import get_template, render_to_file
+from suite_categories import enrich_suite_json
+# pylint: enable=wrong-import-position
 
 
 def generate_bar_chart(summary_dict):
-    """Return base64 PNG for the summary bar chart."""
+    """Return the summary bar chart markup."""
     labels = ["Passed", "Failed", "Failed with Waiver", "Aborted", "Skipped", "Warnings"]
     sizes = [
         summary_dict.get("total_passed", 0),
@@ -39,37 +46,20 @@ def generate_bar_chart(summary_dict):
     ]
     colors = ["#d4edda", "#f8d7da", "#f39c12", "#9e9e9e", "#ffe0b2", "#fff3cd"]
 
-    plt.figure(figsize=(12, 7))
-    bars = plt.bar(labels, sizes, edgecolor="black", color=colors)
-
-    total = sum(sizes)
-    for bar in bars:
-        pct = (bar.get_height() / total * 100) if total else 0
-        plt.text(
-            bar.get_x() + bar.get_width() / 2,
-            bar.get_height() + max(sizes) * 0.01,
-            f"{pct:.2f}%",
-            ha="center",
-            va="bottom",
-            fontsize=12,
-        )
-
-    plt.title("Test Results Distribution", fontsize=18, fontweight="bold")
-    plt.ylabel("Total Count", fontsize=14)
-    plt.xticks(fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.tight_layout()
-
-    buf = BytesIO()
-    plt.savefig(buf, format="png")
-    plt.close()
-    buf.seek(0)
-    return base64.b64encode(buf.getvalue()).decode("utf-8")
+    return bar_chart(
+        labels,
+        sizes,
+        colors,
+        "Test Results Distribution",
+        "Total Count",
+        alt="Chart"
+    )
 
 
 def build_html(overall_summary, test_results, chart_b64, dest_html, suite_name, summary_only=False):
     """Render HTML to dest_html using SCMI summary and testcases."""
-    tmpl = Template(
+    tmpl = get_template(
+        "scmi.html",
         """
 <!DOCTYPE html>
 <html>
@@ -109,7 +99,7 @@ def build_html(overall_summary, test_results, chart_b64, dest_html, suite_name,
 
 {% if not summary_only %}
 <div class="chart-container">
-  <img src="data:image/png;base64,{{ chart_b64 }}" alt="Chart">
+  {{ chart_b64 }}
 </div>
 {% endif %}
 
@@ -130,7 +120,7 @@ def build_html(overall_summary, test_results, chart_b64, dest_html, suite_name,
 {% if not summary_only %}
 <div class="detailed-summary">
 {% for suite in test_results %}
-  <div class="test-suite-header">Test Suite: {{ suite.Test_suite }}</div>
+  <div class="test-suite-header">Test Suite: {{ suite.Test_suite }}</div>{{ suite_info_html(suite.Test_suite_info) }}
   <div class="suite-reason"><strong>Reason:</strong> {{ suite.reason | default('N/A') }}</div>
   <table>
     <thead>
@@ -169,7 +159,9 @@ def build_html(overall_summary, test_results, chart_b64, dest_html, suite_name,
         + overall_summary["total_failed_with_waiver"]
     )
 
-    html = tmpl.render(
+    render_to_file(
+        tmpl,
+        dest_html,
         suite_name=suite_name,
         chart_b64=chart_b64,
         test_results=test_results,
@@ -178,8 +170,6 @@ def build_html(overall_summary, test_results, chart_b64, dest_html, suite_name,
         **overall_summary,
     )
 
-    Path(dest_html).write_text(html, encoding="utf-8")
-
 
 def _tally_from_testcases(test_results):
     """Aggregate counts from SCMI testcases for summary rendering."""
@@ -212,6 +202,7 @@ def _tally_from_testcases(test_results):
 def main(inp_json, detailed_html, summary_html):
     """Entry point for HTML generation."""
     data = json.loads(Path(inp_json).read_text())
+    data = enrich_suite_json(inp_json, data)
     test_results = data.get("test_results", [])
     overall = _tally_from_testcases(test_results)
 
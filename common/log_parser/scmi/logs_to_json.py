@@ -15,35 +15,44 @@
 # limitations under the License.
 
 import argparse
-import chardet
-import json
+import os
 import re
+import sys
 from collections import OrderedDict
 
+# Shared helpers (line_classifier.py, json_stream.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+import json_stream
+from line_classifier import DIGITS, LineClassifier, LineRule, iter_log_lines
+# pylint: enable=wrong-import-position
+
 STATUS_MAP = {
     "CONFORMANT": "PASSED",
     "NON CONFORMANT": "FAILED",
     "SKIPPED": "SKIPPED",
 }
 
-# Matches suite header lines like "*** Starting BASE tests ***".
-SUITE_HDR_RE = re.compile(r"\*{3}\s*Starting\s+(.*?)\s+tests\s*\*{3}", re.I)
-TEST_LINE_RE = re.compile(
-    r"^\s*(\d+)\s*:\s*(.*?)(?:\s*:\s*(CONFORMANT|NON CONFORMANT|SKIPPED))?\s*$",
-    re.I,
-)
-STATUS_LINE_RE = re.compile(r"^(.*?)\s*:\s*(CONFORMANT|NON CONFORMANT|SKIPPED)\s*$", re.I)
-NO_ACCESS_RE = re.compile(r"Calling agent have no access to\s+(.*?)\s+protocol", re.I)
-# If this appears, treat SCMI as not runnable (no JSON/HTML).
-FATAL_SCMI_RE = re.compile(r"Failed to open SCMI raw transport base path", re.I)
-
-
-def detect_file_encoding(file_path):
-    """Detect log encoding so we can read bytes safely."""
-    with open(file_path, "rb") as file:
-        raw_data = file.read()
-    result = chardet.detect(raw_data)
-    return result["encoding"] or "utf-8"
+# Lines of a run, in the order they are tried.
+RUN_LINES = LineClassifier([
+    # If this appears, treat SCMI as not runnable (no JSON/HTML).
+    LineRule("fatal", r"Failed to open SCMI raw transport base path", re.I, search=True,
+             keywords=("failed to open scmi raw transport base path",)),
+    # Matches suite header lines like "*** Starting BASE tests ***".
+    LineRule("suite", r"\*{3}\s*Starting\s+(.*?)\s+tests\s*\*{3}", re.I, search=True,
+             keywords=("***", "starting", "tests")),
+    LineRule("no_access", r"Calling agent have no access to\s+(.*?)\s+protocol", re.I, search=True,
+             keywords=("calling agent have no access to", "protocol")),
+    LineRule("test", r"^\s*(\d+)\s*:\s*(.*?)(?:\s*:\s*(CONFORMANT|NON CONFORMANT|SKIPPED))?\s*$", re.I,
+             first_chars=DIGITS),
+])
+# The status line that ends a test whose header had no status.
+STATUS_LINES = LineClassifier([
+    LineRule("status", r"^(.*?)\s*:\s*(CONFORMANT|NON CONFORMANT|SKIPPED)\s*$", re.I,
+             keywords=(":", ("conformant", "skipped"))),
+])
 
 
 def init_summary():
@@ -125,35 +134,30 @@ def parse_scmi_logs(input_files):
         run_started = True
 
     for input_file in input_files:
-        file_encoding = detect_file_encoding(input_file)
-        with open(input_file, "r", encoding=file_encoding, errors="ignore") as f:
-            lines = f.read().splitlines()
-
-        for raw_line in lines:
+        for raw_line in iter_log_lines(input_file):
             line = raw_line.rstrip()
 
             if "**** SCMI Compliance Suite ****" in line:
                 start_new_run()
                 continue
 
-            if run_started and FATAL_SCMI_RE.search(line):
-                # Signal caller to skip SCMI entirely.
-                return None
-
             if not run_started:
                 continue
 
-            suite_hdr = SUITE_HDR_RE.search(line)
-            if suite_hdr:
-                current_suite = suite_hdr.group(1).strip()
+            kind, match = RUN_LINES.classify(line)
+            if kind == "fatal":
+                # Signal caller to skip SCMI entirely.
+                return None
+
+            if kind == "suite":
+                current_suite = match.group(1).strip()
                 current_test = None
                 current_details = []
                 continue
 
             # Special case: protocol not accessible for this platform.
-            no_access = NO_ACCESS_RE.search(line)
-            if no_access:
-                protocol = no_access.group(1).strip()
+            if kind == "no_access":
+                protocol = match.group(1).strip()
                 suite_for_reason = current_suite or protocol
                 ensure_suite(suite_for_reason)
                 suite_key = suite_for_reason.lower()
@@ -165,11 +169,10 @@ def parse_scmi_logs(input_files):
                 current_details = []
                 continue
 
-            test_match = TEST_LINE_RE.match(line)
-            if test_match:
-                number = test_match.group(1).strip()
-                description = test_match.group(2).strip()
-                status_raw = test_match.group(3)
+            if kind == "test":
+                number = match.group(1).strip()
+                description = match.group(2).strip()
+                status_raw = match.group(3)
                 if status_raw:
                     status = STATUS_MAP.get(status_raw.upper(), status_raw.upper())
                     reason = None
@@ -184,7 +187,7 @@ def parse_scmi_logs(input_files):
                 continue
 
             if current_test:
-                status_match = STATUS_LINE_RE.match(line.strip())
+                kind, status_match = STATUS_LINES.classify(line.strip())
                 if status_match:
                     reason_text = status_match.group(1).strip()
                     status_raw = status_match.group(2)
@@ -240,8 +243,7 @@ def main(input_files, output_file):
         raise SystemExit(2)
     if not data:
         raise SystemExit(1)
-    with open(output_file, "w", encoding="utf-8") as out:
-        json.dump(data, out, indent=2)
+    json_stream.dump(data, output_file, indent=2)
 
 
 if __name__ == "__main__":
@@ -15,12 +15,19 @@
 # limitations under the License.
 
 import json
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from jinja2 import Template
 import sys
 import argparse
+import os
+
+# Shared helpers (html_chart.py, html_templates.py) live in the log_parser directory.
+LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LOG_PARSER_DIR not in sys.path:
+    sys.path.insert(0, LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from html_chart import bar_chart
+from html_templates import get_template, render_to_file
+from suite_categories import enrich_suite_json
+# pylint: enable=wrong-import-position
 
 # 1) Detect which columns are used among all subtests in a given test
 def detect_columns_used(subtests):
@@ -72,42 +79,25 @@ def generate_bar_chart(suite_summary):
     ]
     colors = ['#d4edda', '#f8d7da', '#fff3cd', '#f39c12']
 
-    plt.figure(figsize=(8, 6))
-    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
-
-    total_tests = sum(sizes)
-    for bar, size in zip(bars, sizes):
-        yval = bar.get_height()
-        if total_tests > 0:
-            percentage = (size / total_tests) * 100
-            label = f'{percentage:.2f}%'
-        else:
-            label = '0%'
-        plt.text(
-            bar.get_x() + bar.get_width() / 2,
-            yval + (max(sizes)*0.02 if total_tests > 0 else 0.1),
-            label,
-            ha='center',
-            va='bottom',
-            fontsize=12
-        )
-
-    plt.title('Standalone test Results', fontsize=16, fontweight='bold', pad=20)
-    plt.ylabel('Number of Standalone tests', fontsize=14)
-    plt.tight_layout()
-
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return bar_chart(
+        labels,
+        sizes,
+        colors,
+        'Standalone test Results',
+        'Number of Standalone tests',
+        alt='Standalone tests Results',
+        empty_label='0%',
+        figsize=(8, 6),
+        title_size=16,
+        tick_size=10
+    )
 
 
 def generate_html(suite_summary, test_results_list, output_html_path,
                   is_summary_page=True, include_drop_down=False):
     test_suite_name = 'Standalone'
 
-    template = Template(r"""
+    template = get_template("standalone_tests.html", r"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -239,7 +229,7 @@ def generate_html(suite_summary, test_results_list, output_html_path,
 
     {% if not is_summary_page %}
     <div class="chart-container">
-        <img src="data:image/png;base64,{{ chart_data }}" alt="Standalone tests Results">
+        {{ chart_data }}
     </div>
     {% endif %}
 
@@ -299,7 +289,7 @@ def generate_html(suite_summary, test_results_list, output_html_path,
         {% endif %}
         {% for test in test_results %}
 
-        <div class="test-suite-header">Test Suite: {{ test.Test_suite }}</div>
+        <div class="test-suite-header">Test Suite: {{ test.Test_suite }}</div>{{ suite_info_html(test.Test_suite_info) }}
         <div class="test-suite-description">Description: {{ test.Test_suite_description }}</div>
 
         <div class="test-case-header">Test Case: {{ test.Test_case }}</div>
@@ -386,7 +376,9 @@ def generate_html(suite_summary, test_results_list, output_html_path,
     else:
         chart_data = None
 
-    html_content = template.render(
+    render_to_file(
+        template,
+        output_html_path,
         test_suite_name=test_suite_name,
         total_tests=total_tests,
         total_passed=suite_summary.get("total_passed", 0),
@@ -400,9 +392,6 @@ def generate_html(suite_summary, test_results_list, output_html_path,
         enumerate=enumerate
     )
 
-    with open(output_html_path, "w") as f:
-        f.write(html_content)
-
 
 def get_subtest_status(subtest_result):
     if subtest_result.get('PASSED', 0) > 0:
@@ -446,6 +435,7 @@ def main():
             print(f"Error reading {input_json_file}: {e}")
             continue
 
+        data = enrich_suite_json(input_json_file, data)
         test_results = data.get("test_results", [])
         if test_results:
             # 2) For each test in test_results, compute columns_used
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# test_category.json lookups, shared by merge_jsons.py and the json_to_html
+# scripts.
+#
+# merge_jsons.py adds the fields of a test suite's category row (Waivable,
+# SRS scope, Main Readiness Grouping and the Description as Test_suite_info)
+# to each test suite entry of merged_results.json.  The json_to_html scripts
+# enrich the suite JSON they render in the same way, so a detailed page shows
+# the Test_suite_info that merged_results.json carries without the page being
+# opened again after the merge.
+#
+# Both pick the category file with category_path(): $ACS_TEST_CATEGORY when
+# set (main_log_parser.py sets it for the whole run), else the DT or SR file.
+
+import json
+import os
+
+import suite_registry
+
+TEST_CATEGORY_ENV = "ACS_TEST_CATEGORY"
+CATEGORY_PATHS = {
+    "DT": "/usr/bin/log_parser/test_categoryDT.json",
+    "SR": "/usr/bin/log_parser/test_category.json",
+}
+YOCTO_FLAG_PATH = "/mnt/yocto_image.flag"
+
+# Suite keys whose test suites are listed under "Standalone" in the category files.
+STANDALONE_ALIASES = {
+    "dt_kselftest", "dt_validate", "ethtool_test",
+    "read_write_check_blk_devices", "psci", "capsule update", "network_boot", "smbios", "runtime_dev_map"
+}
+
+# Key order of an enriched test suite entry; other keys follow in their own order.
+ENTRY_KEY_ORDER = [
+    "Test_suite",
+    "Test_suite_name",
+    "Test_suite_description",
+    "Test_suite_info",
+    "Waivable",
+    "SRS scope",
+    "Main Readiness Grouping",
+    "Sub_test_suite",
+    "Test_case",
+    "Test_case_description",
+    "Test Entry Point GUID",
+    "Returned Status Code",
+    "test_result",
+    "reason",
+    "subtests",
+    "test_case_summary"
+]
+
+# Loaded category files: path -> ((mtime_ns, size), index)
+_loaded = {}
+
+
+def category_path(mode=None):
+    """Return the category file for mode ("DT"/"SR", default from the yocto flag)."""
+    override = os.environ.get(TEST_CATEGORY_ENV)
+    if override:
+        return override
+    if mode is None:
+        mode = "DT" if os.path.isfile(YOCTO_FLAG_PATH) else "SR"
+    return CATEGORY_PATHS["DT" if mode == "DT" else "SR"]
+
+
+def build_category_index(category_data):
+    """
+    Build a helper dictionary:
+      result[suite_name_lower][test_suite_name_lower] -> row dictionary
+    so we can easily retrieve waivable / scope / readiness grouping etc.
+    """
+    result = {}
+    if not isinstance(category_data, dict):
+        return result
+
+    for _cat_id, rows in category_data.items():
+        if isinstance(rows, list):
+            for row in rows:
+                suite_str = row.get("Suite", "").strip()
+                testsuite_str = row.get("Test Suite", "").strip()
+                if not suite_str or not testsuite_str:
+                    continue
+                # Convert to lowercase for easy matching
+                s_lower = suite_str.lower()
+                ts_lower = testsuite_str.lower()
+                if s_lower not in result:
+                    result[s_lower] = {}
+                result[s_lower][ts_lower] = row
+    return result
+
+
+def load_category_index(path=None):
+    """Return the index of a category file ({} when it is missing or unreadable).
+
+    The index is kept per process and rebuilt only when the file changes.
+    """
+    if path is None:
+        path = category_path()
+    try:
+        st = os.stat(path)
+    except OSError:
+        _loaded.pop(path, None)
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        with open(path, "r") as catf:
+            index = build_category_index(json.load(catf))
+    except Exception:  # pylint: disable=broad-except
+        index = {}
+    _loaded[path] = (stamp, index)
+    return index
+
+
+def category_suite_key(suite_key):
+    """Return the category file's suite name (lower case) for a suite key."""
+    lookup_suite_key = suite_key.lower()
+    if lookup_suite_key in STANDALONE_ALIASES or lookup_suite_key.startswith("os_"):
+        return "standalone"
+    if lookup_suite_key in ("sbmr-ib", "sbmr-oob"):
+        return "sbmr"
+    return lookup_suite_key
+
+
+def with_category_fields(ts_dict, row_vals):
+    """Return a copy of one test suite entry with the fields of its test_category row."""
+    ts_dict = dict(ts_dict)
+    if "Waivable" in row_vals:
+        ts_dict["Waivable"] = row_vals["Waivable"]
+    if "SRS scope" in row_vals:
+        ts_dict["SRS scope"] = row_vals["SRS scope"]
+    if "Description" in row_vals:
+        ts_dict["Test_suite_info"] = row_vals["Description"]
+    if "Main Readiness Grouping" in row_vals:
+        ts_dict["Main Readiness Grouping"] = row_vals["Main Readiness Grouping"]
+
+    temp = {}
+    for key in ENTRY_KEY_ORDER:
+        if key in ts_dict:
+            temp[key] = ts_dict[key]
+    for key, val in ts_dict.items():
+        if key not in temp:
+            temp[key] = val
+    return temp
+
+
+def enrich(data, suite_key, categories):
+    """
+    Return data with the category fields added to each test suite entry that
+    has a row in categories. Entries that gain fields are copied; data itself
+    is not changed.
+    """
+    # If 'data' is a dict with 'test_results' list, unify it
+    if (isinstance(data, dict)
+        and "test_results" in data
+        and isinstance(data["test_results"], list)
+    ):
+        data_list = data["test_results"]
+    else:
+        data_list = data
+
+    rows = categories.get(category_suite_key(suite_key))
+    if rows is None or not isinstance(data_list, list):
+        return data
+
+    # If there's a match on "Test_suite" => "Test Suite", copy fields.
+    enriched = []
+    for ts_dict in data_list:
+        if isinstance(ts_dict, dict):
+            ts_name_merged = (ts_dict.get("Test_suite") or ts_dict.get("Test_suite_name") or "").strip().lower()
+            if ts_name_merged in rows:
+                ts_dict = with_category_fields(ts_dict, rows[ts_name_merged])
+        enriched.append(ts_dict)
+    if data_list is data:
+        return enriched
+    return dict(data, test_results=enriched)
+
+
+def enrich_suite_json(json_file, data, categories=None):
+    """Return the data of a suite JSON enriched as merge_jsons.py enriches it.
+
+    The suite is found from the file name as in merge_jsons.py; categories
+    defaults to the index of category_path().
+    """
+    suite_key, _ = suite_registry.classify(json_file).names_for(json_file)
+    if categories is None:
+        categories = load_category_index()
+    return enrich(data, suite_key, categories)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Registry of the suite JSONs in acs_jsons/, shared by merge_jsons.py and
+# apply_waivers.py.
+#
+# A SuiteSpec names the file a parser writes for a suite, the words that
+# identify such a file (merge_jsons.py also accepts renamed copies, e.g.
+# "BSA_results.json"), the suite key used for compliance and test category
+# lookups, the merged_results.json section, the suite's level in the DT and
+# SR SRS scope tables, and the suite name apply_waivers.py uses.
+#
+# SUITE_REGISTRY is tried in order and the first spec that matches wins, so
+# a spec must come before any spec whose keywords are a subset of its own
+# (BBSR-FWTS before FWTS).  A spec whose names contain "{stem}" is a family:
+# every matching file becomes its own suite, named after the file.
+
+import os
+from fnmatch import fnmatchcase
+
+
+class SuiteSpec:
+    """One suite JSON family.
+
+    keywords: upper-case strings the upper-cased file name must contain; a
+    tuple entry means any one of its strings.  excludes: strings it must not
+    contain.  exact=True matches file_name itself (case-insensitively)
+    instead.  dt/sr: requirement level in the DT/SR scope table ("M", "CM",
+    "EM", "R"), or None when the suite is not in that table.
+    """
+
+    __slots__ = ("suite_key", "section_name", "file_name", "keywords", "excludes",
+                 "exact", "dt", "sr", "waiver_suite")
+
+    def __init__(self, suite_key, section_name, file_name, keywords=(), excludes=(),
+                 exact=False, dt=None, sr=None, waiver_suite=None):
+        self.suite_key = suite_key
+        self.section_name = section_name
+        self.file_name = file_name
+        self.keywords = tuple(keywords)
+        self.excludes = tuple(excludes)
+        self.exact = exact
+        self.dt = dt
+        self.sr = sr
+        self.waiver_suite = waiver_suite
+
+    @property
+    def per_file(self):
+        return "{stem}" in self.suite_key
+
+    def matches(self, file_name):
+        upper = file_name.upper()
+        if self.exact:
+            return upper == self.file_name.upper()
+        for keyword in self.keywords:
+            if isinstance(keyword, tuple):
+                if not any(kw in upper for kw in keyword):
+                    return False
+            elif keyword not in upper:
+                return False
+        return not any(ex in upper for ex in self.excludes)
+
+    def names_for(self, file_name):
+        """Return (suite_key, section_name) for a file this spec matched."""
+        stem = os.path.splitext(os.path.basename(file_name))[0]
+        return self.suite_key.format(stem=stem), self.section_name.format(stem=stem)
+
+
+SUITE_REGISTRY = (
+    SuiteSpec("BSA", "Suite_Name: BSA", "bsa.json", ("BSA",), excludes=("SBSA",),
+              dt="R", sr="M", waiver_suite="BSA"),
+    SuiteSpec("SBSA", "Suite_Name: SBSA", "sbsa.json", ("SBSA",),
+              sr="R", waiver_suite="SBSA"),
+    SuiteSpec("BBSR-FWTS", "Suite_Name: BBSR-FWTS", "bbsr_fwts.json", ("BBSR", "FWTS"),
+              dt="EM", sr="EM", waiver_suite="BBSR-FWTS"),
+    SuiteSpec("FWTS", "Suite_Name: FWTS", "fwts.json", ("FWTS",),
+              dt="M", sr="M", waiver_suite="FWTS"),
+    SuiteSpec("BBSR-SCT", "Suite_Name: BBSR-SCT", "bbsr_sct.json", ("BBSR", "SCT"),
+              dt="EM", sr="EM", waiver_suite="BBSR-SCT"),
+    SuiteSpec("BBSR-TPM", "Suite_Name: BBSR-TPM", "bbsr_tpm.json", ("BBSR", "TPM"),
+              dt="EM", sr="EM", waiver_suite="BBSR-TPM"),
+    SuiteSpec("SCT", "Suite_Name: SCT", "sct.json", ("SCT",),
+              dt="M", sr="M", waiver_suite="SCT"),
+    SuiteSpec("SBMR-IB", "Suite_Name: SBMR-IB", "sbmr_ib.json", (("SBMR_IB", "SBMR-IB"),),
+              sr="R", waiver_suite="SBMR"),
+    SuiteSpec("SBMR-OOB", "Suite_Name: SBMR-OOB", "sbmr_oob.json", (("SBMR_OOB", "SBMR-OOB"),),
+              sr="R", waiver_suite="SBMR"),
+    SuiteSpec("Capsule Update", "Suite_Name: CAPSULE_UPDATE", "capsule_update.json",
+              ("CAPSULE_UPDATE",), dt="M", waiver_suite="Standalone"),
+    SuiteSpec("DT_KSELFTEST", "Suite_Name: DT Kselftest", "dt_kselftest.json", ("DT_KSELFTEST",),
+              dt="R", waiver_suite="Standalone"),
+    SuiteSpec("DT_VALIDATE", "Suite_Name: DT Validate", "dt_validate.json", ("DT_VALIDATE",),
+              dt="M", waiver_suite="Standalone"),
+    SuiteSpec("ETHTOOL_TEST", "Suite_Name: Ethtool Test", "ethtool_test.json", exact=True,
+              dt="M", waiver_suite="Standalone"),
+    SuiteSpec("OS_TEST", "Suite_Name: OS Tests", "os_test.json", exact=True,
+              dt="M", sr="M", waiver_suite="os Tests"),
+    # One suite per OS image (ethtool_test_<os>.json). Each is mandatory; in
+    # DT mode they join the scope table, see compliance.suite_scope().
+    SuiteSpec("OS_{stem}", "Suite_Name: OS Tests - {stem}", "ethtool_test_*.json",
+              ("ETHTOOL_TEST",), dt="M", waiver_suite="os Tests"),
+    SuiteSpec("READ_WRITE_CHECK_BLK_DEVICES", "Suite_Name: Read Write Check Block Devices",
+              "read_write_check_blk_devices.json", ("READ_WRITE_CHECK_BLK_DEVICES",),
+              dt="M", waiver_suite="Standalone"),
+    SuiteSpec("NETWORK_BOOT", "Suite_Name: Network boot", "network_boot.json", ("NETWORK_BOOT",),
+              dt="R", waiver_suite="Standalone"),
+    SuiteSpec("SMBIOS", "Suite_Name: SMBIOS", "smbios_check.json", ("SMBIOS",),
+              dt="R", waiver_suite="Standalone"),
+    SuiteSpec("PSCI", "Suite_Name: PSCI", "psci.json", ("PSCI",), dt="R"),
+    SuiteSpec("PFDI", "Suite_Name: PFDI", "pfdi.json", ("PFDI",),
+              dt="CM", waiver_suite="PFDI"),
+    SuiteSpec("SCMI", "Suite_Name: SCMI", "scmi.json", ("SCMI",),
+              dt="EM", waiver_suite="SCMI"),
+    SuiteSpec("RUNTIME_DEV_MAP", "Suite_Name: Runtime device mapping", "runtime_dev_map.json",
+              ("RUNTIME_DEV_MAP",), dt="R", waiver_suite="Standalone"),
+    SuiteSpec("POST_SCRIPT", "Suite_Name: POST_SCRIPT", "post_script.json", ("POST_SCRIPT",),
+              dt="R", waiver_suite="POST_SCRIPT"),
+)
+
+UNKNOWN_SUITE = SuiteSpec("Unknown", "Suite_Name: Unknown", None)
+
+
+def classify(file_name):
+    """Return the SuiteSpec for a suite JSON file name (UNKNOWN_SUITE if none matches)."""
+    base = os.path.basename(file_name)
+    for spec in SUITE_REGISTRY:
+        if spec.matches(base):
+            return spec
+    return UNKNOWN_SUITE
+
+
+def suite_label(file_name, default):
+    """Return the suite key of a suite JSON for page headings, or default if none matches."""
+    spec = classify(file_name)
+    return default if spec is UNKNOWN_SUITE else spec.suite_key
+
+
+def scope_table(band):
+    """Return the ((suite_key, requirement), ...) SRS scope table for "DT" or "SR"."""
+    field = "dt" if band == "DT" else "sr"
+    return tuple((spec.suite_key, getattr(spec, field)) for spec in SUITE_REGISTRY
+                 if getattr(spec, field) and not spec.per_file)
+
+
+def waiver_suite_for(file_name):
+    """Return the apply_waivers.py suite name for a suite JSON, or None if it takes no waivers.
+
+    Only the names the parsers write are recognised here, not renamed copies.
+    """
+    for spec in SUITE_REGISTRY:
+        if spec.waiver_suite and fnmatchcase(file_name, spec.file_name):
+            return spec.waiver_suite
+    return None